@@ -0,0 +1,15 @@
+import json
+from typing import List, Optional
+from fastapi import HTTPException, status
+
+def parse_json_list(raw: Optional[str], field_name: str) -> List[str]:
+    """Parses a multipart form field holding a JSON array of strings (empty when omitted)."""
+    if not raw:
+        return []
+    try:
+        values = json.loads(raw)
+    except json.JSONDecodeError:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=f"{field_name} must be a JSON array of strings.")
+    if not isinstance(values, list) or not all(isinstance(value, str) for value in values):
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=f"{field_name} must be a JSON array of strings.")
+    return values
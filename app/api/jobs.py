@@ -1,14 +1,28 @@
-from fastapi import APIRouter, Depends, HTTPException, status
-from typing import List
-from app.schemas import JobListing, JobSearchCriteria
+from fastapi import APIRouter, Depends, File, Form, HTTPException, Request, UploadFile, status
+from typing import List, Optional
+from app.api.forms import parse_json_list
+from app.api.resume import get_job_store, get_pdf_processor
+from app.api.streaming import STREAM_FORMATS, encode_event, event_stream_response
+from app.schemas import JobListing, JobSearchCriteria, RankedJob
+from app.services import services
+from app.uploads import extract_resume_text
+from modules import metrics
+from modules.executors import run_blocking
+from modules.implementations.indexing_job_store import IndexingJobStore
+from modules.interfaces.job_ranker import IJobRanker
 from modules.interfaces.job_scraper import IJobScraper
-from modules.implementations.playwright_job_scraper import PlaywrightJobScraper
+from modules.interfaces.job_store import IJobStore
+from modules.interfaces.pdf_processor import IPDFProcessor
 
 router = APIRouter()
 
-# Dependency provider for the job scraper
+# Dependency provider for the job scraper (shares the lifespan-scoped browser pool)
 def get_job_scraper() -> IJobScraper:
-    return PlaywrightJobScraper()
+    return services.job_scraper
+
+# Dependency provider for the local job ranking index (None when JOB_RANKER_ENABLED is off)
+def get_job_ranker() -> Optional[IJobRanker]:
+    return services.job_ranker
 
 @router.post("/search-jobs", response_model=List[JobListing])
 async def search_jobs_endpoint(
@@ -29,4 +43,73 @@ async def search_jobs_endpoint(
         return jobs
     except Exception as e:
         print(f"Error in job search endpoint: {e}")
-        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=f"An error occurred during job search: {str(e)}")
\ No newline at end of file
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=f"An error occurred during job search: {str(e)}")
+
+@router.post("/search-jobs/stream")
+async def stream_search_jobs_endpoint(
+    request: Request,
+    criteria: JobSearchCriteria,
+    limit: int = 10,
+    stream_format: str = "ndjson", # "ndjson" or "sse"
+    job_scraper: IJobScraper = Depends(get_job_scraper)
+):
+    """
+    Streams job listings as they are scraped instead of waiting for the whole search.
+    Emits `started`, then a `job` and a `progress` event per listing, and finally `done`
+    (or `error`). Scraping stops as soon as the client disconnects.
+    """
+    if not criteria.keywords:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Keywords are required for job search.")
+    if stream_format not in STREAM_FORMATS:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="stream_format must be 'ndjson' or 'sse'.")
+
+    async def event_stream():
+        scraped = 0
+        job_iterator = job_scraper.iter_jobs(criteria, limit)
+        yield encode_event({"event": "started", "limit": limit}, stream_format)
+        try:
+            async for job_listing in job_iterator:
+                if await request.is_disconnected():
+                    print("Client disconnected from job search stream. Cancelling scrape.")
+                    return
+                scraped += 1
+                yield encode_event({"event": "job", "data": job_listing.model_dump()}, stream_format)
+                yield encode_event({"event": "progress", "scraped": scraped, "limit": limit}, stream_format)
+            yield encode_event({"event": "done", "total": scraped}, stream_format)
+        except Exception as e:
+            print(f"Error in job search stream: {e}")
+            yield encode_event({"event": "error", "detail": f"An error occurred during job search: {str(e)}"}, stream_format)
+        finally:
+            # Closing the generator releases the browser context and cancels pending page loads.
+            aclose = getattr(job_iterator, "aclose", None)
+            if aclose is not None:
+                await aclose()
+
+    return event_stream_response(event_stream(), stream_format)
+
+@router.post("/rank-jobs", response_model=List[RankedJob])
+async def rank_jobs_endpoint(
+    resume_file: UploadFile = File(...),
+    top_k: int = Form(10, ge=1, le=500, description="How many of the best matching listings to return."),
+    job_urls: Optional[str] = Form(None, description="JSON array of job URLs to rank; omit to rank every stored listing."),
+    pdf_processor: IPDFProcessor = Depends(get_pdf_processor),
+    job_ranker: Optional[IJobRanker] = Depends(get_job_ranker),
+    job_store: Optional[IJobStore] = Depends(get_job_store)
+):
+    """
+    Ranks scraped listings by TF-IDF similarity to the resume, entirely locally, so the best
+    candidates can be picked before spending LLM calls on /get-resume-suggestions.
+    Listings scraped by any server worker are included: the index catches up with the shared
+    job store before ranking.
+    """
+    if resume_file.content_type != "application/pdf":
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Only PDF files are supported for input.")
+    if job_ranker is None:
+        raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail="Job ranking is disabled.")
+
+    urls = parse_json_list(job_urls, "job_urls") if job_urls is not None else None
+    resume_text = await extract_resume_text(resume_file, pdf_processor)
+    if isinstance(job_store, IndexingJobStore):
+        await run_blocking(job_store.sync_index)
+    with metrics.span("job_rank"):
+        return job_ranker.rank(resume_text, top_k=top_k, job_urls=urls)
@@ -1,69 +1,138 @@
+import hashlib
 import io
-from fastapi import APIRouter, Form, UploadFile, File, HTTPException, Depends, status
-from fastapi.responses import StreamingResponse
+import os
+from typing import BinaryIO, Optional
+from fastapi import APIRouter, Form, UploadFile, File, HTTPException, Depends, Request, status
+from fastapi.responses import Response, StreamingResponse
 
-from app.schemas import ResumeSuggestions
-from modules.implementations.langchain_resume_optimizer import LangChainResumeOptimizer
-from modules.implementations.pypdf_processor import PyPDFProcessor
-from modules.implementations.html_pdf_generator import HtmlPdfGenerator
+from app import config
+from app.api.forms import parse_json_list
+from app.api.streaming import STREAM_FORMATS, encode_event, event_stream_response
+from app.batch_optimization import BatchItem, BatchResumeOptimizer, build_batch_zip
+from app.incremental_optimization import IncrementalResumeOptimizer
+from app.optimization_tasks import OptimizationTaskManager
+from app.schemas import KeywordCoverage, OptimizationTask, OptimizeAndSuggestResponse, ResumeSuggestions
+from app.services import services
+from app.uploads import extract_resume_text, spool_pdf_upload
+from modules import metrics
+from modules.executors import run_blocking
+from modules.implementations.caching_pdf_generator import CachingPdfGenerator
+from modules.keyword_coverage import score_keyword_coverage
 from modules.interfaces.pdf_processor import IPDFProcessor
 from modules.interfaces.resume_optimizer import IResumeOptimizer
-from modules.interfaces.document_generator import IDocumentGenerator
+from modules.interfaces.document_generator import IDocumentGenerator, DocumentGeneratorBusyError, DocumentRenderTimeoutError
+from modules.interfaces.task_queue import TaskQueueFullError
+from modules.interfaces.job_store import IJobStore
+from modules.interfaces.cache import ICache
 
 router = APIRouter()
 
+# Dependency providers hand out the lifespan-scoped singletons from app.services.
+# Override them with app.dependency_overrides in tests.
 def get_pdf_processor() -> IPDFProcessor:
-    return PyPDFProcessor()
+    return services.pdf_processor
 
 def get_resume_optimizer() -> IResumeOptimizer:
-    return LangChainResumeOptimizer()
+    return services.resume_optimizer
 
 def get_document_generator() -> IDocumentGenerator:
     """Dependency provider for document generation (HTML to PDF)."""
-    return HtmlPdfGenerator(template_dir="templates")
+    return services.document_generator
+
+def get_task_manager() -> OptimizationTaskManager:
+    return services.task_manager
+
+def get_job_store() -> Optional[IJobStore]:
+    return services.job_store
+
+def get_resume_version_store() -> ICache:
+    return services.resume_version_store
+
+def get_rendered_pdf_store() -> ICache:
+    return services.rendered_pdf_store
+
+PDF_CHUNK_BYTES = 64 * 1024
+
+def _open_pdf_response(pdf_file: BinaryIO, headers: dict) -> StreamingResponse:
+    """
+    Streams an already-open PDF in PDF_CHUNK_BYTES reads (on the threadpool) and closes it
+    afterwards. Cache files are opened before the response starts, so evicting the entry
+    mid-stream cannot cut the download short.
+    """
+    size = pdf_file.seek(0, os.SEEK_END)
+    pdf_file.seek(0)
+
+    def chunks():
+        with pdf_file:
+            while True:
+                chunk = pdf_file.read(PDF_CHUNK_BYTES)
+                if not chunk:
+                    return
+                yield chunk
+
+    return StreamingResponse(chunks(), media_type="application/pdf", headers={**headers, "Content-Length": str(size)})
+
+async def _pdf_response(document_generator: IDocumentGenerator, resume_data, headers: dict) -> Response:
+    """Renders the resume into a PDF response; cached renders are streamed straight from disk."""
+    if isinstance(document_generator, CachingPdfGenerator):
+        return _open_pdf_response(await document_generator.aopen_pdf(resume_data), headers)
+    output_pdf_buffer = await document_generator.agenerate_pdf(resume_data)
+    return StreamingResponse(output_pdf_buffer, media_type="application/pdf", headers=headers)
 
 @router.post("/optimize-resume", response_class= StreamingResponse)
 async def optimize_resume_endpoint(
     resume_file: UploadFile = File(...),
     job_description: str = Form(..., description="The job description text to tailor the resume for."),
+    bypass_cache: bool = Form(False, description="Ignore any cached LLM response and generate a fresh one."),
+    previous_version: Optional[str] = Form(None, description="X-Resume-Version of an earlier optimization of this resume; only the entries edited since then are re-optimized."),
     pdf_processor: IPDFProcessor = Depends(get_pdf_processor),
     resume_optimizer: IResumeOptimizer = Depends(get_resume_optimizer),
-    document_generator: IDocumentGenerator = Depends(get_document_generator)
+    document_generator: IDocumentGenerator = Depends(get_document_generator),
+    version_store: ICache = Depends(get_resume_version_store)
 ):
     """
     Receives a PDF resume and a job description.
     Optimizes the resume content using AI and returns it as an ATS-friendly PDF file.
+    The X-Resume-Version response header identifies this optimization; pass it back as
+    previous_version after editing the resume to regenerate only the changed entries.
     """
     if resume_file.content_type != "application/pdf":
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Only PDF files are supported for input.")
 
     try:
         # 1. Extract text from the uploaded PDF
-        pdf_content = await resume_file.read()
-        pdf_stream = io.BytesIO(pdf_content)
-        resume_text = pdf_processor.extract_text(pdf_stream)
-        if not resume_text:
-            raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Could not extract text from PDF. Please ensure it's a readable PDF.")
+        resume_text = await extract_resume_text(resume_file, pdf_processor)
 
-        # 2. Optimize the resume content using the AI
-        optimized_resume_data = resume_optimizer.optimize_resume(resume_text, job_description)
-
-        # 3. Generate the PDF document from the optimized structured data
-        output_pdf_buffer = document_generator.generate_pdf(optimized_resume_data)
+        # 2. Optimize the resume content using the AI (incrementally when an earlier version is known)
+        incremental_optimizer = IncrementalResumeOptimizer(resume_optimizer, version_store)
+        optimized_resume_data, version_id, revision = await incremental_optimizer.optimize(
+            resume_text, job_description, previous_version=previous_version, use_cache=not bypass_cache
+        )
 
-        # 4. Return the PDF file as a downloadable StreamingResponse
+        # 3. Generate the PDF document from the optimized structured data and return it as a download
         headers = {
-            "Content-Disposition": "attachment; filename=optimized_resume.pdf"
+            "Content-Disposition": "attachment; filename=optimized_resume.pdf",
+            "X-Resume-Version": version_id,
+            "X-Optimization-Mode": revision["mode"],
         }
-        return StreamingResponse(
-            output_pdf_buffer,
-            media_type="application/pdf",
-            headers=headers
-        )
+        if revision["reoptimized"]:
+            headers["X-Reoptimized-Sections"] = ",".join(revision["reoptimized"])
+        return await _pdf_response(document_generator, optimized_resume_data, headers)
 
     except HTTPException as e:
         # Re-raise any HTTPExceptions (e.g., 400 Bad Request)
         raise e
+    except DocumentGeneratorBusyError:
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail="The PDF renderer is at capacity. Please retry shortly.",
+            headers={"Retry-After": "5"},
+        )
+    except DocumentRenderTimeoutError:
+        raise HTTPException(
+            status_code=status.HTTP_504_GATEWAY_TIMEOUT,
+            detail="Rendering the PDF took too long and was cancelled. Please try again.",
+        )
     except Exception as e:
         # Catch any other unexpected errors and return a generic 500 Internal Server Error
         print(f"An unexpected error occurred in /optimize-resume: {e}") # Log the detailed error
@@ -72,10 +141,54 @@ async def optimize_resume_endpoint(
             detail=f"An internal error occurred during resume optimization. Please try again. ({str(e)})"
         )
 
+@router.post("/optimize-resume/stream")
+async def stream_optimize_resume_endpoint(
+    request: Request,
+    resume_file: UploadFile = File(...),
+    job_description: str = Form(..., description="The job description text to tailor the resume for."),
+    bypass_cache: bool = Form(False, description="Ignore any cached LLM response and generate a fresh one."),
+    stream_format: str = Form("sse", description="'sse' or 'ndjson'."),
+    pdf_processor: IPDFProcessor = Depends(get_pdf_processor),
+    resume_optimizer: IResumeOptimizer = Depends(get_resume_optimizer)
+):
+    """
+    Streams the optimized resume section by section while the model is still generating.
+    Emits `started`, a `section` event per validated field or list entry (with `index` for
+    experience/education/projects), `section_retry` when one section has to be regenerated,
+    then `resume` with the complete result and `done` (or `error`).
+    The finished resume is cached, so a follow-up /optimize-resume call only renders the PDF.
+    """
+    if resume_file.content_type != "application/pdf":
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Only PDF files are supported for input.")
+    if stream_format not in STREAM_FORMATS:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="stream_format must be 'ndjson' or 'sse'.")
+
+    resume_text = await extract_resume_text(resume_file, pdf_processor)
+
+    async def event_stream():
+        section_iterator = resume_optimizer.astream_resume(resume_text, job_description, use_cache=not bypass_cache)
+        yield encode_event({"event": "started"}, stream_format)
+        try:
+            async for event in section_iterator:
+                if await request.is_disconnected():
+                    print("Client disconnected from resume stream. Cancelling generation.")
+                    return
+                yield encode_event(event, stream_format)
+            yield encode_event({"event": "done"}, stream_format)
+        except Exception as e:
+            print(f"Error in resume optimization stream: {e}")
+            yield encode_event({"event": "error", "detail": f"An error occurred during resume optimization: {str(e)}"}, stream_format)
+        finally:
+            # Closing the generator cancels the LLM stream and any section regenerations still running.
+            await section_iterator.aclose()
+
+    return event_stream_response(event_stream(), stream_format)
+
 @router.post("/get-resume-suggestions", response_model=ResumeSuggestions)
 async def get_resume_suggestions_endpoint(
     resume_file: UploadFile = File(...),
     job_description: str = Form(..., description="The job description text to tailor the resume for."),
+    bypass_cache: bool = Form(False, description="Ignore any cached LLM response and generate a fresh one."),
     # Injected dependencies
     pdf_processor: IPDFProcessor = Depends(get_pdf_processor),
     resume_optimizer: IResumeOptimizer = Depends(get_resume_optimizer)
@@ -88,14 +201,10 @@ async def get_resume_suggestions_endpoint(
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Only PDF files are supported for input.")
     try:
         # 1. Extract text from the uploaded PDF
-        pdf_content = await resume_file.read()
-        pdf_stream = io.BytesIO(pdf_content)
-        resume_text = pdf_processor.extract_text(pdf_stream)
-        if not resume_text:
-            raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Could not extract text from PDF. Please ensure it's a readable PDF.")
+        resume_text = await extract_resume_text(resume_file, pdf_processor)
         
         # 2. Get suggestions using the AI
-        suggestions_result = resume_optimizer.get_suggestions(resume_text, job_description)
+        suggestions_result = await resume_optimizer.aget_suggestions(resume_text, job_description, use_cache=not bypass_cache)
         return suggestions_result
 
     except HTTPException as e:
@@ -105,4 +214,267 @@ async def get_resume_suggestions_endpoint(
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"An internal error occurred during suggestion generation. Please try again. ({str(e)})"
-        )
\ No newline at end of file
+        )
+
+@router.post("/keyword-coverage", response_model=KeywordCoverage)
+async def keyword_coverage_endpoint(
+    resume_file: UploadFile = File(...),
+    job_description: str = Form(..., description="The job description text to match the resume against."),
+    pdf_processor: IPDFProcessor = Depends(get_pdf_processor)
+):
+    """
+    Scores how many of the job description's keywords the resume already covers, per section,
+    without calling the LLM. Useful to decide which jobs are worth a full optimization.
+    """
+    if resume_file.content_type != "application/pdf":
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Only PDF files are supported for input.")
+    resume_text = await extract_resume_text(resume_file, pdf_processor)
+    with metrics.span("keyword_coverage"):
+        return score_keyword_coverage(job_description, resume_text)
+
+@router.post("/optimize-resume-with-suggestions", response_model=OptimizeAndSuggestResponse)
+async def optimize_resume_with_suggestions_endpoint(
+    resume_file: UploadFile = File(...),
+    job_description: str = Form(..., description="The job description text to tailor the resume for."),
+    bypass_cache: bool = Form(False, description="Ignore any cached LLM response and generate a fresh one."),
+    pdf_processor: IPDFProcessor = Depends(get_pdf_processor),
+    resume_optimizer: IResumeOptimizer = Depends(get_resume_optimizer),
+    document_generator: IDocumentGenerator = Depends(get_document_generator),
+    pdf_store: ICache = Depends(get_rendered_pdf_store)
+):
+    """
+    Replaces calling /optimize-resume and /get-resume-suggestions back to back: the PDF is
+    uploaded and parsed once and both results come from a single optimizer call.
+    Returns the optimized resume and suggestions as JSON; the rendered PDF is downloaded from pdf_url.
+    """
+    if resume_file.content_type != "application/pdf":
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Only PDF files are supported for input.")
+
+    try:
+        # 1. Extract text once for both results
+        resume_text = await extract_resume_text(resume_file, pdf_processor)
+
+        # 2. Optimize and collect suggestions in one call
+        combined = await resume_optimizer.aoptimize_with_suggestions(resume_text, job_description, use_cache=not bypass_cache)
+
+        # 3. Render the PDF, keyed by content so an identical resume is never rendered twice
+        if isinstance(document_generator, CachingPdfGenerator):
+            # The rendered-PDF cache already keeps the file; the link serves it from disk.
+            await document_generator.arender_to_file(combined.resume)
+            pdf_id = document_generator.cache_key(combined.resume)
+        else:
+            pdf_id = hashlib.sha256(combined.resume.model_dump_json().encode("utf-8")).hexdigest()
+            if pdf_store.get(pdf_id) is None:
+                output_pdf_buffer = await document_generator.agenerate_pdf(combined.resume)
+                pdf_store.set(pdf_id, output_pdf_buffer.getvalue())
+
+        return OptimizeAndSuggestResponse(
+            resume=combined.resume,
+            suggestions=combined.suggestions.suggestions,
+            pdf_url=f"/api/optimize-resume/pdf/{pdf_id}",
+        )
+
+    except HTTPException as e:
+        raise e
+    except DocumentGeneratorBusyError:
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail="The PDF renderer is at capacity. Please retry shortly.",
+            headers={"Retry-After": "5"},
+        )
+    except DocumentRenderTimeoutError:
+        raise HTTPException(
+            status_code=status.HTTP_504_GATEWAY_TIMEOUT,
+            detail="Rendering the PDF took too long and was cancelled. Please try again.",
+        )
+    except Exception as e:
+        print(f"An unexpected error occurred in /optimize-resume-with-suggestions: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"An internal error occurred during resume optimization. Please try again. ({str(e)})"
+        )
+
+@router.get("/optimize-resume/pdf/{pdf_id}")
+async def get_rendered_pdf_endpoint(
+    pdf_id: str,
+    pdf_store: ICache = Depends(get_rendered_pdf_store),
+    document_generator: IDocumentGenerator = Depends(get_document_generator)
+):
+    """
+    Downloads a PDF rendered by /optimize-resume-with-suggestions while it is still retained.
+    """
+    headers = {"Content-Disposition": "attachment; filename=optimized_resume.pdf"}
+    if isinstance(document_generator, CachingPdfGenerator):
+        pdf_file = await run_blocking(document_generator.cache.open, pdf_id) if pdf_id.isalnum() else None
+        if pdf_file is not None:
+            return _open_pdf_response(pdf_file, headers)
+    pdf_bytes = pdf_store.get(pdf_id)
+    if pdf_bytes is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="PDF not found or expired. Please optimize the resume again.")
+    return Response(content=pdf_bytes, media_type="application/pdf", headers=headers)
+
+@router.get("/cache-stats")
+async def cache_stats_endpoint():
+    """
+    Returns hit/miss counters for the server-side caches, plus the tokens saved by prompt compaction.
+    """
+    llm_response_cache = services.llm_response_cache
+    prompt_compactor = services.prompt_compactor
+    rendered_pdf_cache = services.rendered_pdf_cache
+    return {
+        "pdf_text": services.pdf_text_cache.stats(),
+        "llm_responses": llm_response_cache.stats() if llm_response_cache is not None else None,
+        "prompt_compaction": prompt_compactor.stats() if prompt_compactor is not None else None,
+        "rendered_pdfs": rendered_pdf_cache.stats() if rendered_pdf_cache is not None else None,
+    }
+
+@router.post("/optimize-resume/tasks", response_model=OptimizationTask, status_code=status.HTTP_202_ACCEPTED)
+async def submit_optimization_task_endpoint(
+    resume_file: UploadFile = File(...),
+    job_description: str = Form(..., description="The job description text to tailor the resume for."),
+    callback_url: Optional[str] = Form(None, description="Optional http(s) URL the server POSTs the final task status to (an outbound request made on the client's behalf; hosts resolving to loopback, private, link-local or reserved addresses are rejected unless listed in TASK_CALLBACK_ALLOWED_HOSTS)."),
+    bypass_cache: bool = Form(False, description="Ignore any cached LLM response and generate a fresh one."),
+    task_manager: OptimizationTaskManager = Depends(get_task_manager)
+):
+    """
+    Queues a resume optimization and returns immediately with a task id.
+    Poll GET /optimize-resume/tasks/{task_id} (or wait for the callback), then download
+    the PDF from GET /optimize-resume/tasks/{task_id}/pdf.
+    """
+    if resume_file.content_type != "application/pdf":
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Only PDF files are supported for input.")
+    if callback_url:
+        try:
+            await task_manager.check_callback_url(callback_url)
+        except ValueError as e:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    pdf_upload = await spool_pdf_upload(resume_file, config.PDF_MAX_UPLOAD_BYTES, config.PDF_SPOOL_THRESHOLD_BYTES)
+    try:
+        # The task keeps its own copy of the upload so it can be retried later.
+        pdf_content = pdf_upload.read_bytes()
+    finally:
+        pdf_upload.close()
+    try:
+        return await task_manager.submit(pdf_content, job_description, callback_url=callback_url, use_cache=not bypass_cache)
+    except TaskQueueFullError:
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail="Too many optimization tasks are waiting. Please retry shortly.",
+            headers={"Retry-After": "10"},
+        )
+
+@router.get("/optimize-resume/tasks/{task_id}", response_model=OptimizationTask)
+async def get_optimization_task_endpoint(task_id: str, task_manager: OptimizationTaskManager = Depends(get_task_manager)):
+    """
+    Returns the current status of a background optimization task.
+    """
+    task = task_manager.get(task_id)
+    if task is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Task not found.")
+    return task
+
+@router.get("/optimize-resume/tasks/{task_id}/pdf", response_class=Response)
+async def get_optimization_task_pdf_endpoint(task_id: str, task_manager: OptimizationTaskManager = Depends(get_task_manager)):
+    """
+    Downloads the optimized PDF of a completed task.
+    """
+    task = task_manager.get(task_id)
+    if task is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Task not found.")
+    pdf_content = task_manager.get_pdf(task_id)
+    if pdf_content is None:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=f"The PDF is not ready yet (task is {task.status}).")
+    return Response(
+        content=pdf_content,
+        media_type="application/pdf",
+        headers={"Content-Disposition": "attachment; filename=optimized_resume.pdf"},
+    )
+
+@router.post("/optimize-resume/tasks/{task_id}/retry", response_model=OptimizationTask, status_code=status.HTTP_202_ACCEPTED)
+async def retry_optimization_task_endpoint(task_id: str, task_manager: OptimizationTaskManager = Depends(get_task_manager)):
+    """
+    Re-queues a failed task. Stages that already succeeded are not repeated.
+    """
+    try:
+        task = await task_manager.retry(task_id)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
+    except TaskQueueFullError:
+        raise HTTPException(status_code=status.HTTP_429_TOO_MANY_REQUESTS, detail="Too many optimization tasks are waiting. Please retry shortly.", headers={"Retry-After": "10"})
+    if task is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Task not found.")
+    return task
+
+@router.post("/optimize-resume/batch", response_class=StreamingResponse)
+async def batch_optimize_resume_endpoint(
+    resume_file: UploadFile = File(...),
+    job_descriptions: Optional[str] = Form(None, description='JSON array of job description texts, e.g. ["...", "..."].'),
+    job_urls: Optional[str] = Form(None, description="JSON array of job URLs previously returned by /search-jobs (looked up in the job store). Only the stored title, company, location and description snippet (the first ~250 characters) are sent to the LLM, not the full posting; pass the text via job_descriptions for a full tailoring."),
+    bypass_cache: bool = Form(False, description="Ignore any cached LLM response and generate a fresh one."),
+    min_keyword_coverage: Optional[float] = Form(None, ge=0, le=1, description="Skip jobs whose keyword coverage (0-1) is below this, without calling the LLM. Defaults to BATCH_MIN_KEYWORD_COVERAGE."),
+    pdf_processor: IPDFProcessor = Depends(get_pdf_processor),
+    resume_optimizer: IResumeOptimizer = Depends(get_resume_optimizer),
+    document_generator: IDocumentGenerator = Depends(get_document_generator),
+    job_store: Optional[IJobStore] = Depends(get_job_store)
+):
+    """
+    Tailors one resume to many job descriptions in a single request.
+    The PDF is parsed once; optimizations run with bounded concurrency and each result is
+    rendered as soon as it is ready. Returns a ZIP of PDFs plus manifest.json with the
+    status of every item.
+    Jobs given by URL are described only by what the scraper stored (title, company,
+    location and a description snippet), so they are tailored less precisely than jobs
+    given as full text.
+    """
+    if resume_file.content_type != "application/pdf":
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Only PDF files are supported for input.")
+
+    items = [BatchItem(label=f"job_{index + 1}", job_description=text) for index, text in enumerate(parse_json_list(job_descriptions, "job_descriptions"))]
+    for job_url in parse_json_list(job_urls, "job_urls"):
+        stored_job = job_store.get_job(job_url, fresh_only=False) if job_store is not None else None
+        if stored_job is None:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"Job not found in the job store: {job_url}")
+        description = "\n".join(filter(None, [stored_job.title, stored_job.company, stored_job.location, stored_job.description_snippet]))
+        items.append(BatchItem(label=f"{stored_job.company} {stored_job.title}", job_description=description, job_url=stored_job.job_url))
+
+    if not items:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Provide job_descriptions and/or job_urls.")
+    if len(items) > config.BATCH_MAX_ITEMS:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=f"A batch may contain at most {config.BATCH_MAX_ITEMS} jobs.")
+
+    try:
+        # 1. Extract text once for the whole batch
+        resume_text = await extract_resume_text(resume_file, pdf_processor)
+
+        # 2. Fan out optimize + render for every job
+        batch_optimizer = BatchResumeOptimizer(
+            resume_optimizer,
+            document_generator,
+            llm_concurrency=config.BATCH_LLM_CONCURRENCY,
+            render_concurrency=config.BATCH_RENDER_CONCURRENCY,
+            rate_limit_retries=config.BATCH_RATE_LIMIT_RETRIES,
+            rate_limit_backoff_seconds=config.BATCH_RATE_LIMIT_BACKOFF_SECONDS,
+            min_keyword_coverage=config.BATCH_MIN_KEYWORD_COVERAGE if min_keyword_coverage is None else min_keyword_coverage,
+        )
+        outcomes = await batch_optimizer.run(resume_text, items, use_cache=not bypass_cache)
+
+        # 3. Package the PDFs and the per-item manifest
+        archive = await build_batch_zip(outcomes)
+        succeeded = sum(1 for outcome in outcomes if outcome["result"].status == "completed")
+        skipped = sum(1 for outcome in outcomes if outcome["result"].status == "skipped")
+        headers = {
+            "Content-Disposition": "attachment; filename=optimized_resumes.zip",
+            "X-Batch-Succeeded": str(succeeded),
+            "X-Batch-Failed": str(len(outcomes) - succeeded - skipped),
+            "X-Batch-Skipped": str(skipped),
+        }
+        return StreamingResponse(io.BytesIO(archive), media_type="application/zip", headers=headers)
+
+    except HTTPException as e:
+        raise e
+    except Exception as e:
+        print(f"An unexpected error occurred in /optimize-resume/batch: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"An internal error occurred during batch optimization. Please try again. ({str(e)})"
+        )
@@ -0,0 +1,21 @@
+import json
+from typing import AsyncIterator
+from fastapi.responses import StreamingResponse
+
+STREAM_FORMATS = ("ndjson", "sse")
+
+def encode_event(event: dict, stream_format: str) -> str:
+    """Serializes one stream event as an NDJSON line or a Server-Sent Event."""
+    payload = json.dumps(event)
+    if stream_format == "sse":
+        return f"event: {event['event']}\ndata: {payload}\n\n"
+    return payload + "\n"
+
+def event_stream_response(events: AsyncIterator[str], stream_format: str) -> StreamingResponse:
+    """Wraps encoded events in a response that proxies will not buffer."""
+    media_type = "text/event-stream" if stream_format == "sse" else "application/x-ndjson"
+    return StreamingResponse(
+        events,
+        media_type=media_type,
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
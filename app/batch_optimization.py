@@ -0,0 +1,144 @@
+import asyncio
+import json
+import re
+import zipfile
+from io import BytesIO
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+from pydantic import BaseModel
+from modules.executors import run_blocking
+from modules.keyword_coverage import score_keyword_coverage
+from modules.interfaces.document_generator import IDocumentGenerator
+from modules.interfaces.resume_optimizer import IResumeOptimizer
+
+
+class BatchItem(BaseModel):
+    """One target job for a batch run."""
+    label: str
+    job_description: str
+    job_url: Optional[str] = None
+
+
+class BatchItemResult(BaseModel):
+    """Outcome of one batch item, as listed in the ZIP's manifest.json."""
+    index: int
+    label: str
+    job_url: Optional[str] = None
+    status: str # "completed", "failed" or "skipped" (below the keyword coverage threshold)
+    filename: Optional[str] = None
+    error: Optional[str] = None
+    rate_limit_retries: int = 0
+    keyword_coverage: Optional[float] = None
+
+
+def is_rate_limit_error(error: Exception) -> bool:
+    """True for provider throttling errors (HTTP 429 / openai.RateLimitError)."""
+    if getattr(error, "status_code", None) == 429:
+        return True
+    return type(error).__name__ == "RateLimitError"
+
+
+async def call_with_rate_limit_retries(
+    call: Callable[[], Awaitable[Any]],
+    max_retries: int,
+    backoff_seconds: float,
+    on_retry: Optional[Callable[[], None]] = None,
+) -> Any:
+    """Awaits `call()`, backing off exponentially and retrying when the provider throttles us."""
+    attempt = 0
+    while True:
+        try:
+            return await call()
+        except Exception as e:
+            if not is_rate_limit_error(e) or attempt >= max_retries:
+                raise
+            delay = backoff_seconds * (2 ** attempt)
+            attempt += 1
+            if on_retry is not None:
+                on_retry()
+            print(f"LLM rate limit hit; retrying in {delay:.1f}s (attempt {attempt}/{max_retries}).")
+            await asyncio.sleep(delay)
+
+
+def _safe_filename(index: int, label: str) -> str:
+    slug = re.sub(r"[^A-Za-z0-9]+", "_", label).strip("_")[:60] or "resume"
+    return f"{index + 1:02d}_{slug}.pdf"
+
+
+class BatchResumeOptimizer:
+    """
+    Tailors one already-extracted resume to many job descriptions.
+    LLM calls run with bounded concurrency (and back off on rate limits); each item is
+    rendered as soon as its optimization finishes, with rendering bounded separately.
+    Items whose keyword coverage is below min_keyword_coverage are skipped before the LLM call.
+    """
+    def __init__(
+        self,
+        resume_optimizer: IResumeOptimizer,
+        document_generator: IDocumentGenerator,
+        llm_concurrency: int = 4,
+        render_concurrency: int = 4,
+        rate_limit_retries: int = 4,
+        rate_limit_backoff_seconds: float = 2.0,
+        min_keyword_coverage: float = 0.0,
+    ):
+        self.resume_optimizer = resume_optimizer
+        self.document_generator = document_generator
+        self.llm_concurrency = llm_concurrency
+        self.render_concurrency = render_concurrency
+        self.rate_limit_retries = rate_limit_retries
+        self.rate_limit_backoff_seconds = rate_limit_backoff_seconds
+        self.min_keyword_coverage = min_keyword_coverage
+
+    async def run(self, resume_text: str, items: List[BatchItem], use_cache: bool = True) -> List[Dict[str, Any]]:
+        """Returns one {"result": BatchItemResult, "pdf": bytes | None} per item, in input order."""
+        llm_slots = asyncio.Semaphore(self.llm_concurrency)
+        render_slots = asyncio.Semaphore(self.render_concurrency)
+
+        async def process(index: int, item: BatchItem) -> Dict[str, Any]:
+            result = BatchItemResult(index=index, label=item.label, job_url=item.job_url, status="failed")
+            result.keyword_coverage = score_keyword_coverage(item.job_description, resume_text).coverage
+            if result.keyword_coverage < self.min_keyword_coverage:
+                result.status = "skipped"
+                result.error = f"Keyword coverage {result.keyword_coverage:.0%} is below the {self.min_keyword_coverage:.0%} threshold."
+                return {"result": result, "pdf": None}
+
+            def count_retry():
+                result.rate_limit_retries += 1
+
+            try:
+                async with llm_slots:
+                    optimized_resume = await call_with_rate_limit_retries(
+                        lambda: self.resume_optimizer.aoptimize_resume(resume_text, item.job_description, use_cache=use_cache),
+                        self.rate_limit_retries,
+                        self.rate_limit_backoff_seconds,
+                        on_retry=count_retry,
+                    )
+                async with render_slots:
+                    pdf_buffer = await self.document_generator.agenerate_pdf(optimized_resume)
+            except Exception as e:
+                print(f"Batch item {index} ({item.label}) failed: {e}")
+                result.error = str(e)
+                return {"result": result, "pdf": None}
+
+            result.status = "completed"
+            result.filename = _safe_filename(index, item.label)
+            return {"result": result, "pdf": pdf_buffer.getvalue()}
+
+        return await asyncio.gather(*(process(index, item) for index, item in enumerate(items)))
+
+
+def _build_zip(outcomes: List[Dict[str, Any]]) -> bytes:
+    archive = BytesIO()
+    # PDFs are already compressed; storing them avoids burning CPU for no gain.
+    with zipfile.ZipFile(archive, "w", compression=zipfile.ZIP_STORED) as zip_file:
+        for outcome in outcomes:
+            if outcome["pdf"] is not None:
+                zip_file.writestr(outcome["result"].filename, outcome["pdf"])
+        manifest = [outcome["result"].model_dump() for outcome in outcomes]
+        zip_file.writestr("manifest.json", json.dumps(manifest, indent=2), compress_type=zipfile.ZIP_DEFLATED)
+    return archive.getvalue()
+
+
+async def build_batch_zip(outcomes: List[Dict[str, Any]]) -> bytes:
+    """Packs the rendered PDFs plus a manifest.json with per-item status into a ZIP."""
+    return await run_blocking(_build_zip, outcomes)
@@ -0,0 +1,143 @@
+import os
+from typing import Optional, Tuple
+from dotenv import load_dotenv
+
+# Load .env before any setting is read so values are available at import time.
+load_dotenv()
+
+
+def _int_env(name: str, default: int) -> int:
+    value = os.getenv(name)
+    return int(value) if value not in (None, "") else default
+
+
+def _float_env(name: str, default: Optional[float]) -> Optional[float]:
+    value = os.getenv(name)
+    return float(value) if value not in (None, "") else default
+
+
+def _list_env(name: str) -> Optional[Tuple[str, ...]]:
+    """Comma-separated values; None when unset (use the built-in default), empty when set to ""."""
+    value = os.getenv(name)
+    return tuple(item.strip() for item in value.split(",") if item.strip()) if value is not None else None
+
+
+# --- PDF text extraction cache ---
+PDF_CACHE_MAX_ENTRIES = _int_env("PDF_CACHE_MAX_ENTRIES", 256)
+PDF_CACHE_TTL_SECONDS = _float_env("PDF_CACHE_TTL_SECONDS", 24 * 60 * 60)
+PDF_CACHE_DIR = os.getenv("PDF_CACHE_DIR") or None # Unset disables the on-disk layer
+PDF_CACHE_MAX_DISK_BYTES = _int_env("PDF_CACHE_MAX_DISK_BYTES", 256 * 1024 * 1024)
+
+# --- PDF uploads ---
+PDF_MAX_UPLOAD_BYTES = _int_env("PDF_MAX_UPLOAD_BYTES", 10 * 1024 * 1024)
+PDF_MAX_PAGES = _int_env("PDF_MAX_PAGES", 20) # Longer documents are rejected before text extraction
+PDF_SPOOL_THRESHOLD_BYTES = _int_env("PDF_SPOOL_THRESHOLD_BYTES", 1024 * 1024) # Larger uploads are spooled to a temp file
+# Whole request bodies (the PDF plus form fields) above this are refused before they are parsed.
+REQUEST_MAX_BODY_BYTES = _int_env("REQUEST_MAX_BODY_BYTES", PDF_MAX_UPLOAD_BYTES + 1024 * 1024)
+
+# --- LLM response cache ---
+LLM_CACHE_BACKEND = os.getenv("LLM_CACHE_BACKEND", "memory").lower() # "memory", "sqlite" or "none"
+LLM_CACHE_MAX_ENTRIES = _int_env("LLM_CACHE_MAX_ENTRIES", 512)
+LLM_CACHE_TTL_SECONDS = _float_env("LLM_CACHE_TTL_SECONDS", 6 * 60 * 60)
+LLM_CACHE_PATH = os.getenv("LLM_CACHE_PATH", ".cache/llm_responses.sqlite3")
+
+# --- Blocking work offload ---
+# Threads used to run fitz parsing, WeasyPrint rendering and other blocking calls off the event loop.
+BLOCKING_EXECUTOR_WORKERS = _int_env("BLOCKING_EXECUTOR_WORKERS", min(32, (os.cpu_count() or 1) + 4))
+
+# --- PDF rendering ---
+RENDER_BACKEND = os.getenv("RENDER_BACKEND", "thread").lower() # "thread" or "process"
+RENDER_POOL_WORKERS = _int_env("RENDER_POOL_WORKERS", os.cpu_count() or 1)
+RENDER_QUEUE_SIZE = _int_env("RENDER_QUEUE_SIZE", 16) # Renders allowed to wait beyond the busy workers
+RENDER_TIMEOUT_SECONDS = _float_env("RENDER_TIMEOUT_SECONDS", 60.0)
+RENDER_WARM_UP = os.getenv("RENDER_WARM_UP", "true").lower() not in ("0", "false", "no") # Render a sample resume at startup
+
+# --- Prompt compaction ---
+PROMPT_COMPACTION_ENABLED = os.getenv("PROMPT_COMPACTION_ENABLED", "true").lower() not in ("0", "false", "no")
+PROMPT_RESUME_TOKEN_BUDGET = _int_env("PROMPT_RESUME_TOKEN_BUDGET", 0) # Opt-in: trailing resume lines past this many tokens are dropped; 0 sends the whole resume
+PROMPT_JOB_DESCRIPTION_TOKEN_BUDGET = _int_env("PROMPT_JOB_DESCRIPTION_TOKEN_BUDGET", 1500)
+
+# --- Optimized resume versions (for section-level re-optimization of edits) ---
+RESUME_VERSION_MAX_ENTRIES = _int_env("RESUME_VERSION_MAX_ENTRIES", 1000)
+RESUME_VERSION_TTL_SECONDS = _float_env("RESUME_VERSION_TTL_SECONDS", 24 * 60 * 60)
+
+# --- Rendered PDFs served by link (combined optimize + suggest endpoint) ---
+RENDERED_PDF_MAX_ENTRIES = _int_env("RENDERED_PDF_MAX_ENTRIES", 200)
+RENDERED_PDF_TTL_SECONDS = _float_env("RENDERED_PDF_TTL_SECONDS", 60 * 60)
+
+# --- Rendered PDF output cache (content-addressed, served from disk) ---
+RENDERED_PDF_CACHE_DIR = os.getenv("RENDERED_PDF_CACHE_DIR", ".cache/rendered_pdfs") # Empty disables the cache
+RENDERED_PDF_CACHE_MAX_BYTES = _int_env("RENDERED_PDF_CACHE_MAX_BYTES", 512 * 1024 * 1024)
+
+# --- Streaming optimization ---
+RESUME_STREAM_SECTION_RETRIES = _int_env("RESUME_STREAM_SECTION_RETRIES", 2) # Regeneration attempts per invalid section
+
+# --- LLM backend ---
+LLM_BACKEND = os.getenv("LLM_BACKEND", "openai").lower() # "openai" or "fake" (canned answers, no API key needed)
+FAKE_LLM_PROFILE = os.getenv("FAKE_LLM_PROFILE", "gpt-4o") # Latency profile of the fake model: "instant", "gpt-4o" or "slow"
+
+# --- Observability ---
+METRICS_ENABLED = os.getenv("METRICS_ENABLED", "true").lower() not in ("0", "false", "no") # Stage histograms served on /metrics
+# Set by run_server.py --production: workers share their metrics through snapshot files here. Empty = this process only.
+METRICS_MULTIPROCESS_DIR = os.getenv("METRICS_MULTIPROCESS_DIR", "")
+METRICS_SNAPSHOT_INTERVAL_SECONDS = _float_env("METRICS_SNAPSHOT_INTERVAL_SECONDS", 5.0)
+SERVER_TIMING_ENABLED = os.getenv("SERVER_TIMING_ENABLED", "false").lower() not in ("0", "false", "no") # Per-request Server-Timing header
+
+# --- Shared HTTP client for the LLM provider ---
+LLM_HTTP_MAX_CONNECTIONS = _int_env("LLM_HTTP_MAX_CONNECTIONS", 20)
+LLM_HTTP_MAX_KEEPALIVE = _int_env("LLM_HTTP_MAX_KEEPALIVE", 10)
+LLM_HTTP_TIMEOUT_SECONDS = _float_env("LLM_HTTP_TIMEOUT_SECONDS", 120.0)
+
+# --- Job scraping ---
+LINKEDIN_BASE_URL = os.getenv("LINKEDIN_BASE_URL", "https://www.linkedin.com")
+SCRAPER_HEADLESS = os.getenv("SCRAPER_HEADLESS", "true").lower() not in ("0", "false", "no")
+BROWSER_POOL_SIZE = _int_env("BROWSER_POOL_SIZE", 2) # 0 launches a fresh browser per search
+LINKEDIN_STORAGE_STATE_PATH = os.getenv("LINKEDIN_STORAGE_STATE_PATH", ".cache/linkedin_storage_state.json")
+SCRAPER_DETAIL_CONCURRENCY = _int_env("SCRAPER_DETAIL_CONCURRENCY", 4) # Tabs used for job detail pages; 1 = click through cards
+SCRAPER_MIN_REQUEST_INTERVAL = _float_env("SCRAPER_MIN_REQUEST_INTERVAL", 0.5) # Seconds between job page loads
+
+# --- Scraper network policy (route interception) ---
+SCRAPER_RESOURCE_POLICY_ENABLED = os.getenv("SCRAPER_RESOURCE_POLICY_ENABLED", "true").lower() not in ("0", "false", "no")
+# Comma-separated; unset uses modules/resource_policy.py's defaults (images, media and fonts; ad/tracking hosts).
+SCRAPER_BLOCKED_RESOURCE_TYPES = _list_env("SCRAPER_BLOCKED_RESOURCE_TYPES")
+SCRAPER_BLOCKED_DOMAINS = _list_env("SCRAPER_BLOCKED_DOMAINS") # "example.com" also matches subdomains; globs allowed
+SCRAPER_ASSET_CACHE_DIR = os.getenv("SCRAPER_ASSET_CACHE_DIR", ".cache/scraper_assets") # Empty disables the static asset cache
+SCRAPER_ASSET_CACHE_MAX_BYTES = _int_env("SCRAPER_ASSET_CACHE_MAX_BYTES", 128 * 1024 * 1024)
+SCRAPER_ASSET_CACHE_TTL_SECONDS = _float_env("SCRAPER_ASSET_CACHE_TTL_SECONDS", 24 * 60 * 60)
+
+# --- Job listing store ---
+JOB_STORE_BACKEND = os.getenv("JOB_STORE_BACKEND", "sqlite").lower() # "sqlite" or "none"
+JOB_STORE_PATH = os.getenv("JOB_STORE_PATH", ".cache/jobs.sqlite3")
+JOB_STORE_TTL_SECONDS = _float_env("JOB_STORE_TTL_SECONDS", 6 * 60 * 60)
+JOB_RANKER_ENABLED = os.getenv("JOB_RANKER_ENABLED", "true").lower() not in ("0", "false", "no") # Local TF-IDF index of stored listings for /api/rank-jobs
+
+# --- Background optimization tasks ---
+TASK_WORKERS = _int_env("TASK_WORKERS", 4)
+TASK_QUEUE_SIZE = _int_env("TASK_QUEUE_SIZE", 100)
+TASK_MAX_STORED = _int_env("TASK_MAX_STORED", 1000) # Oldest tasks and their artifacts are dropped beyond this
+TASK_CALLBACK_ALLOWED_HOSTS = _list_env("TASK_CALLBACK_ALLOWED_HOSTS") or () # Callback hosts allowed to resolve to private/loopback addresses
+
+# --- Batch optimization ---
+BATCH_MAX_ITEMS = _int_env("BATCH_MAX_ITEMS", 50)
+BATCH_LLM_CONCURRENCY = _int_env("BATCH_LLM_CONCURRENCY", 4) # Simultaneous LLM calls per batch
+BATCH_RENDER_CONCURRENCY = _int_env("BATCH_RENDER_CONCURRENCY", os.cpu_count() or 1)
+BATCH_RATE_LIMIT_RETRIES = _int_env("BATCH_RATE_LIMIT_RETRIES", 4)
+BATCH_RATE_LIMIT_BACKOFF_SECONDS = _float_env("BATCH_RATE_LIMIT_BACKOFF_SECONDS", 2.0) # Doubles on every retry
+BATCH_MIN_KEYWORD_COVERAGE = _float_env("BATCH_MIN_KEYWORD_COVERAGE", 0.0) # Jobs matching fewer keywords are skipped without an LLM call
+
+# --- Start-up ---
+# When the backends (LangChain, PyMuPDF, WeasyPrint, Playwright) are imported and built: "eager"
+# before the server accepts requests, "background" right after it does, "lazy" on first use.
+SERVICES_WARM_UP = os.getenv("SERVICES_WARM_UP", "eager").lower()
+
+# --- Server (run_server.py) ---
+SERVER_HOST = os.getenv("SERVER_HOST", "127.0.0.1")
+SERVER_PORT = _int_env("SERVER_PORT", 8000)
+SERVER_WORKERS = _int_env("SERVER_WORKERS", os.cpu_count() or 1) # Worker processes in --production mode
+SERVER_GRACEFUL_TIMEOUT_SECONDS = _float_env("SERVER_GRACEFUL_TIMEOUT_SECONDS", 30.0) # In-flight requests get this long to finish on shutdown
+
+# --- Cross-process shared state ---
+# SQLite file (WAL mode) holding the extraction, LLM, resume version and rendered-PDF caches
+# plus the task store, so every worker process sees the others' results. Empty keeps them
+# per process. --production defaults it to .cache/shared.sqlite3.
+SHARED_CACHE_PATH = os.getenv("SHARED_CACHE_PATH", "")
@@ -0,0 +1,216 @@
+import asyncio
+import difflib
+import hashlib
+import re
+from typing import Any, Dict, List, Optional, Tuple
+from pydantic import BaseModel
+from app.schemas import ATSFriendlyResume
+from modules.interfaces.cache import ICache
+from modules.interfaces.resume_optimizer import IResumeOptimizer
+from modules.resume_sections import ITEM_SECTIONS
+
+# Entry fields used to find where each optimized entry came from in the source text.
+ANCHOR_FIELDS = {
+    "experience": ("company", "title"),
+    "volunteer_experience": ("company", "title"),
+    "projects": ("name",),
+    "education": ("institution", "degree"),
+}
+
+_SECTION_HEADING_RE = re.compile(
+    r"^(professional |work )?(summary|profile|objective|experience|employment|education|projects?|skills|"
+    r"technical skills|certifications?|awards|volunteer( experience)?|languages|interests|extracted urls)\s*:?$",
+    re.IGNORECASE,
+)
+
+
+def _normalize_line(line: str) -> str:
+    return re.sub(r"\s+", " ", line).strip().lower()
+
+
+def source_lines(text: str) -> List[str]:
+    """Non-empty, whitespace-normalized lines; blank lines and spacing never count as edits."""
+    return [normalized for normalized in (_normalize_line(line) for line in text.splitlines()) if normalized]
+
+
+def resume_version_id(resume_text: str, job_description: str) -> str:
+    """Content hash identifying one (resume text, job description) pair."""
+    material = "\n".join(source_lines(resume_text)) + "\0" + _normalize_line(job_description)
+    return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+
+class ResumeVersion(BaseModel):
+    resume_text: str
+    job_description: str
+    resume: ATSFriendlyResume
+
+
+class RevisionPlan(BaseModel):
+    """Which optimized entries must be regenerated, with the source text each now comes from."""
+    changed: List[Tuple[str, int, str]] # (section, entry index, new source text)
+    reused: int
+
+
+def _heading_section(line: str) -> Optional[str]:
+    """The ANCHOR_FIELDS section a heading line opens, "" for any other heading, None for a non-heading."""
+    match = _SECTION_HEADING_RE.match(line)
+    if match is None:
+        return None
+    name = match.group(2)
+    if name.startswith("volunteer"):
+        return "volunteer_experience"
+    if name in ("experience", "employment"):
+        return "experience"
+    if name.startswith("project"):
+        return "projects"
+    return "education" if name == "education" else ""
+
+
+def _section_lines(lines: List[str]) -> Dict[str, List[int]]:
+    """Line indexes under each list section's heading(s), up to the next heading."""
+    by_section: Dict[str, List[int]] = {section: [] for section in ANCHOR_FIELDS}
+    current = ""
+    for position, line in enumerate(lines):
+        heading = _heading_section(line)
+        if heading is not None:
+            current = heading
+        elif current:
+            by_section[current].append(position)
+    return by_section
+
+
+def _find_anchors(lines: List[str], resume: ATSFriendlyResume) -> Optional[Dict[int, Tuple[str, int]]]:
+    """
+    Maps source line index -> (section, entry index). Each entry is looked up only under its
+    own section's heading, so a summary naming the employer is never taken for an entry.
+    None when some entry cannot be located, or matches more than one line.
+    """
+    anchors: Dict[int, Tuple[str, int]] = {}
+    section_lines = _section_lines(lines)
+    for section, anchor_fields in ANCHOR_FIELDS.items():
+        for index, entry in enumerate(getattr(resume, section) or []):
+            values = [_normalize_line(getattr(entry, field) or "") for field in anchor_fields]
+            values = [value for value in values if value]
+            # Prefer a line naming every anchor field (e.g. company and title), then the first field alone.
+            candidates = [values, values[:1]] if values else []
+            matches: List[int] = []
+            for wanted in candidates:
+                matches = [
+                    position for position in section_lines[section]
+                    if position not in anchors and all(value in lines[position] for value in wanted)
+                ]
+                if matches:
+                    break
+            if len(matches) != 1:
+                return None
+            anchors[matches[0]] = (section, index)
+    return anchors
+
+
+def _map_line(opcodes, position: int) -> int:
+    """Maps a line index in the old text to the new text; lines inserted before it stay with the previous region."""
+    for tag, i1, i2, j1, j2 in opcodes:
+        if tag == "insert" and i1 == position:
+            continue
+        if i1 <= position < i2:
+            return j1 + (position - i1) if tag == "equal" else j1
+    return opcodes[-1][4] if opcodes else 0
+
+
+def plan_revision(previous: ResumeVersion, resume_text: str) -> Optional[RevisionPlan]:
+    """
+    Diffs the new resume text against the text behind `previous` and works out which
+    list entries (experience, projects, ...) changed. Returns None when the edit touches
+    anything that cannot be pinned to a single entry (header, summary, skills, a moved
+    heading, an entry we cannot locate), in which case the whole resume is re-optimized.
+    """
+    old_lines = source_lines(previous.resume_text)
+    # The original casing is what gets sent to the model for changed entries.
+    new_original_lines = [line.strip() for line in resume_text.splitlines() if line.strip()]
+    new_lines = [_normalize_line(line) for line in new_original_lines]
+    anchors = _find_anchors(old_lines, previous.resume)
+    if anchors is None:
+        return None
+
+    headings = {index for index, line in enumerate(old_lines) if _SECTION_HEADING_RE.match(line)}
+    boundaries = sorted({0, len(old_lines)} | set(anchors) | headings)
+    opcodes = difflib.SequenceMatcher(a=old_lines, b=new_lines, autojunk=False).get_opcodes()
+
+    changed: List[Tuple[str, int, str]] = []
+    for start, end in zip(boundaries, boundaries[1:]):
+        new_start, new_end = _map_line(opcodes, start), _map_line(opcodes, end)
+        if old_lines[start:end] == new_lines[new_start:new_end]:
+            continue
+        if start not in anchors:
+            return None
+        section, index = anchors[start]
+        if section not in ITEM_SECTIONS:
+            return None # No section-level prompt for it
+        changed.append((section, index, "\n".join(new_original_lines[new_start:new_end])))
+    return RevisionPlan(changed=changed, reused=len(anchors) - len(changed))
+
+
+class IncrementalResumeOptimizer:
+    """
+    Remembers each optimized resume by content hash so iterative edits only pay for the
+    entries that changed. Unchanged entries, and every non-list section, are reused verbatim.
+    """
+    KEY_PREFIX = "resume-version:"
+
+    def __init__(self, resume_optimizer: IResumeOptimizer, version_store: ICache):
+        self.resume_optimizer = resume_optimizer
+        self.version_store = version_store
+
+    def get_version(self, version_id: str) -> Optional[ResumeVersion]:
+        return self.version_store.get(self.KEY_PREFIX + version_id)
+
+    async def _reoptimize_entries(self, previous: ResumeVersion, plan: RevisionPlan, job_description: str, use_cache: bool) -> ATSFriendlyResume:
+        async def reoptimize(section: str, index: int, source_text: str):
+            previous_entry = getattr(previous.resume, section)[index]
+            return await self.resume_optimizer.aoptimize_section(
+                section, source_text, job_description, [previous_entry], use_cache=use_cache
+            )
+
+        replacements = await asyncio.gather(*(reoptimize(*change) for change in plan.changed))
+        updated: Dict[str, Any] = {}
+        for (section, index, _), entries in zip(plan.changed, replacements):
+            updated.setdefault(section, {})[index] = entries
+
+        resume_data = previous.resume.model_dump()
+        for section, by_index in updated.items():
+            merged = []
+            for index, entry in enumerate(getattr(previous.resume, section)):
+                merged.extend(by_index.get(index, [entry]))
+            resume_data[section] = merged
+        return ATSFriendlyResume.model_validate(resume_data)
+
+    async def optimize(self, resume_text: str, job_description: str, previous_version: Optional[str] = None, use_cache: bool = True):
+        """Returns (resume, version_id, report) where report["mode"] is "unchanged", "incremental" or "full"."""
+        version_id = resume_version_id(resume_text, job_description)
+        stored = self.get_version(version_id) if use_cache else None
+        if stored is not None:
+            return stored.resume, version_id, {"mode": "unchanged", "reoptimized": [], "reused": None}
+
+        report: Dict[str, Any] = {"mode": "full", "reoptimized": [], "reused": None}
+        resume = None
+        previous = self.get_version(previous_version) if previous_version else None
+        if previous is not None and not self.resume_optimizer.supports_section_optimization:
+            print("Resume optimizer has no section-level support; re-optimizing the whole resume.")
+        elif previous is not None and _normalize_line(previous.job_description) == _normalize_line(job_description):
+            plan = plan_revision(previous, resume_text)
+            if plan is not None:
+                resume = await self._reoptimize_entries(previous, plan, job_description, use_cache)
+                report = {
+                    "mode": "incremental",
+                    "reoptimized": [f"{section}[{index}]" for section, index, _ in plan.changed],
+                    "reused": plan.reused,
+                }
+
+        if resume is None:
+            resume = await self.resume_optimizer.aoptimize_resume(resume_text, job_description, use_cache=use_cache)
+
+        self.version_store.set(
+            self.KEY_PREFIX + version_id,
+            ResumeVersion(resume_text=resume_text, job_description=job_description, resume=resume),
+        )
+        return resume, version_id, report
@@ -1,21 +1,79 @@
+import asyncio
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
+from fastapi.responses import PlainTextResponse
 from fastapi.staticfiles import StaticFiles
+from app import config
 from app.api import resume, jobs
+from app.server_timing import ServerTimingMiddleware
+from app.uploads import RequestBodyLimitMiddleware
+from app.services import services
 from dotenv import load_dotenv
+from modules import metrics
+from modules.executors import configure_blocking_executor, run_blocking, shutdown_blocking_executor
 
 
 load_dotenv()
+metrics.configure(enabled=config.METRICS_ENABLED)
+
+async def _write_metrics_snapshots():
+    while True:
+        await asyncio.sleep(config.METRICS_SNAPSHOT_INTERVAL_SECONDS)
+        try:
+            await run_blocking(metrics.write_snapshot, config.METRICS_MULTIPROCESS_DIR)
+        except Exception as e:
+            print(f"Could not write metrics snapshot: {e}")
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Blocking pipeline stages (PDF parsing, rendering) run on this bounded pool.
+    configure_blocking_executor(config.BLOCKING_EXECUTOR_WORKERS)
+    # Build the LLM client, caches and renderer once for the whole application lifetime.
+    await services.startup()
+    snapshot_task = None
+    if config.METRICS_ENABLED and config.METRICS_MULTIPROCESS_DIR:
+        snapshot_task = asyncio.create_task(_write_metrics_snapshots())
+    yield
+    if snapshot_task is not None:
+        snapshot_task.cancel()
+        await asyncio.gather(snapshot_task, return_exceptions=True)
+        metrics.write_snapshot(config.METRICS_MULTIPROCESS_DIR)
+    await services.shutdown()
+    shutdown_blocking_executor()
 
 app = FastAPI(
     title="AutoApply.AI Backend",
     description="API for personalized AI Job Hunter & Applier",
     version="0.0.1",
+    lifespan=lifespan,
 )
 
+app.add_middleware(RequestBodyLimitMiddleware, max_body_bytes=config.REQUEST_MAX_BODY_BYTES)
+if config.SERVER_TIMING_ENABLED:
+    app.add_middleware(ServerTimingMiddleware)
+
 app.mount("/static", StaticFiles(directory="static"), name="static")
 app.include_router(resume.router, prefix="/api", tags=["Resume Optimization"])
 app.include_router(jobs.router, prefix="/api", tags=["Job Search"])
 
 @app.get("/")
 async def root():
-    return {"message": "Welcome to AutoApply.AI API. Visit /docs for API documentation."}
\ No newline at end of file
+    return {"message": "Welcome to AutoApply.AI API. Visit /docs for API documentation."}
+
+@app.get("/health")
+async def health():
+    """Liveness plus whether the backends have been warmed up (see SERVICES_WARM_UP)."""
+    return {"status": "ok", "warmed_up": services.warmed_up}
+
+@app.get("/metrics", response_class=PlainTextResponse, include_in_schema=False)
+async def prometheus_metrics():
+    """
+    Stage timing histograms and LLM token counters in the Prometheus text format. With several
+    workers (METRICS_MULTIPROCESS_DIR) these are the totals across all of them, other workers'
+    numbers being at most METRICS_SNAPSHOT_INTERVAL_SECONDS old.
+    """
+    if config.METRICS_MULTIPROCESS_DIR:
+        text = await run_blocking(metrics.render_all, config.METRICS_MULTIPROCESS_DIR)
+    else:
+        text = metrics.registry.render()
+    return PlainTextResponse(text, media_type="text/plain; version=0.0.4; charset=utf-8")
@@ -0,0 +1,237 @@
+import ipaddress
+import os
+import socket
+import time
+import uuid
+from io import BytesIO
+from urllib.parse import urlsplit
+from typing import Any, Callable, Dict, Optional, Sequence, Set
+import httpx
+from app.schemas import OptimizationTask
+from modules.executors import run_blocking
+from modules.interfaces.document_generator import IDocumentGenerator
+from modules.interfaces.pdf_processor import IPDFProcessor
+from modules.interfaces.resume_optimizer import IResumeOptimizer
+from modules.interfaces.task_queue import ITaskQueue
+from modules.interfaces.task_store import ITaskStore
+from modules.resource_policy import domain_matches
+
+# Artifact names, in pipeline order
+UPLOAD_ARTIFACT = "upload"
+RESUME_TEXT_ARTIFACT = "resume_text"
+OPTIMIZED_RESUME_ARTIFACT = "optimized_resume"
+PDF_ARTIFACT = "pdf"
+
+TERMINAL_STATUSES = ("completed", "failed")
+UNFINISHED_STATUSES = ("queued", "extracting", "optimizing", "rendering")
+INTERRUPTED_ERROR = "Interrupted before it finished (server restart or worker exit); retry it."
+
+
+def validate_callback_url(callback_url: str, allowed_hosts: Sequence[str] = ()) -> None:
+    """
+    Raises ValueError unless the callback is an absolute http(s) URL whose host resolves only
+    to public addresses, so a client cannot make the server call loopback, link-local (cloud
+    metadata), private or reserved hosts. Hosts in `allowed_hosts` (subdomains and globs match
+    as in modules.resource_policy.domain_matches) skip the address check. Blocking: resolves DNS.
+    """
+    parts = urlsplit(callback_url)
+    if parts.scheme not in ("http", "https") or not parts.hostname:
+        raise ValueError("callback_url must be an absolute http:// or https:// URL.")
+    host = parts.hostname
+    if any(domain_matches(host, pattern) for pattern in allowed_hosts):
+        return
+    try:
+        addresses = {info[4][0] for info in socket.getaddrinfo(host, parts.port, type=socket.SOCK_STREAM)}
+    except (socket.gaierror, UnicodeError):
+        raise ValueError(f"callback_url host {host!r} could not be resolved.")
+    for address in addresses:
+        ip = ipaddress.ip_address(address.split("%", 1)[0])
+        if not ip.is_global or ip.is_multicast:
+            raise ValueError("callback_url must not point at a loopback, private, link-local or reserved address.")
+
+
+def _process_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        pass # Exists, owned by another user
+    return True
+
+
+class OptimizationTaskManager:
+    """
+    Runs the resume pipeline (extract -> optimize -> render) as background tasks.
+
+    Each stage stores its output as an artifact before the next one starts, so retrying a
+    failed task resumes after the last completed stage; a failed render never calls the
+    LLM again. When a task finishes, the server itself POSTs the task status to the optional
+    callback URL. That is an outbound request on the client's behalf, so only http(s) URLs
+    resolving to public addresses (or hosts in `callback_allowed_hosts`) are accepted, and
+    the host is checked again right before the POST; redirects are not followed.
+
+    A task whose worker goes away (stop(), a crash, a restart) would otherwise stay in its
+    last stage forever. stop() marks the tasks it abandons as failed, and start() does the
+    same for unfinished tasks left by a process that no longer exists, so all of them can
+    be retried.
+    """
+    def __init__(
+        self,
+        queue: ITaskQueue,
+        store: ITaskStore,
+        pdf_processor: Callable[[], IPDFProcessor],
+        resume_optimizer: Callable[[], IResumeOptimizer],
+        document_generator: Callable[[], IDocumentGenerator],
+        http_client: Optional[Callable[[], httpx.AsyncClient]] = None,
+        callback_allowed_hosts: Sequence[str] = (),
+    ):
+        self.queue = queue
+        self.store = store
+        # Providers rather than instances so the manager always uses the current services.
+        self._pdf_processor = pdf_processor
+        self._resume_optimizer = resume_optimizer
+        self._document_generator = document_generator
+        self._http_client = http_client
+        self.callback_allowed_hosts = tuple(callback_allowed_hosts)
+        self._started = False
+        # Tasks this process queued that have not finished yet.
+        self._unfinished: Set[str] = set()
+
+    async def start(self) -> None:
+        if not self._started:
+            await self.queue.start(self.run_task)
+            self._started = True
+            self._fail_orphaned_tasks()
+
+    async def stop(self) -> None:
+        if self._started:
+            await self.queue.stop()
+            self._started = False
+        for task_id in list(self._unfinished):
+            self._fail_interrupted(self.store.get_task(task_id))
+        self._unfinished.clear()
+
+    def _fail_orphaned_tasks(self) -> None:
+        """Fails unfinished tasks whose process is gone; their queue entries went with it."""
+        for task in self.store.list_tasks(UNFINISHED_STATUSES):
+            if task.task_id in self._unfinished:
+                continue
+            # The same pid as this process means a previous run (e.g. a restarted container).
+            if task.worker_pid is None or task.worker_pid == os.getpid() or not _process_alive(task.worker_pid):
+                self._fail_interrupted(task)
+
+    def _fail_interrupted(self, task: Optional[OptimizationTask]) -> None:
+        if task is not None and task.status not in TERMINAL_STATUSES:
+            print(f"Optimization task {task.task_id} was interrupted during {task.status}; marking it failed.")
+            self._update(task, status="failed", error=INTERRUPTED_ERROR)
+
+    async def check_callback_url(self, callback_url: str) -> None:
+        """validate_callback_url with this manager's allow-list, off the event loop."""
+        await run_blocking(validate_callback_url, callback_url, self.callback_allowed_hosts)
+
+    def _update(self, task: OptimizationTask, **changes: Any) -> OptimizationTask:
+        changes["updated_at"] = time.time()
+        changes["artifacts"] = self.store.list_artifacts(task.task_id)
+        task = task.model_copy(update=changes)
+        self.store.save_task(task)
+        return task
+
+    async def submit(self, pdf_content: bytes, job_description: str, callback_url: Optional[str] = None, use_cache: bool = True) -> OptimizationTask:
+        """Stores the inputs, enqueues the task and returns its initial status."""
+        if callback_url:
+            await self.check_callback_url(callback_url)
+        await self.start()
+        now = time.time()
+        task = OptimizationTask(
+            task_id=uuid.uuid4().hex, created_at=now, updated_at=now, callback_url=callback_url, worker_pid=os.getpid()
+        )
+        self.store.save_task(task)
+        self.store.put_artifact(task.task_id, UPLOAD_ARTIFACT, {
+            "pdf_content": pdf_content,
+            "job_description": job_description,
+            "use_cache": use_cache,
+        })
+        try:
+            await self.queue.enqueue(task.task_id)
+        except Exception:
+            self._update(task, status="failed", error="Task queue is full.")
+            raise
+        self._unfinished.add(task.task_id)
+        return self._update(task)
+
+    async def retry(self, task_id: str) -> Optional[OptimizationTask]:
+        """Re-enqueues a failed task; it resumes from its stored artifacts."""
+        task = self.store.get_task(task_id)
+        if task is None:
+            return None
+        if task.status != "failed":
+            raise ValueError(f"Only failed tasks can be retried (task is {task.status}).")
+        await self.start()
+        task = self._update(task, status="queued", error=None, worker_pid=os.getpid())
+        try:
+            await self.queue.enqueue(task_id)
+        except Exception:
+            # Leave it failed (and retryable) rather than queued with no worker coming for it.
+            self._update(task, status="failed", error="Task queue is full.")
+            raise
+        self._unfinished.add(task_id)
+        return task
+
+    def get(self, task_id: str) -> Optional[OptimizationTask]:
+        return self.store.get_task(task_id)
+
+    def get_pdf(self, task_id: str) -> Optional[bytes]:
+        return self.store.get_artifact(task_id, PDF_ARTIFACT)
+
+    async def run_task(self, task_id: str) -> None:
+        task = self.store.get_task(task_id)
+        if task is None:
+            return
+        task = self._update(task, attempts=task.attempts + 1)
+        upload = self.store.get_artifact(task_id, UPLOAD_ARTIFACT) or {}
+        try:
+            resume_text = self.store.get_artifact(task_id, RESUME_TEXT_ARTIFACT)
+            if resume_text is None:
+                task = self._update(task, status="extracting")
+                resume_text = await self._pdf_processor().aextract_text(BytesIO(upload["pdf_content"]))
+                if not resume_text:
+                    raise ValueError("Could not extract text from PDF. Please ensure it's a readable PDF.")
+                self.store.put_artifact(task_id, RESUME_TEXT_ARTIFACT, resume_text)
+
+            optimized_resume = self.store.get_artifact(task_id, OPTIMIZED_RESUME_ARTIFACT)
+            if optimized_resume is None:
+                task = self._update(task, status="optimizing")
+                optimized_resume = await self._resume_optimizer().aoptimize_resume(
+                    resume_text, upload["job_description"], use_cache=upload.get("use_cache", True)
+                )
+                self.store.put_artifact(task_id, OPTIMIZED_RESUME_ARTIFACT, optimized_resume)
+
+            if self.store.get_artifact(task_id, PDF_ARTIFACT) is None:
+                task = self._update(task, status="rendering")
+                pdf_buffer = await self._document_generator().agenerate_pdf(optimized_resume)
+                self.store.put_artifact(task_id, PDF_ARTIFACT, pdf_buffer.getvalue())
+
+            # The raw upload is no longer needed once every stage has an artifact.
+            self.store.delete_artifact(task_id, UPLOAD_ARTIFACT)
+            task = self._update(task, status="completed", error=None)
+        except Exception as e:
+            print(f"Optimization task {task_id} failed during {task.status}: {e}")
+            task = self._update(task, status="failed", error=f"{task.status} failed: {str(e)}")
+
+        self._unfinished.discard(task_id)
+        await self._notify(task)
+
+    async def _notify(self, task: OptimizationTask) -> None:
+        if not task.callback_url or self._http_client is None:
+            return
+        try:
+            # The host may resolve differently now than when the task was submitted.
+            await self.check_callback_url(task.callback_url)
+            response = await self._http_client().post(task.callback_url, json=task.model_dump(), timeout=10)
+            response.raise_for_status()
+        except Exception as e:
+            print(f"Callback to {task.callback_url} for task {task.task_id} failed: {e}")
+
+    def stats(self) -> Dict[str, Any]:
+        return self.queue.stats()
@@ -0,0 +1,175 @@
+import os
+import signal
+import socket
+import time
+from typing import Callable, Dict, List, Optional
+import uvicorn
+from uvicorn.importer import import_from_string
+
+
+def bind_socket(host: str, port: int, backlog: int = 2048) -> socket.socket:
+    """Listening socket created once by the supervisor and inherited by every worker."""
+    family = socket.AF_INET6 if ":" in host else socket.AF_INET
+    sock = socket.socket(family, socket.SOCK_STREAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    sock.bind((host, port))
+    sock.listen(backlog)
+    sock.set_inheritable(True)
+    return sock
+
+
+def warm_up_application() -> None:
+    """
+    Builds the read-only state every worker needs before the fork: the heavy backend modules
+    (importing app.main leaves them to the service builders), the compiled resume template and
+    the tokenizer used for prompt budgets.
+    """
+    from app.services import import_backends
+    from modules.implementations.html_pdf_generator import _compiled_template
+    from modules.prompt_compaction import count_tokens
+
+    import_backends()
+    _compiled_template("templates", "resume_template.html")
+    count_tokens("warm up")
+
+
+class PreforkServer:
+    """
+    Runs `workers` uvicorn processes that share one listening socket.
+
+    The supervisor imports the application and runs `warm_up` *before* forking, so module
+    imports, compiled templates and other read-only state are built once and shared with the
+    workers copy-on-write instead of being rebuilt in each one. Per-process services (HTTP
+    clients, SQLite connections, thread pools) are still created by each worker's lifespan.
+
+    What each worker keeps to itself, and how the app copes with it:
+    - Metrics registry: workers write snapshots to METRICS_MULTIPROCESS_DIR and /metrics
+      serves their sum, whichever worker answers the scrape.
+    - Job ranking index: rebuilt from the shared job store at startup and brought up to date
+      with it before every /api/rank-jobs call.
+    - Background task queue (InProcessTaskQueue): a task runs on the worker that accepted it
+      and is not handed to another one. Its status lives in the shared task store, so it can
+      be polled anywhere; if the worker dies, its replacement marks the task failed and it
+      can be retried through any worker.
+
+    SIGTERM/SIGINT drain gracefully: workers stop accepting connections and get
+    `graceful_timeout` seconds to finish in-flight requests and run their lifespan shutdown
+    before being killed. A second signal kills them immediately. Workers that die on their
+    own are replaced.
+
+    POSIX only (needs os.fork); run_server.py falls back to uvicorn's spawn-based workers elsewhere.
+    """
+    RESPAWN_BACKOFF_SECONDS = 1.0
+    POLL_INTERVAL_SECONDS = 0.2
+
+    def __init__(
+        self,
+        app: str,
+        host: str = "127.0.0.1",
+        port: int = 8000,
+        workers: int = 1,
+        graceful_timeout: float = 30.0,
+        warm_up: Optional[Callable[[], None]] = None,
+        log_level: str = "info",
+    ):
+        self.app = app
+        self.host = host
+        self.port = port
+        self.workers = max(1, workers)
+        self.graceful_timeout = graceful_timeout
+        self.warm_up = warm_up
+        self.log_level = log_level
+        self._children: Dict[int, float] = {} # pid -> start time
+        self._stopping = False
+        self._force = False
+
+    def _request_stop(self, signum, frame) -> None:
+        if self._stopping:
+            self._force = True
+        self._stopping = True
+
+    def _spawn(self, asgi_app, sock: socket.socket) -> None:
+        pid = os.fork()
+        if pid:
+            self._children[pid] = time.monotonic()
+            return
+        # Worker: uvicorn installs its own SIGINT/SIGTERM handlers for a graceful shutdown.
+        exit_code = 0
+        try:
+            signal.signal(signal.SIGINT, signal.SIG_DFL)
+            signal.signal(signal.SIGTERM, signal.SIG_DFL)
+            config = uvicorn.Config(
+                asgi_app,
+                lifespan="on",
+                log_level=self.log_level,
+                timeout_graceful_shutdown=int(self.graceful_timeout),
+            )
+            uvicorn.Server(config).run(sockets=[sock])
+        except BaseException as e:
+            print(f"Worker {os.getpid()} crashed: {e}")
+            exit_code = 1
+        finally:
+            os._exit(exit_code)
+
+    def _reap(self) -> List[int]:
+        exited = []
+        while self._children:
+            try:
+                pid, status = os.waitpid(-1, os.WNOHANG)
+            except ChildProcessError:
+                self._children.clear()
+                break
+            if pid == 0:
+                break
+            if pid in self._children:
+                del self._children[pid]
+                exited.append(pid)
+                if not self._stopping:
+                    print(f"Worker {pid} exited with status {os.waitstatus_to_exitcode(status)}; starting a replacement.")
+        return exited
+
+    def _signal_children(self, signum: int) -> None:
+        for pid in list(self._children):
+            try:
+                os.kill(pid, signum)
+            except ProcessLookupError:
+                self._children.pop(pid, None)
+
+    def _drain(self) -> None:
+        print(f"Draining {len(self._children)} workers (up to {self.graceful_timeout:g}s)...")
+        self._signal_children(signal.SIGTERM)
+        # uvicorn's own graceful timeout covers requests; allow a little extra for lifespan shutdown.
+        deadline = time.monotonic() + self.graceful_timeout + 5.0
+        while self._children and not self._force and time.monotonic() < deadline:
+            self._reap()
+            time.sleep(self.POLL_INTERVAL_SECONDS)
+        if self._children:
+            print(f"Killing {len(self._children)} workers that did not stop in time.")
+            self._signal_children(signal.SIGKILL)
+            while self._children:
+                self._reap()
+                time.sleep(self.POLL_INTERVAL_SECONDS)
+
+    def run(self) -> None:
+        sock = bind_socket(self.host, self.port)
+        asgi_app = import_from_string(self.app)
+        if self.warm_up is not None:
+            started = time.perf_counter()
+            self.warm_up()
+            print(f"Pre-fork warm-up finished in {(time.perf_counter() - started) * 1000:.0f} ms.")
+
+        signal.signal(signal.SIGTERM, self._request_stop)
+        signal.signal(signal.SIGINT, self._request_stop)
+        print(f"Serving {self.app} on http://{self.host}:{self.port} with {self.workers} workers (supervisor pid {os.getpid()}).")
+        try:
+            for _ in range(self.workers):
+                self._spawn(asgi_app, sock)
+            while not self._stopping:
+                time.sleep(self.POLL_INTERVAL_SECONDS)
+                self._reap()
+                while len(self._children) < self.workers and not self._stopping:
+                    time.sleep(self.RESPAWN_BACKOFF_SECONDS)
+                    self._spawn(asgi_app, sock)
+            self._drain()
+        finally:
+            sock.close()
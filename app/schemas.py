@@ -65,6 +65,31 @@ class ResumeSuggestions(BaseModel):
         [], description="Actionable suggestions for the user to further improve their resume based on ATS best practices and job description matching."
     )
 
+class ResumeWithSuggestions(BaseModel):
+    """
+    Optimized resume and improvement suggestions produced together from one extraction.
+    """
+    resume: ATSFriendlyResume
+    suggestions: ResumeSuggestions
+
+class OptimizeAndSuggestResponse(BaseModel):
+    """
+    Response of the combined optimize + suggest endpoint; the PDF is fetched from pdf_url.
+    """
+    resume: ATSFriendlyResume
+    suggestions: List[str]
+    pdf_url: str
+
+class KeywordCoverage(BaseModel):
+    """
+    Deterministic keyword match between a resume and a job description, computed without the LLM.
+    """
+    coverage: float = Field(description="Weighted share of the posting's keywords found in the resume (0-1); known skills count double.")
+    keywords: List[str] = Field(default_factory=list, description="Keywords extracted from the job description, most important first.")
+    matched_keywords: List[str] = Field(default_factory=list)
+    missing_keywords: List[str] = Field(default_factory=list, description="Keywords the resume lacks, most important first.")
+    section_hits: Dict[str, List[str]] = Field(default_factory=dict, description="Matched keywords per resume section.")
+
 class JobListing(BaseModel):
     """
     Schema for a single job listing.
@@ -77,10 +102,32 @@ class JobListing(BaseModel):
     posted_date: Optional[str] = None # e.g., "24 hours ago", "2 days ago"
     salary_range: Optional[str] = None
 
+class RankedJob(BaseModel):
+    """
+    A job listing scored against a resume by the local relevance ranker.
+    """
+    job: JobListing
+    score: float = Field(description="Cosine similarity between the resume and the listing (0-1).")
+    matched_terms: List[str] = Field(default_factory=list, description="Terms shared by the resume and the listing, strongest first.")
+
 class JobSearchCriteria(BaseModel):
     """
     Schema for input criteria for job search.
     """
     keywords: str = Field(..., description="Job titles, skills, or keywords (e.g., 'Software Engineer, Python').")
     location: Optional[str] = Field(None, description="Geographic location (e.g., 'New York, NY', 'Remote').")
-    # Add more criteria as needed, e.g., 'salary_min', 'job_type', 'experience_level'
\ No newline at end of file
+    # Add more criteria as needed, e.g., 'salary_min', 'job_type', 'experience_level'
+
+class OptimizationTask(BaseModel):
+    """
+    Status of a background resume optimization task (extract -> optimize -> render).
+    """
+    task_id: str
+    status: str = Field("queued", description="One of: queued, extracting, optimizing, rendering, completed, failed.")
+    error: Optional[str] = None
+    created_at: float
+    updated_at: float
+    callback_url: Optional[str] = Field(None, description="http(s) URL the server POSTs this status to when the task finishes.")
+    artifacts: List[str] = Field([], description="Intermediate results already stored (resume_text, optimized_resume, pdf).")
+    attempts: int = 0
+    worker_pid: Optional[int] = Field(None, description="Server process that queued the task; unfinished tasks of a process that exited are marked failed.")
@@ -0,0 +1,26 @@
+from modules import metrics
+
+
+class ServerTimingMiddleware:
+    """
+    Collects the stage spans recorded while handling each HTTP request and reports them in
+    a `Server-Timing` response header (visible in the browser's network panel). Spans that
+    finish after the response has started, e.g. inside a streamed body, are not included.
+    """
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        with metrics.collect_spans() as spans:
+            async def send_with_timing(message):
+                if message["type"] == "http.response.start" and spans:
+                    headers = list(message.get("headers", []))
+                    headers.append((b"server-timing", metrics.server_timing_header(spans).encode("latin-1")))
+                    message = {**message, "headers": headers}
+                await send(message)
+
+            await self.app(scope, receive, send_with_timing)
@@ -0,0 +1,424 @@
+import asyncio
+import importlib
+import threading
+import time
+from typing import TYPE_CHECKING, Any, Optional
+import httpx
+from app import config
+from app.optimization_tasks import OptimizationTaskManager
+from modules.implementations.memory_cache import InMemoryLRUCache
+from modules.implementations.disk_cache import DiskCache
+from modules.implementations.tiered_cache import TieredCache
+from modules.implementations.sqlite_cache import SQLiteCache
+from modules.implementations.caching_pdf_generator import CachingPdfGenerator
+from modules.implementations.sqlite_job_store import SQLiteJobStore
+from modules.implementations.indexing_job_store import IndexingJobStore
+from modules.implementations.in_process_task_queue import InProcessTaskQueue
+from modules.implementations.in_memory_task_store import InMemoryTaskStore
+from modules.implementations.sqlite_task_store import SQLiteTaskStore
+from modules.interfaces.cache import ICache
+from modules.interfaces.pdf_processor import IPDFProcessor
+from modules.interfaces.resume_optimizer import IResumeOptimizer
+from modules.interfaces.document_generator import IDocumentGenerator
+from modules.interfaces.job_scraper import IJobScraper
+from modules.interfaces.job_store import IJobStore
+from modules.interfaces.job_ranker import IJobRanker
+from modules.executors import run_blocking
+from modules.prompt_compaction import PromptCompactor
+from modules.rendered_pdf_cache import RenderedPdfCache
+from modules.resource_policy import ResourcePolicy
+
+if TYPE_CHECKING:
+    from modules.implementations.fake_chat_model import FakeResumeChatModel
+    from modules.implementations.playwright_browser_pool import PlaywrightBrowserPool
+
+# Implementations that pull in LangChain/OpenAI, PyMuPDF, WeasyPrint, Playwright or NumPy.
+# The service builders import them on first use so `import app.main` stays cheap.
+BACKEND_MODULES = (
+    "modules.implementations.langchain_resume_optimizer",
+    "modules.implementations.fake_chat_model",
+    "modules.implementations.pypdf_processor",
+    "modules.implementations.html_pdf_generator",
+    "modules.implementations.process_pool_pdf_generator",
+    "modules.implementations.playwright_browser_pool",
+    "modules.implementations.playwright_job_scraper",
+    "modules.implementations.tfidf_job_ranker",
+)
+
+
+def import_backends() -> None:
+    """Imports every heavy backend module up front (used by warm-ups, including the pre-fork one)."""
+    for module_name in BACKEND_MODULES:
+        importlib.import_module(module_name)
+
+def with_shared_layer(memory_cache: ICache, table: str, max_entries: int, ttl_seconds: Optional[float]) -> ICache:
+    """
+    Puts a table of the SHARED_CACHE_PATH database behind a process-local cache, so a result
+    computed by one server worker is a hit in every other. Returns the local cache unchanged
+    when no shared path is configured.
+    """
+    if not config.SHARED_CACHE_PATH:
+        return memory_cache
+    shared_cache = SQLiteCache(config.SHARED_CACHE_PATH, max_entries=max_entries, ttl_seconds=ttl_seconds, table=table)
+    if isinstance(memory_cache, TieredCache):
+        return TieredCache([*memory_cache.layers, shared_cache])
+    return TieredCache([memory_cache, shared_cache])
+
+
+def build_pdf_text_cache() -> ICache:
+    """Builds the extraction cache: in-memory LRU, optionally backed by disk and the shared database."""
+    cache: ICache = InMemoryLRUCache(max_entries=config.PDF_CACHE_MAX_ENTRIES, ttl_seconds=config.PDF_CACHE_TTL_SECONDS)
+    if config.PDF_CACHE_DIR:
+        disk_cache = DiskCache(config.PDF_CACHE_DIR, max_bytes=config.PDF_CACHE_MAX_DISK_BYTES, ttl_seconds=config.PDF_CACHE_TTL_SECONDS)
+        cache = TieredCache([cache, disk_cache])
+    return with_shared_layer(cache, "pdf_text", config.PDF_CACHE_MAX_ENTRIES * 16, config.PDF_CACHE_TTL_SECONDS)
+
+
+def build_llm_response_cache() -> Optional[ICache]:
+    """Builds the LLM response cache selected by LLM_CACHE_BACKEND (None when disabled)."""
+    if config.LLM_CACHE_BACKEND == "none":
+        return None
+    if config.LLM_CACHE_BACKEND == "sqlite":
+        return SQLiteCache(config.LLM_CACHE_PATH, max_entries=config.LLM_CACHE_MAX_ENTRIES, ttl_seconds=config.LLM_CACHE_TTL_SECONDS)
+    memory_cache = InMemoryLRUCache(max_entries=config.LLM_CACHE_MAX_ENTRIES, ttl_seconds=config.LLM_CACHE_TTL_SECONDS)
+    return with_shared_layer(memory_cache, "llm_responses", config.LLM_CACHE_MAX_ENTRIES * 16, config.LLM_CACHE_TTL_SECONDS)
+
+
+def close_cache(cache: Optional[ICache]) -> None:
+    """Closes the SQLite connections held by a cache or any of its tiers."""
+    if isinstance(cache, TieredCache):
+        for layer in cache.layers:
+            close_cache(layer)
+    elif isinstance(cache, SQLiteCache):
+        cache.close()
+
+
+class AppServices:
+    """
+    Application-lifespan container for the expensive, shareable backends.
+
+    Every service is built at most once: by warm_up() (run from the FastAPI lifespan in
+    app/main.py as SERVICES_WARM_UP selects) or lazily on first access, so code paths that
+    never run the lifespan, such as a bare TestClient, still get working singletons. Heavy
+    implementations are imported inside their builders, behind the interface types. Tests can
+    swap any service with app.dependency_overrides on the router's provider functions.
+    """
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._instances: dict = {}
+        self._warm_up_task: Optional[asyncio.Task] = None
+        self.warmed_up = False
+
+    def _get_or_create(self, name: str, factory) -> Any:
+        with self._lock:
+            if name not in self._instances:
+                self._instances[name] = factory()
+            return self._instances[name]
+
+    # --- Shared HTTP clients ---
+    def _http_limits(self) -> httpx.Limits:
+        return httpx.Limits(
+            max_connections=config.LLM_HTTP_MAX_CONNECTIONS,
+            max_keepalive_connections=config.LLM_HTTP_MAX_KEEPALIVE,
+        )
+
+    @property
+    def http_client(self) -> httpx.Client:
+        return self._get_or_create(
+            "http_client",
+            lambda: httpx.Client(limits=self._http_limits(), timeout=config.LLM_HTTP_TIMEOUT_SECONDS),
+        )
+
+    @property
+    def http_async_client(self) -> httpx.AsyncClient:
+        return self._get_or_create(
+            "http_async_client",
+            lambda: httpx.AsyncClient(limits=self._http_limits(), timeout=config.LLM_HTTP_TIMEOUT_SECONDS),
+        )
+
+    # --- Caches ---
+    @property
+    def pdf_text_cache(self) -> ICache:
+        return self._get_or_create("pdf_text_cache", build_pdf_text_cache)
+
+    @property
+    def llm_response_cache(self) -> Optional[ICache]:
+        return self._get_or_create("llm_response_cache", build_llm_response_cache)
+
+    @property
+    def resume_version_store(self) -> ICache:
+        return self._get_or_create(
+            "resume_version_store",
+            lambda: with_shared_layer(
+                InMemoryLRUCache(max_entries=config.RESUME_VERSION_MAX_ENTRIES, ttl_seconds=config.RESUME_VERSION_TTL_SECONDS),
+                "resume_versions", config.RESUME_VERSION_MAX_ENTRIES, config.RESUME_VERSION_TTL_SECONDS,
+            ),
+        )
+
+    @property
+    def rendered_pdf_store(self) -> ICache:
+        return self._get_or_create(
+            "rendered_pdf_store",
+            lambda: with_shared_layer(
+                InMemoryLRUCache(max_entries=config.RENDERED_PDF_MAX_ENTRIES, ttl_seconds=config.RENDERED_PDF_TTL_SECONDS),
+                "rendered_pdfs", config.RENDERED_PDF_MAX_ENTRIES, config.RENDERED_PDF_TTL_SECONDS,
+            ),
+        )
+
+    @property
+    def prompt_compactor(self) -> Optional[PromptCompactor]:
+        def _build() -> Optional[PromptCompactor]:
+            if not config.PROMPT_COMPACTION_ENABLED:
+                return None
+            return PromptCompactor(
+                resume_token_budget=config.PROMPT_RESUME_TOKEN_BUDGET,
+                job_description_token_budget=config.PROMPT_JOB_DESCRIPTION_TOKEN_BUDGET,
+            )
+        return self._get_or_create("prompt_compactor", _build)
+
+    # --- Pipeline backends ---
+    @property
+    def chat_model(self) -> Optional["FakeResumeChatModel"]:
+        """The fake chat model when LLM_BACKEND=fake; None lets the optimizer build gpt-4o."""
+        def _build():
+            if config.LLM_BACKEND != "fake":
+                return None
+            from modules.implementations.fake_chat_model import FakeResumeChatModel, LATENCY_PROFILES
+
+            return FakeResumeChatModel(profile=LATENCY_PROFILES[config.FAKE_LLM_PROFILE])
+        return self._get_or_create("chat_model", _build)
+
+    @property
+    def pdf_processor(self) -> IPDFProcessor:
+        def _build() -> IPDFProcessor:
+            from modules.implementations.pypdf_processor import PyPDFProcessor
+
+            return PyPDFProcessor(cache=self.pdf_text_cache, max_pages=config.PDF_MAX_PAGES)
+        return self._get_or_create("pdf_processor", _build)
+
+    @property
+    def resume_optimizer(self) -> IResumeOptimizer:
+        def _build() -> IResumeOptimizer:
+            from modules.implementations.langchain_resume_optimizer import LangChainResumeOptimizer
+
+            return LangChainResumeOptimizer(
+                cache=self.llm_response_cache,
+                http_client=self.http_client,
+                http_async_client=self.http_async_client,
+                compactor=self.prompt_compactor,
+                section_retries=config.RESUME_STREAM_SECTION_RETRIES,
+                llm=self.chat_model,
+            )
+        return self._get_or_create("resume_optimizer", _build)
+
+    @property
+    def rendered_pdf_cache(self) -> Optional[RenderedPdfCache]:
+        def _build() -> Optional[RenderedPdfCache]:
+            if not config.RENDERED_PDF_CACHE_DIR:
+                return None
+            return RenderedPdfCache(config.RENDERED_PDF_CACHE_DIR, max_bytes=config.RENDERED_PDF_CACHE_MAX_BYTES)
+        return self._get_or_create("rendered_pdf_cache", _build)
+
+    @property
+    def document_generator(self) -> IDocumentGenerator:
+        def _build() -> IDocumentGenerator:
+            if config.RENDER_BACKEND == "process":
+                from modules.implementations.process_pool_pdf_generator import ProcessPoolPdfGenerator
+
+                generator: IDocumentGenerator = ProcessPoolPdfGenerator(
+                    template_dir="templates",
+                    max_workers=config.RENDER_POOL_WORKERS,
+                    max_queue_size=config.RENDER_QUEUE_SIZE,
+                    render_timeout_seconds=config.RENDER_TIMEOUT_SECONDS,
+                )
+            else:
+                from modules.implementations.html_pdf_generator import HtmlPdfGenerator
+
+                generator = HtmlPdfGenerator(template_dir="templates")
+            # Identical resumes (re-downloads, replayed LLM output) are served from the rendered-PDF cache.
+            if self.rendered_pdf_cache is not None:
+                generator = CachingPdfGenerator(generator, self.rendered_pdf_cache)
+            return generator
+        return self._get_or_create("document_generator", _build)
+
+    @property
+    def browser_pool(self) -> Optional["PlaywrightBrowserPool"]:
+        def _build() -> Optional["PlaywrightBrowserPool"]:
+            if config.BROWSER_POOL_SIZE <= 0:
+                return None
+            from modules.implementations.playwright_browser_pool import PlaywrightBrowserPool
+
+            return PlaywrightBrowserPool(
+                size=config.BROWSER_POOL_SIZE,
+                headless=config.SCRAPER_HEADLESS,
+                storage_state_path=config.LINKEDIN_STORAGE_STATE_PATH,
+            )
+        return self._get_or_create("browser_pool", _build)
+
+    @property
+    def scraper_resource_policy(self) -> Optional[ResourcePolicy]:
+        def _build() -> Optional[ResourcePolicy]:
+            if not config.SCRAPER_RESOURCE_POLICY_ENABLED:
+                return None
+            asset_cache = None
+            if config.SCRAPER_ASSET_CACHE_DIR:
+                asset_cache = DiskCache(
+                    config.SCRAPER_ASSET_CACHE_DIR,
+                    max_bytes=config.SCRAPER_ASSET_CACHE_MAX_BYTES,
+                    ttl_seconds=config.SCRAPER_ASSET_CACHE_TTL_SECONDS,
+                )
+            return ResourcePolicy(
+                blocked_resource_types=config.SCRAPER_BLOCKED_RESOURCE_TYPES,
+                blocked_domains=config.SCRAPER_BLOCKED_DOMAINS,
+                asset_cache=asset_cache,
+            )
+        return self._get_or_create("scraper_resource_policy", _build)
+
+    @property
+    def job_ranker(self) -> Optional[IJobRanker]:
+        def _build() -> Optional[IJobRanker]:
+            if not config.JOB_RANKER_ENABLED:
+                return None
+            from modules.implementations.tfidf_job_ranker import TfidfJobRanker
+
+            return TfidfJobRanker()
+        return self._get_or_create("job_ranker", _build)
+
+    @property
+    def job_store(self) -> Optional[IJobStore]:
+        def _build() -> Optional[IJobStore]:
+            if config.JOB_STORE_BACKEND == "none":
+                return None
+            store: IJobStore = SQLiteJobStore(config.JOB_STORE_PATH, ttl_seconds=config.JOB_STORE_TTL_SECONDS)
+            # Listings the scraper saves are indexed for /api/rank-jobs as they arrive.
+            if self.job_ranker is not None:
+                store = IndexingJobStore(store, self.job_ranker)
+                try:
+                    indexed = store.load_index()
+                    print(f"Indexed {indexed} stored job listings for ranking.")
+                except Exception as e:
+                    # Not fatal: the index fills up as new searches are scraped.
+                    print(f"Could not index stored job listings: {e}")
+            return store
+        return self._get_or_create("job_store", _build)
+
+    @property
+    def job_scraper(self) -> IJobScraper:
+        def _build() -> IJobScraper:
+            from modules.implementations.playwright_job_scraper import PlaywrightJobScraper
+
+            return PlaywrightJobScraper(
+                browser_pool=self.browser_pool,
+                base_url=config.LINKEDIN_BASE_URL,
+                headless=config.SCRAPER_HEADLESS,
+                detail_concurrency=config.SCRAPER_DETAIL_CONCURRENCY,
+                min_request_interval=config.SCRAPER_MIN_REQUEST_INTERVAL,
+                job_store=self.job_store,
+                resource_policy=self.scraper_resource_policy,
+            )
+        return self._get_or_create("job_scraper", _build)
+
+    @property
+    def task_manager(self) -> OptimizationTaskManager:
+        return self._get_or_create(
+            "task_manager",
+            lambda: OptimizationTaskManager(
+                queue=InProcessTaskQueue(workers=config.TASK_WORKERS, max_queue_size=config.TASK_QUEUE_SIZE),
+                store=(
+                    SQLiteTaskStore(config.SHARED_CACHE_PATH, max_tasks=config.TASK_MAX_STORED)
+                    if config.SHARED_CACHE_PATH else InMemoryTaskStore(max_tasks=config.TASK_MAX_STORED)
+                ),
+                pdf_processor=lambda: self.pdf_processor,
+                resume_optimizer=lambda: self.resume_optimizer,
+                document_generator=lambda: self.document_generator,
+                http_client=lambda: self.http_async_client,
+                callback_allowed_hosts=config.TASK_CALLBACK_ALLOWED_HOSTS,
+            ),
+        )
+
+    # --- Lifecycle ---
+    def _build_backends(self) -> None:
+        self.pdf_processor
+        self.resume_optimizer
+        self.document_generator
+        self.job_scraper
+
+    async def warm_up(self) -> float:
+        """
+        Imports and builds every backend, renders a sample resume and launches the browser pool,
+        so no request pays for them. Safe to call more than once; returns the seconds spent.
+        """
+        started = time.perf_counter()
+        # Off the event loop: in background mode requests are already being served while this runs.
+        await run_blocking(self._build_backends)
+        if config.RENDER_WARM_UP:
+            try:
+                seconds = await run_blocking(self.document_generator.warm_up)
+                print(f"PDF renderer warmed up in {seconds * 1000:.0f} ms.")
+            except Exception as e:
+                # Not fatal: the first render pays the start-up cost instead.
+                print(f"Could not warm up the PDF renderer: {e}")
+        if self.browser_pool is not None:
+            try:
+                await self.browser_pool.start()
+            except Exception as e:
+                # Not fatal: the pool retries the launch on the first search.
+                print(f"Could not pre-warm the browser pool: {e}")
+        self.warmed_up = True
+        return time.perf_counter() - started
+
+    async def _warm_up_in_background(self) -> None:
+        try:
+            seconds = await self.warm_up()
+            print(f"Background warm-up finished in {seconds * 1000:.0f} ms.")
+        except Exception as e:
+            # Not fatal: each backend is built on first use instead.
+            print(f"Background warm-up failed: {e}")
+
+    async def startup(self) -> None:
+        """
+        Starts the task workers and warms the backends as SERVICES_WARM_UP selects: before the
+        server accepts requests ("eager"), in a background task once it does ("background"), or
+        not at all ("lazy"), in which case each backend is imported and built on first use.
+        """
+        await self.task_manager.start()
+        if config.SERVICES_WARM_UP == "eager":
+            await self.warm_up()
+        elif config.SERVICES_WARM_UP == "background":
+            self._warm_up_task = asyncio.create_task(self._warm_up_in_background())
+
+    async def shutdown(self) -> None:
+        """Closes pooled clients and worker pools, then forgets all instances."""
+        warm_up_task, self._warm_up_task = self._warm_up_task, None
+        if warm_up_task is not None and not warm_up_task.done():
+            warm_up_task.cancel()
+            await asyncio.gather(warm_up_task, return_exceptions=True)
+        with self._lock:
+            instances, self._instances = self._instances, {}
+            self.warmed_up = False
+
+        task_manager = instances.get("task_manager")
+        if task_manager is not None:
+            await task_manager.stop()
+            if isinstance(task_manager.store, SQLiteTaskStore):
+                task_manager.store.close()
+        browser_pool = instances.get("browser_pool")
+        if browser_pool is not None:
+            await browser_pool.close()
+        generator = instances.get("document_generator")
+        if generator is not None:
+            generator.close()
+        for name in ("pdf_text_cache", "llm_response_cache", "resume_version_store", "rendered_pdf_store"):
+            close_cache(instances.get(name))
+        job_store = instances.get("job_store")
+        if isinstance(job_store, IndexingJobStore):
+            job_store = job_store.inner
+        if isinstance(job_store, SQLiteJobStore):
+            job_store.close()
+        if "http_client" in instances:
+            instances["http_client"].close()
+        if "http_async_client" in instances:
+            await instances["http_async_client"].aclose()
+
+
+services = AppServices()
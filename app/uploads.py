@@ -0,0 +1,139 @@
+import io
+import os
+import tempfile
+from typing import BinaryIO, Optional
+from fastapi import HTTPException, UploadFile, status
+from fastapi.responses import JSONResponse
+from app import config
+from modules.interfaces.pdf_processor import IPDFProcessor, InvalidPDFError, PDFTooLargeError
+
+UPLOAD_CHUNK_BYTES = 64 * 1024
+
+
+def _upload_too_large(max_bytes: int) -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+        detail=f"The PDF is larger than the {max_bytes / (1024 * 1024):g} MB limit.",
+    )
+
+
+class SpooledPDF:
+    """
+    An uploaded PDF held once: in memory while small, in a named temporary file once it
+    passes the spool threshold (so fitz can open it by path). Call close() when done.
+    """
+    def __init__(self, spool_threshold: int, spool_dir: Optional[str] = None):
+        self.spool_threshold = spool_threshold
+        self.spool_dir = spool_dir
+        self.size = 0
+        self.stream: BinaryIO = io.BytesIO()
+
+    @property
+    def on_disk(self) -> bool:
+        return not isinstance(self.stream, io.BytesIO)
+
+    def write(self, chunk: bytes) -> None:
+        if not self.on_disk and self.size + len(chunk) > self.spool_threshold:
+            spooled = tempfile.NamedTemporaryFile(prefix="upload-", suffix=".pdf", dir=self.spool_dir, delete=False)
+            spooled.write(self.stream.getbuffer())
+            self.stream = spooled
+        self.stream.write(chunk)
+        self.size += len(chunk)
+
+    def finish(self) -> BinaryIO:
+        self.stream.flush()
+        self.stream.seek(0)
+        return self.stream
+
+    def read_bytes(self) -> bytes:
+        if isinstance(self.stream, io.BytesIO):
+            return self.stream.getvalue()
+        self.stream.seek(0)
+        return self.stream.read()
+
+    def close(self) -> None:
+        path = getattr(self.stream, "name", None) if self.on_disk else None
+        self.stream.close()
+        if isinstance(path, str):
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+
+
+async def spool_pdf_upload(upload: UploadFile, max_bytes: int, spool_threshold: int, spool_dir: Optional[str] = None) -> SpooledPDF:
+    """
+    Copies an upload chunk by chunk into a SpooledPDF, rejecting it with 413 as soon as it
+    passes max_bytes instead of reading the whole file first.
+    """
+    if upload.size is not None and upload.size > max_bytes:
+        raise _upload_too_large(max_bytes)
+    spooled = SpooledPDF(spool_threshold, spool_dir)
+    try:
+        while chunk := await upload.read(UPLOAD_CHUNK_BYTES):
+            if spooled.size + len(chunk) > max_bytes:
+                raise _upload_too_large(max_bytes)
+            spooled.write(chunk)
+        spooled.finish()
+    except BaseException:
+        spooled.close()
+        raise
+    return spooled
+
+
+async def extract_resume_text(resume_file: UploadFile, pdf_processor: IPDFProcessor) -> str:
+    """
+    Spools the upload (in memory while small, to a temp file past the threshold) within the
+    size limit and extracts its text without copying the document again.
+    """
+    pdf_upload = await spool_pdf_upload(resume_file, config.PDF_MAX_UPLOAD_BYTES, config.PDF_SPOOL_THRESHOLD_BYTES)
+    try:
+        resume_text = await pdf_processor.aextract_text(pdf_upload.stream)
+    except PDFTooLargeError as e:
+        raise HTTPException(status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE, detail=str(e))
+    except InvalidPDFError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    finally:
+        pdf_upload.close()
+    if not resume_text:
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Could not extract text from PDF. Please ensure it's a readable PDF.")
+    return resume_text
+
+
+class RequestBodyLimitMiddleware:
+    """
+    Rejects request bodies larger than max_body_bytes with 413 before the multipart parser
+    spools them: immediately when Content-Length says so, otherwise as soon as the streamed
+    body crosses the limit.
+    """
+    def __init__(self, app, max_body_bytes: int):
+        self.app = app
+        self.max_body_bytes = max_body_bytes
+
+    def _too_large(self) -> HTTPException:
+        return HTTPException(status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE, detail="Request body too large.")
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        content_length = dict(scope.get("headers") or []).get(b"content-length")
+        if content_length is not None and content_length.isdigit() and int(content_length) > self.max_body_bytes:
+            response = JSONResponse({"detail": "Request body too large."}, status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE)
+            await response(scope, receive, send)
+            return
+
+        received = 0
+
+        async def limited_receive():
+            nonlocal received
+            message = await receive()
+            if message["type"] == "http.request":
+                received += len(message.get("body", b""))
+                if received > self.max_body_bytes:
+                    # FastAPI re-raises HTTPExceptions from body parsing, so this becomes a 413 response.
+                    raise self._too_large()
+            return message
+
+        await self.app(scope, limited_receive, send)
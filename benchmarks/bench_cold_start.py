@@ -0,0 +1,166 @@
+"""
+Cold-start benchmark: how long `import app.main` takes, how long a fresh server needs before it
+accepts requests, and how slow its first request is, for each SERVICES_WARM_UP mode:
+
+    python -m benchmarks.bench_cold_start --runs 5 --modes eager background lazy
+
+Import time is measured in fresh interpreters with `-X importtime`; the heaviest packages are
+listed so a dependency creeping back into the import path is easy to spot. Each mode then starts
+a uvicorn process (fake LLM with the "instant" profile, no browser pool, no rendered-PDF cache)
+and reports time until /health answers ("ready"), the latency of the first /api/optimize-resume
+call (extract, LLM, render) and of the second one for comparison.
+
+Every run is appended to a JSONL results file together with the current git commit.
+"""
+import argparse
+import json
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, List, Tuple
+import httpx
+from benchmarks.common import build_resume_pdf, git_commit
+
+DEFAULT_RESULTS_PATH = "benchmarks/results/bench_cold_start.jsonl"
+JOB_DESCRIPTION = "Senior Backend Engineer: Python, FastAPI, Kafka, Kubernetes and production LLM features."
+READY_TIMEOUT_SECONDS = 120.0
+
+
+def measure_import(module: str) -> Tuple[float, Dict[str, float]]:
+    """Seconds to import `module` in a fresh interpreter, plus cumulative seconds per top-level package."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True, text=True, check=True,
+    )
+    total = 0.0
+    packages: Dict[str, float] = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line.split("|", 2)
+        if not cumulative.strip().isdigit():
+            continue # The header line
+        seconds = int(cumulative) / 1e6
+        name = name.strip()
+        if name == module:
+            total = seconds
+        root = name.split(".")[0]
+        packages[root] = max(packages.get(root, 0.0), seconds)
+    packages.pop(module.split(".")[0], None)
+    return total, packages
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def measure_server(mode: str, pdf_bytes: bytes) -> Dict[str, float]:
+    port = free_port()
+    env = dict(
+        os.environ,
+        SERVICES_WARM_UP=mode,
+        LLM_BACKEND="fake",
+        FAKE_LLM_PROFILE="instant",
+        BROWSER_POOL_SIZE="0",
+        RENDERED_PDF_CACHE_DIR="",
+        OPENAI_API_KEY=os.environ.get("OPENAI_API_KEY", "bench"),
+    )
+    started = time.perf_counter()
+    server = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "app.main:app", "--port", str(port), "--log-level", "warning"],
+        env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+    )
+    try:
+        base_url = f"http://127.0.0.1:{port}"
+        with httpx.Client(base_url=base_url, timeout=READY_TIMEOUT_SECONDS) as client:
+            while True:
+                if server.poll() is not None:
+                    raise RuntimeError(f"Server exited with status {server.returncode} while starting in {mode} mode.")
+                if time.perf_counter() - started > READY_TIMEOUT_SECONDS:
+                    raise RuntimeError(f"Server did not become ready within {READY_TIMEOUT_SECONDS:g}s in {mode} mode.")
+                try:
+                    if client.get("/health").status_code == 200:
+                        break
+                except httpx.TransportError:
+                    pass
+                time.sleep(0.01)
+            ready = time.perf_counter() - started
+
+            latencies = []
+            for _ in range(2):
+                request_started = time.perf_counter()
+                response = client.post(
+                    "/api/optimize-resume",
+                    files={"resume_file": ("resume.pdf", pdf_bytes, "application/pdf")},
+                    data={"job_description": JOB_DESCRIPTION, "bypass_cache": "true"},
+                )
+                response.raise_for_status()
+                latencies.append(time.perf_counter() - request_started)
+    finally:
+        server.terminate()
+        server.wait(timeout=30)
+    return {
+        "ready_ms": ready * 1000,
+        "first_request_ms": latencies[0] * 1000,
+        "second_request_ms": latencies[1] * 1000,
+        "first_response_ms": (ready + latencies[0]) * 1000,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=5, help="Fresh interpreters/servers per measurement; medians are reported.")
+    parser.add_argument("--modes", nargs="+", choices=["eager", "background", "lazy"], default=["eager", "background", "lazy"])
+    parser.add_argument("--module", default="app.main", help="Module whose import time is measured.")
+    parser.add_argument("--top", type=int, default=10, help="Heaviest packages to list.")
+    parser.add_argument("--results", default=DEFAULT_RESULTS_PATH, help="JSONL file runs are appended to.")
+    parser.add_argument("--no-save", action="store_true", help="Do not append this run to the results file.")
+    args = parser.parse_args()
+
+    import_runs: List[float] = []
+    package_runs: Dict[str, List[float]] = {}
+    for _ in range(args.runs):
+        total, packages = measure_import(args.module)
+        import_runs.append(total)
+        for name, seconds in packages.items():
+            package_runs.setdefault(name, []).append(seconds)
+    import_ms = statistics.median(import_runs) * 1000
+    heaviest = sorted(((statistics.median(v) * 1000, name) for name, v in package_runs.items()), reverse=True)[:args.top]
+    print(f"import {args.module}: {import_ms:.0f} ms (median of {args.runs})")
+    for milliseconds, name in heaviest:
+        print(f"  {name:<28} {milliseconds:>8.1f} ms")
+
+    pdf_bytes = build_resume_pdf(2)
+    servers: Dict[str, Dict[str, float]] = {}
+    print(f"\n{'mode':>10} {'ready ms':>9} {'1st req ms':>11} {'2nd req ms':>11} {'1st response ms':>16}")
+    for mode in args.modes:
+        runs = [measure_server(mode, pdf_bytes) for _ in range(args.runs)]
+        servers[mode] = {key: statistics.median(run[key] for run in runs) for key in runs[0]}
+        stats = servers[mode]
+        print(f"{mode:>10} {stats['ready_ms']:>9.0f} {stats['first_request_ms']:>11.0f} {stats['second_request_ms']:>11.0f} {stats['first_response_ms']:>16.0f}")
+
+    record = {
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "commit": git_commit(),
+        "runs": args.runs,
+        "import_ms": import_ms,
+        "heaviest_packages_ms": {name: milliseconds for milliseconds, name in heaviest},
+        "servers": servers,
+    }
+    if not args.no_save:
+        results_path = Path(args.results)
+        results_path.parent.mkdir(parents=True, exist_ok=True)
+        with results_path.open("a") as results_file:
+            results_file.write(json.dumps(record) + "\n")
+        print(f"\nSaved to {results_path}")
+
+
+if __name__ == "__main__":
+    main()
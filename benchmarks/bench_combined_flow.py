@@ -0,0 +1,109 @@
+"""
+Compares the frontend's two-request flow (/optimize-resume then /get-resume-suggestions)
+with the combined /optimize-resume-with-suggestions endpoint (plus fetching its PDF link).
+
+PDF parsing and rendering are real; the LLM is replaced by fixed per-call latencies so the
+numbers are reproducible without an API key:
+
+    python -m benchmarks.bench_combined_flow --runs 10 --optimize-latency 1.5 --suggestions-latency 0.8
+"""
+import argparse
+import asyncio
+import statistics
+import time
+import httpx
+from app.api import resume as resume_api
+from app.main import app
+from benchmarks.common import build_resume_pdf
+from app.schemas import ATSFriendlyResume, Experience, ResumeSuggestions, Skill
+from modules.implementations.memory_cache import InMemoryLRUCache
+from modules.implementations.pypdf_processor import PyPDFProcessor
+from modules.interfaces.resume_optimizer import IResumeOptimizer
+
+
+class FixedLatencyOptimizer(IResumeOptimizer):
+    """Answers after a fixed delay; every answer is unique so no downstream cache can short-circuit it."""
+    def __init__(self, optimize_latency: float, suggestions_latency: float):
+        self.optimize_latency = optimize_latency
+        self.suggestions_latency = suggestions_latency
+        self.calls = 0
+
+    def _resume(self, resume_text: str) -> ATSFriendlyResume:
+        self.calls += 1
+        return ATSFriendlyResume(
+            full_name="Jane Doe",
+            contact_info={"email": "jane@example.com", "phone": "(555) 010-0000"},
+            summary=f"Backend engineer focused on reliable data pipelines (run {self.calls}).",
+            experience=[Experience(title="Senior Engineer", company="Acme", start_date="2020", responsibilities=resume_text.splitlines()[:4])],
+            education=[],
+            skills=[Skill(category="Languages", keywords=["Python", "Go"])],
+        )
+
+    def optimize_resume(self, resume_text, job_description, use_cache=True):
+        time.sleep(self.optimize_latency)
+        return self._resume(resume_text)
+
+    def get_suggestions(self, resume_text, job_description, use_cache=True):
+        time.sleep(self.suggestions_latency)
+        return ResumeSuggestions(suggestions=["Quantify the billing migration."])
+
+    async def aoptimize_resume(self, resume_text, job_description, use_cache=True):
+        await asyncio.sleep(self.optimize_latency)
+        return self._resume(resume_text)
+
+    async def aget_suggestions(self, resume_text, job_description, use_cache=True):
+        await asyncio.sleep(self.suggestions_latency)
+        return ResumeSuggestions(suggestions=["Quantify the billing migration."])
+
+
+async def two_request_flow(client: httpx.AsyncClient, files: dict, data: dict):
+    optimized = await client.post("/api/optimize-resume", files=files, data=data)
+    suggestions = await client.post("/api/get-resume-suggestions", files=files, data=data)
+    optimized.raise_for_status()
+    suggestions.raise_for_status()
+
+
+async def combined_flow(client: httpx.AsyncClient, files: dict, data: dict):
+    combined = await client.post("/api/optimize-resume-with-suggestions", files=files, data=data)
+    combined.raise_for_status()
+    pdf = await client.get(combined.json()["pdf_url"])
+    pdf.raise_for_status()
+
+
+async def measure(flow, runs: int, pdf_bytes: bytes) -> list:
+    data = {"job_description": "Senior Backend Engineer: Go, Python, Kafka.", "bypass_cache": "true"}
+    timings = []
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        for _ in range(runs):
+            files = {"resume_file": ("resume.pdf", pdf_bytes, "application/pdf")}
+            started = time.perf_counter()
+            await flow(client, files, data)
+            timings.append(time.perf_counter() - started)
+    return timings
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument("--pages", type=int, default=2, help="Pages in the generated input resume.")
+    parser.add_argument("--optimize-latency", type=float, default=1.5, help="Simulated optimize_resume latency (seconds).")
+    parser.add_argument("--suggestions-latency", type=float, default=0.8, help="Simulated get_suggestions latency (seconds).")
+    args = parser.parse_args()
+
+    optimizer = FixedLatencyOptimizer(args.optimize_latency, args.suggestions_latency)
+    # No text cache: both flows pay for every parse they perform.
+    app.dependency_overrides[resume_api.get_pdf_processor] = lambda: PyPDFProcessor()
+    app.dependency_overrides[resume_api.get_resume_optimizer] = lambda: optimizer
+    pdf_store = InMemoryLRUCache(max_entries=args.runs)
+    app.dependency_overrides[resume_api.get_rendered_pdf_store] = lambda: pdf_store
+    pdf_bytes = build_resume_pdf(args.pages)
+
+    print(f"{'flow':>12} {'runs':>5} {'mean s':>8} {'p50 s':>8} {'max s':>8}")
+    for label, flow in (("two-request", two_request_flow), ("combined", combined_flow)):
+        timings = asyncio.run(measure(flow, args.runs, pdf_bytes))
+        print(f"{label:>12} {len(timings):>5} {statistics.mean(timings):>8.3f} {statistics.median(timings):>8.3f} {max(timings):>8.3f}")
+
+
+if __name__ == "__main__":
+    main()
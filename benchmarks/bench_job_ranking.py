@@ -0,0 +1,88 @@
+"""
+Measures the local job ranking index on synthetic listings: bulk build time, incremental
+adds (as the scraper saves jobs one by one) and query latency against a resume:
+
+    python -m benchmarks.bench_job_ranking --jobs 1000 5000 20000 --queries 200
+"""
+import argparse
+import random
+import statistics
+import time
+from app.schemas import JobListing
+from modules.implementations.tfidf_job_ranker import TfidfJobRanker
+
+SKILLS = [
+    "python", "fastapi", "django", "postgresql", "kubernetes", "docker", "aws", "terraform", "react", "typescript",
+    "node.js", "java", "spring", "kotlin", "go", "rust", "c++", "c#", ".net", "sql", "spark", "airflow", "pytorch",
+    "tensorflow", "machine learning", "data pipelines", "graphql", "redis", "kafka", "ci/cd", "linux", "azure",
+]
+TITLES = ["Backend Engineer", "Frontend Developer", "Data Engineer", "ML Engineer", "DevOps Engineer", "Full Stack Developer", "SRE"]
+LEVELS = ["Junior", "", "Senior", "Staff", "Lead"]
+RESUME = (
+    "Senior backend engineer with 8 years of Python, FastAPI and Django. Designed PostgreSQL schemas, "
+    "Kafka data pipelines and Kubernetes deployments on AWS with Terraform. Mentored engineers, led "
+    "migrations to Docker, added Redis caching and CI/CD. Some machine learning with PyTorch."
+)
+
+
+def synthetic_jobs(count: int, seed: int = 0, start: int = 0):
+    rng = random.Random(seed)
+    jobs = []
+    for index in range(start, start + count):
+        skills = rng.sample(SKILLS, 6)
+        jobs.append(JobListing(
+            title=f"{rng.choice(LEVELS)} {rng.choice(TITLES)}".strip(),
+            company=f"Company {rng.randrange(500)}",
+            location=rng.choice(["Remote", "Berlin", "New York", "London"]),
+            job_url=f"https://www.linkedin.com/jobs/view/{index}/",
+            description_snippet=f"We use {', '.join(skills[:-1])} and {skills[-1]}. Ship reliable services and own them in production.",
+        ))
+    return jobs
+
+
+def percentile(values, fraction):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--jobs", type=int, nargs="+", default=[1000, 5000, 20000])
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--incremental", type=int, default=200, help="Listings added one at a time after the bulk build.")
+    parser.add_argument("--top-k", type=int, default=10)
+    args = parser.parse_args()
+
+    print(f"{'jobs':>7} {'build ms':>9} {'add ms/job':>11} {'1st query ms':>13} {'p50 ms':>8} {'p95 ms':>8} {'vocab':>7}")
+    for count in args.jobs:
+        ranker = TfidfJobRanker()
+        jobs = synthetic_jobs(count)
+        started = time.perf_counter()
+        ranker.add_jobs(jobs)
+        ranker.rank(RESUME, top_k=args.top_k)
+        build = time.perf_counter() - started
+
+        extra = synthetic_jobs(args.incremental, seed=1, start=count)
+        started = time.perf_counter()
+        for job in extra:
+            ranker.add_jobs([job])
+        add = (time.perf_counter() - started) / max(1, len(extra))
+
+        # The first query after adds folds them in and recomputes IDF weights.
+        started = time.perf_counter()
+        ranker.rank(RESUME, top_k=args.top_k)
+        first_query = time.perf_counter() - started
+
+        latencies = []
+        for _ in range(args.queries):
+            started = time.perf_counter()
+            ranker.rank(RESUME, top_k=args.top_k)
+            latencies.append(time.perf_counter() - started)
+        print(
+            f"{count:>7} {build * 1000:>9.1f} {add * 1000:>11.3f} {first_query * 1000:>13.2f} "
+            f"{statistics.median(latencies) * 1000:>8.2f} {percentile(latencies, 0.95) * 1000:>8.2f} {ranker.stats()['vocabulary']:>7}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""
+Measures job scraping throughput against the local LinkedIn fixture site.
+
+Compares the sequential click-through mode with concurrent job-page fetching:
+
+    python -m benchmarks.bench_job_scraper --jobs 30 --delay 0.3 --concurrency 1 4 8
+
+With --assets the fixture pages load a stylesheet, script, image and tracker, and --policy
+selects what the scraper lets through ("none" loads everything, "block" drops images and the
+tracker, "cache" also replays static assets from disk); requests and KiB are reported per run.
+"""
+import argparse
+import asyncio
+import tempfile
+from typing import Optional
+from app.schemas import JobSearchCriteria
+from modules.implementations.disk_cache import DiskCache
+from modules.implementations.playwright_browser_pool import PlaywrightBrowserPool
+from modules.implementations.playwright_job_scraper import PlaywrightJobScraper
+from modules.resource_policy import ResourcePolicy
+from tests.fixtures.linkedin_site import LinkedInFixtureServer
+
+
+def build_policy(name: str, asset_dir: str) -> Optional[ResourcePolicy]:
+    if name == "none":
+        return None
+    asset_cache = DiskCache(asset_dir) if name == "cache" else None
+    return ResourcePolicy(blocked_domains=["localhost"], asset_cache=asset_cache)
+
+
+async def run_search(base_url: str, concurrency: int, limit: int, interval: float, policy: Optional[ResourcePolicy] = None) -> dict:
+    with tempfile.TemporaryDirectory() as state_dir:
+        pool = PlaywrightBrowserPool(size=1, storage_state_path=f"{state_dir}/state.json")
+        scraper = PlaywrightJobScraper(
+            browser_pool=pool,
+            base_url=base_url,
+            detail_concurrency=concurrency,
+            min_request_interval=interval,
+            resource_policy=policy,
+        )
+        # The fixture accepts any credentials; the returned stats cover the scrape, not the login
+        PlaywrightJobScraper.LINKEDIN_EMAIL = PlaywrightJobScraper.LINKEDIN_PASSWORD = "bench"
+        try:
+            _, stats = await scraper.search_jobs_with_stats(JobSearchCriteria(keywords="Engineer"), limit=limit)
+            return stats
+        finally:
+            await pool.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--jobs", type=int, default=30, help="Number of job listings to scrape.")
+    parser.add_argument("--delay", type=float, default=0.3, help="Simulated latency per job page (seconds).")
+    parser.add_argument("--interval", type=float, default=0.0, help="Politeness interval between job page loads.")
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 4, 8])
+    parser.add_argument("--assets", action="store_true", help="Serve fixture pages with static assets and a tracker.")
+    parser.add_argument("--policy", choices=["none", "block", "cache"], nargs="+", default=["none"])
+    args = parser.parse_args()
+
+    with LinkedInFixtureServer(job_count=args.jobs, job_page_delay=args.delay, with_assets=args.assets) as site, \
+            tempfile.TemporaryDirectory() as asset_dir:
+        print(f"{'policy':>7} {'concurrency':>12} {'mode':>11} {'jobs':>5} {'seconds':>8} {'jobs/s':>7} {'requests':>9} {'blocked':>8} {'cached':>7} {'KiB':>8}")
+        for policy_name in args.policy:
+            for concurrency in args.concurrency:
+                # The asset cache directory is shared by every "cache" run, as it is across restarts.
+                policy = build_policy(policy_name, asset_dir)
+                stats = asyncio.run(run_search(site.base_url, concurrency, args.jobs, args.interval, policy))
+                network = stats["network"]
+                print(
+                    f"{policy_name:>7} {concurrency:>12} {stats['mode']:>11} {stats['jobs']:>5} {stats['seconds']:>8.2f} {stats['jobs_per_second']:>7.2f} "
+                    f"{network['requests']:>9} {network['blocked']:>8} {network['asset_cache_hits']:>7} {network['bytes_transferred'] / 1024:>8.1f}"
+                )
+
+
+if __name__ == "__main__":
+    main()
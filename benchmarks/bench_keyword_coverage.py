@@ -0,0 +1,102 @@
+"""
+Measures keyword-coverage scoring throughput (resume/job description pairs per second):
+
+    python -m benchmarks.bench_keyword_coverage --resumes 50 --jobs 200
+
+"cold" scores every pair with the keyword and resume caches cleared first, so each text is
+tokenized once; "warm" repeats the run with both caches populated, like a batch gate that
+scores the same resume against many postings. "structured" scores ATSFriendlyResume objects.
+"""
+import argparse
+import random
+import time
+from app.schemas import ATSFriendlyResume, Experience, Skill
+from modules import keyword_coverage
+from modules.keyword_coverage import score_keyword_coverage
+
+SKILLS = [
+    "Python", "FastAPI", "Django", "PostgreSQL", "Kubernetes", "Docker", "AWS", "Terraform", "React", "TypeScript",
+    "Node.js", "Java", "Spring Boot", "Kotlin", "Golang", "Rust", "C++", "C#", "SQL", "Spark", "Airflow", "PyTorch",
+    "TensorFlow", "machine learning", "data pipelines", "GraphQL", "Redis", "Kafka", "CI/CD", "Linux", "Azure", "k8s",
+]
+FILLER = (
+    "You will collaborate with product managers and designers, review code, mentor engineers and improve the "
+    "reliability of customer-facing services. We value ownership, clear writing and pragmatic engineering."
+)
+
+
+def synthetic_job_description(rng: random.Random) -> str:
+    skills = rng.sample(SKILLS, 8)
+    return (
+        f"{rng.choice(['Senior', 'Staff', ''])} Backend Engineer\n"
+        f"Requirements: {', '.join(skills[:5])}. Nice to have: {', '.join(skills[5:])}.\n"
+        + " ".join([FILLER] * rng.randint(2, 5))
+    )
+
+
+def synthetic_resume(rng: random.Random) -> ATSFriendlyResume:
+    skills = rng.sample(SKILLS, 10)
+    experience = [
+        Experience(
+            title="Software Engineer",
+            company=f"Company {index}",
+            start_date="2019",
+            responsibilities=[f"Built {rng.choice(skills)} services handling payments and scaled {rng.choice(skills)} deployments." for _ in range(5)],
+            technologies_used=rng.sample(skills, 4),
+        )
+        for index in range(3)
+    ]
+    return ATSFriendlyResume(
+        full_name="Jane Doe",
+        contact_info={"email": "jane@example.com"},
+        summary=f"Backend engineer experienced with {', '.join(skills[:3])}.",
+        experience=experience,
+        education=[],
+        skills=[Skill(category="Tools", keywords=skills)],
+    )
+
+
+def resume_text(resume: ATSFriendlyResume) -> str:
+    sections = keyword_coverage.resume_section_texts(resume)
+    return "\n".join(f"{section.title()}\n{text}" for section, text in sections.items() if text)
+
+
+def run(pairs, label: str) -> None:
+    started = time.perf_counter()
+    total = 0.0
+    for job_description, resume in pairs:
+        total += score_keyword_coverage(job_description, resume).coverage
+    elapsed = time.perf_counter() - started
+    print(f"{label:>11} {len(pairs):>8} {elapsed * 1000:>10.1f} {len(pairs) / elapsed:>12,.0f} {elapsed / len(pairs) * 1e6:>9.1f} {total / len(pairs):>9.2f}")
+
+
+def clear_caches() -> None:
+    keyword_coverage.extract_keywords.cache_clear()
+    keyword_coverage._raw_resume_terms.cache_clear()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--resumes", type=int, default=50)
+    parser.add_argument("--jobs", type=int, default=200)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    job_descriptions = [synthetic_job_description(rng) + f"\nRef {index}" for index in range(args.jobs)]
+    resumes = [synthetic_resume(rng) for _ in range(args.resumes)]
+    texts = [resume_text(resume) + f"\nRef {index}" for index, resume in enumerate(resumes)]
+
+    print(f"{'mode':>11} {'pairs':>8} {'total ms':>10} {'pairs/s':>12} {'us/pair':>9} {'coverage':>9}")
+    # Cold: every text is seen for the first time, so the run pays for all the tokenizing.
+    clear_caches()
+    run([(job_descriptions[index % args.jobs], texts[index % args.resumes]) for index in range(max(args.jobs, args.resumes))], "cold")
+    clear_caches()
+    all_pairs = [(job_description, text) for text in texts for job_description in job_descriptions]
+    run(all_pairs, "all pairs")
+    run(all_pairs, "warm")
+    run([(job_description, resume) for resume in resumes[:10] for job_description in job_descriptions], "structured")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,237 @@
+"""
+End-to-end latency benchmark for the resume API, without OpenAI.
+
+Drives the FastAPI app in-process at a fixed concurrency. PDF extraction and rendering are
+real; the LLM is FakeResumeChatModel with a latency profile. It reports p50/p95/p99 latency
+and throughput for the whole request and for each stage (extract, llm, render):
+
+    python -m benchmarks.bench_pipeline --endpoint optimize --requests 50 --concurrency 8 --profile gpt-4o
+
+Every run is appended to a JSONL results file together with the current git commit. The
+report compares against the previous run of the same scenario, so regressions between
+commits show up as deltas.
+"""
+import argparse
+import asyncio
+import json
+import math
+import time
+from collections import defaultdict
+from contextlib import asynccontextmanager
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, List, Optional
+import httpx
+from app.api import resume as resume_api
+from app.main import app
+from app.services import services
+from benchmarks.common import build_resume_pdf, git_commit
+from modules.implementations.fake_chat_model import FakeResumeChatModel, LATENCY_PROFILES
+from modules.implementations.langchain_resume_optimizer import LangChainResumeOptimizer
+from modules.implementations.memory_cache import InMemoryLRUCache
+from modules.implementations.pypdf_processor import PyPDFProcessor
+from modules.interfaces.document_generator import IDocumentGenerator
+from modules.interfaces.pdf_processor import IPDFProcessor
+from modules.interfaces.resume_optimizer import IResumeOptimizer
+
+DEFAULT_RESULTS_PATH = "benchmarks/results/bench_pipeline.jsonl"
+JOB_DESCRIPTION = "Senior Backend Engineer: Python, FastAPI, Kafka, Kubernetes and production LLM features."
+
+
+class StageTimer:
+    def __init__(self):
+        self.durations: Dict[str, List[float]] = defaultdict(list)
+
+    @asynccontextmanager
+    async def measure(self, stage: str):
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.durations[stage].append(time.perf_counter() - started)
+
+
+class TimedPDFProcessor(IPDFProcessor):
+    def __init__(self, inner: IPDFProcessor, timer: StageTimer):
+        self.inner = inner
+        self.timer = timer
+
+    def extract_text(self, pdf_file_stream):
+        return self.inner.extract_text(pdf_file_stream)
+
+    async def aextract_text(self, pdf_file_stream):
+        async with self.timer.measure("extract"):
+            return await self.inner.aextract_text(pdf_file_stream)
+
+
+class TimedResumeOptimizer(IResumeOptimizer):
+    def __init__(self, inner: IResumeOptimizer, timer: StageTimer):
+        self.inner = inner
+        self.timer = timer
+
+    def optimize_resume(self, resume_text, job_description, use_cache=True):
+        return self.inner.optimize_resume(resume_text, job_description, use_cache=use_cache)
+
+    def get_suggestions(self, resume_text, job_description, use_cache=True):
+        return self.inner.get_suggestions(resume_text, job_description, use_cache=use_cache)
+
+    async def aoptimize_resume(self, resume_text, job_description, use_cache=True):
+        async with self.timer.measure("llm"):
+            return await self.inner.aoptimize_resume(resume_text, job_description, use_cache=use_cache)
+
+    async def aget_suggestions(self, resume_text, job_description, use_cache=True):
+        async with self.timer.measure("llm"):
+            return await self.inner.aget_suggestions(resume_text, job_description, use_cache=use_cache)
+
+    async def aoptimize_with_suggestions(self, resume_text, job_description, use_cache=True):
+        async with self.timer.measure("llm"):
+            return await self.inner.aoptimize_with_suggestions(resume_text, job_description, use_cache=use_cache)
+
+
+class TimedDocumentGenerator(IDocumentGenerator):
+    def __init__(self, inner: IDocumentGenerator, timer: StageTimer):
+        self.inner = inner
+        self.timer = timer
+
+    def generate_pdf(self, resume_data):
+        return self.inner.generate_pdf(resume_data)
+
+    async def agenerate_pdf(self, resume_data):
+        async with self.timer.measure("render"):
+            return await self.inner.agenerate_pdf(resume_data)
+
+    def generate_docx(self, resume_data):
+        return self.inner.generate_docx(resume_data)
+
+
+ENDPOINTS = {
+    "optimize": "/api/optimize-resume",
+    "suggestions": "/api/get-resume-suggestions",
+    "combined": "/api/optimize-resume-with-suggestions",
+}
+
+
+def percentile(values: List[float], fraction: float) -> float:
+    """Nearest-rank percentile."""
+    ordered = sorted(values)
+    return ordered[max(0, math.ceil(fraction * len(ordered)) - 1)]
+
+
+def summarize(durations: List[float], wall_seconds: float) -> dict:
+    return {
+        "count": len(durations),
+        "p50_ms": percentile(durations, 0.50) * 1000,
+        "p95_ms": percentile(durations, 0.95) * 1000,
+        "p99_ms": percentile(durations, 0.99) * 1000,
+        "throughput_per_s": len(durations) / wall_seconds if wall_seconds else 0.0,
+    }
+
+
+async def drive(endpoint: str, requests: int, concurrency: int, pdf_bytes: bytes, timer: StageTimer) -> float:
+    slots = asyncio.Semaphore(concurrency)
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=None) as client:
+        async def one_request():
+            async with slots:
+                async with timer.measure("request"):
+                    response = await client.post(
+                        ENDPOINTS[endpoint],
+                        files={"resume_file": ("resume.pdf", pdf_bytes, "application/pdf")},
+                        # Bypass the LLM and version caches so every request exercises the whole pipeline.
+                        data={"job_description": JOB_DESCRIPTION, "bypass_cache": "true"},
+                    )
+                response.raise_for_status()
+
+        started = time.perf_counter()
+        await asyncio.gather(*(one_request() for _ in range(requests)))
+        return time.perf_counter() - started
+
+
+def load_previous(results_path: Path, scenario: dict) -> Optional[dict]:
+    if not results_path.exists():
+        return None
+    previous = None
+    for line in results_path.read_text().splitlines():
+        record = json.loads(line)
+        if record.get("scenario") == scenario:
+            previous = record
+    return previous
+
+
+def print_report(record: dict, previous: Optional[dict]):
+    header = f"{'stage':>8} {'count':>6} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} {'req/s':>8}"
+    if previous:
+        header += f"   vs {previous.get('commit') or 'previous'}: {'p50':>7} {'p95':>7} {'req/s':>7}"
+    print(header)
+    for stage, stats in record["stages"].items():
+        line = f"{stage:>8} {stats['count']:>6} {stats['p50_ms']:>9.1f} {stats['p95_ms']:>9.1f} {stats['p99_ms']:>9.1f} {stats['throughput_per_s']:>8.2f}"
+        before = (previous or {}).get("stages", {}).get(stage)
+        if before:
+            deltas = [
+                (stats[key] - before[key]) / before[key] * 100 if before[key] else 0.0
+                for key in ("p50_ms", "p95_ms", "throughput_per_s")
+            ]
+            line += "   " + " " * (len(previous.get("commit") or "previous") + 5) + " ".join(f"{delta:>+6.1f}%" for delta in deltas)
+        print(line)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--endpoint", choices=sorted(ENDPOINTS), default="optimize")
+    parser.add_argument("--requests", type=int, default=50)
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--profile", choices=sorted(LATENCY_PROFILES), default="gpt-4o", help="Latency profile of the fake LLM.")
+    parser.add_argument("--pages", type=int, default=2, help="Pages in the generated input resume.")
+    parser.add_argument("--results", default=DEFAULT_RESULTS_PATH, help="JSONL file runs are appended to.")
+    parser.add_argument("--no-save", action="store_true", help="Do not append this run to the results file.")
+    args = parser.parse_args()
+
+    timer = StageTimer()
+    optimizer = LangChainResumeOptimizer(
+        llm=FakeResumeChatModel(profile=LATENCY_PROFILES[args.profile]),
+        compactor=services.prompt_compactor,
+    )
+    pdf_store = InMemoryLRUCache(max_entries=args.requests)
+    # No text cache: every request pays for extraction, as a first upload would.
+    app.dependency_overrides[resume_api.get_pdf_processor] = lambda: TimedPDFProcessor(PyPDFProcessor(), timer)
+    app.dependency_overrides[resume_api.get_resume_optimizer] = lambda: TimedResumeOptimizer(optimizer, timer)
+    app.dependency_overrides[resume_api.get_document_generator] = lambda: TimedDocumentGenerator(services.document_generator, timer)
+    app.dependency_overrides[resume_api.get_rendered_pdf_store] = lambda: pdf_store
+
+    pdf_bytes = build_resume_pdf(args.pages)
+
+    async def run() -> float:
+        try:
+            return await drive(args.endpoint, args.requests, args.concurrency, pdf_bytes, timer)
+        finally:
+            app.dependency_overrides.clear()
+            await services.shutdown()
+
+    wall_seconds = asyncio.run(run())
+
+    scenario = {
+        "endpoint": args.endpoint,
+        "requests": args.requests,
+        "concurrency": args.concurrency,
+        "profile": args.profile,
+        "pages": args.pages,
+    }
+    record = {
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "commit": git_commit(),
+        "scenario": scenario,
+        "wall_seconds": wall_seconds,
+        "stages": {stage: summarize(timer.durations[stage], wall_seconds) for stage in ("request", "extract", "llm", "render") if timer.durations[stage]},
+    }
+
+    results_path = Path(args.results)
+    print_report(record, load_previous(results_path, scenario))
+    if not args.no_save:
+        results_path.parent.mkdir(parents=True, exist_ok=True)
+        with results_path.open("a") as results_file:
+            results_file.write(json.dumps(record) + "\n")
+        print(f"\nSaved to {results_path}")
+
+
+if __name__ == "__main__":
+    main()
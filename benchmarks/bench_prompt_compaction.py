@@ -0,0 +1,134 @@
+"""
+Measures what prompt compaction saves on a boilerplate-heavy job posting.
+
+The LLM is stubbed with a chat model whose latency grows with the number of prompt
+tokens (a stand-in for provider prefill time), so no API key or network is needed:
+
+    python -m benchmarks.bench_prompt_compaction --calls 5 --ms-per-1k-tokens 150
+"""
+import argparse
+import os
+import time
+from typing import Any, List
+from langchain_core.language_models.fake_chat_models import FakeListChatModel
+from langchain_core.messages import BaseMessage
+from modules.implementations.langchain_resume_optimizer import LangChainResumeOptimizer
+from modules.prompt_compaction import PromptCompactor, count_tokens
+
+RESUME_TEXT = """Jane   Doe
+Senior Software Engineer  |  jane@example.com  |  (555) 010-0000
+https://github.com/janedoe
+
+
+EXPERIENCE
+Acme Corp — Senior Engineer, 2020 – Present
+- Led the migration of the billing plat-
+form to an event-driven architecture, cutting invoice latency by 40%.
+- Built internal observability tooling adopted by 12 teams.
+Globex — Software Engineer, 2016 – 2020
+- Maintained high-through-
+put ingestion services processing 2B events/day.
+
+EDUCATION
+B.S. Computer Science, State University, 2016
+
+SKILLS
+Python, Go, Kafka, PostgreSQL, Kubernetes, Terraform
+
+
+Extracted URLs:
+https://github.com/janedoe
+mailto:jane@example.com
+https://janedoe.dev
+"""
+
+JOB_DESCRIPTION = """Senior Backend Engineer
+
+About Us:
+{about}
+
+What You'll Do:
+- Design and operate high-throughput event pipelines in Go and Python.
+- Own the reliability of our billing platform.
+- Mentor engineers and lead design reviews.
+
+Requirements:
+- 5+ years building distributed systems.
+- Experience with Kafka, PostgreSQL and Kubernetes.
+- Design and operate high-throughput event pipelines in Go and Python.
+
+Benefits:
+{benefits}
+
+Equal Employment Opportunity:
+{eeo}
+
+Privacy Notice:
+{privacy}
+"""
+
+
+def build_job_description(boilerplate_repeats: int) -> str:
+    about = " ".join(["We are a fast-growing company on a mission to modernize payments for everyone."] * boilerplate_repeats)
+    benefits = "\n".join(f"- Benefit number {i}: generous perks, wellness stipends and flexible time off." for i in range(boilerplate_repeats * 3))
+    eeo = " ".join(["We are an equal opportunity employer and all qualified applicants will receive consideration for employment without regard to race, color, religion, sex, sexual orientation, gender identity, national origin, disability, or veteran status."] * boilerplate_repeats)
+    privacy = " ".join(["By applying, you agree to our candidate privacy policy and the processing of your personal data."] * boilerplate_repeats)
+    return JOB_DESCRIPTION.format(about=about, benefits=benefits, eeo=eeo, privacy=privacy)
+
+
+class PrefillLatencyChatModel(FakeListChatModel):
+    """Fake chat model that sleeps in proportion to the prompt size before answering."""
+    seconds_per_1k_tokens: float = 0.15
+    prompt_tokens: List[int] = []
+
+    def _call(self, messages: List[BaseMessage], *args: Any, **kwargs: Any) -> str:
+        tokens = sum(count_tokens(str(message.content)) for message in messages)
+        self.prompt_tokens.append(tokens)
+        time.sleep(tokens / 1000 * self.seconds_per_1k_tokens)
+        return super()._call(messages, *args, **kwargs)
+
+
+def run(compactor, job_description: str, calls: int, seconds_per_1k_tokens: float) -> dict:
+    optimizer = LangChainResumeOptimizer(compactor=compactor)
+    optimizer.llm = PrefillLatencyChatModel(
+        responses=['{"suggestions": ["Quantify the Kafka work."]}'],
+        seconds_per_1k_tokens=seconds_per_1k_tokens,
+        prompt_tokens=[],
+    )
+    started = time.perf_counter()
+    for _ in range(calls):
+        optimizer.get_suggestions(RESUME_TEXT, job_description, use_cache=False)
+    elapsed = time.perf_counter() - started
+    return {
+        "prompt_tokens": optimizer.llm.prompt_tokens[-1],
+        "ms_per_call": elapsed / calls * 1000,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--calls", type=int, default=5, help="LLM calls per configuration.")
+    parser.add_argument("--boilerplate", type=int, default=6, help="How many times each boilerplate block repeats.")
+    parser.add_argument("--ms-per-1k-tokens", type=float, default=150.0, help="Simulated prefill latency.")
+    parser.add_argument("--jd-budget", type=int, default=1500, help="Job description token budget.")
+    args = parser.parse_args()
+
+    # ChatOpenAI validates that a key is configured even though the stub never calls out.
+    os.environ.setdefault("OPENAI_API_KEY", "sk-benchmark")
+    job_description = build_job_description(args.boilerplate)
+    seconds_per_1k_tokens = args.ms_per_1k_tokens / 1000
+
+    compactor = PromptCompactor(job_description_token_budget=args.jd_budget)
+    _, _, report = compactor.compact(RESUME_TEXT, job_description)
+    print(f"resume tokens:          {report.resume_tokens_before:>6} -> {report.resume_tokens_after}")
+    print(f"job description tokens: {report.job_description_tokens_before:>6} -> {report.job_description_tokens_after}")
+    print()
+
+    print(f"{'mode':>10} {'prompt tokens':>14} {'ms/call':>9}")
+    for label, candidate in (("raw", None), ("compacted", compactor)):
+        result = run(candidate, job_description, args.calls, seconds_per_1k_tokens)
+        print(f"{label:>10} {result['prompt_tokens']:>14} {result['ms_per_call']:>9.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""
+Compares per-render PDF latency of the cold path (template loaded, CSS fetched and parsed and
+fonts resolved on every render, as HtmlPdfGenerator used to) with a warmed HtmlPdfGenerator
+that reuses its compiled template, parsed stylesheets and FontConfiguration:
+
+    python -m benchmarks.bench_render --renders 20
+
+Runs from the repository root so templates/ and static/ resolve.
+"""
+import argparse
+import os
+import statistics
+import time
+from io import BytesIO
+from jinja2 import Environment, FileSystemLoader
+from weasyprint import HTML
+from modules.implementations.fake_chat_model import CANNED_RESUME
+from modules.implementations.html_pdf_generator import HtmlPdfGenerator
+
+
+def cold_render(resume_data) -> BytesIO:
+    env = Environment(loader=FileSystemLoader("templates"))
+    html_content = env.get_template("resume_template.html").render(resume=resume_data.model_dump())
+    pdf_bytes = BytesIO()
+    # base_url lets WeasyPrint resolve the template's <link> to the stylesheet on every render.
+    HTML(string=html_content, base_url=os.getcwd() + os.sep).write_pdf(pdf_bytes)
+    return pdf_bytes
+
+
+def time_renders(render, renders: int) -> list:
+    timings = []
+    for _ in range(renders):
+        started = time.perf_counter()
+        render(CANNED_RESUME)
+        timings.append(time.perf_counter() - started)
+    return timings
+
+
+def report(label: str, timings: list):
+    print(f"{label:>22} {len(timings):>7} {statistics.mean(timings) * 1000:>9.1f} {statistics.median(timings) * 1000:>9.1f} {max(timings) * 1000:>9.1f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--renders", type=int, default=20)
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    generator = HtmlPdfGenerator(template_dir="templates")
+    build_seconds = time.perf_counter() - started
+    warm_up_seconds = generator.warm_up()
+    print(f"Generator built in {build_seconds * 1000:.1f} ms, warmed up in {warm_up_seconds * 1000:.1f} ms.\n")
+
+    cold = time_renders(cold_render, args.renders)
+    warm = time_renders(generator.generate_pdf, args.renders)
+
+    print(f"{'path':>22} {'renders':>7} {'mean ms':>9} {'p50 ms':>9} {'max ms':>9}")
+    report("cold (per-render load)", cold)
+    report("warm generator", warm)
+    print(f"\nMedian per-render reduction: {(1 - statistics.median(warm) / statistics.median(cold)) * 100:.1f}%")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+"""
+Measures peak Python memory per request while ingesting resume PDFs of growing size
+(padded with an incompressible attachment, like a scanned document), plus how quickly an
+upload over PDF_MAX_UPLOAD_BYTES is turned away:
+
+    python -m benchmarks.bench_upload --sizes-mb 1 5 9 --requests 5
+
+Requests run one at a time through /api/get-resume-suggestions with the instant fake
+LLM, so the tracemalloc peak is the ingestion cost of a single request.
+"""
+import argparse
+import asyncio
+import os
+import statistics
+import time
+import tracemalloc
+import httpx
+from app import config
+from app.api import resume as resume_api
+from app.main import app
+from app.services import services
+from benchmarks.common import build_resume_pdf
+from modules.implementations.fake_chat_model import FakeResumeChatModel
+from modules.implementations.langchain_resume_optimizer import LangChainResumeOptimizer
+from modules.implementations.pypdf_processor import PyPDFProcessor
+
+
+def padded_resume_pdf(size_bytes: int) -> bytes:
+    import fitz
+
+    doc = fitz.open(stream=build_resume_pdf(2), filetype="pdf")
+    padding = max(0, size_bytes - len(doc.tobytes()))
+    if padding:
+        doc.embfile_add("scan.bin", os.urandom(padding))
+    return doc.tobytes(deflate=False)
+
+
+async def measure(client: httpx.AsyncClient, pdf_bytes: bytes, requests: int):
+    peaks, latencies, statuses = [], [], set()
+    for _ in range(requests):
+        tracemalloc.reset_peak()
+        baseline, _ = tracemalloc.get_traced_memory()
+        started = time.perf_counter()
+        response = await client.post(
+            "/api/get-resume-suggestions",
+            files={"resume_file": ("resume.pdf", pdf_bytes, "application/pdf")},
+            data={"job_description": "Senior Backend Engineer", "bypass_cache": "true"},
+        )
+        latencies.append(time.perf_counter() - started)
+        _, peak = tracemalloc.get_traced_memory()
+        peaks.append(peak - baseline)
+        statuses.add(response.status_code)
+    return peaks, latencies, statuses
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes-mb", type=float, nargs="+", default=[1, 5, 9])
+    parser.add_argument("--requests", type=int, default=5)
+    args = parser.parse_args()
+
+    optimizer = LangChainResumeOptimizer(llm=FakeResumeChatModel())
+    # No text cache, so every request parses the PDF.
+    app.dependency_overrides[resume_api.get_pdf_processor] = lambda: PyPDFProcessor(max_pages=config.PDF_MAX_PAGES)
+    app.dependency_overrides[resume_api.get_resume_optimizer] = lambda: optimizer
+
+    async def run():
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=None) as client:
+            print(f"Upload limit {config.PDF_MAX_UPLOAD_BYTES / 2**20:g} MB, spool threshold {config.PDF_SPOOL_THRESHOLD_BYTES / 2**20:g} MB.\n")
+            print(f"{'size MB':>8} {'status':>7} {'peak MB':>9} {'peak/size':>10} {'p50 ms':>9}")
+            sizes = list(args.sizes_mb) + [config.PDF_MAX_UPLOAD_BYTES / 2**20 + 1]
+            for size_mb in sizes:
+                pdf_bytes = padded_resume_pdf(int(size_mb * 2**20))
+                peaks, latencies, statuses = await measure(client, pdf_bytes, args.requests)
+                peak = max(peaks)
+                print(
+                    f"{len(pdf_bytes) / 2**20:>8.1f} {','.join(map(str, sorted(statuses))):>7} {peak / 2**20:>9.1f} "
+                    f"{peak / len(pdf_bytes):>10.2f} {statistics.median(latencies) * 1000:>9.1f}"
+                )
+        app.dependency_overrides.clear()
+        await services.shutdown()
+
+    tracemalloc.start()
+    asyncio.run(run())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,21 @@
+"""Helpers shared by the benchmark scripts."""
+import subprocess
+from typing import Optional
+import fitz
+
+
+def build_resume_pdf(pages: int) -> bytes:
+    """A text-only resume PDF of the given length, generated on the fly."""
+    doc = fitz.open()
+    for page_number in range(pages):
+        page = doc.new_page()
+        lines = [f"- Led project {page_number}-{line}: migrated billing services, cutting latency 40%." for line in range(40)]
+        page.insert_text((50, 50), "Jane Doe\njane@example.com\n\n" + "\n".join(lines), fontsize=9)
+    return doc.tobytes()
+
+
+def git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True).stdout.strip()
+    except Exception:
+        return None
@@ -0,0 +1,49 @@
+import asyncio
+import contextvars
+import functools
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Optional
+
+# Bounded pool used to keep blocking work (fitz parsing, WeasyPrint rendering, sync SDK calls)
+# off the event loop. Sized once at startup via configure_blocking_executor().
+_executor: Optional[ThreadPoolExecutor] = None
+_max_workers: int = min(32, (os.cpu_count() or 1) + 4)
+_lock = threading.Lock()
+
+
+def configure_blocking_executor(max_workers: int) -> None:
+    """Sets the pool size, replacing an already-running pool after its queued work finishes."""
+    global _executor, _max_workers
+    if max_workers <= 0:
+        raise ValueError("max_workers must be a positive integer.")
+    with _lock:
+        _max_workers = max_workers
+        previous, _executor = _executor, None
+    if previous is not None:
+        previous.shutdown(wait=False)
+
+
+def get_blocking_executor() -> ThreadPoolExecutor:
+    global _executor
+    with _lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(max_workers=_max_workers, thread_name_prefix="blocking")
+        return _executor
+
+
+def shutdown_blocking_executor(wait: bool = True) -> None:
+    global _executor
+    with _lock:
+        previous, _executor = _executor, None
+    if previous is not None:
+        previous.shutdown(wait=wait)
+
+
+async def run_blocking(func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+    """Runs a blocking callable on the shared bounded executor and awaits its result."""
+    loop = asyncio.get_running_loop()
+    # Like asyncio.to_thread, carry context variables (e.g. the request's timing spans) into the worker.
+    context = contextvars.copy_context()
+    return await loop.run_in_executor(get_blocking_executor(), functools.partial(context.run, func, *args, **kwargs))
@@ -0,0 +1,93 @@
+import hashlib
+import json
+from io import BytesIO
+from typing import BinaryIO, Optional
+from app.schemas import ATSFriendlyResume
+from modules.executors import run_blocking
+from modules.interfaces.document_generator import IDocumentGenerator
+from modules.rendered_pdf_cache import RenderedPdfCache
+
+
+class CachingPdfGenerator(IDocumentGenerator):
+    """
+    Wraps another generator with a content-addressed cache of rendered PDFs. The key is a
+    canonical hash of the resume data plus the wrapped generator's render_version(), so
+    editing the template or stylesheet never serves a stale layout.
+    """
+    def __init__(self, inner: IDocumentGenerator, cache: RenderedPdfCache):
+        self.inner = inner
+        self.cache = cache
+        self._render_version = inner.render_version()
+
+    def render_version(self) -> str:
+        return self._render_version
+
+    def cache_key(self, resume_data: ATSFriendlyResume) -> str:
+        canonical = json.dumps(resume_data.model_dump(mode="json"), sort_keys=True, separators=(",", ":"))
+        return hashlib.sha256(f"{self._render_version}\0{canonical}".encode("utf-8")).hexdigest()
+
+    def warm_up(self) -> float:
+        return self.inner.warm_up()
+
+    def close(self) -> None:
+        self.inner.close()
+
+    def _read_cached(self, key: str) -> Optional[BytesIO]:
+        cached = self.cache.open(key)
+        if cached is None:
+            return None
+        with cached:
+            return BytesIO(cached.read())
+
+    def generate_pdf(self, resume_data: ATSFriendlyResume) -> BytesIO:
+        key = self.cache_key(resume_data)
+        cached = self._read_cached(key)
+        if cached is not None:
+            return cached
+        pdf_buffer = self.inner.generate_pdf(resume_data)
+        self.cache.put(key, pdf_buffer.getvalue())
+        pdf_buffer.seek(0)
+        return pdf_buffer
+
+    async def agenerate_pdf(self, resume_data: ATSFriendlyResume) -> BytesIO:
+        key = self.cache_key(resume_data)
+        cached = await run_blocking(self._read_cached, key)
+        if cached is not None:
+            return cached
+        pdf_buffer = await self.inner.agenerate_pdf(resume_data)
+        await run_blocking(self.cache.put, key, pdf_buffer.getvalue())
+        pdf_buffer.seek(0)
+        return pdf_buffer
+
+    async def arender_to_file(self, resume_data: ATSFriendlyResume) -> str:
+        """
+        Returns the path of the cached PDF for this resume, rendering it first on a miss.
+        Only for warming the cache: the file may be evicted at any time, so use aopen_pdf to read it.
+        """
+        key = self.cache_key(resume_data)
+        path = await run_blocking(self.cache.get_path, key)
+        if path is not None:
+            return path
+        pdf_buffer = await self.inner.agenerate_pdf(resume_data)
+        path = await run_blocking(self.cache.put, key, pdf_buffer.getvalue())
+        if path is None:
+            raise ValueError("Rendered PDF is larger than the whole rendered-PDF cache.")
+        return path
+
+    async def aopen_pdf(self, resume_data: ATSFriendlyResume) -> BinaryIO:
+        """
+        Returns an open, readable PDF for this resume, rendering it first on a miss. Hits are
+        the cache file itself, so endpoints can stream them without copying into memory; the
+        caller closes it.
+        """
+        key = self.cache_key(resume_data)
+        cached = await run_blocking(self.cache.open, key)
+        if cached is not None:
+            return cached
+        pdf_buffer = await self.inner.agenerate_pdf(resume_data)
+        await run_blocking(self.cache.put, key, pdf_buffer.getvalue())
+        pdf_buffer.seek(0)
+        return pdf_buffer
+
+    def generate_docx(self, resume_data: ATSFriendlyResume) -> BytesIO:
+        return self.inner.generate_docx(resume_data)
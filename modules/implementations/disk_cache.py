@@ -0,0 +1,133 @@
+import hashlib
+import os
+import pickle
+import tempfile
+import threading
+import time
+from typing import Any, Dict, Optional
+from modules.interfaces.cache import ICache
+
+class DiskCache(ICache):
+    """
+    Directory-backed cache that pickles one entry per file.
+    The file mtime records when an entry was written (used for the TTL) and the atime
+    is bumped on every hit so the least recently used files are evicted first once the
+    directory grows past max_bytes.
+    """
+    FILE_SUFFIX = ".pkl"
+
+    def __init__(self, directory: str, max_bytes: int = 256 * 1024 * 1024, ttl_seconds: Optional[float] = None):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+        os.makedirs(self.directory, exist_ok=True)
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+        self._total_bytes = sum(os.path.getsize(path) for path in self._entry_paths())
+
+    def _path_for(self, key: str) -> str:
+        digest = hashlib.sha256(key.encode("utf-8")).hexdigest()
+        return os.path.join(self.directory, digest + self.FILE_SUFFIX)
+
+    def _entry_paths(self):
+        for name in os.listdir(self.directory):
+            if name.endswith(self.FILE_SUFFIX):
+                yield os.path.join(self.directory, name)
+
+    def _remove(self, path: str) -> None:
+        try:
+            size = os.path.getsize(path)
+            os.remove(path)
+            self._total_bytes -= size
+        except FileNotFoundError:
+            pass
+
+    def get(self, key: str) -> Optional[Any]:
+        path = self._path_for(key)
+        with self._lock:
+            try:
+                stat = os.stat(path)
+            except FileNotFoundError:
+                self._misses += 1
+                return None
+
+            now = time.time()
+            if self.ttl_seconds and stat.st_mtime + self.ttl_seconds <= now:
+                self._remove(path)
+                self._expirations += 1
+                self._misses += 1
+                return None
+
+            try:
+                with open(path, "rb") as f:
+                    value = pickle.load(f)
+            except Exception as e:
+                # A truncated or unreadable entry is treated as a miss and dropped.
+                print(f"Discarding unreadable disk cache entry {path}: {e}")
+                self._remove(path)
+                self._misses += 1
+                return None
+
+            # Record the access for LRU eviction while keeping the write time in mtime.
+            os.utime(path, (now, stat.st_mtime))
+            self._hits += 1
+            return value
+
+    def set(self, key: str, value: Any) -> None:
+        path = self._path_for(key)
+        payload = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        if len(payload) > self.max_bytes:
+            return # Never cache something that would immediately evict everything else
+
+        with self._lock:
+            self._remove(path)
+            # Write to a temp file first so readers never observe a partial entry.
+            fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+            with os.fdopen(fd, "wb") as f:
+                f.write(payload)
+            os.replace(tmp_path, path)
+            self._total_bytes += len(payload)
+            self._evict_if_needed()
+
+    def _evict_if_needed(self) -> None:
+        if self._total_bytes <= self.max_bytes:
+            return
+        entries = []
+        for entry_path in self._entry_paths():
+            try:
+                entries.append((os.stat(entry_path).st_atime, entry_path))
+            except FileNotFoundError:
+                continue
+        entries.sort()
+        for _, entry_path in entries:
+            if self._total_bytes <= self.max_bytes:
+                break
+            self._remove(entry_path)
+            self._evictions += 1
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._remove(self._path_for(key))
+
+    def clear(self) -> None:
+        with self._lock:
+            for entry_path in list(self._entry_paths()):
+                self._remove(entry_path)
+            self._total_bytes = 0
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "backend": "disk",
+                "hits": self._hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+                "expirations": self._expirations,
+                "size_bytes": self._total_bytes,
+                "max_bytes": self.max_bytes,
+                "hit_rate": self._hits / lookups if lookups else 0.0,
+            }
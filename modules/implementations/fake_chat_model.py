@@ -0,0 +1,178 @@
+import asyncio
+import json
+import time
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional
+from langchain_core.callbacks import AsyncCallbackManagerForLLMRun, CallbackManagerForLLMRun
+from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_core.messages import AIMessage, AIMessageChunk, BaseMessage
+from langchain_core.outputs import ChatGeneration, ChatGenerationChunk, ChatResult
+from pydantic import Field
+from app.schemas import ATSFriendlyResume, Education, Experience, Project, ResumeSuggestions, Skill
+from modules.prompt_compaction import approximate_token_count
+from modules.resume_sections import ITEM_SECTIONS, section_adapter
+
+
+@dataclass(frozen=True)
+class LatencyProfile:
+    """How long a fake completion takes: fixed overhead, prompt processing, then token-by-token output."""
+    time_to_first_token: float = 0.0 # seconds of fixed overhead before any output
+    prefill_seconds_per_1k_tokens: float = 0.0 # grows with prompt size
+    tokens_per_second: float = 0.0 # output rate; 0 emits everything at once
+
+
+LATENCY_PROFILES: Dict[str, LatencyProfile] = {
+    "instant": LatencyProfile(),
+    # Roughly what gpt-4o looks like from a nearby region.
+    "gpt-4o": LatencyProfile(time_to_first_token=0.45, prefill_seconds_per_1k_tokens=0.08, tokens_per_second=90.0),
+    "slow": LatencyProfile(time_to_first_token=1.5, prefill_seconds_per_1k_tokens=0.25, tokens_per_second=25.0),
+}
+
+CANNED_RESUME = ATSFriendlyResume(
+    full_name="Jane Doe",
+    contact_info={"phone": "(555) 010-0000", "email": "jane.doe@example.com"},
+    linkedin_url="https://www.linkedin.com/in/janedoe",
+    github_url="https://github.com/janedoe",
+    summary="Backend engineer who builds reliable Python and FastAPI services and ships AI-powered features to production.",
+    experience=[
+        Experience(
+            title="Senior Software Engineer",
+            company="Acme Corp",
+            location="Remote",
+            start_date="July 2021",
+            end_date="Present",
+            responsibilities=[
+                "Led the migration of the billing platform to an event-driven architecture, cutting invoice latency by 40%.",
+                "Built FastAPI services serving 2M requests/day with 99.95% availability.",
+                "Introduced LLM-assisted support triage that reduced first-response time by 30%.",
+            ],
+            technologies_used=["Python", "FastAPI", "Kafka", "PostgreSQL"],
+            achievements=[],
+        ),
+        Experience(
+            title="Software Engineer",
+            company="Globex",
+            location="Austin, TX",
+            start_date="June 2018",
+            end_date="June 2021",
+            responsibilities=[
+                "Maintained high-throughput ingestion pipelines processing 2B events/day.",
+                "Automated deployment with Terraform and Kubernetes, halving release lead time.",
+            ],
+            technologies_used=["Go", "Kubernetes", "Terraform"],
+            achievements=[],
+        ),
+    ],
+    education=[
+        Education(degree="B.S.", major="Computer Science", institution="State University", end_date="May 2018", relevant_coursework=[]),
+    ],
+    skills=[
+        Skill(category="Languages", keywords=["Python", "Go", "SQL"]),
+        Skill(category="Frameworks & Tools", keywords=["FastAPI", "Kafka", "Docker", "Kubernetes"]),
+        Skill(category="AI", keywords=["LangChain", "Prompt Engineering"]),
+    ],
+    projects=[
+        Project(name="resume-tailor", description="Open-source CLI that tailors resumes to job postings.", technologies=["Python"], link="https://github.com/janedoe/resume-tailor"),
+    ],
+    certifications=[],
+    awards=[],
+    volunteer_experience=[],
+    languages_spoken=["English"],
+    interests=[],
+)
+
+CANNED_SUGGESTIONS = ResumeSuggestions(suggestions=[
+    "Quantify the impact of the ingestion pipeline work at Globex (cost, latency or reliability).",
+    "Add a project that shows hands-on experience with the job's AI requirements.",
+    "Move the most relevant skills for this role to the top of the skills section.",
+])
+
+
+class FakeResumeChatModel(BaseChatModel):
+    """
+    Deterministic stand-in for the OpenAI chat model. It answers every prompt the resume
+    optimizer sends with canned, schema-valid JSON (full resume, suggestions, single
+    sections) and simulates provider latency from a LatencyProfile, including streaming
+    token by token. No network access or API key is needed.
+    """
+    model_name: str = "fake-resume-model"
+    temperature: float = 0.0
+    profile: LatencyProfile = Field(default_factory=LatencyProfile)
+    resume: ATSFriendlyResume = CANNED_RESUME
+    suggestions: ResumeSuggestions = CANNED_SUGGESTIONS
+    chars_per_chunk: int = 4 # about one token per streamed chunk
+    calls: int = 0
+
+    @property
+    def _llm_type(self) -> str:
+        return "fake-resume-chat-model"
+
+    @property
+    def _identifying_params(self) -> Dict[str, Any]:
+        return {"model_name": self.model_name, "profile": self.profile}
+
+    def _section_json(self, section: str, index: Optional[int] = None) -> str:
+        value = getattr(self.resume, section)
+        if index is not None:
+            entries = value or []
+            value = entries[min(index, len(entries) - 1)] if entries else None
+        return json.dumps(section_adapter(section, index).dump_python(value, mode="json"))
+
+    def _respond(self, messages: List[BaseMessage]) -> str:
+        """Picks the canned answer matching the prompt the optimizer built."""
+        self.calls += 1
+        system_prompt = str(messages[0].content) if messages else ""
+        human_prompt = str(messages[-1].content) if messages else ""
+        if "Resume Critic" in system_prompt:
+            return self.suggestions.model_dump_json()
+        if "updating one part of a resume" in system_prompt:
+            section = next((name for name in ITEM_SECTIONS if f"`{name}` entries" in system_prompt), "experience")
+            return json.dumps(json.loads(self._section_json(section))[:1])
+        if "fixing one section" in system_prompt:
+            # The human message starts with "Section: experience[1]" (or just the field name).
+            label = human_prompt.split("\n", 1)[0].replace("Section:", "").strip()
+            section, _, index = label.partition("[")
+            return self._section_json(section, int(index.rstrip("]")) if index else None)
+        return self.resume.model_dump_json()
+
+    def _first_token_delay(self, messages: List[BaseMessage]) -> float:
+        prompt_tokens = sum(approximate_token_count(str(message.content)) for message in messages)
+        return self.profile.time_to_first_token + prompt_tokens / 1000 * self.profile.prefill_seconds_per_1k_tokens
+
+    def _generation_delay(self, text: str) -> float:
+        if self.profile.tokens_per_second <= 0:
+            return 0.0
+        return approximate_token_count(text) / self.profile.tokens_per_second
+
+    def _chunks(self, text: str) -> Iterator[str]:
+        for start in range(0, len(text), self.chars_per_chunk):
+            yield text[start:start + self.chars_per_chunk]
+
+    def _chunk_delay(self) -> float:
+        if self.profile.tokens_per_second <= 0:
+            return 0.0
+        return self.chars_per_chunk / 4 / self.profile.tokens_per_second
+
+    def _generate(self, messages: List[BaseMessage], stop: Optional[List[str]] = None, run_manager: Optional[CallbackManagerForLLMRun] = None, **kwargs: Any) -> ChatResult:
+        text = self._respond(messages)
+        time.sleep(self._first_token_delay(messages) + self._generation_delay(text))
+        return ChatResult(generations=[ChatGeneration(message=AIMessage(content=text))])
+
+    async def _agenerate(self, messages: List[BaseMessage], stop: Optional[List[str]] = None, run_manager: Optional[AsyncCallbackManagerForLLMRun] = None, **kwargs: Any) -> ChatResult:
+        text = self._respond(messages)
+        await asyncio.sleep(self._first_token_delay(messages) + self._generation_delay(text))
+        return ChatResult(generations=[ChatGeneration(message=AIMessage(content=text))])
+
+    def _stream(self, messages: List[BaseMessage], stop: Optional[List[str]] = None, run_manager: Optional[CallbackManagerForLLMRun] = None, **kwargs: Any) -> Iterator[ChatGenerationChunk]:
+        text = self._respond(messages)
+        time.sleep(self._first_token_delay(messages))
+        for piece in self._chunks(text):
+            time.sleep(self._chunk_delay())
+            yield ChatGenerationChunk(message=AIMessageChunk(content=piece))
+
+    async def _astream(self, messages: List[BaseMessage], stop: Optional[List[str]] = None, run_manager: Optional[AsyncCallbackManagerForLLMRun] = None, **kwargs: Any) -> AsyncIterator[ChatGenerationChunk]:
+        text = self._respond(messages)
+        await asyncio.sleep(self._first_token_delay(messages))
+        for piece in self._chunks(text):
+            await asyncio.sleep(self._chunk_delay())
+            yield ChatGenerationChunk(message=AIMessageChunk(content=piece))
@@ -1,27 +1,94 @@
+import functools
+import hashlib
+import os
+import time
 from io import BytesIO
-from app.schemas import ATSFriendlyResume # Import necessary schemas
+from typing import List, Optional, Sequence
+from app.schemas import ATSFriendlyResume, Experience, Skill # Import necessary schemas
+from modules import metrics
 from modules.interfaces.document_generator import IDocumentGenerator
-from jinja2 import Environment, FileSystemLoader
+from jinja2 import Environment, FileSystemLoader, Template
 from weasyprint import HTML, CSS # pip install weasyprint
+from weasyprint.text.fonts import FontConfiguration
+
+DEFAULT_STYLESHEET_PATHS = ("static/styles/resume.css",)
+
+# Small but representative resume rendered once at warm-up so the first real request does not
+# pay for font discovery, Pango initialisation and the first CSS cascade.
+WARM_UP_RESUME = ATSFriendlyResume(
+    full_name="Warm Up",
+    contact_info={"phone": "(555) 010-0000", "email": "warm.up@example.com"},
+    linkedin_url="https://www.linkedin.com/in/warmup",
+    summary="Backend engineer.",
+    experience=[Experience(title="Engineer", company="Acme", start_date="2020", responsibilities=["Built services."], technologies_used=["Python"])],
+    education=[],
+    skills=[Skill(category="Languages", keywords=["Python"])],
+)
+
+
+def render_fingerprint(template_path: str, stylesheet_paths: Sequence[str]) -> str:
+    """Hashes the template and stylesheet sources, so any edit to the layout changes the result."""
+    digest = hashlib.sha256()
+    for path in [template_path, *stylesheet_paths]:
+        digest.update(path.encode("utf-8") + b"\0")
+        if os.path.exists(path):
+            with open(path, "rb") as f:
+                digest.update(f.read())
+    return digest.hexdigest()
+
+
+@functools.lru_cache(maxsize=None)
+def _compiled_template(template_dir: str, template_name: str) -> Template:
+    """Loads and compiles a template once per process; every generator shares the result."""
+    # auto_reload=False: templates ship with the app, so skip the per-render mtime check.
+    env = Environment(loader=FileSystemLoader(template_dir), auto_reload=False)
+    return env.get_template(template_name)
+
 
 class HtmlPdfGenerator(IDocumentGenerator):
-    def __init__(self, template_dir: str = "templates"):
-        self.env = Environment(loader=FileSystemLoader(template_dir))
-        self.template = self.env.get_template("resume_template.html") # Create this HTML template
+    def __init__(
+        self,
+        template_dir: str = "templates",
+        stylesheets: Optional[List[CSS]] = None,
+        font_config: Optional[FontConfiguration] = None,
+        stylesheet_paths: Sequence[str] = DEFAULT_STYLESHEET_PATHS,
+        template_name: str = "resume_template.html",
+    ):
+        self.template = _compiled_template(template_dir, template_name)
+        # Stylesheets are parsed once into CSS objects bound to one shared FontConfiguration
+        # and reused by every render, instead of WeasyPrint fetching the template's <link>.
+        self.font_config = font_config or FontConfiguration()
+        if stylesheets is None:
+            stylesheets = [CSS(filename=path, font_config=self.font_config) for path in stylesheet_paths if os.path.exists(path)]
+        self.stylesheets = stylesheets
+        self.warmed_up = False
+        self._render_version = render_fingerprint(os.path.join(template_dir, template_name), stylesheet_paths)
+
+    def render_version(self) -> str:
+        return self._render_version
+
+    def warm_up(self) -> float:
+        """Renders a sample resume once and returns how long it took (seconds)."""
+        started = time.perf_counter()
+        self.generate_pdf(WARM_UP_RESUME)
+        self.warmed_up = True
+        return time.perf_counter() - started
 
-    def generate_pdf(self, resume_data: ATSFriendlyResume) -> BytesIO: 
+    def generate_pdf(self, resume_data: ATSFriendlyResume) -> BytesIO:
         """
         Generates a PDF byte stream from ATSFriendlyResume data using an HTML template.
         """
         # Render the Jinja2 HTML template with the resume data.
         # The 'resume' variable in the template will be populated by resume_data.model_dump()
-        html_content = self.template.render(resume=resume_data.model_dump())
+        with metrics.span("template_render"):
+            html_content = self.template.render(resume=resume_data.model_dump(), stylesheets_preloaded=bool(self.stylesheets))
 
         # Convert the rendered HTML content to PDF using WeasyPrint
         pdf_bytes = BytesIO()
-        HTML(string=html_content).write_pdf(pdf_bytes)
+        with metrics.span("weasyprint"):
+            HTML(string=html_content).write_pdf(pdf_bytes, stylesheets=self.stylesheets, font_config=self.font_config)
         pdf_bytes.seek(0) # Reset buffer position to the beginning
         return pdf_bytes
 
     def generate_docx(self, resume_data: ATSFriendlyResume) -> BytesIO:
-        raise NotImplementedError("DOCX generation not supported for HtmlPdfGenerator.")
\ No newline at end of file
+        raise NotImplementedError("DOCX generation not supported for HtmlPdfGenerator.")
@@ -0,0 +1,49 @@
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Sequence
+from app.schemas import OptimizationTask
+from modules.interfaces.task_store import ITaskStore
+
+class InMemoryTaskStore(ITaskStore):
+    """
+    Process-local task records and artifacts. Once more than `max_tasks` tasks exist,
+    the oldest ones (and their artifacts) are dropped.
+    """
+    def __init__(self, max_tasks: int = 1000):
+        self.max_tasks = max_tasks
+        self._tasks: "OrderedDict[str, OptimizationTask]" = OrderedDict()
+        self._artifacts: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+
+    def save_task(self, task: OptimizationTask) -> None:
+        with self._lock:
+            self._tasks[task.task_id] = task
+            self._artifacts.setdefault(task.task_id, {})
+            while len(self._tasks) > self.max_tasks:
+                evicted_id, _ = self._tasks.popitem(last=False)
+                self._artifacts.pop(evicted_id, None)
+
+    def get_task(self, task_id: str) -> Optional[OptimizationTask]:
+        with self._lock:
+            return self._tasks.get(task_id)
+
+    def list_tasks(self, statuses: Sequence[str]) -> List[OptimizationTask]:
+        with self._lock:
+            return [task for task in self._tasks.values() if task.status in statuses]
+
+    def put_artifact(self, task_id: str, name: str, value: Any) -> None:
+        with self._lock:
+            if task_id in self._tasks:
+                self._artifacts[task_id][name] = value
+
+    def get_artifact(self, task_id: str, name: str) -> Optional[Any]:
+        with self._lock:
+            return self._artifacts.get(task_id, {}).get(name)
+
+    def delete_artifact(self, task_id: str, name: str) -> None:
+        with self._lock:
+            self._artifacts.get(task_id, {}).pop(name, None)
+
+    def list_artifacts(self, task_id: str) -> List[str]:
+        with self._lock:
+            return sorted(self._artifacts.get(task_id, {}))
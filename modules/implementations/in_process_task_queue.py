@@ -0,0 +1,72 @@
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+from modules.interfaces.task_queue import ITaskQueue, TaskQueueFullError
+
+class InProcessTaskQueue(ITaskQueue):
+    """
+    asyncio-based queue with a fixed number of worker coroutines in the server process.
+    The heavy stages already run off the event loop (async LLM calls, executor offload),
+    so workers only orchestrate. The queue belongs to one server process: with several
+    worker processes each runs only the tasks it accepted, and tasks are lost when the
+    process exits (OptimizationTaskManager then marks them failed so they can be retried).
+    Use an external broker implementation of ITaskQueue when that matters.
+    """
+    def __init__(self, workers: int = 2, max_queue_size: int = 100):
+        if workers <= 0:
+            raise ValueError("workers must be a positive integer.")
+        self.workers = workers
+        self.max_queue_size = max_queue_size
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker_tasks: List[asyncio.Task] = []
+        self._handler: Optional[Callable[[str], Awaitable[None]]] = None
+        self._processed = 0
+        self._failed = 0
+
+    async def start(self, handler: Callable[[str], Awaitable[None]]) -> None:
+        if self._worker_tasks:
+            return
+        self._handler = handler
+        self._queue = asyncio.Queue(maxsize=self.max_queue_size)
+        self._worker_tasks = [asyncio.create_task(self._work(), name=f"task-worker-{index}") for index in range(self.workers)]
+
+    async def _work(self) -> None:
+        while True:
+            task_id = await self._queue.get()
+            try:
+                await self._handler(task_id)
+                self._processed += 1
+            except Exception as e:
+                # Handlers record their own failures; this only guards the worker loop.
+                self._failed += 1
+                print(f"Unhandled error while running task {task_id}: {e}")
+            finally:
+                self._queue.task_done()
+
+    async def enqueue(self, task_id: str) -> None:
+        if self._queue is None:
+            raise RuntimeError("InProcessTaskQueue.start() must be called before enqueue().")
+        try:
+            self._queue.put_nowait(task_id)
+        except asyncio.QueueFull:
+            raise TaskQueueFullError(f"Task queue is full ({self.max_queue_size} tasks waiting).")
+
+    async def stop(self) -> None:
+        for worker in self._worker_tasks:
+            worker.cancel()
+        await asyncio.gather(*self._worker_tasks, return_exceptions=True)
+        self._worker_tasks = []
+        self._queue = None
+
+    @property
+    def started(self) -> bool:
+        return bool(self._worker_tasks)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "backend": "in_process",
+            "workers": self.workers,
+            "queued": self._queue.qsize() if self._queue is not None else 0,
+            "max_queue_size": self.max_queue_size,
+            "processed": self._processed,
+            "failed": self._failed,
+        }
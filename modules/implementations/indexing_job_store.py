@@ -0,0 +1,68 @@
+import threading
+import time
+from typing import Any, Dict, List, Optional
+from app.schemas import JobListing, JobSearchCriteria
+from modules.interfaces.job_ranker import IJobRanker
+from modules.interfaces.job_store import IJobStore
+
+
+class IndexingJobStore(IJobStore):
+    """
+    Wraps a job store so every listing the scraper saves is also added to the ranking index,
+    keeping the index current without a separate rebuild step.
+
+    The index lives in this process, but the store may be shared with other server workers;
+    call sync_index() before ranking to pick up the listings they scraped and to drop those
+    that have outlived the store's TTL.
+    """
+    # Each sync re-reads this much before the previous one, so a write stamped earlier but
+    # committed later is not missed. Re-adding an unchanged listing costs only a lookup.
+    SYNC_OVERLAP_SECONDS = 60.0
+
+    def __init__(self, inner: IJobStore, ranker: IJobRanker):
+        self.inner = inner
+        self.ranker = ranker
+        self._synced_at: Optional[float] = None
+        self._sync_lock = threading.Lock()
+
+    def sync_index(self) -> int:
+        """
+        Indexes the fresh listings written since the last sync (all of them the first time) and
+        removes those that expired in the meantime; returns how many listings were read.
+        """
+        with self._sync_lock:
+            now = time.time()
+            since = None if self._synced_at is None else self._synced_at - self.SYNC_OVERLAP_SECONDS
+            if since is not None:
+                self.ranker.remove_jobs(self.inner.list_expired_job_urls(expired_since=since))
+            jobs = self.inner.list_jobs(scraped_since=since)
+            self.ranker.add_jobs(jobs)
+            self._synced_at = now
+        return len(jobs)
+
+    def load_index(self) -> int:
+        """Indexes every fresh listing already in the store; returns how many were added."""
+        return self.sync_index()
+
+    def upsert_jobs(self, jobs: List[JobListing]) -> None:
+        self.inner.upsert_jobs(jobs)
+        self.ranker.add_jobs(jobs)
+
+    def get_job(self, job_url: str, fresh_only: bool = True) -> Optional[JobListing]:
+        return self.inner.get_job(job_url, fresh_only)
+
+    def get_search(self, criteria: JobSearchCriteria, limit: int) -> Optional[List[JobListing]]:
+        return self.inner.get_search(criteria, limit)
+
+    def save_search(self, criteria: JobSearchCriteria, limit: int, jobs: List[JobListing]) -> None:
+        self.inner.save_search(criteria, limit, jobs)
+        self.ranker.add_jobs(jobs)
+
+    def list_jobs(self, fresh_only: bool = True, scraped_since: Optional[float] = None) -> List[JobListing]:
+        return self.inner.list_jobs(fresh_only, scraped_since)
+
+    def list_expired_job_urls(self, expired_since: Optional[float] = None) -> List[str]:
+        return self.inner.list_expired_job_urls(expired_since)
+
+    def stats(self) -> Dict[str, Any]:
+        return self.inner.stats()
@@ -1,12 +1,62 @@
+import asyncio
+import hashlib
+import json
+import re
+from typing import AsyncIterator, Dict, List, Optional, Tuple
+import httpx
+from langchain_core.language_models.chat_models import BaseChatModel
 from langchain_core.prompts import ChatPromptTemplate
 from langchain_openai import ChatOpenAI
 from langchain.output_parsers import PydanticOutputParser
+from langchain_core.utils.json import parse_json_markdown
 from app.schemas import ATSFriendlyResume, ResumeSuggestions
+from modules import metrics
+from modules.executors import run_blocking
+from modules.interfaces.cache import ICache
 from modules.interfaces.resume_optimizer import IResumeOptimizer
+from modules.prompt_compaction import PromptCompactor, approximate_token_count
+from modules.resume_sections import (
+    ITEM_SECTIONS,
+    is_required_section,
+    resume_section_events,
+    section_adapter,
+    section_event,
+    section_schema,
+    validate_section,
+)
+from modules.streaming_json import IncrementalJSONObjectParser
+
+def _normalize_input(text: str) -> str:
+    """Collapses whitespace so trivially different copies of the same input share a cache key."""
+    return re.sub(r"\s+", " ", text).strip()
+
+def _prompt_fingerprint(prompt: ChatPromptTemplate) -> str:
+    """Hashes the prompt templates (and partials) so editing a prompt invalidates cached responses."""
+    parts = [repr(message) for message in prompt.messages]
+    parts.extend(f"{name}={value}" for name, value in sorted(prompt.partial_variables.items()))
+    return hashlib.sha256("\n".join(parts).encode("utf-8")).hexdigest()
 
 class LangChainResumeOptimizer(IResumeOptimizer):
-    def __init__(self):
-        self.llm = ChatOpenAI(model="gpt-4o", temperature=0.7)
+    supports_section_optimization = True
+
+    def __init__(
+        self,
+        cache: Optional[ICache] = None,
+        http_client: Optional[httpx.Client] = None,
+        http_async_client: Optional[httpx.AsyncClient] = None,
+        compactor: Optional[PromptCompactor] = None,
+        section_retries: int = 2,
+        llm: Optional[BaseChatModel] = None,
+    ):
+        # Passing shared httpx clients lets every optimizer reuse one keep-alive connection pool.
+        # An explicit llm (e.g. FakeResumeChatModel for tests and benchmarks) replaces gpt-4o.
+        self.llm = llm or ChatOpenAI(model="gpt-4o", temperature=0.7, http_client=http_client, http_async_client=http_async_client)
+        # Parsed responses are memoized on (normalized inputs, model, temperature, prompt hash).
+        self.cache = cache
+        # Inputs are cleaned and held to a token budget before caching and sending.
+        self.compactor = compactor
+        # Streaming mode regenerates only the sections that fail validation, this many times each.
+        self.section_retries = section_retries
         self.resume_parser = PydanticOutputParser(pydantic_object=ATSFriendlyResume)
 
         self.resume_prompt = ChatPromptTemplate.from_messages(
@@ -108,29 +158,321 @@ class LangChainResumeOptimizer(IResumeOptimizer):
             ]
         ).partial(format_instructions=self.suggestions_parser.get_format_instructions())
 
-    
-    def optimize_resume(self, resume_text: str, job_description: str) -> ATSFriendlyResume:
+        # --- Prompt for regenerating a single resume section in streaming mode ---
+        self.section_repair_prompt = ChatPromptTemplate.from_messages(
+            [
+                ("system", """
+                 You are fixing one section of an ATS-friendly resume that was tailored to a job description.
+                 The previous output for this section was missing or failed schema validation.
+                 Return ONLY the JSON value for the requested section: no surrounding object, no commentary.
+                 The value MUST validate against this JSON schema:
+                 {section_schema}
+                 """),
+                ("human", "Section: {section}\n\nPrevious output:\n{invalid_output}\n\nValidation error:\n{error}\n\nHere is the user's resume:\n\n{resume_text}\n\nHere is the job description:\n\n{job_description}")
+            ]
+        )
+
+        # --- Prompt for re-optimizing the entries behind one edited part of the resume ---
+        self.section_prompt = ChatPromptTemplate.from_messages(
+            [
+                ("system", """
+                 You are a world-class AI Resume Optimizer and ATS specialist updating one part of a resume
+                 that the candidate has just edited. Apply the same rules as for a full optimization:
+                 tailor to the job description, keep specific names, technologies and numbers, and use
+                 3-5 impactful, grammatically complete bullet points per entry.
+                 Stay consistent in tone and length with the previously optimized version shown.
+                 Return ONLY a JSON list of `{section}` entries (normally exactly one), with no commentary.
+                 The list MUST validate against this JSON schema:
+                 {section_schema}
+                 """),
+                ("human", "Here is the edited part of the user's resume:\n\n{source_text}\n\nPreviously optimized version of this part:\n\n{previous_entries}\n\nHere is the job description:\n\n{job_description}")
+            ]
+        )
+
+        self._resume_prompt_hash = _prompt_fingerprint(self.resume_prompt)
+        self._suggestions_prompt_hash = _prompt_fingerprint(self.suggestions_prompt)
+        self._section_prompt_hash = _prompt_fingerprint(self.section_prompt)
+
+    def _cache_key(self, kind: str, prompt_hash: str, resume_text: str, job_description: str) -> str:
+        key_material = json.dumps({
+            "kind": kind,
+            "model": str(getattr(self.llm, "model_name", "")),
+            "temperature": str(getattr(self.llm, "temperature", "")),
+            "prompt": prompt_hash,
+            "resume_text": _normalize_input(resume_text),
+            "job_description": _normalize_input(job_description),
+        }, sort_keys=True)
+        return f"llm:{kind}:" + hashlib.sha256(key_material.encode("utf-8")).hexdigest()
+
+    def _cache_lookup(self, kind: str, prompt_hash: str, resume_text: str, job_description: str, use_cache: bool):
+        """Returns (cache_key, cached_value); the key is None when caching is disabled."""
+        if self.cache is None:
+            return None, None
+        cache_key = self._cache_key(kind, prompt_hash, resume_text, job_description)
+        return cache_key, self.cache.get(cache_key) if use_cache else None
+
+    async def _acache_lookup(self, kind: str, prompt_hash: str, resume_text: str, job_description: str, use_cache: bool):
+        """Async variant of _cache_lookup; the lookup may hit disk or SQLite, so it runs off the event loop."""
+        if self.cache is None:
+            return None, None
+        cache_key = self._cache_key(kind, prompt_hash, resume_text, job_description)
+        return cache_key, await run_blocking(self.cache.get, cache_key) if use_cache else None
+
+    def _compact_inputs(self, kind: str, resume_text: str, job_description: str):
+        if self.compactor is None:
+            return resume_text, job_description
+        resume_text, job_description, report = self.compactor.compact(resume_text, job_description)
+        print(
+            f"Prompt compaction ({kind}): {report.tokens_before} -> {report.tokens_after} input tokens"
+            + (f" (truncated: {', '.join(report.truncated)})" if report.truncated else "")
+        )
+        return resume_text, job_description
+
+    def _record_token_usage(self, kind: str, prompt_value, completion_text: str, usage: Optional[dict] = None):
+        """Counts prompt/completion tokens, from the provider's usage report when it sends one."""
+        if not metrics.is_enabled():
+            return
+        usage = usage or {}
+        prompt_tokens = usage.get("input_tokens") or sum(
+            approximate_token_count(str(message.content)) for message in prompt_value.to_messages()
+        )
+        completion_tokens = usage.get("output_tokens") or approximate_token_count(completion_text)
+        metrics.record_llm_tokens(kind, prompt_tokens, completion_tokens)
+
+    def _invoke_llm(self, kind: str, prompt: ChatPromptTemplate, inputs: dict):
+        prompt_value = prompt.invoke(inputs)
+        with metrics.span("llm_call", kind=kind):
+            response = self.llm.invoke(prompt_value)
+        self._record_token_usage(kind, prompt_value, str(response.content), getattr(response, "usage_metadata", None))
+        return response
+
+    async def _ainvoke_llm(self, kind: str, prompt: ChatPromptTemplate, inputs: dict):
+        prompt_value = await prompt.ainvoke(inputs)
+        async with metrics.span("llm_call", kind=kind):
+            response = await self.llm.ainvoke(prompt_value)
+        self._record_token_usage(kind, prompt_value, str(response.content), getattr(response, "usage_metadata", None))
+        return response
+
+    def _cached_invoke(self, kind: str, prompt: ChatPromptTemplate, parser, prompt_hash: str, resume_text: str, job_description: str, use_cache: bool):
+        resume_text, job_description = self._compact_inputs(kind, resume_text, job_description)
+        cache_key, cached = self._cache_lookup(kind, prompt_hash, resume_text, job_description, use_cache)
+        if cached is not None:
+            return cached
+
+        response = self._invoke_llm(kind, prompt, {
+            "resume_text": resume_text,
+            "job_description": job_description
+        })
+        with metrics.span("llm_parse", kind=kind):
+            result = parser.invoke(response)
+
+        # A bypassed lookup still refreshes the stored response.
+        if cache_key is not None:
+            self.cache.set(cache_key, result)
+        return result
+
+    async def _acached_invoke(self, kind: str, prompt: ChatPromptTemplate, parser, prompt_hash: str, resume_text: str, job_description: str, use_cache: bool):
+        resume_text, job_description = self._compact_inputs(kind, resume_text, job_description)
+        cache_key, cached = await self._acache_lookup(kind, prompt_hash, resume_text, job_description, use_cache)
+        if cached is not None:
+            return cached
+
+        response = await self._ainvoke_llm(kind, prompt, {
+            "resume_text": resume_text,
+            "job_description": job_description
+        })
+        with metrics.span("llm_parse", kind=kind):
+            result = parser.invoke(response)
+
+        if cache_key is not None:
+            await run_blocking(self.cache.set, cache_key, result)
+        return result
+
+    def optimize_resume(self, resume_text: str, job_description: str, use_cache: bool = True) -> ATSFriendlyResume:
         """Optimizes a resume for ATS compatibility and tailoring to a job description."""
-        chain = self.resume_prompt | self.llm | self.resume_parser
         try:
-            optimized_resume = chain.invoke({
-                "resume_text": resume_text,
-                "job_description": job_description
-            })
+            optimized_resume = self._cached_invoke(
+                "resume", self.resume_prompt, self.resume_parser, self._resume_prompt_hash, resume_text, job_description, use_cache
+            )
             return optimized_resume
         except Exception as e:
             print(f"Error optimizing resume with LLM: {e}")
             raise
 
-    def get_suggestions(self, resume_text: str, job_description: str) -> ResumeSuggestions:
+    def get_suggestions(self, resume_text: str, job_description: str, use_cache: bool = True) -> ResumeSuggestions:
         """Generates improvement suggestions for a resume based on a job description."""
-        chain = self.suggestions_prompt | self.llm | self.suggestions_parser
         try:
-            suggestions = chain.invoke({
-                "resume_text": resume_text,
-                "job_description": job_description
-            })
+            suggestions = self._cached_invoke(
+                "suggestions", self.suggestions_prompt, self.suggestions_parser, self._suggestions_prompt_hash, resume_text, job_description, use_cache
+            )
             return suggestions
         except Exception as e:
             print(f"Error getting suggestions with LLM: {e}")
-            raise
\ No newline at end of file
+            raise
+
+    async def aoptimize_resume(self, resume_text: str, job_description: str, use_cache: bool = True) -> ATSFriendlyResume:
+        """Async variant of optimize_resume using the non-blocking LangChain ainvoke path."""
+        try:
+            return await self._acached_invoke(
+                "resume", self.resume_prompt, self.resume_parser, self._resume_prompt_hash, resume_text, job_description, use_cache
+            )
+        except Exception as e:
+            print(f"Error optimizing resume with LLM: {e}")
+            raise
+
+    async def aget_suggestions(self, resume_text: str, job_description: str, use_cache: bool = True) -> ResumeSuggestions:
+        """Async variant of get_suggestions using the non-blocking LangChain ainvoke path."""
+        try:
+            return await self._acached_invoke(
+                "suggestions", self.suggestions_prompt, self.suggestions_parser, self._suggestions_prompt_hash, resume_text, job_description, use_cache
+            )
+        except Exception as e:
+            print(f"Error getting suggestions with LLM: {e}")
+            raise
+
+    async def aoptimize_section(self, section: str, source_text: str, job_description: str, previous_entries: List[object], use_cache: bool = True) -> List[object]:
+        """Re-optimizes the entries behind one edited block of resume text with a section-scoped prompt."""
+        if section not in ITEM_SECTIONS:
+            raise ValueError(f"Section-level optimization is only supported for {', '.join(ITEM_SECTIONS)}, not {section!r}.")
+        source_text, job_description = self._compact_inputs(f"section-{section}", source_text, job_description)
+        previous_json = json.dumps([section_adapter(section, 0).dump_python(entry, mode="json") for entry in previous_entries])
+        # The previous entries are part of the prompt, so they are part of the cache key too.
+        cache_key, cached = await self._acache_lookup(
+            f"section-{section}", self._section_prompt_hash, source_text + "\n" + previous_json, job_description, use_cache
+        )
+        if cached is not None:
+            return cached
+
+        try:
+            response = await self._ainvoke_llm(f"section-{section}", self.section_prompt, {
+                "section": section,
+                "section_schema": section_schema(section),
+                "source_text": source_text,
+                "previous_entries": previous_json,
+                "job_description": job_description,
+            })
+            with metrics.span("llm_parse", kind=f"section-{section}"):
+                entries = validate_section(section, json.dumps(parse_json_markdown(response.content))) or []
+        except Exception as e:
+            print(f"Error re-optimizing {section} section with LLM: {e}")
+            raise
+
+        if cache_key is not None:
+            await run_blocking(self.cache.set, cache_key, entries)
+        return entries
+
+    async def _arepair_section(self, section: str, index: Optional[int], invalid_output: Optional[str], error: str, resume_text: str, job_description: str):
+        """Regenerates one section until it validates; returns (value, attempts) or raises the last error."""
+        label = section if index is None else f"{section}[{index}]"
+        for attempt in range(1, self.section_retries + 1):
+            response = await self._ainvoke_llm("section-repair", self.section_repair_prompt, {
+                "section": label,
+                "section_schema": section_schema(section, index),
+                "invalid_output": invalid_output or "(missing)",
+                "error": error,
+                "resume_text": resume_text,
+                "job_description": job_description,
+            })
+            invalid_output = response.content
+            try:
+                return validate_section(section, json.dumps(parse_json_markdown(invalid_output)), index), attempt
+            except Exception as e:
+                error = str(e)
+                print(f"Section {label} still invalid after repair attempt {attempt}: {e}")
+        raise ValueError(f"Section {label} could not be regenerated: {error}")
+
+    async def astream_resume(self, resume_text: str, job_description: str, use_cache: bool = True) -> AsyncIterator[dict]:
+        """
+        Streams the resume completion and emits each section as soon as it validates against
+        ATSFriendlyResume. Sections that fail validation are regenerated individually (in the
+        background while the rest streams in) instead of re-running the whole resume.
+        """
+        resume_text, job_description = self._compact_inputs("resume-stream", resume_text, job_description)
+        cache_key, cached = await self._acache_lookup("resume", self._resume_prompt_hash, resume_text, job_description, use_cache)
+        if cached is not None:
+            for event in resume_section_events(cached):
+                yield event
+            return
+
+        fields: Dict[str, object] = {}
+        items: Dict[str, Dict[int, object]] = {section: {} for section in ITEM_SECTIONS}
+        streamed_lists = set()
+        repairs: Dict[Tuple[str, Optional[int]], asyncio.Task] = {}
+
+        def start_repair(section: str, index: Optional[int], raw: Optional[str], error: str) -> dict:
+            repairs[(section, index)] = asyncio.create_task(
+                self._arepair_section(section, index, raw, error, resume_text, job_description)
+            )
+            event = {"event": "section_retry", "section": section, "error": error}
+            if index is not None:
+                event["index"] = index
+            return event
+
+        def accept(parsed: tuple) -> List[dict]:
+            if parsed[0] == "item":
+                _, section, index, raw = parsed
+                if section not in ITEM_SECTIONS:
+                    return []
+                try:
+                    items[section][index] = validate_section(section, raw, index)
+                except Exception as e:
+                    return [start_repair(section, index, raw, str(e))]
+                return [section_event(section, items[section][index], index)]
+
+            _, section, raw = parsed
+            if section not in ATSFriendlyResume.model_fields:
+                return []
+            if section in ITEM_SECTIONS and raw.startswith("["):
+                # Entries were already emitted one by one as they completed.
+                streamed_lists.add(section)
+                return []
+            try:
+                fields[section] = validate_section(section, raw)
+            except Exception as e:
+                return [start_repair(section, None, raw, str(e))]
+            return [section_event(section, fields[section])]
+
+        try:
+            parser = IncrementalJSONObjectParser()
+            prompt_value = await self.resume_prompt.ainvoke({"resume_text": resume_text, "job_description": job_description})
+            completion: List[str] = []
+            # Covers the whole completion, including the per-section validation interleaved with it.
+            async with metrics.span("llm_call", kind="resume-stream"):
+                async for chunk in self.llm.astream(prompt_value):
+                    completion.append(chunk.content)
+                    for parsed in parser.feed(chunk.content):
+                        for event in accept(parsed):
+                            yield event
+            self._record_token_usage("resume-stream", prompt_value, "".join(completion))
+
+            # Required sections the model never produced (e.g. a truncated completion) are generated on their own.
+            for section in ATSFriendlyResume.model_fields:
+                produced = section in fields or section in streamed_lists or (section, None) in repairs
+                if not produced and is_required_section(section):
+                    yield start_repair(section, None, None, "Section missing from the model output.")
+
+            for (section, index), task in list(repairs.items()):
+                try:
+                    value, attempts = await task
+                except Exception as e:
+                    if is_required_section(section):
+                        raise
+                    # Optional sections are dropped rather than failing the whole resume.
+                    yield {"event": "section_error", "section": section, "index": index, "error": str(e)}
+                    continue
+                if index is None:
+                    fields[section] = value
+                else:
+                    items[section][index] = value
+                yield section_event(section, value, index, repaired=True, attempts=attempts)
+        finally:
+            for task in repairs.values():
+                task.cancel()
+
+        for section in streamed_lists:
+            fields[section] = [items[section][index] for index in sorted(items[section])]
+        resume = ATSFriendlyResume.model_validate(fields)
+
+        if cache_key is not None:
+            await run_blocking(self.cache.set, cache_key, resume)
+        yield {"event": "resume", "data": resume.model_dump(mode="json")}
@@ -0,0 +1,227 @@
+import asyncio
+import os
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, List, Optional
+from playwright.async_api import Browser, BrowserContext, Playwright, async_playwright
+from modules import metrics
+
+DEFAULT_LAUNCH_ARGS = [
+    '--no-sandbox',
+    '--disable-setuid-sandbox',
+    '--disable-blink-features=AutomationControlled', # Helps avoid detection
+    '--disable-extensions',
+    '--disable-gpu' # For some environments
+]
+
+DEFAULT_CONTEXT_OPTIONS: Dict[str, Any] = {
+    "user_agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/126.0.0.0 Safari/537.36",
+    "viewport": {'width': 1920, 'height': 1080}, # Set a common viewport size
+    "accept_downloads": False,
+}
+
+
+class PlaywrightBrowserPool:
+    """
+    Long-lived Chromium instance with a fixed set of pre-warmed browser contexts.
+
+    - Contexts are created with the persisted `storage_state` (cookies/localStorage), so a
+      login performed once is reused by every later search and survives restarts.
+    - `acquire()` hands out an idle context and returns it to the pool afterwards; callers
+      wait when all contexts are busy.
+    - `save_session()` persists a freshly authenticated context's state; idle contexts built
+      from an older session are recycled on their next release/acquire.
+    - `health_check()` relaunches the browser if it crashed or was disconnected. Launching,
+      closing and relaunching are serialized by one lock, and the idle queue outlives restarts,
+      so callers waiting for a context are served by the relaunched browser.
+
+    The idle queue holds exactly `size` slots: a context, or None for a context that could not
+    be (re)built and is created on its next acquire instead. Contexts on loan when the browser
+    is relaunched belong to an old generation and are closed, not returned, on release.
+    """
+    def __init__(
+        self,
+        size: int = 2,
+        headless: bool = True,
+        storage_state_path: Optional[str] = ".cache/linkedin_storage_state.json",
+        launch_args: Optional[List[str]] = None,
+        context_options: Optional[Dict[str, Any]] = None,
+    ):
+        if size <= 0:
+            raise ValueError("Browser pool size must be a positive integer.")
+        self.size = size
+        self.headless = headless
+        self.storage_state_path = storage_state_path
+        self.launch_args = launch_args if launch_args is not None else list(DEFAULT_LAUNCH_ARGS)
+        self.context_options = context_options if context_options is not None else dict(DEFAULT_CONTEXT_OPTIONS)
+
+        self._playwright: Optional[Playwright] = None
+        self._browser: Optional[Browser] = None
+        self._idle: Optional[asyncio.Queue] = None
+        self._session_version = 0
+        self._context_versions: Dict[int, int] = {}
+        self._generation = 0
+        self._lock: Optional[asyncio.Lock] = None
+        self._contexts_created = 0
+
+    @property
+    def started(self) -> bool:
+        return self._browser is not None
+
+    def _storage_state(self) -> Optional[str]:
+        if self.storage_state_path and os.path.exists(self.storage_state_path):
+            return self.storage_state_path
+        return None
+
+    def _get_lock(self) -> asyncio.Lock:
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        return self._lock
+
+    def _is_connected(self) -> bool:
+        return self._browser is not None and self._browser.is_connected()
+
+    async def _new_context(self) -> BrowserContext:
+        context = await self._browser.new_context(storage_state=self._storage_state(), **self.context_options)
+        self._context_versions[id(context)] = self._session_version
+        self._contexts_created += 1
+        return context
+
+    async def start(self) -> None:
+        """Launches the browser and pre-warms `size` contexts (idempotent)."""
+        async with self._get_lock():
+            if not self.started:
+                await self._start_locked()
+
+    async def _start_locked(self) -> None:
+        print(f"Starting browser pool with {self.size} contexts (headless={self.headless})...")
+        async with metrics.span("browser_launch"):
+            self._playwright = await async_playwright().start()
+            self._browser = await self._playwright.chromium.launch(headless=self.headless, args=self.launch_args)
+        if self._idle is None:
+            self._idle = asyncio.Queue()
+        contexts: List[BrowserContext] = []
+        try:
+            for _ in range(self.size):
+                contexts.append(await self._new_context())
+        except Exception as e:
+            print(f"Error pre-warming browser contexts (they will be created on demand): {e}")
+        for context in contexts:
+            self._idle.put_nowait(context)
+        for _ in range(self.size - len(contexts)):
+            self._idle.put_nowait(None)
+
+    async def close(self) -> None:
+        """Closes every context, the browser and the Playwright driver."""
+        async with self._get_lock():
+            await self._close_locked()
+
+    async def _close_locked(self) -> None:
+        # Contexts still on loan now belong to an old generation and are dropped on release.
+        self._generation += 1
+        if self._idle is not None:
+            while not self._idle.empty():
+                context = self._idle.get_nowait()
+                if context is not None:
+                    await self._close_context(context)
+        if self._browser is not None:
+            try:
+                await self._browser.close()
+            except Exception as e:
+                print(f"Error closing pooled browser: {e}")
+        if self._playwright is not None:
+            try:
+                await self._playwright.stop()
+            except Exception as e:
+                print(f"Error stopping Playwright: {e}")
+        self._browser = None
+        self._playwright = None
+        self._context_versions.clear()
+
+    async def _close_context(self, context: BrowserContext) -> None:
+        self._context_versions.pop(id(context), None)
+        try:
+            await context.close()
+        except Exception:
+            pass # The context may already be gone with a crashed browser
+
+    async def health_check(self) -> bool:
+        """Returns True when the browser is usable, relaunching it first if it is not."""
+        if self._is_connected():
+            return True
+        async with self._get_lock():
+            # Another caller may have relaunched it while this one waited for the lock.
+            if not self._is_connected():
+                print("Pooled browser is not connected. Relaunching...")
+                await self._close_locked()
+                await self._start_locked()
+        return self._is_connected()
+
+    @asynccontextmanager
+    async def acquire(self) -> AsyncIterator[BrowserContext]:
+        """Borrows a pre-warmed context for the duration of the `async with` block."""
+        if not self.started:
+            await self.start()
+        await self.health_check()
+        context = await self._idle.get()
+        generation = self._generation
+        try:
+            if context is None or self._context_versions.get(id(context)) != self._session_version:
+                # An empty slot, or built before the latest login; (re)build it with the fresh session state.
+                if context is not None:
+                    await self._close_context(context)
+                context = await self._new_context()
+        except BaseException:
+            if generation == self._generation:
+                self._idle.put_nowait(None) # Keep the slot; the next borrower retries
+            raise
+
+        healthy = True
+        try:
+            yield context
+        except Exception:
+            healthy = self._is_connected()
+            raise
+        finally:
+            # Drop pages the caller left open so the next borrower starts clean.
+            for page in list(context.pages):
+                try:
+                    await page.close()
+                except Exception:
+                    healthy = False
+            if generation != self._generation:
+                # The browser was relaunched while this context was on loan; its slot was refilled then.
+                await self._close_context(context)
+            elif healthy and self._context_versions.get(id(context)) == self._session_version:
+                self._idle.put_nowait(context)
+            else:
+                await self._close_context(context)
+                self._idle.put_nowait(None) # Rebuilt on the next acquire
+
+    async def save_session(self, context: BrowserContext) -> None:
+        """Persists an authenticated context's storage state for all future contexts."""
+        if self.storage_state_path:
+            directory = os.path.dirname(os.path.abspath(self.storage_state_path))
+            os.makedirs(directory, exist_ok=True)
+            await context.storage_state(path=self.storage_state_path)
+        self._session_version += 1
+        # The caller's context already carries the new session.
+        self._context_versions[id(context)] = self._session_version
+
+    def has_saved_session(self) -> bool:
+        return self._storage_state() is not None
+
+    async def invalidate_session(self) -> None:
+        """Forgets the persisted session so the next contexts start logged out."""
+        if self.storage_state_path and os.path.exists(self.storage_state_path):
+            os.remove(self.storage_state_path)
+        self._session_version += 1
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "size": self.size,
+            "started": self.started,
+            "idle": self._idle.qsize() if self._idle is not None else 0,
+            "contexts_created": self._contexts_created,
+            "session_version": self._session_version,
+            "has_saved_session": self.has_saved_session(),
+        }
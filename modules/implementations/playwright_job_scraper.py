@@ -1,20 +1,101 @@
 import asyncio
-from typing import List, Optional
-from playwright.async_api import Page, TimeoutError as PlaywrightTimeoutError, async_playwright
+import time
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
+from playwright.async_api import BrowserContext, Page, TimeoutError as PlaywrightTimeoutError, async_playwright
 import os
+from modules import metrics
+from modules.resource_policy import ResourcePolicy, TrafficMeter
 from modules.interfaces.job_scraper import IJobScraper
+from modules.interfaces.job_store import IJobStore
+from modules.implementations.playwright_browser_pool import PlaywrightBrowserPool, DEFAULT_LAUNCH_ARGS, DEFAULT_CONTEXT_OPTIONS
 from app.schemas import JobListing, JobSearchCriteria
 
+class _RateLimiter:
+    """Spaces out acquisitions so at most one happens every `min_interval` seconds."""
+    def __init__(self, min_interval: float):
+        self.min_interval = min_interval
+        self._next_slot = 0.0
+        self._lock = asyncio.Lock()
+
+    async def wait(self) -> None:
+        if self.min_interval <= 0:
+            return
+        async with self._lock:
+            now = time.monotonic()
+            delay = self._next_slot - now
+            self._next_slot = max(now, self._next_slot) + self.min_interval
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+class _ScrapeOutcome:
+    """How a scrape ended; only a clean one may be cached as the whole answer to its search."""
+    def __init__(self):
+        self.completed = False # The result list was walked to the end without an error
+        self.failures = 0 # Listings that could not be extracted
+        self.stats: Dict[str, Any] = {} # Timing and browser traffic of this scrape alone
+
+    @property
+    def clean(self) -> bool:
+        return self.completed and self.failures == 0
+
 class PlaywrightJobScraper(IJobScraper):
     LINKEDIN_EMAIL = os.getenv("LINKEDIN_EMAIL")
     LINKEDIN_PASSWORD = os.getenv("LINKEDIN_PASSWORD")
+    # URL fragments LinkedIn redirects to when the session is missing or expired
+    LOGGED_OUT_URL_MARKERS = ("/login", "/authwall", "/checkpoint", "/uas/login")
+    JOB_CARD_SELECTOR = "div[data-job-id]"
+
+    def __init__(
+        self,
+        browser_pool: Optional[PlaywrightBrowserPool] = None,
+        base_url: str = "https://www.linkedin.com",
+        headless: bool = True,
+        detail_concurrency: int = 1,
+        min_request_interval: float = 0.0,
+        scroll_timeout_ms: int = 5000,
+        job_store: Optional[IJobStore] = None,
+        resource_policy: Optional[ResourcePolicy] = None,
+    ):
+        # With a browser pool, searches borrow a warm, already-authenticated context instead
+        # of launching Chromium and logging in on every call.
+        self.browser_pool = browser_pool
+        self.base_url = base_url.rstrip("/")
+        self.headless = headless
+        # detail_concurrency > 1 collects card URLs first, then loads job pages in that many tabs.
+        self.detail_concurrency = detail_concurrency
+        # Minimum seconds between job page navigations (politeness rate limit across all tabs).
+        self.min_request_interval = min_request_interval
+        self.scroll_timeout_ms = scroll_timeout_ms
+        # Optional local store: fresh searches are answered from it and fresh listings are not re-scraped.
+        self.job_store = job_store
+        # Blocks images, fonts, trackers etc. and replays cached static assets; None loads everything.
+        self.resource_policy = resource_policy
+
+    def _has_credentials(self) -> bool:
+        return bool(self.LINKEDIN_EMAIL and self.LINKEDIN_PASSWORD)
+
+    def _record_traffic(self, outcome: _ScrapeOutcome, network_stats: dict) -> None:
+        """Adds a finished search's request and byte counts to its outcome's stats and /metrics."""
+        outcome.stats["network"] = network_stats
+        metrics.record_scraper_traffic(network_stats)
+        print(
+            f"Search traffic: {network_stats['requests']} requests, {network_stats['blocked']} blocked, "
+            f"{network_stats['asset_cache_hits']} from the asset cache, {network_stats['bytes_transferred'] / 1024:.0f} KiB downloaded."
+        )
+
+    def _is_logged_out(self, page: Page) -> bool:
+        return any(marker in page.url for marker in self.LOGGED_OUT_URL_MARKERS)
 
     async def _login_linkedin(self, page: Page):
+        async with metrics.span("linkedin_login"):
+            await self._perform_login(page)
+
+    async def _perform_login(self, page: Page):
         """
         Handles the LinkedIn login process. This is highly sensitive to UI changes.
         """
         print("Attempting to log in to LinkedIN...")
-        login_url = "https://www.linkedin.com/login"
+        login_url = f"{self.base_url}/login"
         await page.goto(login_url, wait_until="domcontentloaded")
 
         try:
@@ -55,7 +136,7 @@ class PlaywrightJobScraper(IJobScraper):
 
             # Wait for navigation after login (e.g., to the feed or a redirect)
             # This is tricky; might need to wait for a specific element on the dashboard
-            await page.wait_for_url("https://www.linkedin.com/feed*", timeout=30000)
+            await page.wait_for_url(f"{self.base_url}/feed*", timeout=30000)
             print("Login successful!")
 
         except PlaywrightTimeoutError as e:
@@ -122,116 +203,338 @@ class PlaywrightJobScraper(IJobScraper):
             return None
 
 
+    def _build_search_url(self, criteria: JobSearchCriteria) -> str:
+        # Construct LinkedIn Jobs URL.
+        # When logged in, LinkedIn often redirects to a URL with `currentJobId`.
+        # We target the base search URL and let LinkedIn handle the redirect.
+        keywords_encoded = criteria.keywords.replace(' ', '%20')
+        location_encoded = criteria.location.replace(' ', '%20') if criteria.location else ""
+
+        search_url = f"{self.base_url}/jobs/search/?keywords={keywords_encoded}"
+        if location_encoded:
+            search_url += f"&location={location_encoded}"
+        return search_url
+
+    async def _open_search_page(self, page: Page, criteria: JobSearchCriteria, context: Optional[BrowserContext] = None):
+        """
+        Navigates to the search results, logging in again first if the pooled session has expired.
+        """
+        search_url = self._build_search_url(criteria)
+        print(f"Navigating to job search: {search_url}")
+        await page.goto(search_url, wait_until="domcontentloaded", timeout=60000) # Increased timeout
+
+        if self.browser_pool is not None and context is not None and self._is_logged_out(page) and self._has_credentials():
+            print("Pooled LinkedIn session has expired. Logging in again...")
+            await self._login_linkedin(page)
+            await self.browser_pool.save_session(context)
+            await page.goto(search_url, wait_until="domcontentloaded", timeout=60000)
+
+    async def _wait_for_more_cards(self, page: Page, previous_card_count: int) -> bool:
+        """Scrolls the results list and waits until new cards render (False if none appear)."""
+        print("\n Scrolling to load more jobs...")
+        scrollable_list_container = page.locator("div.jobs-search__results-list-container")
+        await scrollable_list_container.evaluate("node => node.scrollTop = node.scrollHeight")
+        try:
+            await page.wait_for_function(
+                "([selector, count]) => document.querySelectorAll(selector).length > count",
+                arg=[self.JOB_CARD_SELECTOR, previous_card_count],
+                timeout=self.scroll_timeout_ms,
+            )
+            return True
+        except PlaywrightTimeoutError:
+            return False
+
+    async def _collect_job_urls(self, page: Page, limit: int) -> List[str]:
+        """Walks the result cards (scrolling as needed) and returns up to `limit` unique job URLs."""
+        job_urls: List[str] = []
+        seen_job_urls = set()
+        while len(job_urls) < limit:
+            job_cards = await page.locator(self.JOB_CARD_SELECTOR).all()
+            for card in job_cards:
+                if len(job_urls) >= limit:
+                    break
+                job_url_relative = await card.locator("a.job-card-container__link").get_attribute("href")
+                if not job_url_relative:
+                    continue
+                full_job_url = f"{self.base_url}{job_url_relative.split('?')[0]}"
+                if full_job_url not in seen_job_urls:
+                    seen_job_urls.add(full_job_url)
+                    job_urls.append(full_job_url)
+
+            if len(job_urls) >= limit or not await self._wait_for_more_cards(page, len(job_cards)):
+                break
+        print(f"Collected {len(job_urls)} job URLs.")
+        return job_urls
+
+    async def _iter_job_details_concurrently(self, context: BrowserContext, job_urls: List[str], outcome: _ScrapeOutcome) -> AsyncIterator[Tuple[int, JobListing]]:
+        """
+        Opens each job's own page across a bounded set of tabs and yields (index, listing)
+        pairs as soon as each extraction finishes. Navigations are spaced by the politeness
+        interval no matter how many tabs are open.
+        """
+        if not job_urls:
+            return
+
+        # Listings still fresh in the store are served without opening their page.
+        urls_to_fetch = []
+        for index, job_url in enumerate(job_urls):
+            stored_listing = self.job_store.get_job(job_url) if self.job_store is not None else None
+            if stored_listing is not None:
+                yield index, stored_listing
+            else:
+                urls_to_fetch.append((index, job_url))
+        if not urls_to_fetch:
+            return
+
+        rate_limiter = _RateLimiter(self.min_request_interval)
+        tab_count = min(self.detail_concurrency, len(urls_to_fetch))
+        tabs: asyncio.Queue = asyncio.Queue()
+        for _ in range(tab_count):
+            tabs.put_nowait(await context.new_page())
+
+        async def fetch(index: int, job_url: str) -> Tuple[int, Optional[JobListing]]:
+            tab = await tabs.get()
+            try:
+                await rate_limiter.wait()
+                async with metrics.span("job_scrape", mode="page"):
+                    await tab.goto(job_url, wait_until="domcontentloaded", timeout=30000)
+                    return index, await self._extract_job_details(tab, job_url)
+            except Exception as e:
+                print(f"An unexpected error occurred for {job_url}: {e}")
+                return index, None
+            finally:
+                tabs.put_nowait(tab)
+
+        tasks = [asyncio.ensure_future(fetch(index, job_url)) for index, job_url in urls_to_fetch]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                index, job_listing = await next_done
+                if job_listing:
+                    print(f"[{index + 1}/{len(job_urls)}] Scraped: {job_listing.title}")
+                    if self.job_store is not None:
+                        self.job_store.upsert_jobs([job_listing])
+                    yield index, job_listing
+                else:
+                    outcome.failures += 1
+        finally:
+            # Stop outstanding fetches if the consumer went away early.
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            while not tabs.empty():
+                await tabs.get_nowait().close()
+
+    async def _iter_search_results(self, page: Page, limit: int, outcome: _ScrapeOutcome) -> AsyncIterator[Tuple[int, JobListing]]:
+        """
+        Yields (result position, listing) pairs from an already opened search page. Errors are
+        logged rather than raised; `outcome` records whether the results were walked to the end.
+        """
+        jobs_found = 0
+        started_at = time.perf_counter()
+        try:
+            # Wait for initial job cards to load.
+            job_list_selector = self.JOB_CARD_SELECTOR
+            await page.wait_for_selector(job_list_selector, timeout=300000)
+
+            if self.detail_concurrency > 1:
+                job_urls = await self._collect_job_urls(page, limit)
+                job_iterator = self._iter_job_details_concurrently(page.context, job_urls, outcome)
+            else:
+                job_iterator = self._iter_by_clicking_cards(page, limit, outcome)
+            async for item in job_iterator:
+                jobs_found += 1
+                yield item
+            outcome.completed = True
+
+            print(f"\n Scraping complete. Total jobs found: {jobs_found}")
+        except PlaywrightTimeoutError as e:
+            print(f"A timeout occurred during the job search process: {e}")
+            await page.screenshot(path="search_timeout_error.png")
+        except Exception as e:
+            print(f"An unexpected error occurred during job search: {e}")
+            await page.screenshot(path="search_general_error.png")
+        finally:
+            elapsed = time.perf_counter() - started_at
+            outcome.stats.update({
+                "mode": "concurrent" if self.detail_concurrency > 1 else "click",
+                "jobs": jobs_found,
+                "seconds": elapsed,
+                "jobs_per_second": jobs_found / elapsed if elapsed > 0 else 0.0,
+            })
+
+    async def _iter_by_clicking_cards(self, page: Page, limit: int, outcome: _ScrapeOutcome) -> AsyncIterator[Tuple[int, JobListing]]:
+        """Sequential mode: click each card and read the split-pane details one at a time."""
+        jobs_found = 0
+        seen_job_urls = set()
+
+        while jobs_found < limit:
+            previous_job_count = jobs_found
+            # Use the CORRECT selector to find all visible job cards
+            job_cards = await page.locator(self.JOB_CARD_SELECTOR).all()
+            print(f"Found {len(job_cards)} job cards on page. Scraping new ones...")
+
+            for card in job_cards:
+                if jobs_found >= limit:
+                    break
+
+                job_link_element = card.locator("a.job-card-container__link")
+                job_url_relative = await job_link_element.get_attribute("href")
+
+                if not job_url_relative:
+                    continue
+
+                job_url_base = job_url_relative.split('?')[0]
+                full_job_url = f"{self.base_url}{job_url_base}"
+
+                if full_job_url in seen_job_urls:
+                    continue
+
+                stored_listing = self.job_store.get_job(full_job_url) if self.job_store is not None else None
+                if stored_listing is not None:
+                    seen_job_urls.add(full_job_url)
+                    jobs_found += 1
+                    yield jobs_found - 1, stored_listing
+                    continue
+
+                try:
+                    async with metrics.span("job_scrape", mode="card"):
+                        await card.click(timeout=5000)
+                        # Wait for the details pane to show this card's job instead of sleeping
+                        job_id = await card.get_attribute("data-job-id")
+                        if job_id:
+                            await page.wait_for_selector(
+                                f'div.jobs-search__job-details--wrapper a[href*="{job_id}"]', timeout=10000
+                            )
+
+                        job_listing = await self._extract_job_details(page, full_job_url)
+
+                except PlaywrightTimeoutError:
+                    print(f"Timeout while processing job: {full_job_url}")
+                    outcome.failures += 1
+                    continue
+                except Exception as e:
+                    print(f"An unexpected error occurred for {full_job_url}: {e}")
+                    outcome.failures += 1
+                    continue
+
+                if job_listing:
+                    seen_job_urls.add(full_job_url)
+                    jobs_found += 1
+                    print(f"[{jobs_found}/{limit}] Scraped: {job_listing.title}")
+                    if self.job_store is not None:
+                        self.job_store.upsert_jobs([job_listing])
+                    yield jobs_found - 1, job_listing
+                else:
+                    outcome.failures += 1
+
+            if jobs_found < limit:
+                more_cards_loaded = await self._wait_for_more_cards(page, len(job_cards))
+                # If nothing new rendered or this pass added no jobs, we've likely reached the end
+                if not more_cards_loaded or jobs_found == previous_job_count:
+                    print("No new jobs loaded after scrolling. Ending search.")
+                    break
+
+    async def _iter_indexed_jobs(self, criteria: JobSearchCriteria, limit: int, outcome: _ScrapeOutcome) -> AsyncIterator[Tuple[int, JobListing]]:
+        if self.job_store is not None:
+            stored_jobs = self.job_store.get_search(criteria, limit)
+            if stored_jobs is not None:
+                print(f"Answering job search from the local store ({len(stored_jobs)} jobs).")
+                outcome.stats.update({"mode": "store", "jobs": len(stored_jobs)})
+                for index, job_listing in enumerate(stored_jobs):
+                    yield index, job_listing
+                return
+
+        indexed_jobs = []
+        async for item in self._iter_scraped_jobs(criteria, limit, outcome):
+            indexed_jobs.append(item)
+            yield item
+
+        if self.job_store is not None:
+            # A short result list is read back as exhaustive, so failed, partial or empty scrapes
+            # are never saved as the search's answer (the listings themselves are already stored).
+            if outcome.clean and indexed_jobs:
+                ordered_jobs = [job_listing for _, job_listing in sorted(indexed_jobs, key=lambda item: item[0])]
+                self.job_store.save_search(criteria, limit, ordered_jobs)
+            else:
+                print(f"Not caching this search: the scrape did not finish cleanly ({len(indexed_jobs)} jobs, {outcome.failures} failed).")
+
+    async def _iter_scraped_jobs(self, criteria: JobSearchCriteria, limit: int, outcome: _ScrapeOutcome) -> AsyncIterator[Tuple[int, JobListing]]:
+        if self.browser_pool is None:
+            async for item in self._iter_with_fresh_browser(criteria, limit, outcome):
+                yield item
+            return
+
+        async with self.browser_pool.acquire() as context:
+            # Pooled contexts outlive the search, so the meter is detached before the context is returned.
+            meter = TrafficMeter(self.resource_policy)
+            await meter.attach(context)
+            try:
+                page = await context.new_page()
+                try:
+                    # Log in once per saved session; later searches reuse the persisted cookies.
+                    if self._has_credentials() and not self.browser_pool.has_saved_session():
+                        await self._login_linkedin(page)
+                        await self.browser_pool.save_session(context)
+                    await self._open_search_page(page, criteria, context)
+                except Exception as e:
+                    print(f"An unexpected error occurred while opening the job search: {e}")
+                    return
+                async for item in self._iter_search_results(page, limit, outcome):
+                    yield item
+            finally:
+                self._record_traffic(outcome, await meter.detach())
+
+    async def iter_jobs(self, criteria: JobSearchCriteria, limit: int = 10) -> AsyncIterator[JobListing]:
+        """Yields each listing as soon as its details have been extracted."""
+        async for _, job_listing in self._iter_indexed_jobs(criteria, limit, _ScrapeOutcome()):
+            yield job_listing
+
     async def search_jobs(self, criteria: JobSearchCriteria, limit: int = 10) -> List[JobListing]:
-        jobs: List[JobListing] = []
+        jobs, _ = await self.search_jobs_with_stats(criteria, limit)
+        return jobs
+
+    async def search_jobs_with_stats(self, criteria: JobSearchCriteria, limit: int = 10) -> Tuple[List[JobListing], Dict[str, Any]]:
+        """
+        Like search_jobs, but also returns this search's stats: mode, jobs, seconds and
+        jobs_per_second, plus the browser's request and byte counts under "network".
+        They belong to this call alone, so concurrent searches never see each other's.
+        """
+        outcome = _ScrapeOutcome()
+        # Concurrent fetches finish out of order; restore the search result order.
+        indexed_jobs = [item async for item in self._iter_indexed_jobs(criteria, limit, outcome)]
+        return [job_listing for _, job_listing in sorted(indexed_jobs, key=lambda item: item[0])], outcome.stats
+
+    async def _iter_with_fresh_browser(self, criteria: JobSearchCriteria, limit: int, outcome: _ScrapeOutcome) -> AsyncIterator[Tuple[int, JobListing]]:
+        """Original one-shot flow: launch Chromium, log in, scrape, close everything."""
         print(f"Using event loop in playwright_job_scraper: {asyncio.get_event_loop().__class__.__name__}")
         async with async_playwright() as p:
-            browser = await p.chromium.launch(
-                headless=False, # Set to False for debugging else True
-                args=[
-                    '--no-sandbox',
-                    '--disable-setuid-sandbox',
-                    '--disable-blink-features=AutomationControlled', # Helps avoid detection
-                    '--disabled-extensions',
-                    '--disabled-gpu' # For some environments
-                ]
-            )
+            async with metrics.span("browser_launch"):
+                browser = await p.chromium.launch(headless=self.headless, args=DEFAULT_LAUNCH_ARGS)
 
             # Use a context for better session management (e.g cookies, user agent)
-            context = await browser.new_context(
-                user_agent="Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/126.0.0.0 Safari/537.36",
-                viewport={'width': 1920, 'height': 1080}, # Set a common viewport size
-                accept_downloads=False
-            )
+            context = await browser.new_context(**DEFAULT_CONTEXT_OPTIONS)
+            meter = TrafficMeter(self.resource_policy)
+            await meter.attach(context)
             page = await context.new_page()
 
             try:
-
-                if self.LINKEDIN_EMAIL and self.LINKEDIN_PASSWORD:
+                if self._has_credentials():
+                    # _login_linkedin already waits for the post-login redirect
                     await self._login_linkedin(page)
-                    await asyncio.sleep(2) # Short pause after login
-                # Construct LinkedIn Jobs URL.
-                # When logged in, LinkedIn often redirects to a URL with `currentJobId`.
-                # We target the base search URL and let LinkedIn handle the redirect.
-                keywords_encoded = criteria.keywords.replace(' ', '%20')
-                location_encoded = criteria.location.replace(' ', '%20') if criteria.location else ""
-
-                search_url = f"https://www.linkedin.com/jobs/search/?keywords={keywords_encoded}"
-                if location_encoded:
-                    search_url += f"&location={location_encoded}"
-
-                print(f"Navigating to job search: {search_url}")
-                await page.goto(search_url, wait_until="domcontentloaded", timeout=60000) # Increased timeout
-
-                # Wait for initial job cards to load.
-                job_list_selector = "div[data-job-id]"
-                await page.wait_for_selector(job_list_selector, timeout=300000)
-
-                seen_job_urls = set()
-
-                while len(jobs) < limit:
-                    previous_job_count = len(jobs)
-                    # Use the CORRECT selector to find all visible job cards
-                    job_cards = await page.locator(job_list_selector).all()
-                    print(f"Found {len(job_cards)} job cards on page. Scraping new ones...")
-
-                    for card in job_cards:
-                        if len(jobs) >= limit:
-                            break
-
-                        job_link_element = card.locator("a.job-card-container__link")
-                        job_url_relative = await job_link_element.get_attribute("href")
-
-                        if not job_url_relative:
-                            continue
-
-                        job_url_base = job_url_relative.split('?')[0]
-                        full_job_url = f"https://www.linkedin.com{job_url_base}"
-
-                        if full_job_url in seen_job_urls:
-                            continue
-
-                        try:
-                            await card.click(timeout=5000)
-                            await asyncio.sleep(2)
-
-                            job_listing = await self._extract_job_details(page, full_job_url)
-
-                            if job_listing:
-                                jobs.append(job_listing)
-                                seen_job_urls.add(full_job_url)
-                                print(f"[{len(jobs)}/{limit}] Scraped: {job_listing.title}")
-
-                        except PlaywrightTimeoutError:
-                            print(f"Timeout while processing job: {full_job_url}")
-                            continue
-                        except Exception as e:
-                            print(f"An unexpected error occurred for {full_job_url}: {e}")
-                            continue
-
-                    if len(jobs) < limit:
-                        print("\n Scrolling to load more jobs...")
-                        scrollable_list_container = page.locator("div.jobs-search__results-list-container")
-                        await scrollable_list_container.evaluate("node => node.scrollTop = node.scrollHeight")
-
-                        # Wait for new content to potentially load
-                        await asyncio.sleep(3)
-
-                        # If no new jobs were added after scrolling, we've likely reached the end
-                        if len(jobs) == previous_job_count:
-                            print("No new jobs loaded after scrolling. Ending search.")
-                            break
-
-                print(f"\n Scraping complete. Total jobs found: {len(jobs)}")
-            except PlaywrightTimeoutError as e:
-                print(f"A timeout occurred during the job search process: {e}")
-                await page.screenshot(path="search_timeout_error.png")
+                await self._open_search_page(page, criteria)
             except Exception as e:
                 print(f"An unexpected error occurred during job search: {e}")
                 await page.screenshot(path="search_general_error.png")
+                self._record_traffic(outcome, await meter.detach())
+                await context.close()
+                await browser.close()
+                return
+
+            try:
+                async for item in self._iter_search_results(page, limit, outcome):
+                    yield item
             finally:
+                self._record_traffic(outcome, await meter.detach())
                 print("Closing browser.")
                 await context.close()
                 await browser.close()
-
-            return jobs
\ No newline at end of file
@@ -0,0 +1,107 @@
+import os
+import time
+from io import BytesIO
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+from app.schemas import ATSFriendlyResume
+from modules import metrics
+from modules.implementations.html_pdf_generator import DEFAULT_STYLESHEET_PATHS, WARM_UP_RESUME, HtmlPdfGenerator, render_fingerprint
+from modules.interfaces.document_generator import (
+    IDocumentGenerator,
+    DocumentGeneratorBusyError,
+    DocumentRenderTimeoutError,
+)
+from modules.process_pool import WarmProcessPool, WorkerPoolBusyError, WorkerPoolTimeoutError
+
+# Per-process generator built once by _init_render_worker and reused for every render.
+_worker_generator = None
+
+
+def _init_render_worker(template_dir: str, stylesheet_paths: Sequence[str]) -> None:
+    """Loads the Jinja template, parsed CSS and font configuration once per worker, then warms them up."""
+    global _worker_generator
+    _worker_generator = HtmlPdfGenerator(template_dir=template_dir, stylesheet_paths=stylesheet_paths)
+    try:
+        _worker_generator.warm_up()
+    except Exception as e:
+        # Not fatal: the first real render pays the cost instead.
+        print(f"Render worker warm-up failed: {e}")
+
+
+def _render_in_worker(resume_dict: Dict[str, Any]) -> Tuple[bytes, List[metrics.SpanRecord]]:
+    # Stage timings measured here are handed back so the server process can record them.
+    with metrics.collect_spans() as spans:
+        resume_data = ATSFriendlyResume.model_validate(resume_dict)
+        pdf_bytes = _worker_generator.generate_pdf(resume_data).getvalue()
+    return pdf_bytes, spans
+
+
+def _unpack_render(result: Tuple[bytes, List[metrics.SpanRecord]]) -> BytesIO:
+    pdf_bytes, spans = result
+    metrics.replay_spans(spans)
+    return BytesIO(pdf_bytes)
+
+
+class ProcessPoolPdfGenerator(IDocumentGenerator):
+    """
+    Renders PDFs with HtmlPdfGenerator inside a warm pool of worker processes so
+    WeasyPrint's CPU-bound layout runs in parallel across cores instead of serially
+    under the server's GIL.
+    """
+    def __init__(
+        self,
+        template_dir: str = "templates",
+        stylesheet_paths: Sequence[str] = DEFAULT_STYLESHEET_PATHS,
+        max_workers: Optional[int] = None,
+        max_queue_size: int = 16,
+        render_timeout_seconds: Optional[float] = 60.0,
+    ):
+        existing_stylesheets = [path for path in stylesheet_paths if os.path.exists(path)]
+        self._render_version = render_fingerprint(os.path.join(template_dir, "resume_template.html"), stylesheet_paths)
+        self.pool = WarmProcessPool(
+            _render_in_worker,
+            initializer=_init_render_worker,
+            initargs=(template_dir, existing_stylesheets),
+            max_workers=max_workers,
+            max_queue_size=max_queue_size,
+            task_timeout=render_timeout_seconds,
+        )
+
+    def generate_pdf(self, resume_data: ATSFriendlyResume) -> BytesIO:
+        """
+        Generates a PDF byte stream in a worker process, blocking until it is ready.
+        """
+        try:
+            return _unpack_render(self.pool.submit(resume_data.model_dump()))
+        except WorkerPoolBusyError as e:
+            raise DocumentGeneratorBusyError(str(e)) from e
+        except WorkerPoolTimeoutError as e:
+            raise DocumentRenderTimeoutError(str(e)) from e
+
+    async def agenerate_pdf(self, resume_data: ATSFriendlyResume) -> BytesIO:
+        """
+        Generates a PDF byte stream in a worker process without blocking the event loop.
+        """
+        try:
+            return _unpack_render(await self.pool.asubmit(resume_data.model_dump()))
+        except WorkerPoolBusyError as e:
+            raise DocumentGeneratorBusyError(str(e)) from e
+        except WorkerPoolTimeoutError as e:
+            raise DocumentRenderTimeoutError(str(e)) from e
+
+    def render_version(self) -> str:
+        return self._render_version
+
+    def warm_up(self) -> float:
+        """Starts the pool; each worker warms its own generator in the initializer."""
+        started = time.perf_counter()
+        _unpack_render(self.pool.submit(WARM_UP_RESUME.model_dump()))
+        return time.perf_counter() - started
+
+    def generate_docx(self, resume_data: ATSFriendlyResume) -> BytesIO:
+        raise NotImplementedError("DOCX generation not supported for ProcessPoolPdfGenerator.")
+
+    def close(self) -> None:
+        self.pool.close()
+
+    def stats(self) -> Dict[str, Any]:
+        return self.pool.stats()
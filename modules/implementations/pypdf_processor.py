@@ -1,26 +1,96 @@
+import hashlib
 import io
 import os
 import re
 import fitz
-from langchain_community.document_loaders import PyPDFLoader
-from modules.interfaces.pdf_processor import IPDFProcessor
+from typing import BinaryIO, Optional
+from modules import metrics
+from modules.interfaces.cache import ICache
+from modules.interfaces.pdf_processor import IPDFProcessor, InvalidPDFError, PDFTooLargeError
+
+HASH_CHUNK_BYTES = 1024 * 1024
 
 class PyPDFProcessor(IPDFProcessor):
-    def extract_text(self, pdf_file_stream: io.BytesIO) -> str:
+    def __init__(self, cache: Optional[ICache] = None, max_pages: Optional[int] = None):
+        # Extracted text is cached by a SHA-256 of the raw PDF bytes, so re-uploads of
+        # the same resume skip the fitz parse and link walk entirely.
+        self.cache = cache
+        # Documents longer than this are rejected before any page is parsed.
+        self.max_pages = max_pages
+
+    @staticmethod
+    def _file_path(pdf_file_stream: BinaryIO) -> Optional[str]:
+        name = getattr(pdf_file_stream, "name", None)
+        return name if isinstance(name, str) and os.path.isfile(name) else None
+
+    @staticmethod
+    def _digest(pdf_file_stream: BinaryIO, pdf_buffer: Optional[memoryview]) -> str:
+        if pdf_buffer is not None:
+            return hashlib.sha256(pdf_buffer).hexdigest()
+        digest = hashlib.sha256()
+        pdf_file_stream.seek(0)
+        for chunk in iter(lambda: pdf_file_stream.read(HASH_CHUNK_BYTES), b""):
+            digest.update(chunk)
+        return digest.hexdigest()
+
+    def extract_text(self, pdf_file_stream: BinaryIO) -> str:
+        """
+        Extracts text and link targets from a PDF. In-memory streams are read through a
+        memoryview and spooled uploads are opened by path, so the document is never copied
+        into another bytes object on the way to fitz.
+        """
+        pdf_buffer: Optional[memoryview] = None
         try:
-            pdf_file_stream.seek(0)
-            doc = fitz.open(stream=pdf_file_stream.read(), filetype="pdf")
-            text = []
-            urls = []
+            pdf_path = self._file_path(pdf_file_stream)
+            if pdf_path is None:
+                if isinstance(pdf_file_stream, io.BytesIO):
+                    pdf_buffer = pdf_file_stream.getbuffer()
+                else:
+                    pdf_file_stream.seek(0)
+                    pdf_buffer = memoryview(pdf_file_stream.read())
+            return self._extract(pdf_file_stream, pdf_path, pdf_buffer)
+        except (PDFTooLargeError, InvalidPDFError):
+            raise
+        except Exception as e:
+            print(f"Error extracting text and links with PyMuPDFProcessor: {e}")
+            raise
+        finally:
+            # A live export of a BytesIO's buffer stops the caller from closing or resizing it.
+            if pdf_buffer is not None:
+                pdf_buffer.release()
+
+    def _extract(self, pdf_file_stream: BinaryIO, pdf_path: Optional[str], pdf_buffer: Optional[memoryview]) -> str:
+        cache_key = None
+        if self.cache is not None:
+            cache_key = "pdf-text:" + self._digest(pdf_file_stream, pdf_buffer)
+            cached_text = self.cache.get(cache_key)
+            if cached_text is not None:
+                return cached_text
+
+        with metrics.span("pdf_extract"):
+            try:
+                if pdf_path is not None:
+                    doc = fitz.open(pdf_path, filetype="pdf")
+                else:
+                    doc = fitz.open(stream=pdf_buffer, filetype="pdf")
+            except Exception as e:
+                raise InvalidPDFError(f"The file could not be read as a PDF: {e}") from None
+            try:
+                if self.max_pages is not None and doc.page_count > self.max_pages:
+                    raise PDFTooLargeError(f"The PDF has {doc.page_count} pages; at most {self.max_pages} are accepted.")
+                text = []
+                urls = []
 
-            for i in range(doc.page_count):
-                page = doc.load_page(i)  # type: ignore
-                text.append(page.get_text("text"))  # type: ignore[attr-defined]
+                for i in range(doc.page_count):
+                    page = doc.load_page(i)  # type: ignore
+                    text.append(page.get_text("text"))  # type: ignore[attr-defined]
 
-                # Extract real hyperlinks
-                for link in page.get_links():  # type: ignore[attr-defined]
-                    if link.get("uri"):
-                        urls.append(link["uri"])
+                    # Extract real hyperlinks
+                    for link in page.get_links():  # type: ignore[attr-defined]
+                        if link.get("uri"):
+                            urls.append(link["uri"])
+            finally:
+                doc.close()
 
             combined_text = "\n".join(text)
 
@@ -28,8 +98,7 @@ class PyPDFProcessor(IPDFProcessor):
             if urls:
                 combined_text += "\n\nExtracted URLs:\n" + "\n".join(set(urls))
 
-            return combined_text
+        if cache_key is not None:
+            self.cache.set(cache_key, combined_text)
 
-        except Exception as e:
-            print(f"Error extracting text and links with PyMuPDFProcessor: {e}")
-            raise
\ No newline at end of file
+        return combined_text
@@ -0,0 +1,166 @@
+import json
+import os
+import re
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, List, Optional
+from urllib.parse import urlsplit, urlunsplit
+from app.schemas import JobListing, JobSearchCriteria
+from modules.interfaces.job_store import IJobStore
+
+
+def normalize_job_url(job_url: str) -> str:
+    """Canonical form used as the dedup key: lowercase host, no query/fragment, trailing slash."""
+    parts = urlsplit(job_url.strip())
+    path = parts.path if parts.path.endswith("/") else parts.path + "/"
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), path, "", ""))
+
+
+def search_key(criteria: JobSearchCriteria) -> str:
+    """Case- and whitespace-insensitive key for a search's criteria."""
+    def _normalize(value: Optional[str]) -> str:
+        return re.sub(r"\s+", " ", value or "").strip().lower()
+    return json.dumps({"keywords": _normalize(criteria.keywords), "location": _normalize(criteria.location)}, sort_keys=True)
+
+
+class SQLiteJobStore(IJobStore):
+    """
+    Local SQLite store of scraped JobListings.
+    Listings are keyed by normalized job_url; searches map their criteria to the ordered
+    list of URLs they returned. Both expire after `ttl_seconds`.
+    """
+    def __init__(self, path: str = ".cache/jobs.sqlite3", ttl_seconds: float = 6 * 60 * 60):
+        self.path = path
+        self.ttl_seconds = ttl_seconds
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, timeout=30)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            """CREATE TABLE IF NOT EXISTS jobs (
+                job_url TEXT PRIMARY KEY,
+                data TEXT NOT NULL,
+                scraped_at REAL NOT NULL
+            )"""
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_jobs_scraped ON jobs (scraped_at)")
+        self._conn.execute(
+            """CREATE TABLE IF NOT EXISTS searches (
+                search_key TEXT PRIMARY KEY,
+                job_urls TEXT NOT NULL,
+                requested_limit INTEGER NOT NULL,
+                searched_at REAL NOT NULL
+            )"""
+        )
+        self._conn.commit()
+        self._job_hits = 0
+        self._job_misses = 0
+        self._search_hits = 0
+        self._search_misses = 0
+
+    def _is_fresh(self, timestamp: float) -> bool:
+        return timestamp + self.ttl_seconds > time.time()
+
+    def _upsert_locked(self, jobs: List[JobListing], now: float) -> None:
+        self._conn.executemany(
+            "INSERT OR REPLACE INTO jobs (job_url, data, scraped_at) VALUES (?, ?, ?)",
+            [(normalize_job_url(job.job_url), job.model_dump_json(), now) for job in jobs],
+        )
+
+    def upsert_jobs(self, jobs: List[JobListing]) -> None:
+        if not jobs:
+            return
+        with self._lock:
+            self._upsert_locked(jobs, time.time())
+            self._conn.commit()
+
+    def get_job(self, job_url: str, fresh_only: bool = True) -> Optional[JobListing]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT data, scraped_at FROM jobs WHERE job_url = ?", (normalize_job_url(job_url),)
+            ).fetchone()
+            if row is None or (fresh_only and not self._is_fresh(row[1])):
+                self._job_misses += 1
+                return None
+            self._job_hits += 1
+        return JobListing.model_validate_json(row[0])
+
+    def get_search(self, criteria: JobSearchCriteria, limit: int) -> Optional[List[JobListing]]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT job_urls, requested_limit, searched_at FROM searches WHERE search_key = ?",
+                (search_key(criteria),),
+            ).fetchone()
+            if row is None or not self._is_fresh(row[2]):
+                self._search_misses += 1
+                return None
+
+            job_urls = json.loads(row[0])
+            # A search that returned fewer jobs than it asked for was exhaustive.
+            exhaustive = len(job_urls) < row[1]
+            if len(job_urls) < limit and not exhaustive:
+                self._search_misses += 1
+                return None
+
+            jobs = []
+            for job_url in job_urls[:limit]:
+                job_row = self._conn.execute(
+                    "SELECT data, scraped_at FROM jobs WHERE job_url = ?", (job_url,)
+                ).fetchone()
+                if job_row is None or not self._is_fresh(job_row[1]):
+                    # A listing went stale; let the caller re-scrape the search.
+                    self._search_misses += 1
+                    return None
+                jobs.append(JobListing.model_validate_json(job_row[0]))
+            self._search_hits += 1
+        return jobs
+
+    def save_search(self, criteria: JobSearchCriteria, limit: int, jobs: List[JobListing]) -> None:
+        now = time.time()
+        with self._lock:
+            self._upsert_locked(jobs, now)
+            self._conn.execute(
+                "INSERT OR REPLACE INTO searches (search_key, job_urls, requested_limit, searched_at) VALUES (?, ?, ?, ?)",
+                (search_key(criteria), json.dumps([normalize_job_url(job.job_url) for job in jobs]), limit, now),
+            )
+            self._conn.commit()
+
+    def list_jobs(self, fresh_only: bool = True, scraped_since: Optional[float] = None) -> List[JobListing]:
+        with self._lock:
+            if scraped_since is None:
+                rows = self._conn.execute("SELECT data, scraped_at FROM jobs").fetchall()
+            else:
+                rows = self._conn.execute("SELECT data, scraped_at FROM jobs WHERE scraped_at >= ?", (scraped_since,)).fetchall()
+        return [JobListing.model_validate_json(data) for data, scraped_at in rows if not fresh_only or self._is_fresh(scraped_at)]
+
+    def list_expired_job_urls(self, expired_since: Optional[float] = None) -> List[str]:
+        with self._lock:
+            if expired_since is None:
+                rows = self._conn.execute(
+                    "SELECT job_url FROM jobs WHERE scraped_at <= ?", (time.time() - self.ttl_seconds,)
+                ).fetchall()
+            else:
+                rows = self._conn.execute(
+                    "SELECT job_url FROM jobs WHERE scraped_at <= ? AND scraped_at > ?",
+                    (time.time() - self.ttl_seconds, expired_since - self.ttl_seconds),
+                ).fetchall()
+        return [job_url for (job_url,) in rows]
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            (job_count,) = self._conn.execute("SELECT COUNT(*) FROM jobs").fetchone()
+            (search_count,) = self._conn.execute("SELECT COUNT(*) FROM searches").fetchone()
+            return {
+                "jobs": job_count,
+                "searches": search_count,
+                "job_hits": self._job_hits,
+                "job_misses": self._job_misses,
+                "search_hits": self._search_hits,
+                "search_misses": self._search_misses,
+            }
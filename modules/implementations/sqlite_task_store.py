@@ -0,0 +1,109 @@
+import os
+import pickle
+import sqlite3
+import threading
+import time
+from typing import Any, List, Optional, Sequence
+from app.schemas import OptimizationTask
+from modules.interfaces.task_store import ITaskStore
+
+class SQLiteTaskStore(ITaskStore):
+    """
+    Task records and artifacts in a SQLite file (WAL mode), so every server worker process
+    sees the same tasks: a task queued by one worker can be polled, downloaded or retried
+    through any other. Once more than `max_tasks` tasks exist, the oldest ones (and their
+    artifacts) are dropped.
+    """
+    def __init__(self, path: str, max_tasks: int = 1000):
+        self.path = path
+        self.max_tasks = max_tasks
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, timeout=30)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            """CREATE TABLE IF NOT EXISTS tasks (
+                task_id TEXT PRIMARY KEY,
+                data TEXT NOT NULL,
+                created_at REAL NOT NULL
+            )"""
+        )
+        self._conn.execute(
+            """CREATE TABLE IF NOT EXISTS task_artifacts (
+                task_id TEXT NOT NULL,
+                name TEXT NOT NULL,
+                value BLOB NOT NULL,
+                PRIMARY KEY (task_id, name)
+            )"""
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_tasks_created ON tasks (created_at)")
+        self._conn.commit()
+
+    def save_task(self, task: OptimizationTask) -> None:
+        with self._lock:
+            updated = self._conn.execute(
+                "UPDATE tasks SET data = ? WHERE task_id = ?", (task.model_dump_json(), task.task_id)
+            ).rowcount
+            if not updated:
+                self._conn.execute(
+                    "INSERT INTO tasks (task_id, data, created_at) VALUES (?, ?, ?)",
+                    (task.task_id, task.model_dump_json(), time.time()),
+                )
+                self._evict_locked()
+            self._conn.commit()
+
+    def _evict_locked(self) -> None:
+        (count,) = self._conn.execute("SELECT COUNT(*) FROM tasks").fetchone()
+        overflow = count - self.max_tasks
+        if overflow > 0:
+            evicted = [row[0] for row in self._conn.execute(
+                "SELECT task_id FROM tasks ORDER BY created_at ASC LIMIT ?", (overflow,)
+            ).fetchall()]
+            self._conn.executemany("DELETE FROM tasks WHERE task_id = ?", [(task_id,) for task_id in evicted])
+            self._conn.executemany("DELETE FROM task_artifacts WHERE task_id = ?", [(task_id,) for task_id in evicted])
+
+    def get_task(self, task_id: str) -> Optional[OptimizationTask]:
+        with self._lock:
+            row = self._conn.execute("SELECT data FROM tasks WHERE task_id = ?", (task_id,)).fetchone()
+        return OptimizationTask.model_validate_json(row[0]) if row is not None else None
+
+    def list_tasks(self, statuses: Sequence[str]) -> List[OptimizationTask]:
+        with self._lock:
+            rows = self._conn.execute("SELECT data FROM tasks ORDER BY created_at ASC").fetchall()
+        tasks = [OptimizationTask.model_validate_json(row[0]) for row in rows]
+        return [task for task in tasks if task.status in statuses]
+
+    def put_artifact(self, task_id: str, name: str, value: Any) -> None:
+        payload = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        with self._lock:
+            if self._conn.execute("SELECT 1 FROM tasks WHERE task_id = ?", (task_id,)).fetchone() is None:
+                return
+            self._conn.execute(
+                "INSERT OR REPLACE INTO task_artifacts (task_id, name, value) VALUES (?, ?, ?)", (task_id, name, payload)
+            )
+            self._conn.commit()
+
+    def get_artifact(self, task_id: str, name: str) -> Optional[Any]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value FROM task_artifacts WHERE task_id = ? AND name = ?", (task_id, name)
+            ).fetchone()
+        return pickle.loads(row[0]) if row is not None else None
+
+    def delete_artifact(self, task_id: str, name: str) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM task_artifacts WHERE task_id = ? AND name = ?", (task_id, name))
+            self._conn.commit()
+
+    def list_artifacts(self, task_id: str) -> List[str]:
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT name FROM task_artifacts WHERE task_id = ? ORDER BY name", (task_id,)
+            ).fetchall()
+        return [row[0] for row in rows]
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,210 @@
+import math
+import re
+import threading
+from collections import Counter
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+import numpy as np
+from app.schemas import JobListing, RankedJob
+from modules.implementations.sqlite_job_store import normalize_job_url
+from modules.interfaces.job_ranker import IJobRanker
+
+_TOKEN_RE = re.compile(r"[a-z0-9][a-z0-9+#.\-]*")
+STOP_WORDS = frozenset("""
+a about above after all also an and any are as at be been being but by can could did do does for from had
+has have having he her here his how i if in into is it its just may more most must my no not of on one or
+other our out over own per she should so some such than that the their them then there these they this
+those through to under up us very was we were what when where which while who will with within would you
+your years year experience work working team role job jobs company including etc strong ability using
+""".split())
+# Single letters that are real skills.
+KEEP_SHORT = frozenset({"c", "r"})
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercased word terms (keeping c++, c#, node.js, ...) plus bigrams of adjacent kept words."""
+    words = []
+    for token in _TOKEN_RE.findall(text.lower()):
+        token = token.rstrip(".-")
+        if token in STOP_WORDS or (len(token) < 2 and token not in KEEP_SHORT):
+            words.append(None)
+        else:
+            words.append(token)
+    terms = [word for word in words if word]
+    terms.extend(f"{first} {second}" for first, second in zip(words, words[1:]) if first and second)
+    return terms
+
+
+def listing_text(job: JobListing) -> str:
+    # The title is repeated so it weighs more than the snippet.
+    return "\n".join(filter(None, [job.title, job.title, job.company, job.location, job.description_snippet]))
+
+
+class TfidfJobRanker(IJobRanker):
+    """
+    Incremental TF-IDF index over JobListings, scored against a resume with cosine similarity.
+
+    Documents are stored as one CSR-style set of NumPy arrays (term ids, sublinear term
+    frequencies and row ids). Adding jobs only appends arrays and bumps document frequencies;
+    IDF weights and row norms are recomputed lazily on the next query. Scoring every listing
+    is a single gather + bincount over the non-zeros, so thousands of listings rank in a few
+    milliseconds.
+    """
+    def __init__(self, compact_min_rows: int = 1024):
+        self.compact_min_rows = compact_min_rows
+        self._lock = threading.Lock()
+        self._reset()
+
+    def _reset(self) -> None:
+        self._vocabulary: Dict[str, int] = {}
+        self._terms: List[str] = []
+        self._df = np.zeros(1024, dtype=np.float64)
+        self._jobs: List[JobListing] = []
+        self._row_by_url: Dict[str, int] = {}
+        self._row_terms: List[np.ndarray] = []
+        self._row_tf: List[np.ndarray] = []
+        self._alive = np.zeros(0, dtype=bool)
+        # Consolidated non-zeros, plus rows appended since the last query.
+        self._indices = np.zeros(0, dtype=np.int32)
+        self._tf = np.zeros(0, dtype=np.float64)
+        self._row_ids = np.zeros(0, dtype=np.int32)
+        self._pending: List[Tuple[int, np.ndarray, np.ndarray]] = []
+        # Derived from the above; None when stale.
+        self._weights: Optional[np.ndarray] = None
+        self._norms: Optional[np.ndarray] = None
+        self._idf: Optional[np.ndarray] = None
+
+    def _term_ids(self, terms: Sequence[str], grow: bool) -> Tuple[np.ndarray, np.ndarray]:
+        counts = Counter(terms)
+        ids, tf = [], []
+        for term, count in counts.items():
+            term_id = self._vocabulary.get(term)
+            if term_id is None:
+                if not grow:
+                    continue
+                term_id = self._vocabulary[term] = len(self._terms)
+                self._terms.append(term)
+            ids.append(term_id)
+            tf.append(1.0 + math.log(count))
+        return np.asarray(ids, dtype=np.int32), np.asarray(tf, dtype=np.float64)
+
+    def add_jobs(self, jobs: Sequence[JobListing]) -> None:
+        if not jobs:
+            return
+        with self._lock:
+            self._add_locked(jobs)
+            self._compact_if_needed()
+
+    def remove_jobs(self, job_urls: Sequence[str]) -> None:
+        with self._lock:
+            for job_url in job_urls:
+                row = self._row_by_url.pop(normalize_job_url(job_url), None)
+                if row is None:
+                    continue
+                self._alive[row] = False
+                self._df[self._row_terms[row]] -= 1
+                self._weights = self._norms = self._idf = None
+            self._compact_if_needed()
+
+    def _add_locked(self, jobs: Sequence[JobListing]) -> None:
+        # Room for every new row up front, so a URL repeated within the batch can be retired.
+        self._alive = np.concatenate([self._alive, np.ones(len(jobs), dtype=bool)])
+        for job in jobs:
+            key = normalize_job_url(job.job_url)
+            previous_row = self._row_by_url.get(key)
+            if previous_row is not None and self._jobs[previous_row] == job:
+                # Scrapers re-save the same listing (per page, then per search); keep the row.
+                continue
+            if previous_row is not None:
+                self._alive[previous_row] = False
+                self._df[self._row_terms[previous_row]] -= 1
+
+            ids, tf = self._term_ids(tokenize(listing_text(job)), grow=True)
+            if len(self._terms) > len(self._df):
+                self._df = np.concatenate([self._df, np.zeros(max(len(self._terms), len(self._df)), dtype=np.float64)])
+            self._df[ids] += 1
+
+            row = len(self._jobs)
+            self._jobs.append(job)
+            self._row_terms.append(ids)
+            self._row_tf.append(tf)
+            self._row_by_url[key] = row
+            self._pending.append((row, ids, tf))
+        self._alive = self._alive[:len(self._jobs)]
+        self._weights = self._norms = self._idf = None
+
+    def _compact_if_needed(self) -> None:
+        dead_rows = len(self._jobs) - int(self._alive.sum())
+        if dead_rows > max(self.compact_min_rows, len(self._jobs) - dead_rows):
+            self._compact()
+
+    def _compact(self) -> None:
+        """Drops the rows of replaced or removed listings once they outnumber the live ones."""
+        live_jobs = [job for job, alive in zip(self._jobs, self._alive) if alive]
+        self._reset()
+        self._add_locked(live_jobs)
+
+    def _refresh(self) -> None:
+        """Folds pending rows into the consolidated arrays and recomputes IDF-weighted norms."""
+        if self._pending:
+            self._indices = np.concatenate([self._indices] + [ids for _, ids, _ in self._pending])
+            self._tf = np.concatenate([self._tf] + [tf for _, _, tf in self._pending])
+            self._row_ids = np.concatenate(
+                [self._row_ids] + [np.full(len(ids), row, dtype=np.int32) for row, ids, _ in self._pending]
+            )
+            self._pending = []
+        if self._weights is None:
+            live_documents = int(self._alive.sum())
+            vocabulary_size = len(self._terms)
+            self._idf = np.log((1.0 + live_documents) / (1.0 + self._df[:vocabulary_size])) + 1.0
+            # Replaced or removed rows keep their non-zeros but contribute nothing.
+            self._weights = self._tf * self._idf[self._indices] * self._alive[self._row_ids]
+            self._norms = np.sqrt(np.bincount(self._row_ids, weights=self._weights ** 2, minlength=len(self._jobs)))
+
+    def rank(self, resume_text: str, top_k: int = 10, job_urls: Optional[Sequence[str]] = None) -> List[RankedJob]:
+        with self._lock:
+            if not self._jobs or top_k <= 0:
+                return []
+            self._refresh()
+            query_ids, query_tf = self._term_ids(tokenize(resume_text), grow=False)
+            if len(query_ids) == 0:
+                return []
+            query = np.zeros(len(self._terms), dtype=np.float64)
+            query[query_ids] = query_tf * self._idf[query_ids]
+            query_norm = np.linalg.norm(query)
+
+            dots = np.bincount(self._row_ids, weights=self._weights * query[self._indices], minlength=len(self._jobs))
+            with np.errstate(divide="ignore", invalid="ignore"):
+                scores = np.where(self._norms > 0, dots / (self._norms * query_norm), 0.0)
+
+            eligible = self._alive.copy()
+            if job_urls is not None:
+                wanted = np.zeros(len(self._jobs), dtype=bool)
+                rows = [self._row_by_url.get(normalize_job_url(job_url)) for job_url in job_urls]
+                wanted[[row for row in rows if row is not None]] = True
+                eligible &= wanted
+            scores = np.where(eligible, scores, -1.0)
+
+            top_k = min(top_k, int(eligible.sum()))
+            if top_k == 0:
+                return []
+            top_rows = np.argpartition(-scores, top_k - 1)[:top_k]
+            top_rows = top_rows[np.argsort(-scores[top_rows], kind="stable")]
+            return [
+                RankedJob(job=self._jobs[row], score=round(float(max(scores[row], 0.0)), 4), matched_terms=self._matched_terms(row, query))
+                for row in top_rows
+            ]
+
+    def _matched_terms(self, row: int, query: np.ndarray, limit: int = 10) -> List[str]:
+        ids = self._row_terms[row]
+        contributions = query[ids] * self._row_tf[row] * self._idf[ids]
+        order = np.argsort(-contributions, kind="stable")
+        return [self._terms[ids[position]] for position in order[:limit] if contributions[position] > 0]
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "jobs": int(self._alive.sum()),
+                "rows": len(self._jobs),
+                "vocabulary": len(self._terms),
+                "non_zeros": int(len(self._indices) + sum(len(ids) for _, ids, _ in self._pending)),
+            }
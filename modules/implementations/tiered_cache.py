@@ -0,0 +1,54 @@
+import threading
+from typing import Any, Dict, List, Optional
+from modules.interfaces.cache import ICache
+
+class TieredCache(ICache):
+    """
+    Chains several caches from fastest to slowest (e.g. in-memory LRU in front of disk).
+    Lookups fall through the layers in order and a hit in a slower layer is copied
+    back into every faster layer.
+    """
+    def __init__(self, layers: List[ICache]):
+        if not layers:
+            raise ValueError("TieredCache needs at least one layer.")
+        self.layers = layers
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def get(self, key: str) -> Optional[Any]:
+        for index, layer in enumerate(self.layers):
+            value = layer.get(key)
+            if value is not None:
+                for faster_layer in self.layers[:index]:
+                    faster_layer.set(key, value)
+                with self._lock:
+                    self._hits += 1
+                return value
+        with self._lock:
+            self._misses += 1
+        return None
+
+    def set(self, key: str, value: Any) -> None:
+        for layer in self.layers:
+            layer.set(key, value)
+
+    def delete(self, key: str) -> None:
+        for layer in self.layers:
+            layer.delete(key)
+
+    def clear(self) -> None:
+        for layer in self.layers:
+            layer.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self._hits + self._misses
+            hits, misses = self._hits, self._misses
+        return {
+            "backend": "tiered",
+            "hits": hits,
+            "misses": misses,
+            "hit_rate": hits / lookups if lookups else 0.0,
+            "layers": [layer.stats() for layer in self.layers],
+        }
@@ -0,0 +1,35 @@
+from abc import ABC, abstractmethod
+from typing import Any, Dict, Optional
+
+class ICache(ABC):
+    @abstractmethod
+    def get(self, key: str) -> Optional[Any]:
+        """
+        Abstract method to look up a cached value.
+        Returns None on a miss or when the entry has expired.
+        """
+        pass
+
+    @abstractmethod
+    def set(self, key: str, value: Any) -> None:
+        """
+        Abstract method to store a value under the given key, evicting older entries if needed.
+        """
+        pass
+
+    @abstractmethod
+    def delete(self, key: str) -> None:
+        """Abstract method to remove a single entry (no-op if the key is absent)."""
+        pass
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Abstract method to remove every entry from the cache."""
+        pass
+
+    @abstractmethod
+    def stats(self) -> Dict[str, Any]:
+        """
+        Abstract method to report cache counters (hits, misses, evictions, size, hit_rate).
+        """
+        pass
@@ -1,6 +1,13 @@
 from abc import ABC, abstractmethod
 from io import BytesIO
 from app.schemas import ATSFriendlyResume
+from modules.executors import run_blocking
+
+class DocumentGeneratorBusyError(Exception):
+    """Raised when a generator cannot accept more work right now (callers should retry later)."""
+
+class DocumentRenderTimeoutError(Exception):
+    """Raised when rendering a single document exceeds the generator's time limit."""
 
 class IDocumentGenerator(ABC):
     @abstractmethod
@@ -10,6 +17,31 @@ class IDocumentGenerator(ABC):
         """
         pass
 
+    async def agenerate_pdf(self, resume_data: ATSFriendlyResume) -> BytesIO:
+        """
+        Async counterpart of generate_pdf; by default offloads it to the shared blocking executor.
+        """
+        return await run_blocking(self.generate_pdf, resume_data)
+
+    def render_version(self) -> str:
+        """
+        Identifies the layout (template, stylesheets) this generator renders with. Caches of
+        rendered output include it in their keys so a layout change invalidates them.
+        """
+        return type(self).__name__
+
+    def warm_up(self) -> float:
+        """
+        Optionally pays one-off rendering costs (fonts, stylesheets, templates) before the first
+        request. Returns the seconds spent; the default does nothing.
+        """
+        return 0.0
+
+    def close(self) -> None:
+        """
+        Releases worker processes or other resources held by the generator. The default does nothing.
+        """
+
     @abstractmethod
     def generate_docx(self, resume_data: ATSFriendlyResume) -> BytesIO:
         """
@@ -0,0 +1,31 @@
+from abc import ABC, abstractmethod
+from typing import Any, Dict, List, Optional, Sequence
+from app.schemas import JobListing, RankedJob
+
+class IJobRanker(ABC):
+    @abstractmethod
+    def add_jobs(self, jobs: Sequence[JobListing]) -> None:
+        """
+        Abstract method to index listings (re-indexing any job_url that is already present).
+        """
+        pass
+
+    @abstractmethod
+    def remove_jobs(self, job_urls: Sequence[str]) -> None:
+        """
+        Abstract method to drop listings from the index (unknown URLs are ignored).
+        """
+        pass
+
+    @abstractmethod
+    def rank(self, resume_text: str, top_k: int = 10, job_urls: Optional[Sequence[str]] = None) -> List[RankedJob]:
+        """
+        Abstract method to return the top_k indexed listings most relevant to the resume,
+        best first, optionally restricted to the given job URLs.
+        """
+        pass
+
+    @abstractmethod
+    def stats(self) -> Dict[str, Any]:
+        """Abstract method to report index size counters."""
+        pass
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import AsyncIterator, List, Optional
 from app.schemas import JobListing, JobSearchCriteria
 
 class IJobScraper(ABC):
@@ -15,6 +15,15 @@ class IJobScraper(ABC):
         """
         pass
 
+    async def iter_jobs(self, criteria: JobSearchCriteria, limit: int = 10) -> AsyncIterator[JobListing]:
+        """
+        Yields job listings one at a time as they become available.
+        Implementations that scrape incrementally should override this; the default
+        waits for search_jobs and then yields its results.
+        """
+        for job_listing in await self.search_jobs(criteria, limit):
+            yield job_listing
+
 # You might add other methods later, e.g., for getting full job descriptions
     # @abstractmethod
     # async def get_full_job_description(self, job_url: str) -> str:
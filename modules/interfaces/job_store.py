@@ -0,0 +1,55 @@
+from abc import ABC, abstractmethod
+from typing import Any, Dict, List, Optional
+from app.schemas import JobListing, JobSearchCriteria
+
+class IJobStore(ABC):
+    @abstractmethod
+    def upsert_jobs(self, jobs: List[JobListing]) -> None:
+        """
+        Abstract method to insert or refresh listings, deduplicated by normalized job_url.
+        """
+        pass
+
+    @abstractmethod
+    def get_job(self, job_url: str, fresh_only: bool = True) -> Optional[JobListing]:
+        """
+        Abstract method to look up one listing by URL.
+        With fresh_only=True, entries older than the store's TTL are treated as missing.
+        """
+        pass
+
+    @abstractmethod
+    def get_search(self, criteria: JobSearchCriteria, limit: int) -> Optional[List[JobListing]]:
+        """
+        Abstract method to return the cached results of an earlier, still fresh search that
+        can satisfy `limit`, or None if the search has to be scraped again.
+        """
+        pass
+
+    @abstractmethod
+    def save_search(self, criteria: JobSearchCriteria, limit: int, jobs: List[JobListing]) -> None:
+        """
+        Abstract method to record which listings a search returned (upserting the listings too).
+        """
+        pass
+
+    def list_jobs(self, fresh_only: bool = True, scraped_since: Optional[float] = None) -> List[JobListing]:
+        """
+        Returns every stored listing (only those within the TTL when fresh_only=True), or only
+        those written at or after the `scraped_since` timestamp.
+        Stores that cannot enumerate their contents return an empty list.
+        """
+        return []
+
+    def list_expired_job_urls(self, expired_since: Optional[float] = None) -> List[str]:
+        """
+        Returns the normalized URLs of listings whose TTL ran out after the `expired_since`
+        timestamp (at any time when None), so indexes built from list_jobs can drop them.
+        Stores without a TTL return an empty list.
+        """
+        return []
+
+    @abstractmethod
+    def stats(self) -> Dict[str, Any]:
+        """Abstract method to report store counters (listings, searches, cache hits)."""
+        pass
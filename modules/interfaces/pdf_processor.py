@@ -1,8 +1,19 @@
 from abc import ABC, abstractmethod
-import io
+from typing import BinaryIO
+from modules.executors import run_blocking
+
+class PDFTooLargeError(Exception):
+    """Raised when an uploaded PDF exceeds the accepted size or page count."""
+
+class InvalidPDFError(ValueError):
+    """Raised when the uploaded bytes cannot be opened as a PDF."""
 
 class IPDFProcessor(ABC):
     @abstractmethod
-    def extract_text(self, pdf_file_stream: io.BytesIO) -> str:
-        """Abstract method to extract text from a PDF file stream"""
+    def extract_text(self, pdf_file_stream: BinaryIO) -> str:
+        """Abstract method to extract text from a PDF file stream (in memory or backed by a file on disk)"""
         pass
+
+    async def aextract_text(self, pdf_file_stream: BinaryIO) -> str:
+        """Async counterpart of extract_text; by default offloads it to the shared blocking executor."""
+        return await run_blocking(self.extract_text, pdf_file_stream)
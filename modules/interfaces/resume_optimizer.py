@@ -1,19 +1,72 @@
+import asyncio
 from abc import ABC, abstractmethod
-from app.schemas import ATSFriendlyResume, ResumeSuggestions
+from typing import Any, AsyncIterator, List
+from app.schemas import ATSFriendlyResume, ResumeSuggestions, ResumeWithSuggestions
+from modules.executors import run_blocking
+from modules.resume_sections import resume_section_events
 
 class IResumeOptimizer(ABC):
+    # Whether aoptimize_section is implemented; callers re-optimize the whole resume otherwise.
+    supports_section_optimization: bool = False
+
     @abstractmethod
-    def optimize_resume(self, resume_text: str, job_description: str) -> ATSFriendlyResume:
+    def optimize_resume(self, resume_text: str, job_description: str, use_cache: bool = True) -> ATSFriendlyResume:
         """
         Abstract method to optimize a resume based on a job description.
         Returns an ATSFriendlyResume object (the content of the resume).
+        Set use_cache=False to skip any cached response and force a fresh generation.
         """
         pass
 
     @abstractmethod
-    def get_suggestions(self, resume_text: str, job_description: str) -> ResumeSuggestions:
+    def get_suggestions(self, resume_text: str, job_description: str, use_cache: bool = True) -> ResumeSuggestions:
         """
         Abstract method to generate improvement suggestions for a resume.
         Returns a ResumeSuggestions object.
+        Set use_cache=False to skip any cached response and force a fresh generation.
+        """
+        pass
+
+    async def aoptimize_resume(self, resume_text: str, job_description: str, use_cache: bool = True) -> ATSFriendlyResume:
+        """
+        Async counterpart of optimize_resume; by default offloads it to the shared blocking executor.
+        """
+        return await run_blocking(self.optimize_resume, resume_text, job_description, use_cache=use_cache)
+
+    async def aget_suggestions(self, resume_text: str, job_description: str, use_cache: bool = True) -> ResumeSuggestions:
+        """
+        Async counterpart of get_suggestions; by default offloads it to the shared blocking executor.
+        """
+        return await run_blocking(self.get_suggestions, resume_text, job_description, use_cache=use_cache)
+
+    async def aoptimize_with_suggestions(self, resume_text: str, job_description: str, use_cache: bool = True) -> ResumeWithSuggestions:
+        """
+        Returns the optimized resume and the improvement suggestions for the same inputs.
+        By default the two LLM requests run concurrently, so the latency is that of the slower one.
+        """
+        resume, suggestions = await asyncio.gather(
+            self.aoptimize_resume(resume_text, job_description, use_cache=use_cache),
+            self.aget_suggestions(resume_text, job_description, use_cache=use_cache),
+        )
+        return ResumeWithSuggestions(resume=resume, suggestions=suggestions)
+
+    async def astream_resume(self, resume_text: str, job_description: str, use_cache: bool = True) -> AsyncIterator[dict]:
+        """
+        Yields {"event": "section", ...} events as parts of the optimized resume become
+        available, followed by one {"event": "resume", "data": ...} with the whole result.
+        Implementations that can parse the model output incrementally should override this;
+        the default waits for aoptimize_resume and then splits its result into sections.
+        """
+        resume = await self.aoptimize_resume(resume_text, job_description, use_cache=use_cache)
+        for event in resume_section_events(resume):
+            yield event
+
+    async def aoptimize_section(self, section: str, source_text: str, job_description: str, previous_entries: List[Any], use_cache: bool = True) -> List[Any]:
+        """
+        Re-optimizes one part of a resume (e.g. a single "experience" or "projects" entry)
+        from its source text, returning the entries for that part of the section.
+        previous_entries are the entries optimized from the earlier version, for consistency.
+        Optional: implementations that override it set supports_section_optimization = True,
+        and raise ValueError for a section outside ITEM_SECTIONS.
         """
-        pass
\ No newline at end of file
+        raise ValueError(f"{type(self).__name__} does not support section-level optimization.")
@@ -0,0 +1,31 @@
+from abc import ABC, abstractmethod
+from typing import Any, Awaitable, Callable, Dict
+
+class TaskQueueFullError(Exception):
+    """Raised when the queue cannot accept another task right now."""
+
+class ITaskQueue(ABC):
+    @abstractmethod
+    async def start(self, handler: Callable[[str], Awaitable[None]]) -> None:
+        """
+        Abstract method to start consuming tasks; `handler(task_id)` is awaited for each one.
+        """
+        pass
+
+    @abstractmethod
+    async def enqueue(self, task_id: str) -> None:
+        """
+        Abstract method to schedule a task for execution.
+        Raises TaskQueueFullError when the backlog is at capacity.
+        """
+        pass
+
+    @abstractmethod
+    async def stop(self) -> None:
+        """Abstract method to stop the workers (in-flight tasks may be cancelled)."""
+        pass
+
+    @abstractmethod
+    def stats(self) -> Dict[str, Any]:
+        """Abstract method to report queue depth and worker counters."""
+        pass
@@ -0,0 +1,42 @@
+from abc import ABC, abstractmethod
+from typing import Any, List, Optional, Sequence
+from app.schemas import OptimizationTask
+
+class ITaskStore(ABC):
+    @abstractmethod
+    def save_task(self, task: OptimizationTask) -> None:
+        """Abstract method to create or update a task's status record."""
+        pass
+
+    @abstractmethod
+    def get_task(self, task_id: str) -> Optional[OptimizationTask]:
+        """Abstract method to fetch a task's status record (None if unknown or expired)."""
+        pass
+
+    @abstractmethod
+    def list_tasks(self, statuses: Sequence[str]) -> List[OptimizationTask]:
+        """Abstract method to fetch every stored task whose status is one of `statuses`."""
+        pass
+
+    @abstractmethod
+    def put_artifact(self, task_id: str, name: str, value: Any) -> None:
+        """
+        Abstract method to store an intermediate artifact (e.g. extracted text, structured
+        resume, rendered PDF) so a retried task can resume after the last completed stage.
+        """
+        pass
+
+    @abstractmethod
+    def get_artifact(self, task_id: str, name: str) -> Optional[Any]:
+        """Abstract method to fetch a stored artifact (None if it was never produced)."""
+        pass
+
+    @abstractmethod
+    def delete_artifact(self, task_id: str, name: str) -> None:
+        """Abstract method to drop an artifact that is no longer needed."""
+        pass
+
+    @abstractmethod
+    def list_artifacts(self, task_id: str) -> List[str]:
+        """Abstract method to list the names of a task's stored artifacts."""
+        pass
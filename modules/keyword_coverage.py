@@ -0,0 +1,347 @@
+import functools
+import re
+from dataclasses import dataclass
+from typing import Dict, FrozenSet, List, Optional, Tuple, Union
+from app.schemas import ATSFriendlyResume, KeywordCoverage
+
+# Canonical skill -> spellings that mean the same thing. Every spelling (and the canonical
+# form itself) is matched as a phrase, so "k8s" in a resume satisfies "Kubernetes" in a posting.
+# Aliases must be unambiguous on their own: coverage gates batch LLM calls, so a word that
+# only sometimes means the skill ("led", "containers", "tf") would inflate it.
+SYNONYMS: Dict[str, List[str]] = {
+    "javascript": ["js", "ecmascript", "es6"],
+    "typescript": [],
+    "node.js": ["node", "nodejs", "node js"],
+    "react": ["react.js", "reactjs", "react js"],
+    "vue": ["vue.js", "vuejs"],
+    "angular": ["angularjs", "angular.js"],
+    "next.js": ["nextjs"],
+    "python": ["python3"],
+    "golang": [], # Bare "go" is too common an English word to match
+    "c++": ["cpp"],
+    "c#": ["csharp", "c sharp"],
+    ".net": ["dotnet", "asp.net"],
+    "postgresql": ["postgres", "psql"],
+    "mysql": [],
+    "mongodb": ["mongo"],
+    "redis": [],
+    "elasticsearch": ["elastic search", "opensearch"],
+    "kafka": ["apache kafka"],
+    "spark": ["apache spark", "pyspark"],
+    "airflow": ["apache airflow"],
+    "kubernetes": ["k8s"],
+    "docker": [],
+    "terraform": [],
+    "aws": ["amazon web services"],
+    "gcp": ["google cloud", "google cloud platform"],
+    "azure": ["microsoft azure"],
+    "ci/cd": ["cicd", "ci cd", "continuous integration", "continuous delivery", "continuous deployment"],
+    "machine learning": ["ml"],
+    "deep learning": ["dl"],
+    "artificial intelligence": ["ai"],
+    "natural language processing": ["nlp"],
+    "large language models": ["llm", "llms"],
+    "computer vision": [],
+    "pytorch": ["torch"],
+    "tensorflow": [],
+    "scikit-learn": ["sklearn", "scikit learn"],
+    "pandas": [],
+    "numpy": [],
+    "sql": [],
+    "nosql": [],
+    "graphql": [],
+    "rest apis": ["rest api", "restful", "restful api", "restful apis"],
+    "grpc": [],
+    "microservices": ["micro services", "microservice"],
+    "distributed systems": [],
+    "fastapi": [],
+    "django": [],
+    "flask": [],
+    "spring": ["spring boot"],
+    "java": [],
+    "kotlin": [],
+    "scala": [],
+    "rust": [],
+    "ruby": ["ruby on rails", "rails"],
+    "php": [],
+    "swift": [],
+    "linux": ["unix"],
+    "git": ["github", "gitlab"],
+    "agile": ["scrum", "kanban"],
+    "front-end": ["frontend", "front end"],
+    "back-end": ["backend", "back end"],
+    "full-stack": ["fullstack", "full stack"],
+    "devops": ["dev ops"],
+    "site reliability engineering": ["sre"],
+    "observability": ["prometheus", "grafana", "datadog"],
+    "data engineering": ["data pipelines", "etl", "elt"],
+    "data warehouse": ["snowflake", "bigquery", "redshift"],
+    "html": ["html5"],
+    "css": ["css3", "sass", "scss"],
+    "unit testing": ["pytest", "jest", "junit", "tdd", "test-driven development"],
+    "security": ["appsec", "infosec"],
+    "leadership": ["mentored", "mentoring"],
+    "communication": [],
+}
+
+# Words too common in postings or resumes to count as keywords on their own.
+STOP_WORDS = frozenset("""
+a about above across after all also an and any are as at be been being both but by can could did do does
+each either etc for from had has have having he her here his how i if in into is it its just like may more
+most must my no not of on one or other our out over own per plus she should so some such than that the
+their them then there these they this those through to under until up us very via was we were what when
+where which while who whom will with within without would you your
+ability able across apply applicant applicants based best bonus candidate candidates career closely
+company day degree deliver demonstrated desired environment equivalent excellent experience experienced
+familiar familiarity global good great help highly ideal including join knowledge level looking
+new nice offer opportunity plus position preferred proficiency proficient proven qualifications related
+required requirements responsibilities responsible role skill skills solid strong successful support team
+teams understanding using work working world year years
+""".split())
+
+_TOKEN_RE = re.compile(r"\.net\b|[a-z0-9][a-z0-9+#./\-]*")
+_WORD_RE = re.compile(r"[a-z]+")
+
+# Weight of a known skill relative to any other repeated keyword when computing coverage.
+SKILL_WEIGHT = 2.0
+
+# Resume section headings recognised in raw (PDF-extracted) text.
+RAW_SECTION_HEADINGS = {
+    "summary": r"(professional )?summary|profile|objective|about( me)?",
+    "experience": r"(work |professional )?experience|employment( history)?|work history",
+    "skills": r"(technical |core )?skills|technologies|tech stack|competencies",
+    "projects": r"(personal |selected )?projects",
+    "education": r"education|academic background",
+    "certifications": r"certifications?|licenses?|awards|honou?rs",
+}
+_RAW_HEADING_RE = re.compile(
+    r"^\W*(?:" + "|".join(f"(?P<{section}>{pattern})" for section, pattern in RAW_SECTION_HEADINGS.items()) + r")\W*$",
+    re.IGNORECASE,
+)
+
+
+@functools.lru_cache(maxsize=65536)
+def stem(word: str) -> str:
+    """
+    Light suffix stripping for plain English words: "services", "service" -> "servic";
+    "scaled", "scaling" -> "scal". Applied identically to postings and resumes, so only
+    consistency matters, not linguistics.
+    """
+    if len(word) <= 4 or not word.isalpha():
+        return word
+    if word.endswith("sses"):
+        word = word[:-2]
+    elif word.endswith("ies"):
+        word = word[:-3] + "y"
+    elif word.endswith(("xes", "ches", "shes")):
+        word = word[:-2]
+    elif word.endswith("s") and not word.endswith(("ss", "us", "is")):
+        word = word[:-1]
+    for suffix in ("ing", "ed"):
+        if word.endswith(suffix) and len(word) - len(suffix) >= 3:
+            word = word[: -len(suffix)]
+            # "planned" -> "plan"
+            if len(word) > 3 and word[-1] == word[-2] and word[-1] not in "lsz":
+                word = word[:-1]
+            break
+    if word.endswith("ation"):
+        word = word[:-3]
+    if word.endswith("e") and len(word) > 3:
+        word = word[:-1]
+    return word
+
+
+def _build_phrase_table() -> Dict[Tuple[str, ...], str]:
+    table = {}
+    for canonical, aliases in SYNONYMS.items():
+        for spelling in [canonical, *aliases]:
+            table[tuple(spelling.split())] = canonical
+    return table
+
+
+PHRASES = _build_phrase_table()
+# First word of every multi-word spelling -> its longest length in words.
+PHRASE_STARTS: Dict[str, int] = {
+    phrase[0]: max(len(other) for other in PHRASES if other[0] == phrase[0]) for phrase in PHRASES if len(phrase) > 1
+}
+SKILL_TERMS: FrozenSet[str] = frozenset(SYNONYMS)
+
+
+def _raw_tokens(text: str) -> List[str]:
+    tokens = []
+    for token in _TOKEN_RE.findall(text.lower()):
+        token = token.rstrip("./-")
+        if "/" not in token and "-" not in token:
+            if token:
+                tokens.append(token)
+        elif (token,) in PHRASES:
+            tokens.append(token)
+        else:
+            # "python/django" and "cloud-native" are two words unless the whole token is a known skill.
+            tokens.extend(part for part in re.split(r"[/\-]", token) if part)
+    return tokens
+
+
+@functools.lru_cache(maxsize=65536)
+def _word_term(token: str) -> Optional[Tuple[str, str]]:
+    """(term, surface) for a single token, or None for stop words and numbers."""
+    canonical = PHRASES.get((token,))
+    if canonical is not None:
+        return canonical, canonical
+    if token in STOP_WORDS or len(token) < 2 or token.isdigit():
+        return None
+    return (stem(token) if _WORD_RE.fullmatch(token) else token), token
+
+
+def _terms_with_surface(text: str) -> List[Tuple[str, str]]:
+    tokens = _raw_tokens(text)
+    terms = []
+    position, count = 0, len(tokens)
+    while position < count:
+        token = tokens[position]
+        # Only tokens that open a multi-word synonym need the longest-match scan.
+        for length in range(min(PHRASE_STARTS.get(token, 1), count - position), 1, -1):
+            canonical = PHRASES.get(tuple(tokens[position:position + length]))
+            if canonical is not None:
+                terms.append((canonical, canonical))
+                position += length
+                break
+        else:
+            position += 1
+            term = _word_term(token)
+            if term is not None:
+                terms.append(term)
+    return terms
+
+
+def normalize_terms(text: str) -> List[str]:
+    """
+    Tokenizes text into canonical terms: known skills (longest synonym phrase first) and the
+    stems of every other non-stop word, in order of appearance.
+    """
+    return [term for term, _ in _terms_with_surface(text)]
+
+
+@dataclass(frozen=True)
+class JobKeywords:
+    """Keywords extracted from one job description, most important first."""
+    terms: Tuple[str, ...]
+    labels: Tuple[str, ...] # How each term is reported: the canonical skill or the posting's first spelling
+    weights: Tuple[float, ...]
+
+    @property
+    def total_weight(self) -> float:
+        return sum(self.weights)
+
+
+@functools.lru_cache(maxsize=2048)
+def extract_keywords(job_description: str, max_keywords: int = 40) -> JobKeywords:
+    """
+    Every known skill in the posting, then other words the posting repeats (by frequency),
+    capped at max_keywords. Cached, since the same posting is scored against many resumes.
+    """
+    counts: Dict[str, int] = {}
+    first_seen: Dict[str, int] = {}
+    labels: Dict[str, str] = {}
+    for position, (term, surface) in enumerate(_terms_with_surface(job_description)):
+        counts[term] = counts.get(term, 0) + 1
+        first_seen.setdefault(term, position)
+        labels.setdefault(term, surface)
+
+    skills = sorted((term for term in counts if term in SKILL_TERMS), key=first_seen.__getitem__)
+    others = sorted(
+        (term for term, count in counts.items() if count >= 2 and term not in SKILL_TERMS and len(term) >= 3),
+        key=lambda term: (-counts[term], first_seen[term]),
+    )
+    terms = (skills + others)[:max_keywords]
+    return JobKeywords(
+        terms=tuple(terms),
+        labels=tuple(labels[term] for term in terms),
+        weights=tuple(SKILL_WEIGHT if term in SKILL_TERMS else 1.0 for term in terms),
+    )
+
+
+def _join(values) -> str:
+    return "\n".join(value for value in values if value)
+
+
+def resume_section_texts(resume: ATSFriendlyResume) -> Dict[str, str]:
+    """Groups a structured resume's text by the section an ATS would attribute it to."""
+    def _experience(entries) -> str:
+        return _join(
+            _join([entry.title, entry.company, *entry.responsibilities, *(entry.technologies_used or []), *(entry.achievements or [])])
+            for entry in entries or []
+        )
+
+    return {
+        "summary": resume.summary,
+        "experience": _experience(resume.experience),
+        "skills": _join(f"{skill.category}: {', '.join(skill.keywords)}" for skill in resume.skills),
+        "projects": _join(
+            _join([project.name, project.description, *(project.technologies or []), project.impact]) for project in resume.projects or []
+        ),
+        "education": _join(
+            _join([entry.degree, entry.major, entry.institution, *(entry.relevant_coursework or []), entry.additional_info])
+            for entry in resume.education
+        ),
+        "certifications": _join([*(resume.certifications or []), *(resume.awards or [])]),
+        "other": _join([_experience(resume.volunteer_experience), *(resume.languages_spoken or []), *(resume.interests or [])]),
+    }
+
+
+def split_raw_sections(resume_text: str) -> Dict[str, str]:
+    """Splits extracted resume text on recognised headings; text before the first one is "header"."""
+    sections: Dict[str, List[str]] = {}
+    current = "header"
+    for line in resume_text.splitlines():
+        match = _RAW_HEADING_RE.match(line) if len(line) <= 40 else None
+        if match:
+            current = match.lastgroup
+            continue
+        sections.setdefault(current, []).append(line)
+    return {section: "\n".join(lines) for section, lines in sections.items()}
+
+
+@functools.lru_cache(maxsize=1024)
+def _raw_resume_terms(resume_text: str) -> Dict[str, FrozenSet[str]]:
+    return {section: frozenset(normalize_terms(text)) for section, text in split_raw_sections(resume_text).items()}
+
+
+def resume_terms(resume: Union[ATSFriendlyResume, str]) -> Dict[str, FrozenSet[str]]:
+    """Canonical term set per resume section (raw text results are cached by content)."""
+    if isinstance(resume, str):
+        return _raw_resume_terms(resume)
+    return {section: frozenset(normalize_terms(text)) for section, text in resume_section_texts(resume).items() if text}
+
+
+def score_keyword_coverage(job_description: str, resume: Union[ATSFriendlyResume, str], max_keywords: int = 40) -> KeywordCoverage:
+    """
+    Deterministic ATS-style match of a resume against a posting: which of the posting's
+    keywords the resume contains (after stemming and synonym mapping), where, and what is missing.
+    """
+    keywords = extract_keywords(job_description, max_keywords)
+    sections = resume_terms(resume)
+    all_terms = frozenset().union(*sections.values()) if sections else frozenset()
+
+    matched, missing, matched_weight = [], [], 0.0
+    for term, label, weight in zip(keywords.terms, keywords.labels, keywords.weights):
+        if term in all_terms:
+            matched.append((term, label))
+            matched_weight += weight
+        else:
+            missing.append(label)
+
+    section_hits = {}
+    for section, terms in sections.items():
+        hits = [label for term, label in matched if term in terms]
+        if hits:
+            section_hits[section] = hits
+
+    total_weight = keywords.total_weight
+    return KeywordCoverage(
+        coverage=round(matched_weight / total_weight, 4) if total_weight else 0.0,
+        keywords=list(keywords.labels),
+        matched_keywords=[label for _, label in matched],
+        missing_keywords=missing,
+        section_hits=section_hits,
+    )
@@ -0,0 +1,321 @@
+import bisect
+import contextvars
+import json
+import os
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+# Prometheus' default latency buckets stretched to cover multi-second LLM calls and scrapes.
+DEFAULT_BUCKETS: Tuple[float, ...] = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0)
+
+STAGE_HISTOGRAM = "autoapply_stage_duration_seconds"
+LLM_TOKENS_COUNTER = "autoapply_llm_tokens_total"
+SCRAPER_REQUESTS_COUNTER = "autoapply_scraper_requests_total"
+SCRAPER_BYTES_COUNTER = "autoapply_scraper_bytes_total"
+
+LabelKey = Tuple[Tuple[str, str], ...]
+# (stage, labels, seconds) as recorded by one span.
+SpanRecord = Tuple[str, Dict[str, str], float]
+
+_enabled = False
+# Spans of the request being handled, for the Server-Timing header; None outside a collecting scope.
+_request_spans: contextvars.ContextVar[Optional[List[SpanRecord]]] = contextvars.ContextVar("request_spans", default=None)
+
+
+def _label_key(labels: Dict[str, str]) -> LabelKey:
+    return tuple(sorted((name, str(value)) for name, value in labels.items()))
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(labels: LabelKey, extra: Sequence[Tuple[str, str]] = ()) -> str:
+    pairs = list(labels) + list(extra)
+    if not pairs:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in pairs) + "}"
+
+
+class _Histogram:
+    def __init__(self, buckets: Sequence[float]):
+        self.buckets = tuple(buckets)
+        self.counts = [0] * len(self.buckets)
+        self.total = 0
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        position = bisect.bisect_left(self.buckets, value)
+        if position < len(self.counts):
+            self.counts[position] += 1
+        self.total += 1
+        self.sum += value
+
+
+class MetricsRegistry:
+    """
+    Minimal thread-safe histogram and counter store rendered in the Prometheus text
+    exposition format, so the app needs no client library to expose /metrics.
+    """
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS):
+        self.buckets = tuple(sorted(buckets))
+        self._lock = threading.Lock()
+        self._histograms: Dict[str, Dict[LabelKey, _Histogram]] = {}
+        self._counters: Dict[str, Dict[LabelKey, float]] = {}
+        self._help: Dict[str, str] = {
+            STAGE_HISTOGRAM: "Time spent in each pipeline stage.",
+            LLM_TOKENS_COUNTER: "Prompt and completion tokens sent to and received from the LLM.",
+            SCRAPER_REQUESTS_COUNTER: "Browser requests made while scraping, by outcome (network, blocked, asset_cache).",
+            SCRAPER_BYTES_COUNTER: "Bytes the scraper's browser received, by source (network, asset_cache).",
+        }
+
+    def observe(self, name: str, value: float, **labels: str) -> None:
+        key = _label_key(labels)
+        with self._lock:
+            series = self._histograms.setdefault(name, {})
+            histogram = series.get(key)
+            if histogram is None:
+                histogram = series[key] = _Histogram(self.buckets)
+            histogram.observe(value)
+
+    def inc(self, name: str, amount: float = 1.0, **labels: str) -> None:
+        key = _label_key(labels)
+        with self._lock:
+            series = self._counters.setdefault(name, {})
+            series[key] = series.get(key, 0.0) + amount
+
+    def reset(self) -> None:
+        with self._lock:
+            self._histograms.clear()
+            self._counters.clear()
+
+    def snapshot(self) -> Dict[str, Any]:
+        """JSON-serializable copy of every series, for merging into another registry."""
+        with self._lock:
+            return {
+                "buckets": list(self.buckets),
+                "histograms": {
+                    name: [[list(map(list, key)), list(h.counts), h.total, h.sum] for key, h in series.items()]
+                    for name, series in self._histograms.items()
+                },
+                "counters": {
+                    name: [[list(map(list, key)), value] for key, value in series.items()]
+                    for name, series in self._counters.items()
+                },
+            }
+
+    def merge(self, snapshot: Dict[str, Any]) -> None:
+        """Adds a snapshot's counts to this registry; histograms with other buckets are skipped."""
+        with self._lock:
+            if tuple(snapshot.get("buckets", ())) == self.buckets:
+                for name, entries in snapshot.get("histograms", {}).items():
+                    series = self._histograms.setdefault(name, {})
+                    for key, counts, total, total_sum in entries:
+                        key = tuple(tuple(pair) for pair in key)
+                        histogram = series.get(key)
+                        if histogram is None:
+                            histogram = series[key] = _Histogram(self.buckets)
+                        histogram.counts = [mine + theirs for mine, theirs in zip(histogram.counts, counts)]
+                        histogram.total += total
+                        histogram.sum += total_sum
+            for name, entries in snapshot.get("counters", {}).items():
+                series = self._counters.setdefault(name, {})
+                for key, value in entries:
+                    key = tuple(tuple(pair) for pair in key)
+                    series[key] = series.get(key, 0.0) + value
+
+    def render(self) -> str:
+        lines: List[str] = []
+        with self._lock:
+            for name, series in sorted(self._histograms.items()):
+                lines.append(f"# HELP {name} {self._help.get(name, name)}")
+                lines.append(f"# TYPE {name} histogram")
+                for key, histogram in sorted(series.items()):
+                    cumulative = 0
+                    for bound, count in zip(histogram.buckets, histogram.counts):
+                        cumulative += count
+                        lines.append(f"{name}_bucket{_format_labels(key, [('le', repr(bound))])} {cumulative}")
+                    lines.append(f"{name}_bucket{_format_labels(key, [('le', '+Inf')])} {histogram.total}")
+                    lines.append(f"{name}_sum{_format_labels(key)} {histogram.sum}")
+                    lines.append(f"{name}_count{_format_labels(key)} {histogram.total}")
+            for name, series in sorted(self._counters.items()):
+                lines.append(f"# HELP {name} {self._help.get(name, name)}")
+                lines.append(f"# TYPE {name} counter")
+                for key, value in sorted(series.items()):
+                    lines.append(f"{name}{_format_labels(key)} {value}")
+        return "\n".join(lines) + "\n"
+
+
+registry = MetricsRegistry()
+
+# Multi-process servers (run_server.py --production): every worker has its own registry, so each
+# one periodically writes a snapshot to a shared directory and /metrics serves the sum of all of
+# them. Snapshots of exited workers are kept, so counters never go backwards when one is replaced.
+SNAPSHOT_SUFFIX = ".json"
+
+
+def write_snapshot(directory: str) -> None:
+    """Writes this process's registry to `directory`/<pid>.json (atomically)."""
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    with os.fdopen(fd, "w") as f:
+        json.dump(registry.snapshot(), f)
+    os.replace(tmp_path, os.path.join(directory, f"{os.getpid()}{SNAPSHOT_SUFFIX}"))
+
+
+def render_all(directory: str) -> str:
+    """Renders this process's live registry plus the latest snapshot of every other worker."""
+    combined = MetricsRegistry(registry.buckets)
+    own_name = f"{os.getpid()}{SNAPSHOT_SUFFIX}"
+    try:
+        names = os.listdir(directory)
+    except FileNotFoundError:
+        names = []
+    for name in names:
+        if not name.endswith(SNAPSHOT_SUFFIX) or name == own_name:
+            continue
+        try:
+            with open(os.path.join(directory, name)) as f:
+                combined.merge(json.load(f))
+        except (OSError, ValueError) as e:
+            print(f"Skipping unreadable metrics snapshot {name}: {e}")
+    combined.merge(registry.snapshot())
+    return combined.render()
+
+
+def clear_snapshots(directory: str) -> None:
+    """Removes the snapshots of a previous server run; call before starting the workers."""
+    try:
+        names = os.listdir(directory)
+    except FileNotFoundError:
+        return
+    for name in names:
+        if name.endswith(SNAPSHOT_SUFFIX) or name.endswith(".tmp"):
+            try:
+                os.remove(os.path.join(directory, name))
+            except FileNotFoundError:
+                pass
+
+
+def configure(enabled: bool) -> None:
+    global _enabled
+    _enabled = enabled
+
+
+def is_enabled() -> bool:
+    return _enabled
+
+
+def record_span(stage: str, seconds: float, labels: Optional[Dict[str, str]] = None) -> None:
+    labels = labels or {}
+    if _enabled:
+        registry.observe(STAGE_HISTOGRAM, seconds, stage=stage, **labels)
+    request_spans = _request_spans.get()
+    if request_spans is not None:
+        request_spans.append((stage, labels, seconds))
+
+
+def replay_spans(spans: Sequence[SpanRecord]) -> None:
+    """Records spans measured elsewhere, e.g. inside a render worker process."""
+    for stage, labels, seconds in spans:
+        record_span(stage, seconds, labels)
+
+
+def record_llm_tokens(kind: str, prompt_tokens: int, completion_tokens: int) -> None:
+    if not _enabled:
+        return
+    registry.inc(LLM_TOKENS_COUNTER, prompt_tokens, kind=kind, type="prompt")
+    registry.inc(LLM_TOKENS_COUNTER, completion_tokens, kind=kind, type="completion")
+
+
+def record_scraper_traffic(stats: Dict[str, Any]) -> None:
+    """Adds one search's TrafficMeter stats to the scraper counters."""
+    if not _enabled:
+        return
+    network_requests = stats["requests"] - stats["blocked"] - stats["asset_cache_hits"]
+    registry.inc(SCRAPER_REQUESTS_COUNTER, max(0, network_requests), outcome="network")
+    registry.inc(SCRAPER_REQUESTS_COUNTER, stats["blocked"], outcome="blocked")
+    registry.inc(SCRAPER_REQUESTS_COUNTER, stats["asset_cache_hits"], outcome="asset_cache")
+    registry.inc(SCRAPER_BYTES_COUNTER, stats["bytes_transferred"], source="network")
+    registry.inc(SCRAPER_BYTES_COUNTER, stats["bytes_from_cache"], source="asset_cache")
+
+
+class _Span:
+    __slots__ = ("stage", "labels", "started")
+
+    def __init__(self, stage: str, labels: Dict[str, str]):
+        self.stage = stage
+        self.labels = labels
+        self.started = 0.0
+
+    def __enter__(self):
+        self.started = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        record_span(self.stage, time.perf_counter() - self.started, self.labels)
+        return False
+
+    async def __aenter__(self):
+        return self.__enter__()
+
+    async def __aexit__(self, *exc_info):
+        return self.__exit__(*exc_info)
+
+
+class _NoopSpan:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+
+_NOOP_SPAN = _NoopSpan()
+
+
+def span(stage: str, **labels: str):
+    """
+    Times a pipeline stage (`with span("pdf_extract"):` or `async with`). When metrics and
+    Server-Timing are both off this returns a shared no-op object without reading the clock.
+    """
+    if not _enabled and _request_spans.get() is None:
+        return _NOOP_SPAN
+    return _Span(stage, labels)
+
+
+@contextmanager
+def collect_spans() -> Iterator[List[SpanRecord]]:
+    """Collects every span recorded in this context (and threads started from it) into a list."""
+    spans: List[SpanRecord] = []
+    token = _request_spans.set(spans)
+    try:
+        yield spans
+    finally:
+        _request_spans.reset(token)
+
+
+def server_timing_header(spans: Sequence[SpanRecord]) -> str:
+    """Formats spans as a Server-Timing header value, summing repeated stages."""
+    totals: Dict[Tuple[str, LabelKey], float] = {}
+    for stage, labels, seconds in spans:
+        key = (stage, _label_key(labels))
+        totals[key] = totals.get(key, 0.0) + seconds
+    entries = []
+    for (stage, labels), seconds in totals.items():
+        entry = stage
+        if labels:
+            entry += ';desc="' + ",".join(f"{name}={value}" for name, value in labels).replace('"', "'") + '"'
+        entries.append(f"{entry};dur={seconds * 1000:.1f}")
+    return ", ".join(entries)
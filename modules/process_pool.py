@@ -0,0 +1,295 @@
+import asyncio
+import itertools
+import multiprocessing
+import queue
+import threading
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+# Set in each worker by _init_worker: the queue workers report task starts on.
+_started_queue = None
+
+
+def _init_worker(started_queue, initializer: Optional[Callable[..., None]], initargs: Tuple) -> None:
+    global _started_queue
+    _started_queue = started_queue
+    if initializer is not None:
+        initializer(*initargs)
+
+
+def _run_task(token: int, func: Callable[..., Any], args: Tuple) -> Any:
+    # Tells the parent the task left the queue, so its timeout covers only the run itself.
+    _started_queue.put(token)
+    return func(*args)
+
+
+class WorkerPoolBusyError(Exception):
+    """Raised when the pool already holds its maximum number of running and queued tasks."""
+
+
+class WorkerPoolTimeoutError(Exception):
+    """Raised when a task exceeds its timeout; the worker running it is killed."""
+
+
+class _PoolGeneration:
+    """
+    One multiprocessing.Pool plus the number of tasks still attributed to it. Replacement
+    generations are created empty and started on the maintenance thread; `ready` is set once
+    `pool` (or `error`, if it could not be started) is filled in.
+    """
+    def __init__(self, pool=None):
+        self.pool = pool
+        self.error: Optional[BaseException] = None
+        self.ready = threading.Event()
+        if pool is not None:
+            self.ready.set()
+        self.in_flight = 0
+        self.retired = False
+
+
+class WarmProcessPool:
+    """
+    Eagerly started process pool for CPU-bound work that must not hold the server's GIL.
+
+    - Every worker runs `initializer(*initargs)` once at startup, so expensive state
+      (templates, parsed stylesheets, fonts) stays warm between tasks.
+    - At most `max_workers + max_queue_size` tasks may be running or queued at once;
+      beyond that `submit`/`asubmit` fail fast with WorkerPoolBusyError.
+    - A task that runs longer than `task_timeout` (counted from when a worker picks it up,
+      not from submission) raises WorkerPoolTimeoutError. Its pool is retired: new tasks go
+      to a fresh pool and the old one is terminated (killing the runaway worker) as soon as
+      its remaining tasks have settled, or by close() at the latest. Starting the new pool
+      and terminating the old one happen on a background thread, never on the caller's.
+    """
+    # How often a queued task that has not started yet re-checks whether its pool was retired.
+    START_POLL_SECONDS = 0.05
+
+    def __init__(
+        self,
+        func: Callable[..., Any],
+        initializer: Optional[Callable[..., None]] = None,
+        initargs: Tuple = (),
+        max_workers: Optional[int] = None,
+        max_queue_size: int = 16,
+        task_timeout: Optional[float] = 60.0,
+        start_method: str = "spawn",
+    ):
+        self.func = func
+        self.initializer = initializer
+        self.initargs = initargs
+        self.max_workers = max_workers or multiprocessing.cpu_count()
+        self.max_queue_size = max_queue_size
+        self.task_timeout = task_timeout
+        self._context = multiprocessing.get_context(start_method)
+        self._lock = threading.Lock()
+        self._pending = 0
+        self._rejected = 0
+        self._timeouts = 0
+        self._completed = 0
+        self._closed = False
+        self._retired: List[_PoolGeneration] = []
+        # token -> callback run (on the listener thread) when a worker starts that task
+        self._start_callbacks: Dict[int, Callable[[], None]] = {}
+        self._tokens = itertools.count()
+        self._started_queue = self._context.SimpleQueue()
+        self._listener = threading.Thread(target=self._listen_for_starts, name="process-pool-starts", daemon=True)
+        self._listener.start()
+        # Starts replacement pools and terminates retired ones; both block for a while.
+        self._maintenance: "queue.SimpleQueue[Optional[Callable[[], None]]]" = queue.SimpleQueue()
+        self._maintainer = threading.Thread(target=self._run_maintenance, name="process-pool-maintenance", daemon=True)
+        self._maintainer.start()
+        self._generation = _PoolGeneration(self._new_pool())
+
+    def _new_pool(self):
+        return self._context.Pool(
+            processes=self.max_workers,
+            initializer=_init_worker,
+            initargs=(self._started_queue, self.initializer, self.initargs),
+        )
+
+    def _start_generation(self, generation: _PoolGeneration) -> None:
+        try:
+            generation.pool = self._new_pool()
+        except Exception as e:
+            print(f"Could not start a replacement worker pool: {e}")
+            generation.error = e
+        finally:
+            generation.ready.set()
+
+    def _run_maintenance(self) -> None:
+        while True:
+            job = self._maintenance.get()
+            if job is None:
+                return
+            try:
+                job()
+            except Exception as e:
+                print(f"Worker pool maintenance failed: {e}")
+
+    def _replace_generation(self) -> None:
+        # Called with self._lock held; tasks acquired from now on wait for the new pool to start.
+        generation = _PoolGeneration()
+        self._generation = generation
+        self._maintenance.put(lambda: self._start_generation(generation))
+
+    def _raise_if_not_started(self, generation: _PoolGeneration) -> None:
+        if generation.pool is None:
+            raise RuntimeError(f"Worker pool could not be started: {generation.error}") from generation.error
+
+    def _listen_for_starts(self) -> None:
+        while True:
+            token = self._started_queue.get()
+            if token is None:
+                return
+            with self._lock:
+                callback = self._start_callbacks.pop(token, None)
+            if callback is not None:
+                try:
+                    callback()
+                except RuntimeError:
+                    pass # The submitting event loop has already closed
+
+    def _register_start(self, callback: Callable[[], None]) -> int:
+        with self._lock:
+            token = next(self._tokens)
+            self._start_callbacks[token] = callback
+            return token
+
+    def _forget_start(self, token: int) -> None:
+        with self._lock:
+            self._start_callbacks.pop(token, None)
+
+    @property
+    def capacity(self) -> int:
+        return self.max_workers + self.max_queue_size
+
+    def _acquire(self) -> _PoolGeneration:
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("WarmProcessPool has been closed.")
+            if self._pending >= self.capacity:
+                self._rejected += 1
+                raise WorkerPoolBusyError(
+                    f"Worker pool is full ({self._pending} tasks running or queued)."
+                )
+            self._pending += 1
+            generation = self._generation
+            generation.in_flight += 1
+            return generation
+
+    def _release(self, generation: _PoolGeneration, timed_out: bool = False) -> None:
+        terminate = None
+        with self._lock:
+            self._pending -= 1
+            generation.in_flight -= 1
+            if timed_out:
+                self._timeouts += 1
+                if not generation.retired:
+                    generation.retired = True
+                    self._retired.append(generation)
+                    if generation is self._generation and not self._closed:
+                        self._replace_generation()
+            elif generation.error is not None:
+                if generation is self._generation and not self._closed:
+                    self._replace_generation() # Try again for the next task
+            else:
+                self._completed += 1
+            if generation.retired and generation.in_flight == 0 and generation in self._retired:
+                self._retired.remove(generation)
+                # Kills any worker still stuck on a timed-out task.
+                if self._closed:
+                    terminate = generation.pool # The maintenance thread has already stopped
+                else:
+                    self._maintenance.put(generation.pool.terminate)
+        if terminate is not None:
+            terminate.terminate()
+
+    def submit(self, *args: Any) -> Any:
+        """Runs func(*args) in a worker and blocks until it finishes or times out."""
+        generation = self._acquire()
+        timed_out = False
+        started = threading.Event()
+        token = self._register_start(started.set)
+        try:
+            generation.ready.wait()
+            self._raise_if_not_started(generation)
+            async_result = generation.pool.apply_async(_run_task, (token, self.func, args))
+            # Waiting behind other tasks does not count against the timeout, unless the pool was
+            # retired: its workers may all be stuck, so the task might never start.
+            while not started.wait(self.START_POLL_SECONDS) and not async_result.ready() and not generation.retired:
+                pass
+            try:
+                return async_result.get(self.task_timeout)
+            except multiprocessing.TimeoutError:
+                timed_out = True
+                raise WorkerPoolTimeoutError(f"Task exceeded {self.task_timeout}s and was killed.")
+        finally:
+            self._forget_start(token)
+            self._release(generation, timed_out=timed_out)
+
+    async def asubmit(self, *args: Any) -> Any:
+        """Async variant of submit that awaits the worker without blocking the event loop."""
+        generation = self._acquire()
+        timed_out = False
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        started = loop.create_future()
+
+        def _resolve(target, setter, value):
+            if not target.done():
+                setter(value)
+
+        token = self._register_start(lambda: loop.call_soon_threadsafe(_resolve, started, started.set_result, None))
+        try:
+            while not generation.ready.is_set():
+                await asyncio.sleep(self.START_POLL_SECONDS)
+            self._raise_if_not_started(generation)
+            generation.pool.apply_async(
+                _run_task,
+                (token, self.func, args),
+                callback=lambda result: loop.call_soon_threadsafe(_resolve, future, future.set_result, result),
+                error_callback=lambda error: loop.call_soon_threadsafe(_resolve, future, future.set_exception, error),
+            )
+            # Waiting behind other tasks does not count against the timeout, unless the pool was
+            # retired: its workers may all be stuck, so the task might never start.
+            while not generation.retired:
+                done, _ = await asyncio.wait((started, future), timeout=self.START_POLL_SECONDS, return_when=asyncio.FIRST_COMPLETED)
+                if done:
+                    break
+            try:
+                return await asyncio.wait_for(future, self.task_timeout)
+            except asyncio.TimeoutError:
+                timed_out = True
+                raise WorkerPoolTimeoutError(f"Task exceeded {self.task_timeout}s and was killed.")
+        finally:
+            started.cancel()
+            self._forget_start(token)
+            self._release(generation, timed_out=timed_out)
+
+    def close(self) -> None:
+        """Stops accepting work and shuts down the worker processes, including retired pools."""
+        with self._lock:
+            self._closed = True
+            generation = self._generation
+            retired, self._retired = self._retired, []
+        # Lets pending pool starts and terminations finish first.
+        self._maintenance.put(None)
+        self._maintainer.join()
+        if generation.pool is not None:
+            generation.pool.close()
+            generation.pool.join()
+        for retired_generation in retired:
+            # Still running a timed-out task; nothing else will ever finish there.
+            retired_generation.pool.terminate()
+        self._started_queue.put(None)
+        self._listener.join()
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "max_workers": self.max_workers,
+                "max_queue_size": self.max_queue_size,
+                "pending": self._pending,
+                "completed": self._completed,
+                "rejected": self._rejected,
+                "timeouts": self._timeouts,
+            }
@@ -0,0 +1,234 @@
+import re
+import threading
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional
+
+# Headings that open a section recruiters never need the model to read. Everything up to
+# the next heading is dropped.
+BOILERPLATE_HEADING_PATTERNS = [
+    r"equal (employment )?opportunity",
+    r"\beeo\b",
+    r"benefits?",
+    r"perks",
+    r"what we offer",
+    r"why (join|work)",
+    r"compensation( and|\s*&)? benefits",
+    r"pay (range|transparency)",
+    r"accommodations?",
+    r"privacy( notice| policy)?",
+    r"diversity(,)? (equity|and inclusion)",
+    r"e-?verify",
+    r"about (us|the company)",
+]
+
+# Stand-alone sentences that show up in postings regardless of the section they are in.
+BOILERPLATE_LINE_PATTERNS = [
+    r"equal opportunity employer",
+    r"without regard to (race|age|sex|religion)",
+    r"reasonable accommodation",
+    r"e-?verify",
+    r"we (do not|don't) discriminate",
+    r"applicants? (will|shall) receive consideration",
+    r"by (applying|submitting), you (agree|consent)",
+    r"this (job description|posting) is not (intended|designed) to be (all-inclusive|exhaustive)",
+]
+
+_HEADING_MAX_CHARS = 60
+_BOILERPLATE_HEADING_RE = re.compile(r"^\W*(" + "|".join(BOILERPLATE_HEADING_PATTERNS) + r")\b", re.IGNORECASE)
+_BOILERPLATE_LINE_RE = re.compile("|".join(BOILERPLATE_LINE_PATTERNS), re.IGNORECASE)
+_URL_APPENDIX_MARKER = "Extracted URLs:"
+
+
+_encoding_lock = threading.Lock()
+_encodings: Dict[str, object] = {}
+
+
+def _get_encoding(model: str):
+    """Loads the tiktoken encoding once; returns None when tiktoken or its data files are unavailable."""
+    with _encoding_lock:
+        if model not in _encodings:
+            try:
+                import tiktoken
+                _encodings[model] = tiktoken.encoding_for_model(model)
+            except Exception as e:
+                print(f"tiktoken encoding for {model} unavailable ({e}); falling back to approximate token counts.")
+                _encodings[model] = None
+        return _encodings[model]
+
+
+def approximate_token_count(text: str) -> int:
+    """Roughly 4 characters per token for English prose."""
+    return (len(text) + 3) // 4
+
+
+def count_tokens(text: str, model: str = "gpt-4o") -> int:
+    encoding = _get_encoding(model)
+    if encoding is None:
+        return approximate_token_count(text)
+    return len(encoding.encode(text, disallowed_special=()))
+
+
+def _is_heading(line: str) -> bool:
+    """Short lines ending in ':', in ALL CAPS, markdown headings or Title Case phrases."""
+    if not line or len(line) > _HEADING_MAX_CHARS or line[0] in "-*•·":
+        return False
+    if line.endswith(":") or line.startswith("#") or line.isupper():
+        return True
+    if line.endswith((".", ",", ";")):
+        return False
+    words = [word for word in re.findall(r"[A-Za-z']+", line) if len(word) > 3]
+    return bool(words) and all(word[0].isupper() for word in words)
+
+
+def normalize_extracted_text(text: str) -> str:
+    """
+    Cleans up PDF extraction artifacts: re-joins words hyphenated across line breaks,
+    collapses runs of spaces and blank lines, and drops URLs in the "Extracted URLs"
+    appendix that already appear in the visible text.
+    """
+    text = text.replace("\r\n", "\n").replace("\u00ad", "").replace("\u00a0", " ")
+    text = re.sub(r"(\w)-\n[ \t]*([a-z])", r"\1\2", text)
+    text = re.sub(r"[ \t]+", " ", text)
+    text = re.sub(r" ?\n ?", "\n", text)
+    text = re.sub(r"\n{3,}", "\n\n", text)
+
+    body, marker, appendix = text.partition(_URL_APPENDIX_MARKER)
+    if marker:
+        urls = []
+        for url in appendix.split():
+            if url not in urls and url not in body and url.replace("mailto:", "") not in body:
+                urls.append(url)
+        text = body.rstrip() + ("\n\n" + _URL_APPENDIX_MARKER + "\n" + "\n".join(urls) if urls else "")
+    return text.strip()
+
+
+def compact_job_description(text: str) -> str:
+    """
+    Strips boilerplate sections (EEO statements, benefits, privacy notices, ...) and
+    repeated lines from a job posting, keeping the requirements the model actually tailors to.
+    """
+    text = normalize_extracted_text(text)
+    kept: List[str] = []
+    seen = set()
+    skipping = False
+    for line in text.split("\n"):
+        stripped = line.strip()
+        if _is_heading(stripped):
+            skipping = bool(_BOILERPLATE_HEADING_RE.match(stripped))
+        if skipping or _BOILERPLATE_LINE_RE.search(stripped):
+            continue
+
+        dedupe_key = re.sub(r"\W+", " ", stripped).strip().lower()
+        if dedupe_key:
+            if dedupe_key in seen:
+                continue
+            seen.add(dedupe_key)
+        elif kept and not kept[-1]:
+            continue
+        kept.append(stripped)
+    return "\n".join(kept).strip()
+
+
+def truncate_to_budget(text: str, budget: int, counter: Callable[[str], int]) -> str:
+    """Drops whole trailing lines until `text` fits in `budget` tokens."""
+    if budget <= 0 or counter(text) <= budget:
+        return text
+    lines = text.split("\n")
+    low, high = 0, len(lines)
+    # Binary search for the longest line prefix that fits.
+    while low < high:
+        middle = (low + high + 1) // 2
+        if counter("\n".join(lines[:middle])) <= budget:
+            low = middle
+        else:
+            high = middle - 1
+    return "\n".join(lines[:low]).rstrip()
+
+
+@dataclass
+class CompactionReport:
+    resume_tokens_before: int
+    resume_tokens_after: int
+    job_description_tokens_before: int
+    job_description_tokens_after: int
+    truncated: List[str] = field(default_factory=list)
+
+    @property
+    def tokens_before(self) -> int:
+        return self.resume_tokens_before + self.job_description_tokens_before
+
+    @property
+    def tokens_after(self) -> int:
+        return self.resume_tokens_after + self.job_description_tokens_after
+
+
+class PromptCompactor:
+    """
+    Shrinks the user-supplied parts of a prompt before they are sent to the LLM.
+    Resume text only gets whitespace/hyphenation cleanup (its content is the product);
+    job descriptions additionally lose boilerplate. Both are then held to a token budget
+    (0 disables the budget), cutting the URL appendix before any resume content.
+    """
+    def __init__(
+        self,
+        resume_token_budget: int = 0,
+        job_description_token_budget: int = 0,
+        model: str = "gpt-4o",
+        token_counter: Optional[Callable[[str], int]] = None,
+    ):
+        self.resume_token_budget = resume_token_budget
+        self.job_description_token_budget = job_description_token_budget
+        self.count_tokens = token_counter or (lambda text: count_tokens(text, model))
+        self._lock = threading.Lock()
+        self._calls = 0
+        self._tokens_before = 0
+        self._tokens_after = 0
+        self._truncations = 0
+
+    def _fit_resume(self, resume_text: str) -> str:
+        if self.resume_token_budget <= 0 or self.count_tokens(resume_text) <= self.resume_token_budget:
+            return resume_text
+        body, marker, _ = resume_text.partition("\n\n" + _URL_APPENDIX_MARKER)
+        if marker and self.count_tokens(body) <= self.resume_token_budget:
+            return truncate_to_budget(resume_text, self.resume_token_budget, self.count_tokens)
+        return truncate_to_budget(body if marker else resume_text, self.resume_token_budget, self.count_tokens)
+
+    def compact(self, resume_text: str, job_description: str):
+        """Returns (compacted_resume_text, compacted_job_description, CompactionReport)."""
+        compact_resume = normalize_extracted_text(resume_text)
+        resume_cleaned_tokens = self.count_tokens(compact_resume)
+        compact_resume = self._fit_resume(compact_resume)
+
+        compact_job = compact_job_description(job_description)
+        job_cleaned_tokens = self.count_tokens(compact_job)
+        compact_job = truncate_to_budget(compact_job, self.job_description_token_budget, self.count_tokens)
+
+        report = CompactionReport(
+            resume_tokens_before=self.count_tokens(resume_text),
+            resume_tokens_after=self.count_tokens(compact_resume),
+            job_description_tokens_before=self.count_tokens(job_description),
+            job_description_tokens_after=self.count_tokens(compact_job),
+        )
+        if report.resume_tokens_after < resume_cleaned_tokens:
+            report.truncated.append("resume_text")
+        if report.job_description_tokens_after < job_cleaned_tokens:
+            report.truncated.append("job_description")
+
+        with self._lock:
+            self._calls += 1
+            self._tokens_before += report.tokens_before
+            self._tokens_after += report.tokens_after
+            self._truncations += len(report.truncated)
+        return compact_resume, compact_job, report
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "calls": self._calls,
+                "tokens_before": self._tokens_before,
+                "tokens_after": self._tokens_after,
+                "tokens_saved": self._tokens_before - self._tokens_after,
+                "truncations": self._truncations,
+                "resume_token_budget": self.resume_token_budget,
+                "job_description_token_budget": self.job_description_token_budget,
+            }
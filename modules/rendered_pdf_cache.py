@@ -0,0 +1,164 @@
+import os
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, BinaryIO, Dict, Optional
+
+
+class RenderedPdfCache:
+    """
+    Bounded directory of rendered PDFs, one plain `.pdf` file per entry so hits can be
+    streamed from disk in chunks instead of being read back into memory whole.
+
+    Recency is tracked in memory and mirrored to each file's atime, so the least recently
+    used files are evicted first once the directory grows past max_bytes, and the order
+    survives restarts. Several processes may share the directory; each adopts files the
+    others wrote on first lookup.
+
+    Every write and lookup also bumps the file's mtime, and files touched within the last
+    `read_grace_seconds` are skipped by eviction, so a response still streaming one (from this
+    or another process) keeps its file. The directory may briefly exceed max_bytes instead, but
+    never by more than GRACE_OVERSHOOT_FACTOR times: past that the least recently used files go
+    regardless (readers that already opened them are unaffected; only new lookups miss).
+    """
+    FILE_SUFFIX = ".pdf"
+    GRACE_OVERSHOOT_FACTOR = 2.0
+
+    def __init__(self, directory: str, max_bytes: int = 512 * 1024 * 1024, read_grace_seconds: float = 60.0):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.read_grace_seconds = read_grace_seconds
+        os.makedirs(self.directory, exist_ok=True)
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._entries: "OrderedDict[str, int]" = OrderedDict() # key -> size, least recently used first
+        self._total_bytes = 0
+        self._load_index()
+
+    def _load_index(self) -> None:
+        found = []
+        for name in os.listdir(self.directory):
+            if not name.endswith(self.FILE_SUFFIX):
+                continue
+            try:
+                stat = os.stat(os.path.join(self.directory, name))
+            except FileNotFoundError:
+                continue
+            found.append((stat.st_atime, name[:-len(self.FILE_SUFFIX)], stat.st_size))
+        for _, key, size in sorted(found):
+            self._entries[key] = size
+            self._total_bytes += size
+
+    def path_for(self, key: str) -> str:
+        if not key.isalnum():
+            raise ValueError("Rendered PDF keys must be alphanumeric.")
+        return os.path.join(self.directory, key + self.FILE_SUFFIX)
+
+    def get_path(self, key: str) -> Optional[str]:
+        """Returns the file holding `key` and marks it most recently used, or None on a miss."""
+        path = self.path_for(key)
+        with self._lock:
+            try:
+                size = os.stat(path).st_size
+            except FileNotFoundError:
+                self._discard(key)
+                self._misses += 1
+                return None
+            if key not in self._entries:
+                # Written by another server process sharing the directory.
+                self._entries[key] = size
+                self._total_bytes += size
+            self._entries.move_to_end(key)
+            self._hits += 1
+            try:
+                os.utime(path)
+            except FileNotFoundError:
+                pass
+            return path
+
+    def open(self, key: str) -> Optional[BinaryIO]:
+        """
+        Opens the file holding `key` for reading, or returns None on a miss. The open file
+        stays readable even if the entry is evicted while the caller is still streaming it.
+        """
+        path = self.get_path(key)
+        if path is None:
+            return None
+        try:
+            return open(path, "rb")
+        except FileNotFoundError:
+            return None
+
+    def put(self, key: str, pdf_bytes: bytes) -> Optional[str]:
+        """Stores a rendered PDF and returns its path (None when it is larger than the whole cache)."""
+        if len(pdf_bytes) > self.max_bytes:
+            return None
+        path = self.path_for(key)
+        # Write to a temp file first so readers never observe a partial PDF.
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            f.write(pdf_bytes)
+        with self._lock:
+            os.replace(tmp_path, path)
+            self._discard(key, remove_file=False)
+            self._entries[key] = len(pdf_bytes)
+            self._total_bytes += len(pdf_bytes)
+            self._evict_if_needed(keep=key)
+        return path
+
+    def _discard(self, key: str, remove_file: bool = True) -> None:
+        size = self._entries.pop(key, None)
+        if size is not None:
+            self._total_bytes -= size
+        if remove_file:
+            try:
+                os.remove(self.path_for(key))
+            except FileNotFoundError:
+                pass
+
+    def _recently_used(self, key: str, now: float) -> bool:
+        try:
+            return now - os.stat(self.path_for(key)).st_mtime < self.read_grace_seconds
+        except FileNotFoundError:
+            return False
+
+    def _evict_if_needed(self, keep: str) -> None:
+        now = time.time()
+        for key in list(self._entries):
+            if self._total_bytes <= self.max_bytes:
+                return
+            if key == keep or self._recently_used(key, now):
+                continue # May still be streaming to a client
+            self._discard(key)
+            self._evictions += 1
+        # Too many recent files to honour the grace period: bound the overshoot instead.
+        hard_limit = self.max_bytes * self.GRACE_OVERSHOOT_FACTOR
+        for key in list(self._entries):
+            if self._total_bytes <= hard_limit:
+                return
+            if key == keep:
+                continue
+            self._discard(key)
+            self._evictions += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            for key in list(self._entries):
+                self._discard(key)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "backend": "disk",
+                "entries": len(self._entries),
+                "hits": self._hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+                "size_bytes": self._total_bytes,
+                "max_bytes": self.max_bytes,
+                "hit_rate": self._hits / lookups if lookups else 0.0,
+            }
@@ -0,0 +1,200 @@
+import asyncio
+import fnmatch
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Set
+from urllib.parse import urlsplit
+from modules.executors import run_blocking
+from modules.interfaces.cache import ICache
+
+if TYPE_CHECKING:
+    from playwright.async_api import BrowserContext, Request, Route
+
+# Playwright resource types (request.resource_type) a scrape never needs.
+DEFAULT_BLOCKED_RESOURCE_TYPES = ("image", "media", "font")
+# Ad, analytics and tracking hosts; a pattern also matches its subdomains.
+DEFAULT_BLOCKED_DOMAINS = (
+    "doubleclick.net",
+    "googlesyndication.com",
+    "googletagmanager.com",
+    "google-analytics.com",
+    "facebook.net",
+    "ads.linkedin.com",
+    "bat.bing.com",
+    "scorecardresearch.com",
+)
+# Static assets that may be replayed from the on-disk asset cache.
+DEFAULT_CACHEABLE_RESOURCE_TYPES = ("stylesheet", "script", "font", "image")
+# Headers kept with a cached asset. Bodies are stored decoded, so encoding and length headers are dropped.
+REPLAYED_HEADERS = ("content-type", "cache-control", "access-control-allow-origin", "timing-allow-origin")
+
+
+def domain_matches(host: str, pattern: str) -> bool:
+    """A plain pattern matches the host and its subdomains; patterns with *, ? or [ are globs."""
+    host, pattern = host.lower(), pattern.lower()
+    if any(char in pattern for char in "*?["):
+        return fnmatch.fnmatchcase(host, pattern)
+    return host == pattern or host.endswith("." + pattern)
+
+
+def _headers_size(headers: Dict[str, str]) -> int:
+    return sum(len(name) + len(value) + 4 for name, value in headers.items())
+
+
+class ResourcePolicy:
+    """
+    Decides which requests the scraper's browser makes. Requests of a blocked resource type or
+    to a blocked domain are aborted; top-level documents are never blocked by type. With an
+    `asset_cache`, GET requests for cacheable static assets are answered from it, so stylesheets
+    and scripts survive browser restarts instead of being downloaded by every new context.
+
+    Passing None for a list uses the defaults above; an empty list blocks nothing.
+    """
+    def __init__(
+        self,
+        blocked_resource_types: Optional[Iterable[str]] = None,
+        blocked_domains: Optional[Iterable[str]] = None,
+        asset_cache: Optional[ICache] = None,
+        cacheable_resource_types: Optional[Iterable[str]] = None,
+    ):
+        self.blocked_resource_types = frozenset(
+            DEFAULT_BLOCKED_RESOURCE_TYPES if blocked_resource_types is None else blocked_resource_types
+        )
+        self.blocked_domains = tuple(DEFAULT_BLOCKED_DOMAINS if blocked_domains is None else blocked_domains)
+        self.asset_cache = asset_cache
+        self.cacheable_resource_types = frozenset(
+            DEFAULT_CACHEABLE_RESOURCE_TYPES if cacheable_resource_types is None else cacheable_resource_types
+        )
+
+    @property
+    def intercepts(self) -> bool:
+        """Whether any request needs routing through the policy at all."""
+        return bool(self.blocked_resource_types or self.blocked_domains or self.asset_cache is not None)
+
+    def block_reason(self, url: str, resource_type: str) -> Optional[str]:
+        """"type" or "domain" when the request should be aborted, None when it may load."""
+        if resource_type != "document" and resource_type in self.blocked_resource_types:
+            return "type"
+        host = urlsplit(url).hostname or ""
+        if any(domain_matches(host, pattern) for pattern in self.blocked_domains):
+            return "domain"
+        return None
+
+    def is_cacheable(self, method: str, resource_type: str) -> bool:
+        return self.asset_cache is not None and method == "GET" and resource_type in self.cacheable_resource_types
+
+
+class TrafficMeter:
+    """
+    Applies a ResourcePolicy to one browser context for the length of a search and counts what
+    the search cost: requests issued, blocked and served from the asset cache, and bytes
+    downloaded over the network (response headers plus bodies, as reported by Playwright).
+    Without a policy nothing is intercepted and the meter only counts.
+    """
+    def __init__(self, policy: Optional[ResourcePolicy] = None):
+        self.policy = policy
+        self.requests = 0
+        self.blocked = 0
+        self.asset_cache_hits = 0
+        self.bytes_transferred = 0
+        self.bytes_from_cache = 0
+        self.requests_by_type: Dict[str, int] = {}
+        self._context: Optional["BrowserContext"] = None
+        self._routed = False
+        # Requests answered by the meter itself; their bytes are counted when they are served.
+        self._served: Set["Request"] = set()
+        self._pending: List[asyncio.Future] = []
+
+    async def attach(self, context: "BrowserContext") -> None:
+        self._context = context
+        context.on("request", self._on_request)
+        context.on("requestfinished", self._on_request_finished)
+        if self.policy is not None and self.policy.intercepts:
+            await context.route("**/*", self._handle_route)
+            self._routed = True
+
+    async def detach(self) -> Dict[str, Any]:
+        """Stops intercepting and counting, and returns the search's traffic stats."""
+        context, self._context = self._context, None
+        if context is not None:
+            context.remove_listener("request", self._on_request)
+            context.remove_listener("requestfinished", self._on_request_finished)
+            if self._routed:
+                try:
+                    await context.unroute("**/*", self._handle_route)
+                except Exception:
+                    pass # The context may already be closed
+                self._routed = False
+        await asyncio.gather(*self._pending, return_exceptions=True)
+        self._pending.clear()
+        self._served.clear()
+        return self.stats()
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "requests": self.requests,
+            "blocked": self.blocked,
+            "asset_cache_hits": self.asset_cache_hits,
+            "bytes_transferred": self.bytes_transferred,
+            "bytes_from_cache": self.bytes_from_cache,
+            "requests_by_type": dict(self.requests_by_type),
+        }
+
+    def _on_request(self, request: "Request") -> None:
+        self.requests += 1
+        self.requests_by_type[request.resource_type] = self.requests_by_type.get(request.resource_type, 0) + 1
+
+    def _on_request_finished(self, request: "Request") -> None:
+        if request in self._served:
+            return
+        self._pending.append(asyncio.ensure_future(self._add_transfer_size(request)))
+
+    async def _add_transfer_size(self, request: "Request") -> None:
+        sizes = await request.sizes()
+        self.bytes_transferred += max(0, sizes["responseHeadersSize"]) + max(0, sizes["responseBodySize"])
+
+    async def _handle_route(self, route: "Route") -> None:
+        request = route.request
+        try:
+            if self.policy.block_reason(request.url, request.resource_type) is not None:
+                self.blocked += 1
+                await route.abort("blockedbyclient")
+            elif self.policy.is_cacheable(request.method, request.resource_type):
+                await self._serve_asset(route, request)
+            else:
+                await route.continue_()
+        except Exception as e:
+            # Never let a routing error fail the scrape, nor leave the request hanging unanswered.
+            print(f"Could not route {request.url}: {e}")
+            await self._release_route(route)
+
+    async def _release_route(self, route: "Route") -> None:
+        """Lets a request whose handling failed go through unmodified, or fails it if even that is impossible."""
+        try:
+            await route.continue_()
+            return
+        except Exception:
+            pass
+        try:
+            await route.abort("failed")
+        except Exception:
+            pass # Already handled, or the page closed mid-request
+
+    async def _serve_asset(self, route: "Route", request: "Request") -> None:
+        cache = self.policy.asset_cache
+        key = "asset:" + request.url
+        cached = await run_blocking(cache.get, key)
+        if cached is not None:
+            self._served.add(request)
+            self.asset_cache_hits += 1
+            self.bytes_from_cache += len(cached["body"])
+            await route.fulfill(status=cached["status"], headers=cached["headers"], body=cached["body"])
+            return
+
+        response = await route.fetch()
+        body = await response.body()
+        headers = {name: value for name, value in response.headers.items() if name in REPLAYED_HEADERS}
+        self._served.add(request)
+        self.bytes_transferred += _headers_size(response.headers) + len(body)
+        cache_control = response.headers.get("cache-control", "")
+        if response.status == 200 and "no-store" not in cache_control and "private" not in cache_control:
+            await run_blocking(cache.set, key, {"status": response.status, "headers": headers, "body": body})
+        await route.fulfill(status=response.status, headers=headers, body=body)
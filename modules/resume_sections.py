@@ -0,0 +1,55 @@
+import json
+from typing import Any, Dict, Iterator, Optional
+from pydantic import TypeAdapter
+from app.schemas import ATSFriendlyResume, Education, Experience, Project
+
+# List sections whose entries are streamed one at a time; every other field is a single section.
+ITEM_SECTIONS: Dict[str, Any] = {
+    "experience": Experience,
+    "education": Education,
+    "projects": Project,
+    "volunteer_experience": Experience,
+}
+
+_field_adapters = {name: TypeAdapter(field.annotation) for name, field in ATSFriendlyResume.model_fields.items()}
+_item_adapters = {name: TypeAdapter(item_type) for name, item_type in ITEM_SECTIONS.items()}
+
+
+def is_required_section(section: str) -> bool:
+    return ATSFriendlyResume.model_fields[section].is_required()
+
+
+def section_adapter(section: str, index: Optional[int] = None) -> TypeAdapter:
+    if index is not None:
+        return _item_adapters[section]
+    return _field_adapters[section]
+
+
+def validate_section(section: str, raw_json: str, index: Optional[int] = None) -> Any:
+    """Decodes and validates one streamed section; raises ValueError when it does not fit the schema."""
+    return section_adapter(section, index).validate_python(json.loads(raw_json))
+
+
+def section_schema(section: str, index: Optional[int] = None) -> str:
+    return json.dumps(section_adapter(section, index).json_schema())
+
+
+def section_event(section: str, value: Any, index: Optional[int] = None, **extra) -> dict:
+    event = {"event": "section", "section": section}
+    if index is not None:
+        event["index"] = index
+    event["data"] = section_adapter(section, index).dump_python(value, mode="json")
+    event.update(extra)
+    return event
+
+
+def resume_section_events(resume: ATSFriendlyResume) -> Iterator[dict]:
+    """Splits a finished resume into the same events a streaming optimizer emits, then the whole resume."""
+    for section in ATSFriendlyResume.model_fields:
+        value = getattr(resume, section)
+        if section in ITEM_SECTIONS and value is not None:
+            for index, item in enumerate(value):
+                yield section_event(section, item, index)
+        else:
+            yield section_event(section, value)
+    yield {"event": "resume", "data": resume.model_dump(mode="json")}
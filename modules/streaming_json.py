@@ -0,0 +1,120 @@
+import json
+from typing import List, Optional, Tuple
+
+
+class _Frame:
+    __slots__ = ("kind", "state", "key", "start", "index", "in_primitive")
+
+    def __init__(self, kind: str):
+        self.kind = kind # "object" or "array"
+        self.state = "key" if kind == "object" else "value"
+        self.key: Optional[str] = None
+        self.start = 0
+        self.index = 0
+        self.in_primitive = False
+
+
+class IncrementalJSONObjectParser:
+    """
+    Scans a JSON object as it streams in and reports values the moment they are complete,
+    without re-parsing the whole buffer on every chunk.
+
+    `feed()` returns events as tuples:
+      ("field", key, raw_json)        a top-level field's value is complete
+      ("item", key, index, raw_json)  an element of a top-level array field is complete
+
+    The raw JSON text is returned undecoded so callers can decide how to handle malformed
+    sections. Anything before the opening brace (e.g. a ```json fence) is ignored.
+    """
+    def __init__(self):
+        self._text = ""
+        self._pos = 0
+        self._stack: List[_Frame] = []
+        self._in_string = False
+        self._escape = False
+        self._string_is_key = False
+        self._key_start = 0
+        self.done = False
+
+    @property
+    def text(self) -> str:
+        return self._text
+
+    def feed(self, chunk: str) -> List[Tuple]:
+        self._text += chunk
+        events: List[Tuple] = []
+        text = self._text
+        while self._pos < len(text) and not self.done:
+            index = self._pos
+            char = text[index]
+            self._pos += 1
+
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif char == "\\":
+                    self._escape = True
+                elif char == '"':
+                    self._in_string = False
+                    self._end_string(index, events)
+                continue
+
+            if not self._stack:
+                if char == "{":
+                    self._stack.append(_Frame("object"))
+                continue
+
+            frame = self._stack[-1]
+            if frame.in_primitive:
+                if char in ",}]" or char.isspace():
+                    self._end_child(index, events)
+                else:
+                    continue
+
+            if char.isspace():
+                continue
+            if char == '"':
+                self._in_string = True
+                self._string_is_key = frame.kind == "object" and frame.state == "key"
+                if self._string_is_key:
+                    self._key_start = index
+                else:
+                    frame.start = index
+            elif char == ":":
+                frame.state = "value"
+            elif char == ",":
+                frame.state = "key" if frame.kind == "object" else "value"
+            elif char in "{[":
+                frame.start = index
+                self._stack.append(_Frame("object" if char == "{" else "array"))
+            elif char in "}]":
+                self._stack.pop()
+                if not self._stack:
+                    self.done = True
+                else:
+                    self._end_child(index + 1, events)
+            else:
+                frame.start = index
+                frame.in_primitive = True
+        return events
+
+    def _end_string(self, index: int, events: List[Tuple]):
+        frame = self._stack[-1]
+        if self._string_is_key:
+            frame.key = json.loads(self._text[self._key_start:index + 1])
+            frame.state = "colon"
+        else:
+            self._end_child(index + 1, events)
+
+    def _end_child(self, end: int, events: List[Tuple]):
+        frame = self._stack[-1]
+        raw = self._text[frame.start:end]
+        frame.in_primitive = False
+        frame.state = "comma"
+        depth = len(self._stack)
+        if depth == 1:
+            events.append(("field", frame.key, raw))
+        elif depth == 2 and frame.kind == "array":
+            events.append(("item", self._stack[0].key, frame.index, raw))
+        if frame.kind == "array":
+            frame.index += 1
@@ -1,14 +1,55 @@
 # run_server.py
 
+import argparse
 import asyncio
+import os
 import uvicorn
 import sys
 
 def main():
+    parser = argparse.ArgumentParser(description="Run the AutoApply.AI API server.")
+    parser.add_argument("--production", action="store_true", help="Run several worker processes that share caches through SQLite.")
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes in --production mode (default: SERVER_WORKERS, i.e. the core count).")
+    parser.add_argument("--host", default=None, help="Bind address (default: SERVER_HOST).")
+    parser.add_argument("--port", type=int, default=None, help="Bind port (default: SERVER_PORT).")
+    args = parser.parse_args()
+
+    if args.production:
+        # Workers must see each other's cached results and tasks; set before app.config is imported.
+        os.environ.setdefault("SHARED_CACHE_PATH", ".cache/shared.sqlite3")
+        # Each worker keeps its own metrics registry; /metrics sums their snapshots from here.
+        os.environ.setdefault("METRICS_MULTIPROCESS_DIR", ".cache/metrics")
+    from app import config
+
+    host = args.host or config.SERVER_HOST
+    port = args.port or config.SERVER_PORT
+
     if sys.platform.startswith("win"):
         asyncio.set_event_loop_policy(asyncio.WindowsProactorEventLoopPolicy())
-    print(f"Using event loop: {asyncio.get_event_loop().__class__.__name__}")
-    uvicorn.run("app.main:app", host="127.0.0.1", port=8000, reload=False)
+
+    if not args.production:
+        print(f"Using event loop: {asyncio.get_event_loop().__class__.__name__}")
+        uvicorn.run("app.main:app", host=host, port=port, reload=False)
+        return
+
+    workers = args.workers or config.SERVER_WORKERS
+    if config.METRICS_MULTIPROCESS_DIR:
+        from modules import metrics
+        metrics.clear_snapshots(config.METRICS_MULTIPROCESS_DIR)
+    if not hasattr(os, "fork"):
+        # No fork (Windows): uvicorn spawns the workers, each importing and warming up on its own.
+        uvicorn.run("app.main:app", host=host, port=port, workers=workers, timeout_graceful_shutdown=int(config.SERVER_GRACEFUL_TIMEOUT_SECONDS))
+        return
+
+    from app.prefork import PreforkServer, warm_up_application
+    PreforkServer(
+        "app.main:app",
+        host=host,
+        port=port,
+        workers=workers,
+        graceful_timeout=config.SERVER_GRACEFUL_TIMEOUT_SECONDS,
+        warm_up=warm_up_application,
+    ).run()
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,173 @@
+"""
+Minimal local stand-in for the LinkedIn pages the Playwright scraper touches.
+It serves a login form, a feed page, a job search page with clickable cards and
+standalone job view pages, and counts requests so tests can assert on logins.
+With `with_assets`, job pages also load a stylesheet, a script, an image and a
+"tracker" script from http://localhost (a different host than 127.0.0.1).
+"""
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse
+
+SESSION_COOKIE = "li_at=fixture-session"
+
+LOGIN_PAGE = """<!DOCTYPE html>
+<html><body>
+<form onsubmit="return false;">
+  <input id="username" type="text">
+  <input id="password" type="password">
+  <input id="rememberMeOptIn-checkbox" type="checkbox" checked>
+  <label for="rememberMeOptIn-checkbox">Keep me signed in</label>
+  <button aria-label="Sign in" type="button" onclick="window.location.href='/login-submit'">Sign in</button>
+</form>
+</body></html>"""
+
+FEED_PAGE = "<!DOCTYPE html><html><body><h1>Feed</h1></body></html>"
+
+# path -> (content type, body); sized roughly like a real page's assets.
+STATIC_ASSETS = {
+    "/static/site.css": ("text/css", "body { margin: 0; }\n" + "/* padding */\n" * 400),
+    "/static/app.js": ("application/javascript", "window.fixtureApp = true;\n" + "// padding\n" * 800),
+    "/static/logo.png": ("image/png", "P" * 20000),
+    "/static/tracker.js": ("application/javascript", "window.tracked = true;\n"),
+}
+
+
+def _asset_tags(port):
+    return f"""<link rel="stylesheet" href="/static/site.css">
+<script src="/static/app.js"></script>
+<script src="http://localhost:{port}/static/tracker.js"></script>
+<img src="/static/logo.png" alt="logo">"""
+
+
+def make_jobs(count):
+    return [
+        {
+            "id": str(1000 + index),
+            "title": f"Software Engineer {index}",
+            "company": f"Company {index}",
+            "location": "Remote",
+            "description": f"Build Python services for team {index}. " * 5,
+        }
+        for index in range(count)
+    ]
+
+
+def _details_html(job):
+    return f"""
+      <h1 class="t-24"><a href="/jobs/view/{job['id']}/">{job['title']}</a></h1>
+      <div class="job-details-jobs-unified-top-card__company-name"><a href="#">{job['company']}</a></div>
+      <div class="job-details-jobs-unified-top-card__tertiary-description">
+        <span>{job['location']}</span><span>2 days ago</span>
+      </div>
+      <div id="job-details">{job['description']}</div>"""
+
+
+def _search_page(jobs, assets=""):
+    cards = "\n".join(
+        f"""<div data-job-id="{job['id']}" onclick="showJob('{job['id']}')">
+              <a class="job-card-container__link" href="/jobs/view/{job['id']}/?refId=abc">{job['title']}</a>
+            </div>"""
+        for job in jobs
+    )
+    templates = "\n".join(
+        f'<template id="job-{job["id"]}">{_details_html(job)}</template>' for job in jobs
+    )
+    return f"""<!DOCTYPE html>
+<html><head>{assets}</head><body>
+<div class="jobs-search__results-list-container" style="height: 400px; overflow: auto;">{cards}</div>
+<div class="jobs-search__job-details--wrapper" id="details"></div>
+{templates}
+<script>
+  function showJob(id) {{
+    document.getElementById('details').innerHTML = document.getElementById('job-' + id).innerHTML;
+  }}
+</script>
+</body></html>"""
+
+
+def _job_view_page(job, assets=""):
+    return f"""<!DOCTYPE html>
+<html><head>{assets}</head><body>
+<div class="jobs-search__job-details--wrapper">{_details_html(job)}</div>
+</body></html>"""
+
+
+class LinkedInFixtureServer:
+    """Serves the fixture site on 127.0.0.1 from a background thread."""
+    def __init__(self, job_count=5, job_page_delay=0.0, with_assets=False):
+        self.jobs = make_jobs(job_count)
+        # Simulated server latency for job view pages, so tab concurrency is measurable
+        self.job_page_delay = job_page_delay
+        self.with_assets = with_assets
+        self.jobs_by_id = {job["id"]: job for job in self.jobs}
+        self.login_submissions = 0
+        self.request_paths = []
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), self._handler_class())
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def base_url(self):
+        host, port = self._server.server_address
+        return f"http://{host}:{port}"
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def _assets(self):
+        return _asset_tags(self._server.server_address[1]) if self.with_assets else ""
+
+    def _handler_class(self):
+        site = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args):
+                pass
+
+            def _send(self, status, body="", headers=None, content_type="text/html; charset=utf-8"):
+                payload = body.encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(payload)))
+                for name, value in (headers or {}).items():
+                    self.send_header(name, value)
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def _logged_in(self):
+                return SESSION_COOKIE in (self.headers.get("Cookie") or "")
+
+            def do_GET(self):
+                path = urlparse(self.path).path
+                site.request_paths.append(path)
+                if path == "/login":
+                    self._send(200, LOGIN_PAGE)
+                elif path == "/login-submit":
+                    site.login_submissions += 1
+                    self._send(302, headers={"Location": "/feed", "Set-Cookie": f"{SESSION_COOKIE}; Path=/"})
+                elif path == "/feed":
+                    self._send(200, FEED_PAGE)
+                elif path.startswith("/jobs/search"):
+                    if not self._logged_in():
+                        self._send(302, headers={"Location": "/authwall"})
+                    else:
+                        self._send(200, _search_page(site.jobs, site._assets()))
+                elif path.startswith("/jobs/view/"):
+                    time.sleep(site.job_page_delay)
+                    job = site.jobs_by_id.get(path.strip("/").split("/")[-1])
+                    self._send(200, _job_view_page(job, site._assets())) if job else self._send(404, "Not found")
+                elif path in STATIC_ASSETS:
+                    content_type, body = STATIC_ASSETS[path]
+                    self._send(200, body, headers={"Cache-Control": "public, max-age=3600"}, content_type=content_type)
+                elif path == "/authwall":
+                    self._send(200, "<html><body>Sign in to continue</body></html>")
+                else:
+                    self._send(404, "Not found")
+
+        return Handler
@@ -0,0 +1,158 @@
+import asyncio
+import pytest
+from app.schemas import JobSearchCriteria
+from modules.implementations.playwright_browser_pool import PlaywrightBrowserPool
+from modules.implementations.playwright_job_scraper import PlaywrightJobScraper
+from tests.fixtures.linkedin_site import LinkedInFixtureServer
+
+
+def _chromium_available():
+    from playwright.async_api import async_playwright
+
+    async def probe():
+        async with async_playwright() as p:
+            browser = await p.chromium.launch(headless=True)
+            await browser.close()
+    try:
+        asyncio.run(probe())
+        return True
+    except Exception:
+        return False
+
+
+pytestmark = pytest.mark.skipif(not _chromium_available(), reason="Playwright Chromium is not installed.")
+
+
+@pytest.fixture
+def linkedin_site():
+    with LinkedInFixtureServer(job_count=4) as site:
+        yield site
+
+
+@pytest.fixture
+def credentials(monkeypatch):
+    monkeypatch.setattr(PlaywrightJobScraper, "LINKEDIN_EMAIL", "user@example.com")
+    monkeypatch.setattr(PlaywrightJobScraper, "LINKEDIN_PASSWORD", "secret")
+
+
+def test_browser_pool_reuses_login_across_searches(linkedin_site, credentials, tmp_path):
+    async def scenario():
+        pool = PlaywrightBrowserPool(size=2, storage_state_path=str(tmp_path / "state.json"))
+        scraper = PlaywrightJobScraper(browser_pool=pool, base_url=linkedin_site.base_url)
+        try:
+            criteria = JobSearchCriteria(keywords="Software Engineer")
+            first = await scraper.search_jobs(criteria, limit=2)
+            second = await scraper.search_jobs(criteria, limit=2)
+            return first, second
+        finally:
+            await pool.close()
+
+    first, second = asyncio.run(scenario())
+    assert [job.title for job in first] == ["Software Engineer 0", "Software Engineer 1"]
+    assert len(second) == 2
+    # Only the first search logs in; the second reuses the persisted storage state
+    assert linkedin_site.login_submissions == 1
+    assert (tmp_path / "state.json").exists()
+
+
+def test_browser_pool_logs_in_again_when_session_expires(linkedin_site, credentials, tmp_path):
+    async def scenario():
+        pool = PlaywrightBrowserPool(size=1, storage_state_path=str(tmp_path / "state.json"))
+        scraper = PlaywrightJobScraper(browser_pool=pool, base_url=linkedin_site.base_url)
+        try:
+            criteria = JobSearchCriteria(keywords="Engineer")
+            await scraper.search_jobs(criteria, limit=1)
+            # Simulate LinkedIn expiring the session cookies
+            async with pool.acquire() as context:
+                await context.clear_cookies()
+            return await scraper.search_jobs(criteria, limit=1)
+        finally:
+            await pool.close()
+
+    jobs = asyncio.run(scenario())
+    assert len(jobs) == 1
+    assert linkedin_site.login_submissions == 2
+
+
+def test_concurrent_detail_mode_fetches_every_job_in_order(credentials, tmp_path):
+    async def scenario(site):
+        pool = PlaywrightBrowserPool(size=1, storage_state_path=str(tmp_path / "state.json"))
+        scraper = PlaywrightJobScraper(browser_pool=pool, base_url=site.base_url, detail_concurrency=3)
+        try:
+            return await scraper.search_jobs_with_stats(JobSearchCriteria(keywords="Engineer"), limit=5)
+        finally:
+            await pool.close()
+
+    with LinkedInFixtureServer(job_count=6, job_page_delay=0.2) as site:
+        jobs, stats = asyncio.run(scenario(site))
+        view_requests = [path for path in site.request_paths if path.startswith("/jobs/view/")]
+
+    assert [job.title for job in jobs] == [f"Software Engineer {index}" for index in range(5)]
+    assert jobs[0].job_url.endswith("/jobs/view/1000/")
+    assert len(view_requests) == 5
+    assert stats["mode"] == "concurrent"
+
+
+def test_job_store_answers_repeat_searches_without_scraping(linkedin_site, credentials, tmp_path):
+    from modules.implementations.sqlite_job_store import SQLiteJobStore
+
+    async def scenario():
+        pool = PlaywrightBrowserPool(size=1, storage_state_path=str(tmp_path / "state.json"))
+        store = SQLiteJobStore(str(tmp_path / "jobs.sqlite3"))
+        scraper = PlaywrightJobScraper(browser_pool=pool, base_url=linkedin_site.base_url, detail_concurrency=2, job_store=store)
+        try:
+            criteria = JobSearchCriteria(keywords="Engineer")
+            first = await scraper.search_jobs(criteria, limit=2)
+            requests_after_first = len(linkedin_site.request_paths)
+            repeat = await scraper.search_jobs(JobSearchCriteria(keywords="engineer"), limit=2)
+            requests_after_repeat = len(linkedin_site.request_paths)
+            # A larger overlapping search only opens the job pages it has not seen yet
+            larger = await scraper.search_jobs(criteria, limit=3)
+            return first, repeat, larger, requests_after_first, requests_after_repeat
+        finally:
+            await pool.close()
+
+    first, repeat, larger, requests_after_first, requests_after_repeat = asyncio.run(scenario())
+    assert [job.job_url for job in repeat] == [job.job_url for job in first]
+    assert requests_after_repeat == requests_after_first
+    assert len(larger) == 3
+    view_requests = [path for path in linkedin_site.request_paths if path.startswith("/jobs/view/")]
+    assert len(view_requests) == 3
+
+
+def test_resource_policy_blocks_and_caches_assets_across_sessions(credentials, tmp_path):
+    from modules.implementations.disk_cache import DiskCache
+    from modules.resource_policy import ResourcePolicy
+
+    def policy():
+        # A fresh policy per browser, sharing only the on-disk asset cache
+        return ResourcePolicy(
+            blocked_resource_types=["image"],
+            blocked_domains=["localhost"],
+            asset_cache=DiskCache(str(tmp_path / "assets")),
+        )
+
+    async def search(site, state_name):
+        pool = PlaywrightBrowserPool(size=1, storage_state_path=str(tmp_path / state_name))
+        scraper = PlaywrightJobScraper(browser_pool=pool, base_url=site.base_url, detail_concurrency=2, resource_policy=policy())
+        try:
+            _, stats = await scraper.search_jobs_with_stats(JobSearchCriteria(keywords="Engineer"), limit=2)
+            return stats["network"]
+        finally:
+            await pool.close()
+
+    with LinkedInFixtureServer(job_count=3, with_assets=True) as site:
+        first = asyncio.run(search(site, "first.json"))
+        second = asyncio.run(search(site, "second.json"))
+        asset_requests = [path for path in site.request_paths if path.startswith("/static/")]
+
+    # The image and the tracker on another host never reach the server
+    assert "/static/logo.png" not in asset_requests
+    assert "/static/tracker.js" not in asset_requests
+    # Stylesheet and script are downloaded once and replayed from disk by the second browser
+    assert asset_requests.count("/static/site.css") == 1
+    assert asset_requests.count("/static/app.js") == 1
+    assert first["blocked"] >= 2 and second["blocked"] >= 2
+    assert second["asset_cache_hits"] >= 2
+    assert second["bytes_from_cache"] > 0
+    assert 0 < second["bytes_transferred"] < first["bytes_transferred"]
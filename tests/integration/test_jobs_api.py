@@ -0,0 +1,82 @@
+import json
+from typing import List
+from fastapi.testclient import TestClient
+from app.main import app
+from app.api import jobs
+from app.schemas import JobListing, JobSearchCriteria
+from modules.interfaces.job_scraper import IJobScraper
+
+class StubJobScraper(IJobScraper):
+    def __init__(self, count: int = 3, fail_after: int = None):
+        self.count = count
+        self.fail_after = fail_after
+
+    async def search_jobs(self, criteria: JobSearchCriteria, limit: int = 10) -> List[JobListing]:
+        return [job async for job in self.iter_jobs(criteria, limit)]
+
+    async def iter_jobs(self, criteria: JobSearchCriteria, limit: int = 10):
+        for index in range(min(self.count, limit)):
+            if self.fail_after is not None and index == self.fail_after:
+                raise RuntimeError("scraper crashed")
+            yield JobListing(
+                title=f"{criteria.keywords} {index}",
+                company="Acme",
+                location="Remote",
+                job_url=f"https://example.com/jobs/{index}",
+            )
+
+def _stream_events(scraper, params):
+    app.dependency_overrides[jobs.get_job_scraper] = lambda: scraper
+    try:
+        client = TestClient(app)
+        response = client.post("/api/search-jobs/stream", params=params, json={"keywords": "Engineer"})
+    finally:
+        app.dependency_overrides.clear()
+    return response
+
+def test_stream_search_jobs_emits_each_listing_as_ndjson():
+    response = _stream_events(StubJobScraper(count=3), {"limit": 2})
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+
+    events = [json.loads(line) for line in response.text.splitlines()]
+    assert [event["event"] for event in events] == ["started", "job", "progress", "job", "progress", "done"]
+    assert events[1]["data"]["title"] == "Engineer 0"
+    assert events[4] == {"event": "progress", "scraped": 2, "limit": 2}
+    assert events[-1]["total"] == 2
+
+def test_stream_search_jobs_reports_errors_after_partial_results_as_sse():
+    response = _stream_events(StubJobScraper(count=3, fail_after=1), {"stream_format": "sse"})
+    assert response.headers["content-type"].startswith("text/event-stream")
+    event_names = [line.split(": ", 1)[1] for line in response.text.splitlines() if line.startswith("event: ")]
+    assert event_names == ["started", "job", "progress", "error"]
+
+def test_rank_jobs_returns_best_matches_for_uploaded_resume():
+    from modules.implementations.tfidf_job_ranker import TfidfJobRanker
+    from modules.interfaces.pdf_processor import IPDFProcessor
+
+    class StubPDFProcessor(IPDFProcessor):
+        def extract_text(self, pdf_file) -> str:
+            return "Python engineer building FastAPI services"
+
+    ranker = TfidfJobRanker()
+    ranker.add_jobs([
+        JobListing(title="Python Engineer", company="Acme", location="Remote", job_url="https://example.com/jobs/1", description_snippet="FastAPI"),
+        JobListing(title="Accountant", company="Acme", location="Remote", job_url="https://example.com/jobs/2"),
+    ])
+    app.dependency_overrides[jobs.get_job_ranker] = lambda: ranker
+    app.dependency_overrides[jobs.get_pdf_processor] = lambda: StubPDFProcessor()
+    try:
+        response = TestClient(app).post(
+            "/api/rank-jobs",
+            files={"resume_file": ("resume.pdf", b"%PDF-1.4", "application/pdf")},
+            data={"top_k": "1"},
+        )
+    finally:
+        app.dependency_overrides.clear()
+
+    assert response.status_code == 200
+    ranked = response.json()
+    assert len(ranked) == 1
+    assert ranked[0]["job"]["title"] == "Python Engineer"
+    assert "python" in ranked[0]["matched_terms"]
@@ -1,10 +1,21 @@
 from fastapi.testclient import TestClient
 from app.main import app
+from app.api import resume
+from modules.implementations.fake_chat_model import FakeResumeChatModel
+from modules.implementations.langchain_resume_optimizer import LangChainResumeOptimizer
 import io
 import pytest
 
 client = TestClient(app)
 
+@pytest.fixture(autouse=True)
+def fake_llm():
+    # The pipeline runs for real except the LLM, which answers instantly with a canned resume.
+    chat_model = FakeResumeChatModel()
+    app.dependency_overrides[resume.get_resume_optimizer] = lambda: LangChainResumeOptimizer(llm=chat_model)
+    yield chat_model
+    app.dependency_overrides.clear()
+
 # Helper to create a dummy PDF for testing
 def create_dummy_pdf_bytes(text_content="Dummy resume content for integration test."):
     from reportlab.pdfgen import canvas
@@ -16,30 +27,43 @@ def create_dummy_pdf_bytes(text_content="Dummy resume content for integration te
     buffer.seek(0)
     return buffer.getvalue()
 
-def test_optimize_resume_success():
+def test_optimize_resume_success(fake_llm):
     dummy_pdf_bytes = create_dummy_pdf_bytes("My skills include Python, FastAPI, and AI.")
     job_desc = "We need a Python developer with FastAPI and AI experience."
 
     files = {"resume_file": ("resume.pdf", dummy_pdf_bytes, "application/pdf")}
-    data = {"job_description": job_desc}
+    data = {"job_description": job_desc, "bypass_cache": "true"}
 
     # Make a POST request to your API endpoint
     response = client.post("/api/optimize-resume/", files=files, data=data)
 
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/pdf"
+    assert response.content.startswith(b"%PDF")
+    assert response.headers["x-resume-version"]
+    assert fake_llm.calls == 1
+
+def test_optimize_resume_with_suggestions_returns_structured_resume():
+    dummy_pdf_bytes = create_dummy_pdf_bytes("My skills include Python, FastAPI, and AI.")
+    files = {"resume_file": ("resume.pdf", dummy_pdf_bytes, "application/pdf")}
+    data = {"job_description": "We need a Python developer with FastAPI and AI experience.", "bypass_cache": "true"}
+
+    response = client.post("/api/optimize-resume-with-suggestions", files=files, data=data)
+
     assert response.status_code == 200
     data = response.json()
 
     # Basic assertions that the response structure matches ATSFriendlyResume
-    assert "full_name" in data
-    assert "summary" in data
-    assert "experience" in data
-    assert isinstance(data["experience"], list)
-    assert "skills" in data
-    assert isinstance(data["skills"], list)
+    optimized = data["resume"]
+    assert "full_name" in optimized
+    assert isinstance(optimized["experience"], list)
+    assert isinstance(optimized["skills"], list)
+    assert "python" in optimized["summary"].lower() or any("Python" in skill["keywords"] for skill in optimized["skills"])
+    assert data["suggestions"]
 
-    # More specific assertions based on expected LLM behavior (might be less precise)
-    assert "python" in data["summary"].lower() or any("python" in s.lower() for s in data["skills"])
-    assert "fastapi" in data["summary"].lower() or any("fastapi" in s.lower() for s in data["skills"])
+    pdf_response = client.get(data["pdf_url"])
+    assert pdf_response.status_code == 200
+    assert pdf_response.content.startswith(b"%PDF")
 
 
 def test_optimize_resume_invalid_file_type():
@@ -51,7 +75,7 @@ def test_optimize_resume_invalid_file_type():
 
     response = client.post("/api/optimize-resume/", files=files, data=data)
     assert response.status_code == 400
-    assert "Only PDF files are supported." in response.json()["detail"]
+    assert "Only PDF files are supported" in response.json()["detail"]
 
 def test_optimize_resume_no_job_description():
     dummy_pdf_bytes = create_dummy_pdf_bytes()
@@ -59,4 +83,58 @@ def test_optimize_resume_no_job_description():
     # Missing data={"job_description": job_desc}
 
     response = client.post("/api/optimize-resume/", files=files)
-    assert response.status_code == 422 # Unprocessable Entity for validation error
\ No newline at end of file
+    assert response.status_code == 422 # Unprocessable Entity for validation error
+
+def test_metrics_endpoint_reports_pipeline_stages():
+    files = {"resume_file": ("resume.pdf", create_dummy_pdf_bytes("Python developer."), "application/pdf")}
+    client.post("/api/optimize-resume/", files=files, data={"job_description": "Python role", "bypass_cache": "true"})
+
+    response = client.get("/metrics")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+    assert 'autoapply_stage_duration_seconds_count{stage="pdf_extract"}' in response.text
+    assert 'stage="llm_call"' in response.text
+
+def test_keyword_coverage_scores_resume_without_calling_the_llm(fake_llm):
+    files = {"resume_file": ("resume.pdf", create_dummy_pdf_bytes("Python developer, FastAPI services on k8s."), "application/pdf")}
+    data = {"job_description": "We need a Python developer with FastAPI, Kubernetes and Terraform."}
+
+    response = client.post("/api/keyword-coverage", files=files, data=data)
+
+    assert response.status_code == 200
+    result = response.json()
+    assert result["matched_keywords"] == ["python", "fastapi", "kubernetes"]
+    assert result["missing_keywords"] == ["terraform"]
+    assert fake_llm.calls == 0
+
+def _multi_page_pdf_bytes(pages):
+    from reportlab.pdfgen import canvas
+    buffer = io.BytesIO()
+    p = canvas.Canvas(buffer)
+    for page in range(pages):
+        p.drawString(100, 750, f"Resume page {page}")
+        p.showPage()
+    p.save()
+    return buffer.getvalue()
+
+@pytest.mark.parametrize("endpoint", ["/api/keyword-coverage", "/api/get-resume-suggestions"])
+def test_pdf_over_the_page_limit_is_rejected_with_413(endpoint):
+    from modules.implementations.pypdf_processor import PyPDFProcessor
+    app.dependency_overrides[resume.get_pdf_processor] = lambda: PyPDFProcessor(max_pages=2)
+    files = {"resume_file": ("resume.pdf", _multi_page_pdf_bytes(5), "application/pdf")}
+
+    response = client.post(endpoint, files=files, data={"job_description": "Python developer"})
+
+    assert response.status_code == 413
+    assert "5 pages" in response.json()["detail"]
+
+@pytest.mark.parametrize("endpoint", ["/api/keyword-coverage", "/api/get-resume-suggestions"])
+def test_non_pdf_body_is_rejected_with_400(endpoint):
+    from modules.implementations.pypdf_processor import PyPDFProcessor
+    app.dependency_overrides[resume.get_pdf_processor] = lambda: PyPDFProcessor()
+    files = {"resume_file": ("resume.pdf", b"this is not a PDF at all", "application/pdf")}
+
+    response = client.post(endpoint, files=files, data={"job_description": "Python developer"})
+
+    assert response.status_code == 400
+    assert "PDF" in response.json()["detail"]
@@ -0,0 +1,95 @@
+import asyncio
+import json
+import zipfile
+from io import BytesIO
+from app.batch_optimization import BatchItem, BatchResumeOptimizer, build_batch_zip
+from app.schemas import ATSFriendlyResume, ResumeSuggestions
+from modules.interfaces.document_generator import IDocumentGenerator
+from modules.interfaces.resume_optimizer import IResumeOptimizer
+
+class RateLimitError(Exception):
+    status_code = 429
+
+class FakeOptimizer(IResumeOptimizer):
+    def __init__(self, rate_limited_calls=0, failing_descriptions=()):
+        self.rate_limited_calls = rate_limited_calls
+        self.failing_descriptions = set(failing_descriptions)
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    def optimize_resume(self, resume_text, job_description, use_cache=True):
+        raise NotImplementedError
+
+    def get_suggestions(self, resume_text, job_description, use_cache=True):
+        return ResumeSuggestions()
+
+    async def aoptimize_resume(self, resume_text, job_description, use_cache=True):
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(0.01)
+            if self.rate_limited_calls:
+                self.rate_limited_calls -= 1
+                raise RateLimitError("Too Many Requests")
+            if job_description in self.failing_descriptions:
+                raise ValueError("model returned garbage")
+            return ATSFriendlyResume(full_name=resume_text, contact_info={}, summary=job_description, experience=[], education=[], skills=[])
+        finally:
+            self.in_flight -= 1
+
+class FakeGenerator(IDocumentGenerator):
+    def generate_pdf(self, resume_data):
+        return BytesIO(b"%PDF " + resume_data.summary.encode())
+
+    def generate_docx(self, resume_data):
+        raise NotImplementedError
+
+def _run(optimizer, items, **kwargs):
+    batch = BatchResumeOptimizer(optimizer, FakeGenerator(), rate_limit_backoff_seconds=0.0, **kwargs)
+    return asyncio.run(batch.run("Jane", items))
+
+def test_batch_bounds_llm_concurrency_and_keeps_input_order():
+    optimizer = FakeOptimizer()
+    items = [BatchItem(label=f"Job {i}", job_description=f"jd {i}") for i in range(8)]
+
+    outcomes = _run(optimizer, items, llm_concurrency=2)
+
+    assert optimizer.max_in_flight == 2
+    assert [outcome["pdf"] for outcome in outcomes] == [f"%PDF jd {i}".encode() for i in range(8)]
+    assert outcomes[0]["result"].filename == "01_Job_0.pdf"
+
+def test_batch_retries_rate_limited_calls():
+    optimizer = FakeOptimizer(rate_limited_calls=2)
+
+    outcomes = _run(optimizer, [BatchItem(label="only", job_description="jd")], rate_limit_retries=3)
+
+    assert outcomes[0]["result"].status == "completed"
+    assert outcomes[0]["result"].rate_limit_retries == 2
+
+def test_batch_zip_contains_pdfs_and_manifest_with_failures():
+    optimizer = FakeOptimizer(failing_descriptions={"bad"})
+    items = [BatchItem(label="Good", job_description="good"), BatchItem(label="Bad", job_description="bad")]
+
+    outcomes = _run(optimizer, items)
+    archive = zipfile.ZipFile(BytesIO(asyncio.run(build_batch_zip(outcomes))))
+
+    assert sorted(archive.namelist()) == ["01_Good.pdf", "manifest.json"]
+    manifest = json.loads(archive.read("manifest.json"))
+    assert [entry["status"] for entry in manifest] == ["completed", "failed"]
+    assert manifest[1]["error"] == "model returned garbage"
+
+def test_batch_skips_jobs_below_keyword_coverage_without_calling_the_llm():
+    optimizer = FakeOptimizer()
+    items = [
+        BatchItem(label="Match", job_description="Python engineer with Kubernetes"),
+        BatchItem(label="Miss", job_description="Accountant with tax audits"),
+    ]
+    batch = BatchResumeOptimizer(optimizer, FakeGenerator(), min_keyword_coverage=0.5)
+
+    outcomes = asyncio.run(batch.run("Python developer, deployed to k8s", items))
+
+    assert [outcome["result"].status for outcome in outcomes] == ["completed", "skipped"]
+    assert outcomes[0]["result"].keyword_coverage == 1.0
+    assert outcomes[1]["result"].keyword_coverage == 0.0
+    assert outcomes[1]["pdf"] is None
+    assert optimizer.max_in_flight == 1
@@ -0,0 +1,113 @@
+import asyncio
+import pytest
+from modules.implementations import playwright_browser_pool
+from modules.implementations.playwright_browser_pool import PlaywrightBrowserPool
+
+class _FakeContext:
+    def __init__(self):
+        self.pages = []
+        self.closed = False
+
+    async def close(self):
+        self.closed = True
+
+class _FakeBrowser:
+    def __init__(self):
+        self.connected = True
+        self.fail_new_context = False
+
+    def is_connected(self):
+        return self.connected
+
+    async def new_context(self, **options):
+        if self.fail_new_context:
+            raise RuntimeError("Target page, context or browser has been closed")
+        return _FakeContext()
+
+    async def close(self):
+        self.connected = False
+
+class _FakePlaywright:
+    """Stands in for async_playwright(): every launch yields a new fake browser."""
+    def __init__(self):
+        self.browsers = []
+        self.chromium = self
+
+    def __call__(self):
+        return self
+
+    async def start(self):
+        return self
+
+    async def stop(self):
+        pass
+
+    async def launch(self, **options):
+        await asyncio.sleep(0.01) # Gives concurrent relaunches a chance to overlap
+        self.browsers.append(_FakeBrowser())
+        return self.browsers[-1]
+
+@pytest.fixture
+def fake_playwright(monkeypatch):
+    fake = _FakePlaywright()
+    monkeypatch.setattr(playwright_browser_pool, "async_playwright", fake)
+    return fake
+
+def test_failed_context_rebuild_keeps_the_slot(fake_playwright, tmp_path):
+    async def scenario():
+        pool = PlaywrightBrowserPool(size=1, storage_state_path=str(tmp_path / "state.json"))
+        await pool.start()
+        await pool.invalidate_session() # The idle context must be rebuilt on its next acquire
+        fake_playwright.browsers[0].fail_new_context = True
+        with pytest.raises(RuntimeError):
+            async with pool.acquire():
+                pass
+
+        fake_playwright.browsers[0].fail_new_context = False
+
+        async def borrow():
+            async with pool.acquire() as context:
+                return context
+
+        assert not (await asyncio.wait_for(borrow(), timeout=1)).closed
+        assert pool.stats()["idle"] == 1
+        await pool.close()
+
+    asyncio.run(scenario())
+
+def test_relaunch_happens_once_and_serves_waiting_callers(fake_playwright, tmp_path):
+    async def scenario():
+        pool = PlaywrightBrowserPool(size=1, storage_state_path=str(tmp_path / "state.json"))
+        await pool.start()
+        borrowed = asyncio.Event()
+        release = asyncio.Event()
+
+        async def holder():
+            async with pool.acquire() as context:
+                borrowed.set()
+                await release.wait()
+            return context
+
+        async def waiter():
+            async with pool.acquire() as context:
+                return context
+
+        holding = asyncio.create_task(holder())
+        await borrowed.wait()
+        waiting = asyncio.create_task(waiter())
+        await asyncio.sleep(0.01) # The waiter is now blocked on the idle queue
+
+        fake_playwright.browsers[0].connected = False # The browser crashed
+        assert all(await asyncio.gather(pool.health_check(), pool.health_check()))
+        assert len(fake_playwright.browsers) == 2
+
+        fresh_context = await asyncio.wait_for(waiting, timeout=1)
+        release.set()
+        old_context = await holding
+
+        # The context lent out before the crash is closed rather than returned to the pool
+        assert old_context.closed and not fresh_context.closed
+        assert pool.stats()["idle"] == 1
+        await pool.close()
+
+    asyncio.run(scenario())
@@ -0,0 +1,88 @@
+import os
+import time
+from modules.implementations.memory_cache import InMemoryLRUCache
+from modules.implementations.disk_cache import DiskCache
+from modules.implementations.tiered_cache import TieredCache
+from modules.implementations.sqlite_cache import SQLiteCache
+
+def test_memory_cache_evicts_least_recently_used():
+    cache = InMemoryLRUCache(max_entries=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1 # "a" is now the most recently used
+    cache.set("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    stats = cache.stats()
+    assert stats["evictions"] == 1
+    assert stats["hits"] == 3
+    assert stats["misses"] == 1
+
+def test_memory_cache_ttl_expires_entries():
+    cache = InMemoryLRUCache(max_entries=10, ttl_seconds=0.05)
+    cache.set("a", "value")
+    assert cache.get("a") == "value"
+    time.sleep(0.1)
+    assert cache.get("a") is None
+    assert cache.stats()["expirations"] == 1
+
+def test_disk_cache_round_trip_and_size_bound(tmp_path):
+    cache = DiskCache(str(tmp_path), max_bytes=600)
+    cache.set("first", "x" * 200)
+    cache.set("second", "y" * 200)
+    # Touch "first" so "second" becomes the eviction candidate
+    assert cache.get("first") == "x" * 200
+    os.utime(cache._path_for("second"), (0, time.time()))
+    cache.set("third", "z" * 200)
+
+    assert cache.get("second") is None
+    assert cache.get("first") == "x" * 200
+    assert cache.get("third") == "z" * 200
+    assert cache.stats()["size_bytes"] <= 600
+
+def test_disk_cache_survives_new_instance(tmp_path):
+    DiskCache(str(tmp_path)).set("key", {"text": "resume"})
+    assert DiskCache(str(tmp_path)).get("key") == {"text": "resume"}
+
+def test_tiered_cache_backfills_memory_from_disk(tmp_path):
+    disk = DiskCache(str(tmp_path))
+    disk.set("key", "from disk")
+    memory = InMemoryLRUCache(max_entries=4)
+    cache = TieredCache([memory, disk])
+
+    assert cache.get("key") == "from disk"
+    assert memory.get("key") == "from disk"
+    assert cache.stats()["hit_rate"] == 1.0
+
+def test_sqlite_cache_round_trip_ttl_and_eviction(tmp_path):
+    path = str(tmp_path / "cache.sqlite3")
+    cache = SQLiteCache(path, max_entries=2, ttl_seconds=60)
+    cache.set("a", {"value": 1})
+    cache.set("b", {"value": 2})
+    assert cache.get("a") == {"value": 1}
+    cache.set("c", {"value": 3}) # Evicts "b", the least recently accessed
+
+    assert cache.get("b") is None
+    assert cache.get("c") == {"value": 3}
+    assert cache.stats()["evictions"] == 1
+
+    # A second handle on the same file sees the stored entries
+    assert SQLiteCache(path).get("a") == {"value": 1}
+
+    expiring = SQLiteCache(str(tmp_path / "ttl.sqlite3"), ttl_seconds=0.05)
+    expiring.set("a", "value")
+    time.sleep(0.1)
+    assert expiring.get("a") is None
+
+def test_sqlite_caches_share_one_file_per_table(tmp_path):
+    path = str(tmp_path / "shared.sqlite3")
+    worker_a = SQLiteCache(path, table="llm_responses")
+    worker_b = SQLiteCache(path, table="llm_responses")
+    other_table = SQLiteCache(path, table="pdf_text")
+
+    worker_a.set("k", {"answer": 42})
+    assert worker_b.get("k") == {"answer": 42}
+    assert other_table.get("k") is None
+    assert worker_b.stats()["table"] == "llm_responses"
@@ -0,0 +1,27 @@
+import asyncio
+import time
+from modules.implementations.fake_chat_model import CANNED_RESUME, CANNED_SUGGESTIONS, FakeResumeChatModel, LatencyProfile
+from modules.implementations.langchain_resume_optimizer import LangChainResumeOptimizer
+
+def test_fake_model_answers_each_optimizer_prompt_with_valid_output():
+    optimizer = LangChainResumeOptimizer(llm=FakeResumeChatModel())
+
+    assert optimizer.optimize_resume("Resume text", "Job description") == CANNED_RESUME
+    assert optimizer.get_suggestions("Resume text", "Job description") == CANNED_SUGGESTIONS
+    entries = asyncio.run(optimizer.aoptimize_section("projects", "resume-tailor CLI", "Job description", CANNED_RESUME.projects))
+    assert entries == CANNED_RESUME.projects[:1]
+
+def test_fake_model_streams_sections_with_the_configured_latency():
+    profile = LatencyProfile(time_to_first_token=0.05, tokens_per_second=20000.0)
+    optimizer = LangChainResumeOptimizer(llm=FakeResumeChatModel(profile=profile))
+
+    async def collect():
+        return [event async for event in optimizer.astream_resume("Resume text", "Job description")]
+
+    started = time.perf_counter()
+    events = asyncio.run(collect())
+    elapsed = time.perf_counter() - started
+
+    assert elapsed >= 0.05
+    assert [event["index"] for event in events if event.get("section") == "experience"] == [0, 1]
+    assert events[-1]["data"]["full_name"] == CANNED_RESUME.full_name
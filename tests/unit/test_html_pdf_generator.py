@@ -0,0 +1,24 @@
+from modules.implementations.html_pdf_generator import WARM_UP_RESUME, HtmlPdfGenerator
+
+
+def test_generators_share_one_compiled_template():
+    first = HtmlPdfGenerator(template_dir="templates")
+    second = HtmlPdfGenerator(template_dir="templates")
+    assert first.template is second.template
+
+
+def test_stylesheets_are_parsed_once_and_not_linked_again():
+    generator = HtmlPdfGenerator(template_dir="templates")
+    assert len(generator.stylesheets) == 1
+
+    preloaded = generator.template.render(resume=WARM_UP_RESUME.model_dump(), stylesheets_preloaded=True)
+    linked = generator.template.render(resume=WARM_UP_RESUME.model_dump())
+    assert "resume.css" not in preloaded
+    assert "resume.css" in linked
+
+
+def test_warm_up_renders_a_sample_resume():
+    generator = HtmlPdfGenerator(template_dir="templates")
+    assert generator.warm_up() >= 0
+    assert generator.warmed_up
+    assert generator.generate_pdf(WARM_UP_RESUME).getvalue().startswith(b"%PDF")
@@ -0,0 +1,118 @@
+import asyncio
+from app.incremental_optimization import IncrementalResumeOptimizer, resume_version_id
+from app.schemas import ATSFriendlyResume, Experience, ResumeSuggestions
+from modules.implementations.memory_cache import InMemoryLRUCache
+from modules.interfaces.resume_optimizer import IResumeOptimizer
+
+RESUME_TEXT = """Jane Doe
+jane@example.com
+
+EXPERIENCE
+Senior Engineer, Acme Corp, 2020 - Present
+- Led the billing migration.
+- Built observability tooling.
+Engineer, Globex, 2016 - 2020
+- Maintained ingestion services.
+
+SKILLS
+Python, Go
+"""
+
+def _experience(title, company, bullets):
+    return Experience(title=title, company=company, start_date="2020", responsibilities=bullets)
+
+class SectionAwareOptimizer(IResumeOptimizer):
+    supports_section_optimization = True
+
+    def __init__(self):
+        self.full_calls = 0
+        self.section_calls = []
+
+    def optimize_resume(self, resume_text, job_description, use_cache=True):
+        self.full_calls += 1
+        return ATSFriendlyResume(
+            full_name="Jane Doe", contact_info={"email": "jane@example.com"}, summary="Engineer.",
+            experience=[
+                _experience("Senior Engineer", "Acme Corp", ["Led billing migration."]),
+                _experience("Engineer", "Globex", ["Maintained ingestion."]),
+            ],
+            education=[], skills=[],
+        )
+
+    def get_suggestions(self, resume_text, job_description, use_cache=True):
+        return ResumeSuggestions()
+
+    async def aoptimize_section(self, section, source_text, job_description, previous_entries, use_cache=True):
+        self.section_calls.append((section, source_text))
+        previous = previous_entries[0]
+        return [previous.model_copy(update={"responsibilities": source_text.splitlines()[1:]})]
+
+def _optimize(incremental, text, previous_version=None):
+    return asyncio.run(incremental.optimize(text, "Backend role", previous_version=previous_version))
+
+def test_edited_bullet_reoptimizes_only_its_experience_entry():
+    optimizer = SectionAwareOptimizer()
+    incremental = IncrementalResumeOptimizer(optimizer, InMemoryLRUCache(max_entries=8))
+    first, version, report = _optimize(incremental, RESUME_TEXT)
+    assert report["mode"] == "full"
+
+    edited = RESUME_TEXT.replace("- Maintained ingestion services.", "- Maintained ingestion services.\n- Cut p99 latency by 30%.")
+    second, second_version, report = _optimize(incremental, edited, previous_version=version)
+
+    assert optimizer.full_calls == 1
+    assert report == {"mode": "incremental", "reoptimized": ["experience[1]"], "reused": 1}
+    assert optimizer.section_calls == [("experience", "Engineer, Globex, 2016 - 2020\n- Maintained ingestion services.\n- Cut p99 latency by 30%.")]
+    assert second.experience[0] == first.experience[0]
+    assert second.experience[1].responsibilities[-1] == "- Cut p99 latency by 30%."
+    assert second_version == resume_version_id(edited, "Backend role")
+
+def test_resubmitting_identical_text_is_served_from_the_version_store():
+    optimizer = SectionAwareOptimizer()
+    incremental = IncrementalResumeOptimizer(optimizer, InMemoryLRUCache(max_entries=8))
+    _, version, _ = _optimize(incremental, RESUME_TEXT)
+
+    _, same_version, report = _optimize(incremental, RESUME_TEXT.replace("Jane Doe", "Jane  Doe\n"), previous_version=version)
+
+    assert same_version == version
+    assert report["mode"] == "unchanged"
+    assert optimizer.full_calls == 1
+
+def test_edits_outside_list_entries_fall_back_to_full_optimization():
+    optimizer = SectionAwareOptimizer()
+    incremental = IncrementalResumeOptimizer(optimizer, InMemoryLRUCache(max_entries=8))
+    _, version, _ = _optimize(incremental, RESUME_TEXT)
+
+    _, _, report = _optimize(incremental, RESUME_TEXT.replace("Python, Go", "Python, Go, Rust"), previous_version=version)
+
+    assert report["mode"] == "full"
+    assert optimizer.full_calls == 2
+    assert optimizer.section_calls == []
+
+def test_summary_naming_the_employer_is_not_taken_for_the_experience_entry():
+    optimizer = SectionAwareOptimizer()
+    incremental = IncrementalResumeOptimizer(optimizer, InMemoryLRUCache(max_entries=8))
+    text = RESUME_TEXT.replace("jane@example.com\n", "jane@example.com\n\nSUMMARY\nSenior Engineer at Acme Corp building data platforms.\n")
+    _, version, _ = _optimize(incremental, text)
+
+    edited = text.replace("building data platforms.", "building ML platforms at scale.")
+    _, _, report = _optimize(incremental, edited, previous_version=version)
+
+    # The summary is not a list entry, so the edit needs a full re-optimization
+    assert report["mode"] == "full"
+    assert optimizer.full_calls == 2
+    assert optimizer.section_calls == []
+
+def test_optimizers_without_section_support_reoptimize_the_whole_resume():
+    class WholeResumeOptimizer(SectionAwareOptimizer):
+        supports_section_optimization = False
+
+    optimizer = WholeResumeOptimizer()
+    incremental = IncrementalResumeOptimizer(optimizer, InMemoryLRUCache(max_entries=8))
+    _, version, _ = _optimize(incremental, RESUME_TEXT)
+
+    edited = RESUME_TEXT.replace("- Maintained ingestion services.", "- Maintained ingestion services.\n- Cut p99 latency by 30%.")
+    _, _, report = _optimize(incremental, edited, previous_version=version)
+
+    assert report["mode"] == "full"
+    assert optimizer.full_calls == 2
+    assert optimizer.section_calls == []
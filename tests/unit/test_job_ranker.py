@@ -0,0 +1,116 @@
+import time
+from app.schemas import JobListing
+from modules.implementations.indexing_job_store import IndexingJobStore
+from modules.implementations.sqlite_job_store import SQLiteJobStore
+from modules.implementations.tfidf_job_ranker import TfidfJobRanker, tokenize
+
+RESUME = "Senior Python engineer. Built FastAPI services on PostgreSQL and Kubernetes; machine learning pipelines."
+
+def _job(index, title, description):
+    return JobListing(
+        title=title,
+        company="Acme",
+        location="Remote",
+        job_url=f"https://www.linkedin.com/jobs/view/{index}/",
+        description_snippet=description,
+    )
+
+JOBS = [
+    _job(1, "Python Backend Engineer", "FastAPI, PostgreSQL, Kubernetes."),
+    _job(2, "Frontend Developer", "React, TypeScript, CSS."),
+    _job(3, "Machine Learning Engineer", "Python, machine learning pipelines, PyTorch."),
+    _job(4, "Accountant", "Ledgers, audits and tax filings."),
+]
+
+def test_tokenize_keeps_tech_terms_and_adds_bigrams():
+    terms = tokenize("Experience with C++, C# and Node.js. Machine learning.")
+    assert {"c++", "c#", "node.js", "machine", "learning", "machine learning"} <= set(terms)
+    assert "with" not in terms
+
+def test_rank_orders_listings_by_similarity():
+    ranker = TfidfJobRanker()
+    ranker.add_jobs(JOBS)
+
+    ranked = ranker.rank(RESUME, top_k=3)
+    assert {result.job.job_url for result in ranked[:2]} == {JOBS[0].job_url, JOBS[2].job_url}
+    assert ranked[0].score >= ranked[1].score >= ranked[2].score
+    assert "python" in ranked[0].matched_terms
+
+def test_rank_can_be_restricted_to_given_urls():
+    ranker = TfidfJobRanker()
+    ranker.add_jobs(JOBS)
+
+    ranked = ranker.rank(RESUME, top_k=10, job_urls=[JOBS[1].job_url + "?trk=feed", "https://example.com/unknown"])
+    assert [result.job.job_url for result in ranked] == [JOBS[1].job_url]
+
+def test_incremental_add_replaces_listing_with_same_url():
+    ranker = TfidfJobRanker()
+    ranker.add_jobs(JOBS)
+    assert ranker.rank("accountant audits", top_k=1)[0].job.job_url == JOBS[3].job_url
+
+    ranker.add_jobs([_job(4, "Rust Systems Engineer", "Rust, embedded, Linux kernel.")])
+    ranker.add_jobs([_job(4, "Rust Systems Engineer", "Rust, embedded, Linux kernel.")]) # Unchanged re-save
+    assert ranker.stats()["jobs"] == 4
+    assert ranker.stats()["rows"] == 5
+    assert ranker.rank("accountant audits", top_k=4)[0].score < 0.1
+    assert ranker.rank("rust linux kernel", top_k=1)[0].job.title == "Rust Systems Engineer"
+
+def test_replaced_rows_are_compacted():
+    ranker = TfidfJobRanker(compact_min_rows=2)
+    ranker.add_jobs(JOBS)
+    for revision in range(5):
+        ranker.add_jobs([_job(1, f"Python Backend Engineer v{revision}", "FastAPI.")])
+
+    assert ranker.stats()["jobs"] == 4
+    assert ranker.stats()["rows"] <= 8
+    assert ranker.rank("fastapi", top_k=1)[0].job.title == "Python Backend Engineer v4"
+
+def test_rank_with_empty_index_or_unknown_terms_returns_nothing():
+    ranker = TfidfJobRanker()
+    assert ranker.rank(RESUME) == []
+    ranker.add_jobs(JOBS)
+    assert ranker.rank("zzz qqq") == []
+
+def test_indexing_job_store_indexes_saved_and_existing_listings(tmp_path):
+    inner = SQLiteJobStore(str(tmp_path / "jobs.sqlite3"))
+    inner.upsert_jobs(JOBS[:2])
+
+    ranker = TfidfJobRanker()
+    store = IndexingJobStore(inner, ranker)
+    assert store.load_index() == 2
+    store.upsert_jobs([JOBS[2]])
+    assert ranker.stats()["jobs"] == 3
+    assert store.get_job(JOBS[2].job_url).title == JOBS[2].title
+
+def test_sync_index_picks_up_listings_saved_by_another_worker(tmp_path):
+    path = str(tmp_path / "jobs.sqlite3")
+    ranker = TfidfJobRanker()
+    store = IndexingJobStore(SQLiteJobStore(path), ranker)
+    assert store.load_index() == 0
+
+    # Another server process writes to the same database file
+    SQLiteJobStore(path).upsert_jobs(JOBS[:2])
+    assert ranker.stats()["jobs"] == 0
+
+    store.sync_index()
+    assert ranker.stats()["jobs"] == 2
+    assert ranker.rank(RESUME, top_k=1)[0].job.job_url == JOBS[0].job_url
+
+def test_sync_index_drops_listings_past_the_store_ttl(tmp_path, monkeypatch):
+    inner = SQLiteJobStore(str(tmp_path / "jobs.sqlite3"), ttl_seconds=60)
+    ranker = TfidfJobRanker()
+    store = IndexingJobStore(inner, ranker)
+    now = time.time()
+    with monkeypatch.context() as patched:
+        patched.setattr(time, "time", lambda: now - 50)
+        store.upsert_jobs([JOBS[0]])
+        store.load_index()
+    store.upsert_jobs([JOBS[1]])
+    assert ranker.stats()["jobs"] == 2
+
+    # Twenty seconds on, JOBS[0] has outlived the 60 second TTL; JOBS[1] is still fresh
+    monkeypatch.setattr(time, "time", lambda: now + 20)
+    store.sync_index()
+
+    assert ranker.stats()["jobs"] == 1
+    assert [result.job.job_url for result in ranker.rank(RESUME)] == [JOBS[1].job_url]
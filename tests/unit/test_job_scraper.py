@@ -0,0 +1,85 @@
+import asyncio
+import time
+from modules.implementations.playwright_job_scraper import _RateLimiter, PlaywrightJobScraper
+from app.schemas import JobSearchCriteria
+
+def test_rate_limiter_spaces_out_concurrent_callers():
+    limiter = _RateLimiter(min_interval=0.05)
+
+    async def scenario():
+        started = time.monotonic()
+        stamps = []
+
+        async def worker():
+            await limiter.wait()
+            stamps.append(time.monotonic() - started)
+
+        await asyncio.gather(*(worker() for _ in range(4)))
+        return sorted(stamps)
+
+    stamps = asyncio.run(scenario())
+    assert stamps[-1] >= 0.14 # Four callers need at least three intervals
+    assert all(later - earlier >= 0.04 for earlier, later in zip(stamps, stamps[1:]))
+
+def test_search_url_uses_configured_base_url():
+    scraper = PlaywrightJobScraper(base_url="http://127.0.0.1:9999/")
+    url = scraper._build_search_url(JobSearchCriteria(keywords="Data Engineer", location="New York"))
+    assert url == "http://127.0.0.1:9999/jobs/search/?keywords=Data%20Engineer&location=New%20York"
+
+class _ScriptedScraper(PlaywrightJobScraper):
+    """Replays scripted scrapes instead of driving a browser: each is (listings, finished cleanly)."""
+    def __init__(self, job_store, scrapes):
+        super().__init__(job_store=job_store)
+        self.scrapes = list(scrapes)
+        self.scrape_count = 0
+
+    async def _iter_scraped_jobs(self, criteria, limit, outcome):
+        listings, clean = self.scrapes[self.scrape_count]
+        self.scrape_count += 1
+        for index, job_listing in enumerate(listings[:limit]):
+            await asyncio.sleep(0) # Let concurrent searches interleave
+            yield index, job_listing
+        outcome.completed = clean
+        outcome.stats["jobs"] = min(len(listings), limit)
+
+def _listing(index):
+    from app.schemas import JobListing
+    return JobListing(title=f"Engineer {index}", company="Acme", location="Remote", job_url=f"https://www.linkedin.com/jobs/view/{index}/")
+
+def test_failed_or_partial_scrapes_are_not_cached_as_the_search_answer(tmp_path):
+    from modules.implementations.sqlite_job_store import SQLiteJobStore
+    store = SQLiteJobStore(str(tmp_path / "jobs.sqlite3"))
+    criteria = JobSearchCriteria(keywords="Engineer")
+    scraper = _ScriptedScraper(store, [
+        ([], False), # Login or browser launch failed
+        ([_listing(0)], False), # Timed out after the first listing
+        ([_listing(0), _listing(1), _listing(2)], True),
+    ])
+
+    assert asyncio.run(scraper.search_jobs(criteria, limit=3)) == []
+    partial = asyncio.run(scraper.search_jobs(criteria, limit=3))
+    complete = asyncio.run(scraper.search_jobs(criteria, limit=3))
+    repeat = asyncio.run(scraper.search_jobs(criteria, limit=3))
+
+    assert len(partial) == 1
+    assert [job.title for job in complete] == ["Engineer 0", "Engineer 1", "Engineer 2"]
+    # Every search after a failure scraped again; only the clean one answers the repeat
+    assert scraper.scrape_count == 3
+    assert repeat == complete
+    store.close()
+
+def test_concurrent_searches_each_get_their_own_stats():
+    scraper = _ScriptedScraper(None, [
+        ([_listing(0), _listing(1), _listing(2)], True),
+        ([_listing(3)], True),
+    ])
+
+    async def scenario():
+        return await asyncio.gather(
+            scraper.search_jobs_with_stats(JobSearchCriteria(keywords="Engineer"), limit=3),
+            scraper.search_jobs_with_stats(JobSearchCriteria(keywords="Designer"), limit=3),
+        )
+
+    (first_jobs, first_stats), (second_jobs, second_stats) = asyncio.run(scenario())
+    assert (len(first_jobs), first_stats["jobs"]) == (3, 3)
+    assert (len(second_jobs), second_stats["jobs"]) == (1, 1)
@@ -0,0 +1,45 @@
+import time
+from app.schemas import JobListing, JobSearchCriteria
+from modules.implementations.sqlite_job_store import SQLiteJobStore, normalize_job_url
+
+def _job(index, url_suffix=""):
+    return JobListing(
+        title=f"Engineer {index}",
+        company="Acme",
+        location="Remote",
+        job_url=f"https://www.linkedin.com/jobs/view/{index}/{url_suffix}",
+    )
+
+def test_normalize_job_url_strips_tracking_and_case():
+    assert normalize_job_url("HTTPS://WWW.LinkedIn.com/jobs/view/1?refId=abc#top") == "https://www.linkedin.com/jobs/view/1/"
+
+def test_upsert_deduplicates_by_normalized_url(tmp_path):
+    store = SQLiteJobStore(str(tmp_path / "jobs.sqlite3"))
+    store.upsert_jobs([_job(1)])
+    updated = _job(1, "?trk=feed").model_copy(update={"title": "Senior Engineer 1"})
+    store.upsert_jobs([updated])
+
+    assert store.stats()["jobs"] == 1
+    assert store.get_job("https://www.linkedin.com/jobs/view/1").title == "Senior Engineer 1"
+
+def test_search_results_are_reused_until_stale(tmp_path):
+    store = SQLiteJobStore(str(tmp_path / "jobs.sqlite3"), ttl_seconds=0.2)
+    criteria = JobSearchCriteria(keywords="Python  Engineer", location="Remote")
+    store.save_search(criteria, 3, [_job(1), _job(2), _job(3)])
+
+    same_search = JobSearchCriteria(keywords="python engineer", location="remote")
+    assert [job.title for job in store.get_search(same_search, 2)] == ["Engineer 1", "Engineer 2"]
+    # Asking for more than was scraped needs a fresh scrape
+    assert store.get_search(same_search, 5) is None
+
+    time.sleep(0.25)
+    assert store.get_search(same_search, 2) is None
+    assert store.get_job(_job(1).job_url) is None
+    assert store.get_job(_job(1).job_url, fresh_only=False) is not None
+
+def test_exhaustive_search_answers_larger_limits(tmp_path):
+    store = SQLiteJobStore(str(tmp_path / "jobs.sqlite3"))
+    criteria = JobSearchCriteria(keywords="Rare Role")
+    store.save_search(criteria, 10, [_job(1)]) # Only one job existed
+
+    assert len(store.get_search(criteria, 25)) == 1
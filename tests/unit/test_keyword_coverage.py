@@ -0,0 +1,69 @@
+from app.schemas import ATSFriendlyResume, Experience, Skill
+from modules.keyword_coverage import extract_keywords, normalize_terms, score_keyword_coverage, split_raw_sections, stem
+
+JOB_DESCRIPTION = """Senior Backend Engineer
+We are looking for a Python engineer with FastAPI, PostgreSQL, Kubernetes and AWS.
+Experience with CI/CD and machine learning is a plus. You will scale our payment services
+and own payment reliability."""
+
+def test_stem_conflates_inflections():
+    assert stem("services") == stem("service")
+    assert stem("scaling") == stem("scaled") == stem("scale")
+    assert stem("planned") == stem("plan")
+    assert stem("c++") == "c++"
+
+def test_normalize_terms_maps_synonyms_to_canonical_skills():
+    terms = normalize_terms("Deployed to k8s on Amazon Web Services with Postgres, Node.js and Golang")
+    assert {"kubernetes", "aws", "postgresql", "node.js", "golang"} <= set(terms)
+    assert "with" not in terms
+
+def test_ambiguous_words_do_not_count_as_skills():
+    terms = set(normalize_terms("Led the team that ran containers and monitoring in TS and TF"))
+    assert not terms & {"leadership", "docker", "observability", "typescript", "tensorflow"}
+
+def test_extract_keywords_lists_skills_first_then_repeated_words():
+    keywords = extract_keywords(JOB_DESCRIPTION)
+    assert keywords.terms[:7] == ("back-end", "python", "fastapi", "postgresql", "kubernetes", "aws", "ci/cd")
+    assert "payment" in keywords.labels
+    # Words used only once are not keywords unless they are known skills.
+    assert "reliability" not in keywords.labels
+
+def test_score_raw_resume_reports_coverage_missing_and_sections():
+    resume_text = """Jane Doe
+SUMMARY
+Backend engineer with 8 years of Python.
+Experience
+Built FastAPI services on Postgres for payments, deployed to k8s on Amazon Web Services.
+Skills
+Python, ML, Docker"""
+
+    result = score_keyword_coverage(JOB_DESCRIPTION, resume_text)
+
+    assert result.missing_keywords == ["ci/cd"]
+    assert 0.8 < result.coverage < 1.0
+    assert result.section_hits["skills"] == ["python", "machine learning"]
+    assert "kubernetes" in result.section_hits["experience"]
+    assert "python" in result.section_hits["summary"]
+
+def test_score_structured_resume():
+    resume = ATSFriendlyResume(
+        full_name="Jane Doe",
+        contact_info={},
+        summary="Backend engineer.",
+        experience=[Experience(title="Engineer", company="Acme", start_date="2020", responsibilities=["Scaled payment services."], technologies_used=["AWS", "PostgreSQL"])],
+        education=[],
+        skills=[Skill(category="Languages", keywords=["Python", "FastAPI"])],
+    )
+
+    result = score_keyword_coverage(JOB_DESCRIPTION, resume)
+
+    assert set(result.missing_keywords) == {"kubernetes", "ci/cd", "machine learning"}
+    assert result.section_hits["skills"] == ["python", "fastapi"]
+    assert "aws" in result.section_hits["experience"]
+
+def test_split_raw_sections_on_headings():
+    sections = split_raw_sections("Jane\nWork Experience\nAcme\nEducation:\nMIT")
+    assert sections == {"header": "Jane", "experience": "Acme", "education": "MIT"}
+
+def test_empty_job_description_scores_zero():
+    assert score_keyword_coverage("", "Python").coverage == 0.0
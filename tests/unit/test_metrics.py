@@ -0,0 +1,112 @@
+import json
+import asyncio
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from app.server_timing import ServerTimingMiddleware
+from modules import metrics
+from modules.executors import run_blocking
+from modules.implementations.fake_chat_model import FakeResumeChatModel
+from modules.implementations.langchain_resume_optimizer import LangChainResumeOptimizer
+
+
+@pytest.fixture
+def enabled_metrics():
+    previous = metrics.is_enabled()
+    metrics.registry.reset()
+    metrics.configure(enabled=True)
+    yield metrics.registry
+    metrics.configure(enabled=previous)
+    metrics.registry.reset()
+
+
+def test_span_is_a_noop_when_disabled():
+    previous = metrics.is_enabled()
+    metrics.configure(enabled=False)
+    try:
+        assert metrics.span("pdf_extract") is metrics.span("weasyprint")
+    finally:
+        metrics.configure(enabled=previous)
+
+
+def test_spans_render_as_prometheus_histograms(enabled_metrics):
+    with metrics.span("pdf_extract"):
+        pass
+    metrics.record_span("llm_call", 0.7, {"kind": "resume"})
+    metrics.record_llm_tokens("resume", 1200, 300)
+
+    text = enabled_metrics.render()
+    assert "# TYPE autoapply_stage_duration_seconds histogram" in text
+    assert 'autoapply_stage_duration_seconds_count{stage="pdf_extract"} 1' in text
+    assert 'autoapply_stage_duration_seconds_bucket{kind="resume",stage="llm_call",le="0.5"} 0' in text
+    assert 'autoapply_stage_duration_seconds_bucket{kind="resume",stage="llm_call",le="1.0"} 1' in text
+    assert 'autoapply_stage_duration_seconds_bucket{kind="resume",stage="llm_call",le="+Inf"} 1' in text
+    assert 'autoapply_llm_tokens_total{kind="resume",type="prompt"} 1200.0' in text
+
+
+def _render_step():
+    with metrics.span("weasyprint"):
+        pass
+
+
+def test_collected_spans_follow_work_into_blocking_threads():
+    async def handle():
+        with metrics.collect_spans() as spans:
+            async with metrics.span("llm_call", kind="resume"):
+                pass
+            await run_blocking(_render_step)
+        return spans
+
+    spans = asyncio.run(handle())
+    assert [stage for stage, _, _ in spans] == ["llm_call", "weasyprint"]
+    header = metrics.server_timing_header(spans)
+    assert header.startswith('llm_call;desc="kind=resume";dur=')
+    assert ", weasyprint;dur=" in header
+
+
+def test_optimizer_times_llm_call_and_parse(enabled_metrics):
+    optimizer = LangChainResumeOptimizer(llm=FakeResumeChatModel())
+    with metrics.collect_spans() as spans:
+        asyncio.run(optimizer.aoptimize_resume("Resume text", "Job description", use_cache=False))
+
+    assert [(stage, labels) for stage, labels, _ in spans] == [
+        ("llm_call", {"kind": "resume"}),
+        ("llm_parse", {"kind": "resume"}),
+    ]
+    text = enabled_metrics.render()
+    assert 'autoapply_llm_tokens_total{kind="resume",type="completion"}' in text
+
+
+def test_server_timing_middleware_adds_header():
+    app = FastAPI()
+    app.add_middleware(ServerTimingMiddleware)
+
+    @app.get("/work")
+    async def work():
+        with metrics.span("template_render"):
+            pass
+        return {"ok": True}
+
+    response = TestClient(app).get("/work")
+    assert response.status_code == 200
+    assert response.headers["server-timing"].startswith("template_render;dur=")
+
+
+def test_render_all_sums_the_snapshots_of_every_worker(enabled_metrics, tmp_path):
+    other_worker = metrics.MetricsRegistry()
+    other_worker.observe(metrics.STAGE_HISTOGRAM, 0.7, stage="llm_call")
+    other_worker.inc(metrics.LLM_TOKENS_COUNTER, 500, kind="resume", type="prompt")
+    (tmp_path / f"999999{metrics.SNAPSHOT_SUFFIX}").write_text(json.dumps(other_worker.snapshot()))
+
+    metrics.record_span("llm_call", 0.2)
+    metrics.record_llm_tokens("resume", 1200, 300)
+    metrics.write_snapshot(str(tmp_path))
+    metrics.record_llm_tokens("resume", 100, 0)
+
+    text = metrics.render_all(str(tmp_path))
+    # This worker's own snapshot is replaced by its live registry, not counted twice
+    assert 'autoapply_stage_duration_seconds_count{stage="llm_call"} 2' in text
+    assert 'autoapply_llm_tokens_total{kind="resume",type="prompt"} 1800.0' in text
+
+    metrics.clear_snapshots(str(tmp_path))
+    assert list(tmp_path.iterdir()) == []
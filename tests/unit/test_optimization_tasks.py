@@ -0,0 +1,195 @@
+import asyncio
+from io import BytesIO
+from app.optimization_tasks import OptimizationTaskManager
+from app.schemas import ATSFriendlyResume, ResumeSuggestions
+from modules.implementations.in_memory_task_store import InMemoryTaskStore
+from modules.implementations.in_process_task_queue import InProcessTaskQueue
+from modules.interfaces.document_generator import IDocumentGenerator
+from modules.interfaces.pdf_processor import IPDFProcessor
+from modules.interfaces.resume_optimizer import IResumeOptimizer
+
+class FakeProcessor(IPDFProcessor):
+    def extract_text(self, pdf_file_stream):
+        return pdf_file_stream.read().decode()
+
+class CountingOptimizer(IResumeOptimizer):
+    def __init__(self):
+        self.calls = 0
+
+    def optimize_resume(self, resume_text, job_description, use_cache=True):
+        self.calls += 1
+        return ATSFriendlyResume(full_name=resume_text, contact_info={}, summary=job_description, experience=[], education=[], skills=[])
+
+    def get_suggestions(self, resume_text, job_description, use_cache=True):
+        return ResumeSuggestions()
+
+class FlakyGenerator(IDocumentGenerator):
+    def __init__(self, failures):
+        self.failures = failures
+
+    def generate_pdf(self, resume_data):
+        if self.failures:
+            self.failures -= 1
+            raise RuntimeError("renderer crashed")
+        return BytesIO(b"%PDF " + resume_data.full_name.encode())
+
+    def generate_docx(self, resume_data):
+        raise NotImplementedError
+
+def _manager(optimizer, generator):
+    return OptimizationTaskManager(
+        queue=InProcessTaskQueue(workers=2),
+        store=InMemoryTaskStore(),
+        pdf_processor=FakeProcessor,
+        resume_optimizer=lambda: optimizer,
+        document_generator=lambda: generator,
+    )
+
+async def _wait_until_finished(manager, task_id):
+    for _ in range(200):
+        task = manager.get(task_id)
+        if task.status in ("completed", "failed"):
+            return task
+        await asyncio.sleep(0.01)
+    raise AssertionError("task did not finish")
+
+def test_task_runs_pipeline_and_stores_pdf():
+    async def scenario():
+        manager = _manager(CountingOptimizer(), FlakyGenerator(failures=0))
+        try:
+            task = await manager.submit(b"Jane Doe", "Python role")
+            assert task.status == "queued"
+            finished = await _wait_until_finished(manager, task.task_id)
+            return finished, manager.get_pdf(task.task_id)
+        finally:
+            await manager.stop()
+
+    task, pdf = asyncio.run(scenario())
+    assert task.status == "completed"
+    assert pdf == b"%PDF Jane Doe"
+    assert "upload" not in task.artifacts
+    assert {"resume_text", "optimized_resume", "pdf"} <= set(task.artifacts)
+
+def test_retry_after_failed_render_does_not_call_llm_again():
+    optimizer = CountingOptimizer()
+
+    async def scenario():
+        manager = _manager(optimizer, FlakyGenerator(failures=1))
+        try:
+            task = await manager.submit(b"Jane Doe", "Python role")
+            failed = await _wait_until_finished(manager, task.task_id)
+            await manager.retry(task.task_id)
+            retried = await _wait_until_finished(manager, task.task_id)
+            return failed, retried
+        finally:
+            await manager.stop()
+
+    failed, retried = asyncio.run(scenario())
+    assert failed.status == "failed"
+    assert failed.error.startswith("rendering failed")
+    assert retried.status == "completed"
+    assert retried.attempts == 2
+    assert optimizer.calls == 1
+
+class _FullQueue(InProcessTaskQueue):
+    async def enqueue(self, task_id):
+        from modules.interfaces.task_queue import TaskQueueFullError
+        raise TaskQueueFullError("full")
+
+def test_retry_on_a_full_queue_leaves_the_task_failed_and_retryable():
+    import pytest
+    from modules.interfaces.task_queue import TaskQueueFullError
+
+    async def scenario():
+        manager = _manager(CountingOptimizer(), FlakyGenerator(failures=1))
+        try:
+            task = await manager.submit(b"Jane Doe", "Python role")
+            await _wait_until_finished(manager, task.task_id)
+            real_queue, manager.queue = manager.queue, _FullQueue()
+            with pytest.raises(TaskQueueFullError):
+                await manager.retry(task.task_id)
+            after_full_queue = manager.get(task.task_id)
+            manager.queue = real_queue
+            await manager.retry(task.task_id)
+            return after_full_queue, await _wait_until_finished(manager, task.task_id)
+        finally:
+            await manager.stop()
+
+    after_full_queue, retried = asyncio.run(scenario())
+    assert after_full_queue.status == "failed"
+    assert after_full_queue.error == "Task queue is full."
+    assert retried.status == "completed"
+
+def test_submit_rejects_non_http_callback_urls():
+    import pytest
+
+    async def scenario(callback_url):
+        manager = _manager(CountingOptimizer(), FlakyGenerator(failures=0))
+        try:
+            return await manager.submit(b"Jane Doe", "Python role", callback_url=callback_url)
+        finally:
+            await manager.stop()
+
+    for callback_url in ("file:///etc/passwd", "gopher://internal:70/", "/relative/path"):
+        with pytest.raises(ValueError):
+            asyncio.run(scenario(callback_url))
+    assert asyncio.run(scenario("https://93.184.215.14/hooks/resume")).callback_url == "https://93.184.215.14/hooks/resume"
+
+def test_callback_urls_must_not_reach_internal_hosts():
+    import pytest
+    from app.optimization_tasks import validate_callback_url
+
+    for callback_url in (
+        "http://127.0.0.1:8000/hook",
+        "http://169.254.169.254/latest/meta-data/",
+        "http://10.0.0.5/hook",
+        "http://[::1]/hook",
+        "http://[::ffff:127.0.0.1]/hook",
+        "http://localhost/hook",
+    ):
+        with pytest.raises(ValueError):
+            validate_callback_url(callback_url)
+    # An explicitly allowed host may be internal
+    validate_callback_url("http://127.0.0.1:8000/hook", allowed_hosts=("127.0.0.1",))
+
+def test_interrupted_tasks_are_marked_failed_and_can_be_retried():
+    import os
+    from app.schemas import OptimizationTask
+
+    class BlockingOptimizer(CountingOptimizer):
+        async def aoptimize_resume(self, resume_text, job_description, use_cache=True):
+            await asyncio.sleep(30)
+
+    async def scenario():
+        store = InMemoryTaskStore()
+        stopped = OptimizationTaskManager(
+            queue=InProcessTaskQueue(workers=1), store=store, pdf_processor=FakeProcessor,
+            resume_optimizer=BlockingOptimizer, document_generator=lambda: FlakyGenerator(failures=0),
+        )
+        task = await stopped.submit(b"Jane Doe", "Python role")
+        while stopped.get(task.task_id).status != "optimizing":
+            await asyncio.sleep(0.01)
+        await stopped.stop()
+        after_stop = stopped.get(task.task_id)
+
+        # A task left behind by a process that no longer exists (e.g. a killed worker)
+        orphan = OptimizationTask(task_id="orphan", status="rendering", created_at=0, updated_at=0, worker_pid=2 ** 22 + 1)
+        running = OptimizationTask(task_id="running", status="optimizing", created_at=0, updated_at=0, worker_pid=os.getppid())
+        store.save_task(orphan)
+        store.save_task(running)
+        manager = _manager(CountingOptimizer(), FlakyGenerator(failures=0))
+        manager.store = store
+        try:
+            await manager.start()
+            orphan_after_start, running_after_start = manager.get("orphan"), manager.get("running")
+            await manager.retry(task.task_id)
+            return after_stop, orphan_after_start, running_after_start, await _wait_until_finished(manager, task.task_id)
+        finally:
+            await manager.stop()
+
+    after_stop, orphan, running, retried = asyncio.run(scenario())
+    assert after_stop.status == "failed" and "Interrupted" in after_stop.error
+    assert orphan.status == "failed"
+    # Still owned by a live process, so it is left alone
+    assert running.status == "optimizing"
+    assert retried.status == "completed"
@@ -30,4 +30,30 @@ def test_pypdf_processor_invalid_file():
     processor = PyPDFProcessor()
     # Pass a non-PDF stream
     with pytest.raises(Exception): # Expect PyPDFLoader to raise an error
-        processor.extract_text(io.BytesIO(b"Not a PDF content"))
\ No newline at end of file
+        processor.extract_text(io.BytesIO(b"Not a PDF content"))
+
+def test_pypdf_processor_cache_skips_reparse():
+    from unittest.mock import patch
+    from modules.implementations.memory_cache import InMemoryLRUCache
+    import modules.implementations.pypdf_processor as pypdf_module
+
+    cache = InMemoryLRUCache(max_entries=4)
+    processor = PyPDFProcessor(cache=cache)
+    pdf_bytes = create_dummy_pdf_stream("Cached resume text.").getvalue()
+
+    with patch.object(pypdf_module.fitz, "open", wraps=pypdf_module.fitz.open) as fitz_open:
+        first = processor.extract_text(io.BytesIO(pdf_bytes))
+        second = processor.extract_text(io.BytesIO(pdf_bytes))
+
+    assert first == second
+    assert "Cached resume text." in second
+    assert fitz_open.call_count == 1
+    assert cache.stats()["hits"] == 1
+
+
+def test_pypdf_processor_async_extract_text():
+    import asyncio
+    processor = PyPDFProcessor()
+    dummy_pdf = create_dummy_pdf_stream("Offloaded extraction.")
+    extracted_text = asyncio.run(processor.aextract_text(dummy_pdf))
+    assert "Offloaded extraction." in extracted_text
@@ -0,0 +1,65 @@
+import os
+import signal
+import socket
+import subprocess
+import sys
+import threading
+import time
+import httpx
+import pytest
+
+pytestmark = pytest.mark.skipif(not hasattr(os, "fork"), reason="pre-fork server needs os.fork")
+
+async def app(scope, receive, send):
+    """Tiny ASGI app that reports the pid of the worker serving the request."""
+    if scope["type"] == "lifespan":
+        while (await receive())["type"] != "lifespan.shutdown":
+            await send({"type": "lifespan.startup.complete"})
+        await send({"type": "lifespan.shutdown.complete"})
+        return
+    if scope["path"] == "/slow":
+        import asyncio
+        await asyncio.sleep(1.0)
+    await send({"type": "http.response.start", "status": 200, "headers": [(b"content-type", b"text/plain")]})
+    await send({"type": "http.response.body", "body": str(os.getpid()).encode()})
+
+def _free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+def _wait_for(url):
+    for _ in range(100):
+        try:
+            return httpx.get(url)
+        except httpx.TransportError:
+            time.sleep(0.1)
+    raise AssertionError("server did not start")
+
+def test_prefork_server_replaces_dead_workers_and_drains_on_sigterm():
+    port = _free_port()
+    script = (
+        "from app.prefork import PreforkServer; "
+        f"PreforkServer('tests.unit.test_prefork:app', port={port}, workers=2, graceful_timeout=5, log_level='warning').run()"
+    )
+    supervisor = subprocess.Popen([sys.executable, "-c", script], cwd=os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+    try:
+        url = f"http://127.0.0.1:{port}"
+        worker_pid = int(_wait_for(url + "/").text)
+
+        os.kill(worker_pid, signal.SIGKILL)
+        time.sleep(1.5)
+        assert _wait_for(url + "/").status_code == 200
+
+        # A request in flight when SIGTERM arrives still completes.
+        results = {}
+        slow = threading.Thread(target=lambda: results.setdefault("status", httpx.get(url + "/slow", timeout=10).status_code))
+        slow.start()
+        time.sleep(0.3)
+        supervisor.send_signal(signal.SIGTERM)
+        slow.join()
+        assert results["status"] == 200
+        assert supervisor.wait(timeout=15) == 0
+    finally:
+        if supervisor.poll() is None:
+            supervisor.kill()
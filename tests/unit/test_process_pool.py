@@ -0,0 +1,111 @@
+import asyncio
+import multiprocessing
+import os
+import time
+import pytest
+from modules.process_pool import WarmProcessPool, WorkerPoolBusyError, WorkerPoolTimeoutError
+
+# Task functions must live at module level so spawned workers can import them.
+_worker_state = {}
+
+def _init_worker(value):
+    _worker_state["value"] = value
+
+def _read_state(offset):
+    return _worker_state["value"] + offset
+
+def _sleep_then_pid(seconds):
+    time.sleep(seconds)
+    return os.getpid()
+
+def test_warm_process_pool_runs_initializer_once_per_worker():
+    pool = WarmProcessPool(_read_state, initializer=_init_worker, initargs=(40,), max_workers=2)
+    try:
+        assert pool.submit(2) == 42
+        assert asyncio.run(pool.asubmit(3)) == 43
+        assert pool.stats()["completed"] == 2
+    finally:
+        pool.close()
+
+def test_warm_process_pool_rejects_when_full():
+    pool = WarmProcessPool(_sleep_then_pid, max_workers=1, max_queue_size=0, task_timeout=10)
+
+    async def scenario():
+        running = asyncio.ensure_future(pool.asubmit(0.5))
+        await asyncio.sleep(0) # Let the first task claim the only slot
+        with pytest.raises(WorkerPoolBusyError):
+            await pool.asubmit(0)
+        return await running
+
+    try:
+        assert isinstance(asyncio.run(scenario()), int)
+        assert pool.stats()["rejected"] == 1
+    finally:
+        pool.close()
+
+def test_warm_process_pool_kills_runaway_tasks():
+    pool = WarmProcessPool(_sleep_then_pid, max_workers=1, task_timeout=0.5)
+    try:
+        with pytest.raises(WorkerPoolTimeoutError):
+            pool.submit(30)
+        # A fresh pool picks up new work immediately
+        assert isinstance(pool.submit(0), int)
+        assert pool.stats()["timeouts"] == 1
+    finally:
+        pool.close()
+
+def test_warm_process_pool_timeout_starts_when_a_worker_picks_up_the_task():
+    pool = WarmProcessPool(_sleep_then_pid, max_workers=1, task_timeout=1.0)
+
+    async def scenario():
+        # The second task waits ~0.7s behind the first, then runs well within its own timeout
+        return await asyncio.gather(pool.asubmit(0.7), pool.asubmit(0.7))
+
+    try:
+        assert all(isinstance(pid, int) for pid in asyncio.run(scenario()))
+        assert pool.stats()["timeouts"] == 0
+    finally:
+        pool.close()
+
+def _worker_pids():
+    return {process.pid for process in multiprocessing.active_children()}
+
+def test_warm_process_pool_close_terminates_retired_pools():
+    pool = WarmProcessPool(_sleep_then_pid, max_workers=2, task_timeout=1.0)
+
+    async def scenario():
+        # Both workers are up before the runaway starts, so neither task waits for a worker
+        await asyncio.gather(pool.asubmit(0.2), pool.asubmit(0.2))
+        runaway = asyncio.ensure_future(pool.asubmit(30))
+        await asyncio.sleep(0.5)
+        other = asyncio.ensure_future(pool.asubmit(30))
+        with pytest.raises(WorkerPoolTimeoutError):
+            await runaway
+        # The other task is still running on the retired pool, so only close() can stop it
+        workers = _worker_pids()
+        pool.close()
+        still_running = workers & _worker_pids()
+        with pytest.raises(WorkerPoolTimeoutError):
+            await other
+        return workers, still_running
+
+    started = time.monotonic()
+    workers, still_running = asyncio.run(scenario())
+    assert time.monotonic() - started < 10
+    assert workers and not still_running
+
+def test_warm_process_pool_fails_tasks_stuck_behind_a_runaway():
+    pool = WarmProcessPool(_sleep_then_pid, max_workers=1, task_timeout=0.5)
+
+    async def scenario():
+        return await asyncio.gather(pool.asubmit(30), pool.asubmit(0), return_exceptions=True)
+
+    try:
+        started = time.monotonic()
+        results = asyncio.run(scenario())
+        # The queued task cannot start on the retired pool, so it times out too instead of hanging
+        assert all(isinstance(result, WorkerPoolTimeoutError) for result in results)
+        assert time.monotonic() - started < 10
+        assert isinstance(pool.submit(0), int)
+    finally:
+        pool.close()
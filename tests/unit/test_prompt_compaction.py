@@ -0,0 +1,73 @@
+from unittest.mock import patch
+from modules.prompt_compaction import (
+    PromptCompactor,
+    approximate_token_count,
+    compact_job_description,
+    normalize_extracted_text,
+    truncate_to_budget,
+)
+
+def test_normalize_extracted_text_fixes_hyphenation_whitespace_and_duplicate_urls():
+    raw = "Led the migra-\ntion  of   billing\n\n\n\nhttps://github.com/jane\n\nExtracted URLs:\nhttps://github.com/jane\nhttps://jane.dev\nhttps://jane.dev"
+
+    text = normalize_extracted_text(raw)
+
+    assert text == "Led the migration of billing\n\nhttps://github.com/jane\n\nExtracted URLs:\nhttps://jane.dev"
+
+def test_compact_job_description_drops_boilerplate_sections_and_repeats():
+    posting = "\n".join([
+        "Requirements:",
+        "- Python and Kafka experience.",
+        "- Python and Kafka experience.",
+        "Benefits:",
+        "- Unlimited snacks",
+        "- Health insurance",
+        "What You'll Do",
+        "- Build event pipelines.",
+        "We are an equal opportunity employer.",
+    ])
+
+    compacted = compact_job_description(posting)
+
+    assert compacted == "Requirements:\n- Python and Kafka experience.\nWhat You'll Do\n- Build event pipelines."
+
+def test_truncate_to_budget_keeps_whole_leading_lines():
+    text = "\n".join(f"line {i} " + "x" * 36 for i in range(10))
+
+    truncated = truncate_to_budget(text, 25, approximate_token_count)
+
+    assert truncated.split("\n") == text.split("\n")[:2]
+    assert approximate_token_count(truncated) <= 25
+
+def test_prompt_compactor_cuts_url_appendix_before_resume_content_and_reports():
+    resume = "Jane Doe\n" + "Experience line.\n" * 5 + "\nExtracted URLs:\n" + "\n".join(f"https://example.com/{i}" for i in range(20))
+    compactor = PromptCompactor(resume_token_budget=30, token_counter=approximate_token_count)
+
+    compact_resume, compact_job, report = compactor.compact(resume, "Requirements:\n- Go")
+
+    assert compact_resume.startswith("Jane Doe\nExperience line.")
+    assert compact_resume.count("Experience line.") == 5
+    assert report.resume_tokens_after <= 30 < report.resume_tokens_before
+    assert report.truncated == ["resume_text"]
+    assert compact_job == "Requirements:\n- Go"
+    assert compactor.stats()["tokens_saved"] == report.tokens_before - report.tokens_after
+
+@patch('modules.implementations.langchain_resume_optimizer.ChatOpenAI')
+def test_resume_optimizer_sends_compacted_inputs(mock_chatopenai):
+    from langchain_core.language_models.fake_chat_models import FakeListChatModel
+    from modules.implementations.langchain_resume_optimizer import LangChainResumeOptimizer
+
+    seen_prompts = []
+
+    class RecordingChatModel(FakeListChatModel):
+        def _call(self, messages, *args, **kwargs):
+            seen_prompts.append(messages[-1].content)
+            return super()._call(messages, *args, **kwargs)
+
+    mock_chatopenai.return_value = RecordingChatModel(responses=['{"suggestions": ["ok"]}'])
+    optimizer = LangChainResumeOptimizer(compactor=PromptCompactor(token_counter=approximate_token_count))
+
+    optimizer.get_suggestions("Built pipe-\nlines", "Requirements:\n- Go\nBenefits:\n- Free lunch")
+
+    assert "Built pipelines" in seen_prompts[0]
+    assert "Free lunch" not in seen_prompts[0]
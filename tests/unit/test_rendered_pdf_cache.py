@@ -0,0 +1,126 @@
+import asyncio
+import os
+import time
+from io import BytesIO
+from app.schemas import ATSFriendlyResume
+from modules.implementations.caching_pdf_generator import CachingPdfGenerator
+from modules.interfaces.document_generator import IDocumentGenerator
+from modules.rendered_pdf_cache import RenderedPdfCache
+
+
+class CountingGenerator(IDocumentGenerator):
+    def __init__(self, version="v1"):
+        self.version = version
+        self.renders = 0
+
+    def render_version(self):
+        return self.version
+
+    def generate_pdf(self, resume_data):
+        self.renders += 1
+        return BytesIO(b"%PDF-" + resume_data.full_name.encode())
+
+    def generate_docx(self, resume_data):
+        raise NotImplementedError
+
+
+def _resume(name="Jane Doe"):
+    return ATSFriendlyResume(full_name=name, contact_info={"email": "jane@example.com"}, summary="", experience=[], education=[], skills=[])
+
+
+def test_cache_evicts_least_recently_used_file(tmp_path):
+    cache = RenderedPdfCache(str(tmp_path), max_bytes=25, read_grace_seconds=0)
+    cache.put("a", b"x" * 10)
+    cache.put("b", b"x" * 10)
+    assert cache.get_path("a") is not None # "b" is now the least recently used
+    cache.put("c", b"x" * 10)
+
+    assert cache.get_path("b") is None
+    assert open(cache.get_path("a"), "rb").read() == b"x" * 10
+    stats = cache.stats()
+    assert stats["evictions"] == 1
+    assert stats["size_bytes"] == 20
+    assert stats["hits"] == 2 and stats["misses"] == 1
+
+
+def test_cache_index_survives_restart_in_recency_order(tmp_path):
+    cache = RenderedPdfCache(str(tmp_path), max_bytes=25, read_grace_seconds=0)
+    cache.put("a", b"x" * 10)
+    cache.put("b", b"x" * 10)
+    time.sleep(0.01)
+    cache.get_path("a")
+
+    reopened = RenderedPdfCache(str(tmp_path), max_bytes=25, read_grace_seconds=0)
+    assert reopened.stats()["entries"] == 2
+    reopened.put("c", b"x" * 10)
+    assert reopened.get_path("b") is None
+    assert reopened.get_path("a") is not None
+
+
+def test_caching_generator_renders_each_resume_once(tmp_path):
+    inner = CountingGenerator()
+    generator = CachingPdfGenerator(inner, RenderedPdfCache(str(tmp_path)))
+
+    first = asyncio.run(generator.arender_to_file(_resume()))
+    second = asyncio.run(generator.arender_to_file(_resume()))
+    assert first == second
+    with asyncio.run(generator.aopen_pdf(_resume())) as pdf_file:
+        assert pdf_file.read() == b"%PDF-Jane Doe"
+    assert generator.generate_pdf(_resume()).getvalue() == b"%PDF-Jane Doe"
+    assert asyncio.run(generator.agenerate_pdf(_resume("John Roe"))).getvalue() == b"%PDF-John Roe"
+
+    assert inner.renders == 2
+    assert generator.cache.stats()["hits"] == 3
+
+
+def test_layout_change_invalidates_cached_renders(tmp_path):
+    cache = RenderedPdfCache(str(tmp_path))
+    old_layout = CachingPdfGenerator(CountingGenerator("v1"), cache)
+    new_layout = CachingPdfGenerator(CountingGenerator("v2"), cache)
+    assert old_layout.cache_key(_resume()) != new_layout.cache_key(_resume())
+
+
+def test_cache_adopts_files_written_by_another_process(tmp_path):
+    first = RenderedPdfCache(str(tmp_path))
+    second = RenderedPdfCache(str(tmp_path))
+
+    first.put("abc123", b"%PDF-shared")
+
+    assert second.get_path("abc123") == first.path_for("abc123")
+    assert second.stats()["entries"] == 1
+
+
+def test_open_file_survives_eviction(tmp_path):
+    cache = RenderedPdfCache(str(tmp_path), max_bytes=15, read_grace_seconds=0)
+    cache.put("a", b"a" * 10)
+    with cache.open("a") as pdf_file:
+        cache.put("b", b"b" * 10) # Evicts "a" while it is being read
+        assert cache.get_path("a") is None
+        assert pdf_file.read() == b"a" * 10
+
+
+def test_recently_served_files_are_not_evicted(tmp_path):
+    cache = RenderedPdfCache(str(tmp_path), max_bytes=15, read_grace_seconds=60)
+    cache.put("a", b"a" * 10)
+    cache.put("b", b"b" * 10)
+
+    # "a" may still be streaming, so the cache runs over budget rather than delete it
+    assert cache.get_path("a") is not None
+    assert cache.stats()["evictions"] == 0 and cache.stats()["size_bytes"] == 20
+
+    stale = time.time() - 120
+    os.utime(cache.path_for("a"), (stale, stale))
+    cache.put("c", b"c" * 10)
+    assert cache.get_path("a") is None
+    assert cache.get_path("b") is not None and cache.get_path("c") is not None
+
+
+def test_grace_period_overshoot_is_bounded(tmp_path):
+    cache = RenderedPdfCache(str(tmp_path), max_bytes=15, read_grace_seconds=60)
+    for key in "abcd":
+        cache.put(key, key.encode() * 10)
+
+    # Every file is recent, but the directory stops growing at twice max_bytes
+    assert cache.stats()["size_bytes"] <= 30
+    assert cache.get_path("a") is None
+    assert cache.get_path("d") is not None
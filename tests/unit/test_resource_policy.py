@@ -0,0 +1,160 @@
+import asyncio
+from modules.implementations.memory_cache import InMemoryLRUCache
+from modules.resource_policy import ResourcePolicy, TrafficMeter, domain_matches
+
+
+class FakeRequest:
+    def __init__(self, url, resource_type, method="GET", response_bytes=1000):
+        self.url = url
+        self.resource_type = resource_type
+        self.method = method
+        self.response_bytes = response_bytes
+
+    async def sizes(self):
+        return {"requestBodySize": 0, "requestHeadersSize": 100, "responseBodySize": self.response_bytes, "responseHeadersSize": 200}
+
+
+class FakeResponse:
+    def __init__(self, body, headers):
+        self.status = 200
+        self.headers = headers
+        self._body = body
+
+    async def body(self):
+        return self._body
+
+
+class FakeRoute:
+    def __init__(self, request, body=b"body{}", headers=None):
+        self.request = request
+        self.response = FakeResponse(body, headers or {"content-type": "text/css", "content-encoding": "gzip"})
+        self.actions = []
+
+    async def abort(self, error_code):
+        self.actions.append(("abort", error_code))
+
+    async def continue_(self):
+        self.actions.append(("continue",))
+
+    async def fetch(self):
+        self.actions.append(("fetch",))
+        return self.response
+
+    async def fulfill(self, status, headers, body):
+        self.actions.append(("fulfill", status, headers, body))
+
+
+class FakeContext:
+    def __init__(self):
+        self.listeners = {}
+        self.route_handler = None
+
+    def on(self, event, handler):
+        self.listeners[event] = handler
+
+    def remove_listener(self, event, handler):
+        assert self.listeners.pop(event) == handler
+
+    async def route(self, pattern, handler):
+        self.route_handler = handler
+
+    async def unroute(self, pattern, handler):
+        self.route_handler = None
+
+    async def load(self, route):
+        self.listeners["request"](route.request)
+        if self.route_handler is not None:
+            await self.route_handler(route)
+        if not route.actions or route.actions[-1][0] != "abort":
+            self.listeners["requestfinished"](route.request)
+        return route.actions
+
+
+def test_domain_patterns_match_subdomains_and_globs():
+    assert domain_matches("stats.g.doubleclick.net", "doubleclick.net")
+    assert domain_matches("doubleclick.net", "doubleclick.net")
+    assert not domain_matches("notdoubleclick.net", "doubleclick.net")
+    assert domain_matches("px4.ads.linkedin.com", "*.ads.linkedin.com")
+    assert not domain_matches("www.linkedin.com", "*.ads.linkedin.com")
+
+
+def test_policy_blocks_types_and_domains_but_never_documents_by_type():
+    policy = ResourcePolicy(blocked_resource_types=["image", "document"], blocked_domains=["tracker.example"])
+    assert policy.block_reason("https://www.linkedin.com/jobs/search/", "document") is None
+    assert policy.block_reason("https://static.licdn.com/logo.png", "image") == "type"
+    assert policy.block_reason("https://cdn.tracker.example/t.js", "script") == "domain"
+    assert policy.block_reason("https://static.licdn.com/app.js", "script") is None
+    # An empty policy intercepts nothing; defaults block images and known ad hosts
+    assert not ResourcePolicy(blocked_resource_types=[], blocked_domains=[]).intercepts
+    assert ResourcePolicy().block_reason("https://www.google-analytics.com/collect", "xhr") == "domain"
+
+
+def test_traffic_meter_blocks_fetches_and_replays_cached_assets():
+    policy = ResourcePolicy(blocked_domains=["tracker.example"], asset_cache=InMemoryLRUCache(max_entries=10))
+
+    async def scenario():
+        context = FakeContext()
+        meter = TrafficMeter(policy)
+        await meter.attach(context)
+        document = await context.load(FakeRoute(FakeRequest("https://site.example/jobs/", "document", response_bytes=5000)))
+        image = await context.load(FakeRoute(FakeRequest("https://site.example/logo.png", "image")))
+        tracker = await context.load(FakeRoute(FakeRequest("https://tracker.example/t.js", "script")))
+        first_css = await context.load(FakeRoute(FakeRequest("https://site.example/site.css", "stylesheet")))
+        second_css = await context.load(FakeRoute(FakeRequest("https://site.example/site.css", "stylesheet")))
+        stats = await meter.detach()
+        return context, stats, (document, image, tracker, first_css, second_css)
+
+    context, stats, (document, image, tracker, first_css, second_css) = asyncio.run(scenario())
+    assert document == [("continue",)]
+    assert image == [("abort", "blockedbyclient")] and tracker == [("abort", "blockedbyclient")]
+    assert first_css[0] == ("fetch",)
+    # Replayed without the encoding header, since the stored body is already decoded
+    assert second_css == [("fulfill", 200, {"content-type": "text/css"}, b"body{}")]
+    assert stats["requests"] == 5
+    assert stats["blocked"] == 2
+    assert stats["asset_cache_hits"] == 1
+    assert stats["bytes_from_cache"] == len(b"body{}")
+    # The document's reported sizes plus the fetched stylesheet (headers and body)
+    fetched_css_bytes = len("content-type") + len("text/css") + len("content-encoding") + len("gzip") + 8 + len(b"body{}")
+    assert stats["bytes_transferred"] == 5200 + fetched_css_bytes
+    assert stats["requests_by_type"] == {"document": 1, "image": 1, "script": 1, "stylesheet": 2}
+    assert context.route_handler is None and context.listeners == {}
+
+
+def test_traffic_meter_without_policy_only_counts():
+    async def scenario():
+        context = FakeContext()
+        meter = TrafficMeter(None)
+        await meter.attach(context)
+        actions = await context.load(FakeRoute(FakeRequest("https://site.example/logo.png", "image", response_bytes=300)))
+        return actions, await meter.detach()
+
+    actions, stats = asyncio.run(scenario())
+    assert actions == []
+    assert stats["requests"] == 1 and stats["blocked"] == 0
+    assert stats["bytes_transferred"] == 500
+
+
+def test_routing_errors_fall_back_to_continuing_the_request():
+    class FailingCache(InMemoryLRUCache):
+        def get(self, key):
+            raise OSError("asset cache unavailable")
+
+    class UncontinuableRoute(FakeRoute):
+        async def continue_(self):
+            raise RuntimeError("Route is already handled!")
+
+    policy = ResourcePolicy(asset_cache=FailingCache(max_entries=10))
+
+    async def scenario():
+        context = FakeContext()
+        meter = TrafficMeter(policy)
+        await meter.attach(context)
+        continued = await context.load(FakeRoute(FakeRequest("https://site.example/site.css", "stylesheet")))
+        aborted = await context.load(UncontinuableRoute(FakeRequest("https://site.example/app.css", "stylesheet")))
+        await meter.detach()
+        return continued, aborted
+
+    continued, aborted = asyncio.run(scenario())
+    assert continued == [("continue",)]
+    assert aborted == [("abort", "failed")]
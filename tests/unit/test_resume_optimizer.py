@@ -47,4 +47,134 @@ def test_langchain_resume_optimizer_optimize_resume(mock_parser_class, mock_chat
     assert result.full_name == "John Doe"
     assert result.experience[0].company == "Tech Corp"
     assert result.improvement_suggestions is not None
-    assert result.improvement_suggestions[0].startswith("Tailor your resume")
\ No newline at end of file
+    assert result.improvement_suggestions[0].startswith("Tailor your resume")
+
+@patch('modules.implementations.langchain_resume_optimizer.ChatOpenAI')
+def test_langchain_resume_optimizer_caches_responses(mock_chatopenai):
+    from langchain_core.language_models.fake_chat_models import FakeListChatModel
+    from modules.implementations.memory_cache import InMemoryLRUCache
+    from app.schemas import ResumeSuggestions
+
+    mock_chatopenai.return_value = FakeListChatModel(responses=[
+        '{"suggestions": ["First answer"]}',
+        '{"suggestions": ["Second answer"]}',
+    ])
+    cache = InMemoryLRUCache(max_entries=8)
+    optimizer = LangChainResumeOptimizer(cache=cache)
+
+    first = optimizer.get_suggestions("Resume  text", "Job description")
+    # Whitespace differences normalize to the same key, so this is served from the cache
+    second = optimizer.get_suggestions("Resume text", " Job description ")
+    # Bypassing the cache forces a fresh LLM call and refreshes the stored entry
+    third = optimizer.get_suggestions("Resume text", "Job description", use_cache=False)
+    fourth = optimizer.get_suggestions("Resume text", "Job description")
+
+    assert isinstance(first, ResumeSuggestions)
+    assert first.suggestions == ["First answer"]
+    assert second.suggestions == ["First answer"]
+    assert third.suggestions == ["Second answer"]
+    assert fourth.suggestions == ["Second answer"]
+    assert cache.stats()["hits"] == 2
+
+
+@patch('modules.implementations.langchain_resume_optimizer.ChatOpenAI')
+def test_langchain_resume_optimizer_async_suggestions(mock_chatopenai):
+    import asyncio
+    from langchain_core.language_models.fake_chat_models import FakeListChatModel
+
+    mock_chatopenai.return_value = FakeListChatModel(responses=['{"suggestions": ["Async answer"]}'])
+    optimizer = LangChainResumeOptimizer()
+
+    result = asyncio.run(optimizer.aget_suggestions("Resume text", "Job description"))
+    assert result.suggestions == ["Async answer"]
+
+
+@patch('modules.implementations.langchain_resume_optimizer.ChatOpenAI')
+def test_langchain_resume_optimizer_reoptimizes_one_section(mock_chatopenai):
+    import asyncio
+    from langchain_core.language_models.fake_chat_models import FakeListChatModel
+    from app.schemas import Experience
+
+    mock_chatopenai.return_value = FakeListChatModel(responses=[
+        '```json\n[{"title": "Engineer", "company": "Globex", "start_date": "2016", "responsibilities": ["Cut p99 latency by 30%."]}]\n```'
+    ])
+    optimizer = LangChainResumeOptimizer()
+    previous = Experience(title="Engineer", company="Globex", start_date="2016", responsibilities=["Maintained ingestion."])
+
+    entries = asyncio.run(optimizer.aoptimize_section("experience", "Engineer, Globex\n- Cut p99 latency by 30%.", "Backend role", [previous]))
+
+    assert entries == [Experience(title="Engineer", company="Globex", start_date="2016", responsibilities=["Cut p99 latency by 30%."])]
+
+
+def test_optimize_with_suggestions_runs_both_requests_concurrently():
+    import asyncio
+    import time
+    from app.schemas import ATSFriendlyResume, ResumeSuggestions
+    from modules.interfaces.resume_optimizer import IResumeOptimizer
+
+    class SlowOptimizer(IResumeOptimizer):
+        def optimize_resume(self, resume_text, job_description, use_cache=True):
+            raise NotImplementedError
+
+        def get_suggestions(self, resume_text, job_description, use_cache=True):
+            raise NotImplementedError
+
+        async def aoptimize_resume(self, resume_text, job_description, use_cache=True):
+            await asyncio.sleep(0.2)
+            return ATSFriendlyResume(full_name=resume_text, contact_info={}, summary="", experience=[], education=[], skills=[])
+
+        async def aget_suggestions(self, resume_text, job_description, use_cache=True):
+            await asyncio.sleep(0.2)
+            return ResumeSuggestions(suggestions=[job_description])
+
+    started = time.perf_counter()
+    combined = asyncio.run(SlowOptimizer().aoptimize_with_suggestions("Jane", "Add metrics"))
+
+    assert time.perf_counter() - started < 0.35
+    assert combined.resume.full_name == "Jane"
+    assert combined.suggestions.suggestions == ["Add metrics"]
+
+
+@patch('modules.implementations.langchain_resume_optimizer.ChatOpenAI')
+def test_langchain_resume_optimizer_rejects_unsupported_sections(mock_chatopenai):
+    import asyncio
+
+    optimizer = LangChainResumeOptimizer()
+
+    with pytest.raises(ValueError, match="skills"):
+        asyncio.run(optimizer.aoptimize_section("skills", "Python, Go", "Backend role", []))
+
+
+@patch('modules.implementations.langchain_resume_optimizer.ChatOpenAI')
+def test_async_paths_keep_cache_io_off_the_event_loop(mock_chatopenai):
+    import asyncio
+    import threading
+    from langchain_core.language_models.fake_chat_models import FakeListChatModel
+    from modules.implementations.memory_cache import InMemoryLRUCache
+
+    class ThreadRecordingCache(InMemoryLRUCache):
+        def __init__(self):
+            super().__init__(max_entries=8)
+            self.threads = []
+
+        def get(self, key):
+            self.threads.append(threading.get_ident())
+            return super().get(key)
+
+        def set(self, key, value):
+            self.threads.append(threading.get_ident())
+            super().set(key, value)
+
+    mock_chatopenai.return_value = FakeListChatModel(responses=['{"suggestions": ["Async answer"]}'])
+    cache = ThreadRecordingCache()
+    optimizer = LangChainResumeOptimizer(cache=cache)
+
+    async def scenario():
+        first = await optimizer.aget_suggestions("Resume text", "Job description")
+        second = await optimizer.aget_suggestions("Resume text", "Job description")
+        return threading.get_ident(), first, second
+
+    loop_thread, first, second = asyncio.run(scenario())
+    assert first.suggestions == second.suggestions == ["Async answer"]
+    # Miss, store, then hit; none of them on the event loop's thread
+    assert len(cache.threads) == 3 and loop_thread not in cache.threads
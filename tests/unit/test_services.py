@@ -0,0 +1,62 @@
+import asyncio
+from app.services import AppServices
+
+def test_app_services_builds_singletons_and_closes_clients(monkeypatch):
+    monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+    services = AppServices()
+
+    assert services.pdf_processor is services.pdf_processor
+    optimizer = services.resume_optimizer
+    assert optimizer is services.resume_optimizer
+    # The optimizer shares the container's pooled HTTP client
+    assert optimizer.llm.http_client is services.http_client
+
+    http_client = services.http_client
+    asyncio.run(services.shutdown())
+    assert http_client.is_closed
+    # After shutdown a fresh instance is built on next access
+    assert services.resume_optimizer is not optimizer
+
+def test_shared_cache_path_lets_service_containers_share_results(monkeypatch, tmp_path):
+    from app import config
+    monkeypatch.setattr(config, "SHARED_CACHE_PATH", str(tmp_path / "shared.sqlite3"))
+    worker_a, worker_b = AppServices(), AppServices()
+
+    worker_a.resume_version_store.set("v1", {"resume": "data"})
+    assert worker_b.resume_version_store.get("v1") == {"resume": "data"}
+    assert type(worker_b.task_manager.store).__name__ == "SQLiteTaskStore"
+
+    asyncio.run(worker_a.shutdown())
+    asyncio.run(worker_b.shutdown())
+
+def test_importing_the_app_leaves_heavy_backends_unloaded():
+    import subprocess
+    import sys
+    heavy = ("langchain_openai", "langchain_core", "langchain_community", "playwright", "fitz", "weasyprint", "numpy")
+    code = f"import sys, app.main; print(','.join(m for m in {heavy!r} if m in sys.modules))"
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, timeout=60)
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.strip() == ""
+
+def test_warm_up_modes(monkeypatch):
+    from app import config
+    monkeypatch.setattr(config, "RENDER_WARM_UP", False)
+    monkeypatch.setattr(config, "BROWSER_POOL_SIZE", 0)
+    built = []
+    monkeypatch.setattr(AppServices, "_build_backends", lambda self: built.append(True))
+
+    async def start(mode):
+        monkeypatch.setattr(config, "SERVICES_WARM_UP", mode)
+        services = AppServices()
+        await services.startup()
+        warmed_at_startup = services.warmed_up
+        if services._warm_up_task is not None:
+            await services._warm_up_task
+        warmed_later = services.warmed_up
+        await services.shutdown()
+        return warmed_at_startup, warmed_later
+
+    assert asyncio.run(start("eager")) == (True, True)
+    assert asyncio.run(start("background")) == (False, True)
+    assert asyncio.run(start("lazy")) == (False, False)
+    assert len(built) == 2
@@ -0,0 +1,36 @@
+import time
+from app.schemas import OptimizationTask
+from modules.implementations.sqlite_task_store import SQLiteTaskStore
+
+def _task(task_id):
+    now = time.time()
+    return OptimizationTask(task_id=task_id, created_at=now, updated_at=now)
+
+def test_tasks_and_artifacts_are_visible_to_other_processes(tmp_path):
+    path = str(tmp_path / "shared.sqlite3")
+    worker_a = SQLiteTaskStore(path)
+    worker_b = SQLiteTaskStore(path)
+
+    worker_a.save_task(_task("t1"))
+    worker_a.put_artifact("t1", "pdf", b"%PDF")
+    worker_a.save_task(_task("t1").model_copy(update={"status": "completed"}))
+
+    assert worker_b.get_task("t1").status == "completed"
+    assert worker_b.get_artifact("t1", "pdf") == b"%PDF"
+    assert worker_b.list_artifacts("t1") == ["pdf"]
+    worker_b.delete_artifact("t1", "pdf")
+    assert worker_a.get_artifact("t1", "pdf") is None
+
+def test_oldest_tasks_and_their_artifacts_are_dropped(tmp_path):
+    store = SQLiteTaskStore(str(tmp_path / "tasks.sqlite3"), max_tasks=2)
+    for task_id in ("t1", "t2", "t3"):
+        store.save_task(_task(task_id))
+        store.put_artifact(task_id, "resume_text", task_id)
+        time.sleep(0.01)
+
+    assert store.get_task("t1") is None
+    assert store.get_artifact("t1", "resume_text") is None
+    assert store.get_task("t3") is not None
+    # Artifacts of unknown tasks are ignored, like the in-memory store.
+    store.put_artifact("t1", "resume_text", "late")
+    assert store.list_artifacts("t1") == []
@@ -0,0 +1,78 @@
+import asyncio
+import json
+from unittest.mock import patch
+from modules.streaming_json import IncrementalJSONObjectParser
+
+RESUME = {
+    "full_name": "Jane Doe",
+    "contact_info": {"email": "jane@example.com"},
+    "summary": "Backend engineer, \"pipelines\" and {braces}.",
+    "experience": [
+        {"title": "Engineer", "company": "Acme", "start_date": "2020", "responsibilities": ["Built things"]},
+        {"title": "Intern", "company": "Globex", "start_date": "2019", "responsibilities": []},
+    ],
+    "education": [{"degree": "BS", "institution": "State"}],
+    "skills": [{"category": "Languages", "keywords": ["Python", "Go"]}],
+    "projects": None,
+}
+
+def test_incremental_parser_reports_fields_and_items_as_they_complete():
+    text = "```json\n" + json.dumps(RESUME, indent=2) + "\n```"
+    parser = IncrementalJSONObjectParser()
+    events = []
+    for position in range(0, len(text), 5):
+        events.extend(parser.feed(text[position:position + 5]))
+
+    fields = {event[1]: json.loads(event[2]) for event in events if event[0] == "field"}
+    experience_items = [json.loads(event[3]) for event in events if event[0] == "item" and event[1] == "experience"]
+
+    assert fields == RESUME
+    assert experience_items == RESUME["experience"]
+    assert parser.done
+    # The first experience entry is reported before the summary of the rest of the document arrives
+    first_item = next(i for i, event in enumerate(events) if event[0] == "item")
+    assert first_item < next(i for i, event in enumerate(events) if event[1] == "education")
+
+def _collect(optimizer, **kwargs):
+    async def run():
+        return [event async for event in optimizer.astream_resume("Resume text", "Job description", **kwargs)]
+    return asyncio.run(run())
+
+@patch('modules.implementations.langchain_resume_optimizer.ChatOpenAI')
+def test_astream_resume_emits_sections_and_caches_result(mock_chatopenai):
+    from langchain_core.language_models.fake_chat_models import FakeListChatModel
+    from modules.implementations.langchain_resume_optimizer import LangChainResumeOptimizer
+    from modules.implementations.memory_cache import InMemoryLRUCache
+
+    mock_chatopenai.return_value = FakeListChatModel(responses=[json.dumps(RESUME)])
+    cache = InMemoryLRUCache(max_entries=8)
+    optimizer = LangChainResumeOptimizer(cache=cache)
+
+    events = _collect(optimizer)
+
+    sections = [(event["section"], event.get("index")) for event in events if event["event"] == "section"]
+    assert sections[:5] == [("full_name", None), ("contact_info", None), ("summary", None), ("experience", 0), ("experience", 1)]
+    assert events[-1]["event"] == "resume"
+    assert events[-1]["data"]["experience"][1]["company"] == "Globex"
+    # The streamed result is served to the non-streaming path from the cache
+    assert optimizer.optimize_resume("Resume text", "Job description").full_name == "Jane Doe"
+    assert cache.stats()["hits"] == 1
+
+@patch('modules.implementations.langchain_resume_optimizer.ChatOpenAI')
+def test_astream_resume_regenerates_only_the_invalid_section(mock_chatopenai):
+    from langchain_core.language_models.fake_chat_models import FakeListChatModel
+    from modules.implementations.langchain_resume_optimizer import LangChainResumeOptimizer
+
+    broken = dict(RESUME, experience=[RESUME["experience"][0], {"title": "Intern", "start_date": "2019"}])
+    repaired_item = {"title": "Intern", "company": "Globex", "start_date": "2019", "responsibilities": ["Shipped a fix"]}
+    mock_chatopenai.return_value = FakeListChatModel(responses=[json.dumps(broken), "```json\n" + json.dumps(repaired_item) + "\n```"])
+    optimizer = LangChainResumeOptimizer()
+
+    events = _collect(optimizer)
+
+    retries = [event for event in events if event["event"] == "section_retry"]
+    assert [(event["section"], event["index"]) for event in retries] == [("experience", 1)]
+    repaired = [event for event in events if event.get("repaired")]
+    assert repaired[0]["data"]["company"] == "Globex"
+    assert events[-1]["data"]["experience"][1]["responsibilities"] == ["Shipped a fix"]
+    assert events[-1]["data"]["experience"][0]["company"] == "Acme"
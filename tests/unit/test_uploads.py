@@ -0,0 +1,84 @@
+import asyncio
+import io
+import os
+import fitz
+import pytest
+from fastapi import FastAPI, File, HTTPException, UploadFile
+from fastapi.testclient import TestClient
+from app.uploads import RequestBodyLimitMiddleware, spool_pdf_upload
+from modules.implementations.pypdf_processor import PyPDFProcessor
+from modules.interfaces.pdf_processor import PDFTooLargeError
+
+
+def _pdf_bytes(pages=1):
+    doc = fitz.open()
+    for page_number in range(pages):
+        doc.new_page().insert_text((50, 50), f"Page {page_number} of the resume")
+    return doc.tobytes()
+
+
+def _upload(content: bytes) -> UploadFile:
+    return UploadFile(io.BytesIO(content), filename="resume.pdf")
+
+
+def test_small_upload_stays_in_memory():
+    content = _pdf_bytes()
+    spooled = asyncio.run(spool_pdf_upload(_upload(content), max_bytes=len(content), spool_threshold=len(content)))
+    try:
+        assert not spooled.on_disk
+        assert spooled.read_bytes() == content
+    finally:
+        spooled.close()
+
+
+def test_large_upload_is_spooled_to_disk_and_removed_on_close(tmp_path):
+    content = _pdf_bytes(pages=3)
+    spooled = asyncio.run(spool_pdf_upload(_upload(content), max_bytes=10 * len(content), spool_threshold=100, spool_dir=str(tmp_path)))
+    assert spooled.on_disk
+    assert "Page 2" in PyPDFProcessor().extract_text(spooled.stream)
+    spooled.close()
+    assert os.listdir(tmp_path) == []
+
+
+def test_oversized_upload_is_rejected_while_reading(tmp_path):
+    with pytest.raises(HTTPException) as error:
+        asyncio.run(spool_pdf_upload(_upload(b"x" * 200_000), max_bytes=100_000, spool_threshold=10, spool_dir=str(tmp_path)))
+    assert error.value.status_code == 413
+    assert os.listdir(tmp_path) == []
+
+
+def test_page_limit_is_enforced_before_extraction():
+    processor = PyPDFProcessor(max_pages=2)
+    with pytest.raises(PDFTooLargeError):
+        processor.extract_text(io.BytesIO(_pdf_bytes(pages=3)))
+    assert "Page 1" in processor.extract_text(io.BytesIO(_pdf_bytes(pages=2)))
+
+
+def test_body_limit_middleware_rejects_by_content_length():
+    app = FastAPI()
+    app.add_middleware(RequestBodyLimitMiddleware, max_body_bytes=1000)
+
+    @app.post("/upload")
+    async def upload(resume_file: UploadFile = File(...)):
+        return {"size": len(await resume_file.read())}
+
+    client = TestClient(app)
+    assert client.post("/upload", files={"resume_file": ("r.pdf", b"x" * 100, "application/pdf")}).status_code == 200
+    assert client.post("/upload", files={"resume_file": ("r.pdf", b"x" * 5000, "application/pdf")}).status_code == 413
+
+
+def test_body_limit_middleware_stops_streamed_bodies():
+    app = FastAPI()
+    app.add_middleware(RequestBodyLimitMiddleware, max_body_bytes=1000)
+
+    @app.post("/upload")
+    async def upload(resume_file: UploadFile = File(...)):
+        return {"size": len(await resume_file.read())}
+
+    def chunks():
+        yield b'--b\r\nContent-Disposition: form-data; name="resume_file"; filename="r.pdf"\r\n\r\n'
+        for _ in range(10):
+            yield b"x" * 500
+
+    response = TestClient(app).post("/upload", content=chunks(), headers={"content-type": "multipart/form-data; boundary=b"})
+    assert response.status_code == 413